@@ -0,0 +1,94 @@
+"""Grounding benchmark: time to bind every operator of a scaled problem.
+
+Builds a synthetic logistics problem with ``K`` cities of twenty locations
+each (one of them an airport), ``K`` packages, one truck and one airplane,
+and times enumerating the bindings of all its operators with the static and
+the reachability binder (the first call, so the reachability analysis is
+included), printing the number of groundings. The static join is dominated
+by ``drive-truck``, whose two ``in-city`` atoms meet on the city: joined by
+scanning, it costs ``|in-city|**2`` matches however few bindings it yields.
+
+With ``--workers``, it also times grounding every operator (binding and
+substituting, with the static binder) sequentially and with
+``ground_parallel`` over each pool size given; the speedup is bounded by
+the CPUs of the machine.
+
+Run from the repository root::
+
+    python benchmarks/grounding.py [--repeat N] [--scale K ...] [--workers W ...]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pddlpy import DomainProblem  # noqa: E402
+from pddlpy.binding import (  # noqa: E402
+    ReachabilityBinder,
+    StaticPrunedBinder,
+)
+from pddlpy.parallel import ground_parallel  # noqa: E402
+
+BINDERS = (("static", StaticPrunedBinder),
+           ("reachability", ReachabilityBinder))
+
+
+def logistics(cities, locations=20):
+    objects = ["tru - truck", "pln - airplane"]
+    init = ["(at tru pos0-0)", "(at pln apt0)"]
+    for c in range(cities):
+        objects += ["cit%d - city" % c, "apt%d - airport" % c, "obj%d - package" % c]
+        init += ["(in-city apt%d cit%d)" % (c, c), "(at obj%d apt%d)" % (c, c)]
+        for p in range(locations - 1):
+            objects.append("pos%d-%d - location" % (c, p))
+            init.append("(in-city pos%d-%d cit%d)" % (c, p, c))
+    text = ("(define (problem logistics-%d) (:domain logistics) (:objects %s)"
+            " (:init %s) (:goal (and (at obj0 apt%d))))" % (
+                cities, " ".join(objects), " ".join(init), cities - 1))
+    with open(os.path.join(ROOT, "tests/corpus/logistics-domain.pddl")) as f:
+        return f.read(), text
+
+
+def bind(domain, problem, binder):
+    dp = DomainProblem.from_strings(domain, problem)
+    start = time.perf_counter()
+    count = sum(1 for op in dp.domain.operators.values() for _ in binder.bind(dp, op))
+    return time.perf_counter() - start, count
+
+
+def ground(domain, problem, workers):
+    dp = DomainProblem.from_strings(domain, problem)
+    start = time.perf_counter()
+    if workers is None:
+        count = len([gop for name in dp.operators() for gop in dp.ground_operator(name)])
+    else:
+        count = len(ground_parallel(dp, workers))
+    return time.perf_counter() - start, count
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--scale", type=int, nargs="+", default=[5, 10, 20])
+    ap.add_argument("--workers", type=int, nargs="*", default=[])
+    args = ap.parse_args(argv)
+    print("%-14s %-13s %9s %10s" % ("problem", "binder", "actions", "ms"))
+    for cities in args.scale:
+        domain, problem = logistics(cities)
+        for name, binder in BINDERS:
+            runs = [bind(domain, problem, binder()) for _ in range(args.repeat)]
+            print("%-14s %-13s %9d %10.1f" % (
+                "logistics-%d" % cities, name, runs[0][1], min(t for t, _ in runs) * 1e3))
+        for workers in [None] + args.workers if args.workers else []:
+            runs = [ground(domain, problem, workers) for _ in range(args.repeat)]
+            print("%-14s %-13s %9d %10.1f" % (
+                "logistics-%d" % cities,
+                "sequential" if workers is None else "workers=%d" % workers,
+                runs[0][1], min(t for t, _ in runs) * 1e3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Parse-time benchmark over the shipped PDDL corpus.
+
+Times three ways of building the same models from every file under
+``tests/corpus``, ``examples-pddl`` and ``examples/pddl``:
+
+- ``ll``    -- ANTLR in full LL prediction mode (the pre-1.3 behaviour);
+- ``sll``   -- ANTLR two-stage parsing: SLL with a bail-out error strategy,
+               falling back to LL only when SLL fails (the default);
+- ``sexpr`` -- the hand-written S-expression backend.
+
+Run from the repository root::
+
+    python benchmarks/parse_modes.py [--repeat N] [--scale K]
+
+``--scale`` additionally times a synthetic problem with ``K`` objects, where
+prediction cost dominates. Each mode is warmed up once first, so the numbers
+compare steady-state parsing rather than ANTLR's DFA cache construction.
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from antlr4 import ParseTreeWalker  # noqa: E402
+
+from pddlpy import sexpr  # noqa: E402
+from pddlpy.pddl import DomainListener, ProblemListener, _parse_tree, _read_text  # noqa: E402
+
+PATTERNS = ("tests/corpus/*.pddl", "examples-pddl/*.pddl", "examples/pddl/*.pddl")
+
+
+def corpus():
+    out = []
+    for pattern in PATTERNS:
+        for path in sorted(glob.glob(os.path.join(ROOT, pattern))):
+            rule = "domain" if "domain" in os.path.basename(path) else "problem"
+            out.append((_read_text(path), rule))
+    return out
+
+
+def synthetic(n):
+    objs = " ".join("b%d" % i for i in range(n))
+    init = " ".join("(on b%d b%d) (clear b%d)" % (i, i + 1, i) for i in range(n - 1))
+    text = ("(define (problem big) (:domain blocksworld) (:objects %s) "
+            "(:init %s (handempty)) (:goal (and %s)))" % (objs, init, init))
+    return [(text, "problem")]
+
+
+def antlr(sll):
+    def parse(text, rule):
+        listener = DomainListener() if rule == "domain" else ProblemListener()
+        ParseTreeWalker().walk(listener, _parse_tree(text, rule, sll=sll))
+        return listener
+    return parse
+
+
+MODES = (("ll", antlr(False)), ("sll", antlr(True)), ("sexpr", sexpr.build))
+
+
+def bench(files, repeat):
+    times = {}
+    for name, parse in MODES:
+        for text, rule in files:  # warm-up
+            parse(text, rule)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for text, rule in files:
+                parse(text, rule)
+        times[name] = time.perf_counter() - start
+    return times
+
+
+def report(label, times):
+    base = times["ll"]
+    print(label)
+    for name, _ in MODES:
+        print("  %-6s %8.3fs  %5.1fx" % (name, times[name], base / times[name]))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--scale", type=int, default=0,
+                    help="also time a synthetic problem with this many objects")
+    args = ap.parse_args(argv)
+    files = corpus()
+    report("corpus: %d files x %d" % (len(files), args.repeat), bench(files, args.repeat))
+    if args.scale:
+        report("synthetic problem: %d objects" % args.scale, bench(synthetic(args.scale), 1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Successor-generation benchmark: set-based ``State`` vs packed ``BitState``.
+
+For each problem, collects up to ``--states`` reachable states by
+breadth-first expansion, then times generating every successor of every
+collected state with a ``GroundedTask`` (frozensets of atom IDs) and with a
+``PackedTask`` (one int bitmask per state), and reports both and the ratio.
+A successor counts as generated once it is hashed, as search does when it
+checks the closed list.
+
+Run from the repository root::
+
+    python benchmarks/successors.py [--repeat N] [--states N] [--scale K] [PROBLEM...]
+
+A ``PROBLEM`` is a corpus name such as ``gripper`` (resolved against
+``tests/corpus`` and ``examples/pddl``); the default is gripper and
+logistics. ``--scale`` adds a synthetic gripper problem with ``K`` balls
+and ``K // 5`` rooms, to show both paths at thousands of grounded
+actions. ``tested`` is the mean number of actions the successor generator
+hands over for a full applicability test per state.
+"""
+import argparse
+import os
+import sys
+import time
+from collections import deque
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pddlpy import DomainProblem  # noqa: E402
+from pddlpy.planning import GroundedTask, PackedTask  # noqa: E402
+
+DIRS = ("tests/corpus", "examples/pddl")
+
+
+def load(name):
+    for directory in DIRS:
+        domain = os.path.join(ROOT, directory, "%s-domain.pddl" % name)
+        if os.path.exists(domain):
+            return DomainProblem(domain, os.path.join(ROOT, directory, "%s-problem.pddl" % name))
+    raise SystemExit("no problem named %r under %s" % (name, ", ".join(DIRS)))
+
+
+def gripper(balls):
+    rooms = max(2, balls // 5)
+    text = ("(define (problem gripper-%d) (:domain gripper)"
+            " (:objects %s - ball %s - room left right - gripper)"
+            " (:init (at-robby room0) (free left) (free right) %s)"
+            " (:goal (and %s)))" % (
+                balls,
+                " ".join("ball%d" % i for i in range(balls)),
+                " ".join("room%d" % i for i in range(rooms)),
+                " ".join("(at ball%d room0)" % i for i in range(balls)),
+                " ".join("(at ball%d room%d)" % (i, rooms - 1) for i in range(balls))))
+    with open(os.path.join(ROOT, "tests/corpus/gripper-domain.pddl")) as f:
+        return DomainProblem.from_strings(f.read(), text)
+
+
+def reachable(task, limit):
+    seen = {task.initial}
+    frontier = deque([task.initial])
+    while frontier and len(seen) < limit:
+        for _, succ in task.successors(frontier.popleft()):
+            if succ not in seen:
+                seen.add(succ)
+                frontier.append(succ)
+    return list(seen)
+
+
+def expand(task, states):
+    start = time.perf_counter()
+    for state in states:
+        for _, succ in task.successors(state):
+            hash(succ)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--states", type=int, default=5000)
+    ap.add_argument("--scale", type=int, default=0)
+    ap.add_argument("problems", nargs="*", default=["gripper", "logistics"])
+    args = ap.parse_args(argv)
+    tasks = [(name, load(name)) for name in args.problems]
+    if args.scale:
+        tasks.append(("gripper-%d" % args.scale, gripper(args.scale)))
+    print("%-14s %7s %7s %7s %10s %10s %8s" % (
+        "problem", "actions", "tested", "states", "State ms", "Bit ms", "speedup"))
+    for name, dp in tasks:
+        plain, packed = GroundedTask(dp), PackedTask(dp)
+        plain_states = reachable(plain, args.states)
+        packed_states = reachable(packed, args.states)
+        slow = min(expand(plain, plain_states) for _ in range(args.repeat))
+        fast = min(expand(packed, packed_states) for _ in range(args.repeat))
+        tested = sum(len(plain.generator.candidates(s.ids)) for s in plain_states)
+        print("%-14s %7d %7.1f %7d %10.1f %10.1f %7.1fx" % (
+            name, len(plain.actions), tested / len(plain_states), len(plain_states),
+            slow * 1e3, fast * 1e3, slow / fast))
+
+
+if __name__ == "__main__":
+    main()
@@ -18,7 +18,28 @@
 #
 #
 
-from .pddl import DomainProblem
+# The object model pulls in the generated ANTLR parser, whose ATN is
+# deserialized at import time. Load it on first use so that importing a
+# light submodule (``pddlpy.cache``, ``pddlpy.planning``) or running
+# ``pddlpy --help`` does not pay for it.
+from typing import TYPE_CHECKING, Any, List
 
-__all__ = ["DomainProblem"]
+if TYPE_CHECKING:
+    from .pddl import Domain, DomainProblem
+
+__all__ = ["Domain", "DomainProblem"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        from . import pddl
+
+        value = getattr(pddl, name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
 
@@ -0,0 +1,115 @@
+"""Parallel batch parsing of many problem files for one domain.
+
+Loading a directory of generated problems one ``DomainProblem`` at a time
+runs every parse serially in one interpreter. :func:`parse_many` parses the
+domain once, fans the problem files out over a process pool and yields each
+result as soon as its worker finishes::
+
+    from pddlpy.batch import parse_many
+
+    for result in parse_many("domain.pddl", ["p01.pddl", "p02.pddl"], workers=4):
+        if result.error is None:
+            print(result.path, len(result.problem.initialstate()))
+
+Workers send back only the ``ProblemListener`` model — the same picklable
+object the parse cache stores — and the parent attaches it to the shared
+:class:`~pddlpy.pddl.Domain`, so the domain model is never copied between
+processes. Results arrive in completion order, not input order; a file that
+cannot be read or parsed yields a result carrying the error message instead
+of ending the batch.
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, as_completed, wait
+from typing import Any, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+from pddlpy.binding import VariableBinder
+from pddlpy.cache import ParseCache
+from pddlpy.pddl import Domain, DomainProblem, ProblemListener, _load
+
+#: Tasks kept in flight per worker, so a long input iterable is consumed
+#: (and its results held in memory) only a little ahead of the caller.
+_BACKLOG = 4
+
+
+class BatchResult(NamedTuple):
+    """One parsed problem file: ``problem`` is set on success, ``error`` (a
+    one-line message) on failure."""
+    path: str
+    problem: Optional[DomainProblem]
+    error: Optional[str]
+
+
+def problem_files(paths: Iterable[str], exclude: Iterable[str] = ()) -> List[str]:
+    """Expand ``paths``: a directory stands for the ``*.pddl`` files directly
+    inside it, in sorted order; files are kept as given. Paths in
+    ``exclude`` (typically the domain file) are dropped."""
+    skip = {os.path.abspath(p) for p in exclude}
+    out: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            found = sorted(os.path.join(path, name) for name in os.listdir(path)
+                           if name.endswith(".pddl"))
+        else:
+            found = [path]
+        out.extend(p for p in found if os.path.abspath(p) not in skip)
+    return out
+
+
+def _parse_problem(path: str, cache: Optional[ParseCache],
+                   backend: str) -> Tuple[str, Any, Optional[str]]:
+    """Worker entry point: parse one problem file into its model."""
+    try:
+        return path, _load(path, "problem", ProblemListener, cache, backend), None
+    except Exception as exc:  # one bad file must not end the batch
+        return path, None, "%s: %s" % (type(exc).__name__, exc)
+
+
+def parse_many(domain: Union[str, Domain], problems: Iterable[str],
+               workers: Optional[int] = None, cache: Optional[ParseCache] = None,
+               backend: str = "antlr",
+               binder: Optional[VariableBinder] = None) -> Iterator[BatchResult]:
+    """Parse ``problems`` against ``domain`` (a path or a parsed ``Domain``)
+    and return an iterator of :class:`BatchResult`, one per file, yielded as
+    each parse completes. The domain is parsed before this returns.
+
+    workers -- size of the process pool; ``None`` uses every CPU and ``1``
+               parses serially in this process, in input order.
+    cache / backend -- as for ``DomainProblem``; a path ``domain`` is parsed
+               with them, and problems are parsed with the domain's own.
+    binder  -- the variable binder given to every ``DomainProblem``.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if not isinstance(domain, Domain):
+        domain = Domain(domain, cache=cache, backend=backend)
+    return _stream(domain, problems, workers, binder)
+
+
+def _stream(domain: Domain, problems: Iterable[str], workers: int,
+            binder: Optional[VariableBinder]) -> Iterator[BatchResult]:
+    def attach(done: Tuple[str, Any, Optional[str]]) -> BatchResult:
+        path, model, error = done
+        if error is not None:
+            return BatchResult(path, None, error)
+        return BatchResult(path, DomainProblem._from_models(domain, model, binder), None)
+
+    if workers == 1:
+        for path in problems:
+            yield attach(_parse_problem(path, domain.cache, domain.backend))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Set[Future] = set()
+        for path in problems:
+            pending.add(pool.submit(_parse_problem, path, domain.cache, domain.backend))
+            if len(pending) < workers * _BACKLOG:
+                continue
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield attach(future.result())
+        for future in as_completed(pending):
+            yield attach(future.result())
@@ -33,20 +33,36 @@ it can be swapped or overridden:
   the initial state — sound, because a static predicate (one no action ever
   modifies) has the same truth value in every reachable state as in the initial
   state. It never drops a genuinely applicable grounding.
+- :class:`ReachabilityBinder` prunes further: it joins *all* positive
+  preconditions against the atoms reachable from the initial state under the
+  delete relaxation, so groundings that no reachable state can enable are
+  dropped as well.
 
-Binders are stateless and receive the ``DomainProblem`` plus the lifted operator
-on each call, so there is no cross-operator caching to get wrong (#26).
+Binders receive the ``DomainProblem`` plus the lifted operator on each call.
+The cartesian and static binders are stateless, so there is no
+cross-operator caching to get wrong (#26); the reachability binder keeps only
+its per-problem analysis, keyed by the ``DomainProblem`` itself.
 
 A custom binder only needs to implement ``bind(dp, operator)`` and yield
 ``{param: object}`` dicts; useful ``DomainProblem`` helpers are
-``candidate_objects(type)``, ``worldobjects()``, ``initialstate()`` and
-``static_predicates()``.
+``candidate_objects(type)``, ``worldobjects()``, ``initialstate()``,
+``init_index()`` (the initial state as a :class:`FactIndex`) and
+``static_predicates()``. Durative actions are bound through
+``bind_durative(dp, action)``, which defaults to the cartesian product; the
+static and reachability binders prune them on their time-tagged conditions.
 """
 from __future__ import annotations
 
 import itertools
 from abc import ABC, abstractmethod
-from typing import Dict, Iterator, List, Optional
+from typing import Any, Container, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+from weakref import WeakKeyDictionary
+
+#: A ground atom, e.g. ``("on", "a", "b")``.
+GroundAtom = Tuple[str, ...]
+#: Relaxed-reachable atoms, plus the predicates assumed reachable for every
+#: argument tuple (see :class:`ReachabilityBinder`).
+Reached = Tuple[FrozenSet[GroundAtom], FrozenSet[str]]
 
 
 class VariableBinder(ABC):
@@ -62,6 +78,13 @@ class VariableBinder(ABC):
         """
         raise NotImplementedError  # pragma: no cover - abstract
 
+    def bind_durative(self, dp, action) -> Iterator[Dict[str, str]]:
+        """Yield the assignments for a lifted ``DurativeAction`` (#23). The
+        default is the full cartesian product, so a binder written for
+        instantaneous operators only keeps grounding durative actions as
+        before."""
+        yield from CartesianBinder().bind(dp, action)
+
 
 class CartesianBinder(VariableBinder):
     """Full cartesian product of each parameter over its type-compatible
@@ -75,6 +98,65 @@ class CartesianBinder(VariableBinder):
             yield dict(zip(names, combo))
 
 
+class FactIndex():
+    """A set of ground atoms indexed for joins: by predicate name, and by
+    ``(predicate, position, value)`` for every argument position.
+
+    ``DomainProblem.init_index()`` holds one over the initial state; the
+    binders match each precondition atom against the smallest list any of
+    its already-known arguments selects, so a join touches the atoms that
+    can match rather than every atom of the predicate. Atoms are filed in
+    sorted order, so joins enumerate them deterministically.
+    """
+
+    def __init__(self, atoms: Iterable[GroundAtom] = ()) -> None:
+        self._atoms: Set[GroundAtom] = set()
+        self._by_pred: Dict[str, List[GroundAtom]] = {}
+        self._by_arg: Dict[Tuple[str, int, str], List[GroundAtom]] = {}
+        self._distinct: Dict[Tuple[str, int], int] = {}
+        for atom in sorted(atoms):
+            self.add(atom)
+
+    def add(self, atom: GroundAtom) -> bool:
+        """Index ``atom``; False if it was already present."""
+        if atom in self._atoms:
+            return False
+        self._atoms.add(atom)
+        pred = atom[0]
+        self._by_pred.setdefault(pred, []).append(atom)
+        for i, value in enumerate(atom[1:], 1):
+            key = (pred, i, value)
+            bucket = self._by_arg.get(key)
+            if bucket is None:
+                bucket = self._by_arg[key] = []
+                self._distinct[pred, i] = self._distinct.get((pred, i), 0) + 1
+            bucket.append(atom)
+        return True
+
+    def atoms(self, predicate: str) -> List[GroundAtom]:
+        """The atoms of ``predicate``."""
+        return self._by_pred.get(predicate, [])
+
+    def lookup(self, predicate: str, position: int, value: str) -> List[GroundAtom]:
+        """The atoms of ``predicate`` whose argument ``position`` (1-based)
+        is ``value``."""
+        return self._by_arg.get((predicate, position, value), [])
+
+    def distinct(self, predicate: str, position: int) -> int:
+        """How many different values argument ``position`` of ``predicate``
+        takes."""
+        return self._distinct.get((predicate, position), 0)
+
+    def __contains__(self, atom: object) -> bool:
+        return atom in self._atoms
+
+    def __iter__(self) -> Iterator[GroundAtom]:
+        return iter(self._atoms)
+
+    def __len__(self) -> int:
+        return len(self._atoms)
+
+
 class StaticPrunedBinder(VariableBinder):
     """Default binder: prune bindings using static preconditions (#12).
 
@@ -84,52 +166,82 @@ class StaticPrunedBinder(VariableBinder):
     their type domain. Negative static preconditions filter out bindings whose
     atom is present in the initial state. This yields a subset of the cartesian
     bindings, dropping only ones that can never be applicable.
+
+    Durative actions (:meth:`bind_durative`) join the guaranteed conjuncts
+    of their at-start, over-all and at-end conditions together.
+
+    Pruning assumes the joined atoms must all hold. An ADL precondition —
+    a disjunction (#13), a quantifier, an equality or a nested negation
+    (#10) — is pruned on its guaranteed conjuncts only: the literals
+    reached from the root through ``and`` nodes (``Condition.conjuncts``).
+    Parameters they leave unbound expand over their type domain, and the
+    grounded precondition tree still decides applicability.
+
+    The join runs over ``dp.init_index()``, most selective atom first: at
+    each step the atom expected to match the fewest facts, given its
+    constants and the variables bound so far, is joined next, and each
+    partial binding looks its matches up by a bound argument. Grounding
+    cost follows the number of matches rather than ``|init|`` per atom.
     """
 
     def bind(self, dp, operator) -> Iterator[Dict[str, str]]:
-        # Pruning assumes the positive preconditions must all hold (a
-        # conjunction). If the precondition is anything richer than a plain
-        # conjunction of literals/numerics — a disjunction (#13), a quantifier,
-        # an equality, or a nested negation (#10) — the flat positive atoms are
-        # not guaranteed conjuncts, so static joining would be unsound: fall
-        # back to the full cartesian product.
-        if not getattr(operator, 'simple_conjunction', True):
-            yield from CartesianBinder().bind(dp, operator)
-            return
+        init = dp.init_index()
+        yield from self._join(dp, operator, init, dp.static_predicates(), init)
 
+    def bind_durative(self, dp, action) -> Iterator[Dict[str, str]]:
+        # The conditions of every time point must hold for the action to
+        # execute, so they join exactly like a conjunctive precondition.
+        yield from self.bind(dp, action)
+
+    def bind_in(self, dp, operator, facts: FactIndex) -> Iterator[Dict[str, str]]:
+        """Bindings of ``operator`` whose guaranteed positive preconditions,
+        static or not, all hold in ``facts`` — typically one search state —
+        so the operator can be grounded on demand. Static negative
+        preconditions are checked against the initial state; the rest is
+        left to the applicability test."""
+        yield from self._join(dp, operator, facts, _Except(frozenset()), dp.init_index())
+
+    def _join(self, dp, operator, facts: FactIndex, joinable: Container[str],
+              absent: Container[GroundAtom]) -> Iterator[Dict[str, str]]:
+        """Bindings of ``operator`` that satisfy every positive precondition
+        over a ``joinable`` predicate, matched against ``facts``, and whose
+        static negative preconditions are not in ``absent``; other
+        parameters expand over their type domain."""
         static = dp.static_predicates()
-        init = {a.ground({}) for a in dp.initialstate()}
         objtype = dp.worldobjects()
 
-        pos = [a for a in operator.precondition_pos if a.predicate[0] in static]
-        neg = [a for a in operator.precondition_neg if a.predicate[0] in static]
+        conj_pos, conj_neg = _conjuncts(operator)
+        pos = [a for a in conj_pos if a.predicate[0] in joinable]
+        neg = [a for a in conj_neg if a.predicate[0] in static]
 
-        # Seed with the empty assignment, then join each static positive atom
-        # against matching initial-state tuples.
+        # Seed with the empty assignment, then join each positive atom against
+        # the facts it can match.
         partials: List[Dict[str, str]] = [{}]
-        for atom in pos:
+        for atom in _join_order(pos, facts):
             pattern = atom.predicate
-            name = pattern[0]
-            candidates = [t for t in init
-                          if t[0] == name and len(t) == len(pattern)]
             nxt: List[Dict[str, str]] = []
             for partial in partials:
-                for tup in candidates:
+                for tup in _matches(facts, pattern, partial):
+                    if len(tup) != len(pattern):
+                        continue
                     merged = self._unify(partial, pattern, tup, operator, dp, objtype)
                     if merged is not None:
                         nxt.append(merged)
             partials = nxt
             if not partials:
-                return  # a static positive precondition is unsatisfiable
+                return  # a positive precondition is unsatisfiable
 
+        # Bindings are yielded in parameter order, whatever the join order.
         names = list(operator.variable_list.keys())
         for partial in partials:
-            free = [v for v in names if v not in partial]
-            domains = [dp.candidate_objects(operator.variable_list[v]) for v in free]
+            free = [i for i, v in enumerate(names) if v not in partial]
+            domains = [dp.candidate_objects(operator.variable_list[names[i]]) for i in free]
+            row = [partial.get(v) for v in names]
             for combo in itertools.product(*domains):
-                full = dict(partial)
-                full.update(zip(free, combo))
-                if any(a.ground(full) in init for a in neg):
+                for i, value in zip(free, combo):
+                    row[i] = value
+                full = dict(zip(names, row))
+                if any(a.ground(full) in absent for a in neg):
                     continue  # a static negative precondition is violated
                 yield full
 
@@ -152,3 +264,191 @@ class StaticPrunedBinder(VariableBinder):
             elif sym != val:
                 return None  # constant in the precondition must match
         return merged
+
+
+def _conjuncts(operator) -> Tuple[List[Any], List[Any]]:
+    """The positive and negative precondition atoms of ``operator`` that
+    every applicable grounding must satisfy; for a durative action, the
+    guaranteed conjuncts of its timed conditions at every time point.
+    Atoms over variables that are not parameters (a quantifier's) are left
+    out: they cannot be joined."""
+    if hasattr(operator, 'condition_trees'):
+        pos: List[Any] = []
+        neg: List[Any] = []
+        for time in operator.CONDITION_TIMES:
+            for tree in operator.condition_trees[time]:
+                p, n = tree.conjuncts()
+                pos += p
+                neg += n
+    elif getattr(operator, 'simple_conjunction', True):
+        pos, neg = list(operator.precondition_pos), list(operator.precondition_neg)
+    else:
+        pos, neg = operator.precondition_tree.conjuncts()
+    params = operator.variable_list
+    return ([a for a in pos if _over(a, params)], [a for a in neg if _over(a, params)])
+
+
+def _over(atom, params: Container[str]) -> bool:
+    """True if every variable of ``atom`` is one of ``params``."""
+    return all(sym in params for sym in atom.predicate[1:] if sym.startswith('?'))
+
+
+def _join_order(atoms: List[Any], facts: FactIndex) -> List[Any]:
+    """``atoms`` in greedy join order: repeatedly the one with the fewest
+    expected matches given the variables bound by those before it."""
+    remaining = sorted(atoms, key=lambda a: tuple(a.predicate))
+    bound: Set[str] = set()
+    order = []
+    while remaining:
+        best = min(remaining, key=lambda a: _estimate(a.predicate, bound, facts))
+        remaining.remove(best)
+        order.append(best)
+        bound.update(sym for sym in best.predicate[1:] if sym.startswith('?'))
+    return order
+
+
+def _estimate(pattern: List[str], bound: Set[str], facts: FactIndex) -> float:
+    """Expected matches of ``pattern``: a constant selects its exact bucket,
+    a bound variable one value out of the position's distinct values."""
+    pred = pattern[0]
+    estimate = float(len(facts.atoms(pred)))
+    for i, sym in enumerate(pattern[1:], 1):
+        if not sym.startswith('?'):
+            estimate = min(estimate, len(facts.lookup(pred, i, sym)))
+        elif sym in bound:
+            estimate /= max(1, facts.distinct(pred, i))
+    return estimate
+
+
+def _matches(facts: FactIndex, pattern: List[str], partial: Dict[str, str]
+             ) -> List[GroundAtom]:
+    """The facts ``pattern`` can match under ``partial``: the smallest bucket
+    selected by one of its constants or bound variables."""
+    pred = pattern[0]
+    best = facts.atoms(pred)
+    for i, sym in enumerate(pattern[1:], 1):
+        value = partial.get(sym) if sym.startswith('?') else sym
+        if value is not None:
+            bucket = facts.lookup(pred, i, value)
+            if len(bucket) < len(best):
+                best = bucket
+    return best
+
+
+class ReachabilityBinder(StaticPrunedBinder):
+    """Prune bindings whose preconditions are unreachable even under the
+    delete relaxation.
+
+    On first use for a ``DomainProblem`` the binder runs the relaxed
+    exploration from ``initialstate()``, Datalog style: every operator's
+    positive preconditions (for an ADL precondition, its guaranteed
+    conjuncts) are joined against the atoms reached so far and
+    the add effects of each match are reached in turn, until nothing new is
+    added. Delete effects, non-static negative preconditions and numeric
+    conditions are ignored, so the reached atoms over-approximate every
+    reachable state; an operator binding whose positive preconditions cannot
+    all be reached can never apply, and is not generated.
+
+    Durative actions take part too: once the conditions of all their time
+    points are reached, both their at-start and at-end effects are. A
+    condition on a predicate the action itself adds at start is not
+    required, since the action may support it.
+
+    Effects outside the joinable fragment stay sound: every predicate an
+    operator with conditional or universal effects may add counts as
+    reachable for every argument tuple.
+
+    The analysis is kept per ``DomainProblem`` (weakly), so a binder instance
+    can serve many problems, and is not pickled with it; :meth:`pruned`
+    reports what it removed.
+    """
+
+    def __init__(self) -> None:
+        self._reached: "WeakKeyDictionary[Any, Reached]" = WeakKeyDictionary()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The analyses are held weakly, per problem; a copy (a parallel
+        # grounding worker's, say) starts without them.
+        return {}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._reached = WeakKeyDictionary()
+
+    def bind(self, dp, operator) -> Iterator[Dict[str, str]]:
+        reached, wild = self.reachable(dp)
+        pos = [a for a in _conjuncts(operator)[0] if a.predicate[0] not in wild
+               and a.predicate[0] not in _self_supported(operator)]
+        # Filter the static join rather than join against the reached atoms,
+        # so bindings keep StaticPrunedBinder's order (and plans their ties).
+        for binding in super().bind(dp, operator):
+            if all(a.ground(binding) in reached for a in pos):
+                yield binding
+
+    def reachable(self, dp) -> Reached:
+        """The relaxed-reachable atoms of ``dp``, and the predicates whose
+        every atom must be assumed reachable."""
+        memo = self._reached.get(dp)
+        if memo is None:
+            memo = self._reached[dp] = self._explore(dp)
+        return memo
+
+    def _explore(self, dp) -> Reached:
+        domain = dp.domain
+        wild: Set[str] = set()
+        rules = []
+        for op in domain.operators.values():
+            if op.effect_tree is not None and "conditional-effects" in op.effect_tree.features():
+                wild |= op.effect_tree.predicates()
+            else:
+                rules.append(op)
+        wild_set = frozenset(wild)
+        durative = list(domain.durative_operators.values())
+
+        init = dp.init_index()
+        reached = FactIndex(init)
+        joinable = _Except(wild_set)
+        changed = True
+        while changed:
+            changed = False
+            for op in rules:
+                new = [a.ground(binding)
+                       for binding in self._join(dp, op, reached, joinable, init)
+                       for a in op.effect_pos]
+                for atom in new:
+                    changed |= reached.add(atom)
+            for da in durative:
+                own = _Except(wild_set | _self_supported(da))
+                new = [a.ground(binding)
+                       for binding in self._join(dp, da, reached, own, init)
+                       for time in da.EFFECT_TIMES for a in da.effect_pos[time]]
+                for atom in new:
+                    changed |= reached.add(atom)
+        return frozenset(reached), wild_set
+
+    def pruned(self, dp) -> Dict[str, int]:
+        """The number of groundings of each operator and durative action that
+        the static pruning of :class:`StaticPrunedBinder` keeps but this
+        binder drops."""
+        static = StaticPrunedBinder()
+        actions = {**dp.domain.operators, **dp.domain.durative_operators}
+        return {name: sum(1 for _ in static.bind(dp, op)) - sum(1 for _ in self.bind(dp, op))
+                for name, op in actions.items()}
+
+
+def _self_supported(operator) -> FrozenSet[str]:
+    """Predicates a durative action adds at start: its own over-all and
+    at-end conditions on them may be met by the action itself, so the
+    exploration must not require them beforehand."""
+    if not hasattr(operator, 'condition_pos'):
+        return frozenset()
+    return frozenset(a.predicate[0] for a in operator.effect_pos['start'])
+
+
+class _Except():
+    """Every name except ``names`` (a ``Container`` for ``_join``)."""
+
+    def __init__(self, names: FrozenSet[str]) -> None:
+        self.names = names
+
+    def __contains__(self, name: object) -> bool:
+        return name not in self.names
@@ -0,0 +1,187 @@
+"""Persistent on-disk parse cache for the object model.
+
+Parsing runs the ANTLR lexer, parser and tree walker over every file, which
+dominates the cost of loading a domain/problem pair that has been seen
+before. :class:`ParseCache` stores the built ``DomainListener`` /
+``ProblemListener`` models as pickles keyed by a SHA-256 of the file
+*content* (plus the grammar rule, the pddlpy version and a cache format
+number), so a warm load skips ANTLR entirely and an edited file — or an
+upgraded pddlpy — simply misses.
+
+The cache is opt-in::
+
+    from pddlpy import DomainProblem
+    from pddlpy.cache import ParseCache
+
+    cache = ParseCache("~/.cache/pddlpy", max_entries=512)
+    dp = DomainProblem("domain.pddl", "problem.pddl", cache=cache)
+    cache.stats()   # {'hits': 0, 'misses': 2, 'evictions': 0, ...}
+
+The command-line interface and the MCP server use the cache named by the
+``PDDLPY_CACHE_DIR`` environment variable, if set (see :func:`default_cache`).
+
+Eviction is least-recently-used, bounded by entry count and optionally by
+total size on disk; a hit refreshes the entry's modification time. Entries
+are pickles: only point the cache at a directory you trust.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+#: Bumped whenever the pickled model classes change shape, so stale entries
+#: written by an older layout miss instead of unpickling into the wrong thing.
+CACHE_FORMAT = 2
+
+#: Environment variable naming the cache directory used by the CLI and MCP
+#: server.
+CACHE_DIR_ENV = "PDDLPY_CACHE_DIR"
+
+_SUFFIX = ".pickle"
+
+
+@lru_cache(maxsize=None)
+def _version() -> str:
+    # importlib.metadata is slow to import; only pay for it once a key is
+    # actually computed, not whenever the CLI starts.
+    from importlib import metadata
+
+    try:
+        return metadata.version("pddlpy")
+    except metadata.PackageNotFoundError:  # pragma: no cover - running from a source tree
+        return "0+unknown"
+
+
+class ParseCache():
+    """A size-bounded, content-addressed store of parsed PDDL models.
+
+    directory   -- where entries live; created on first use. ``~`` expands.
+    max_entries -- keep at most this many entries (LRU eviction).
+    max_bytes   -- optionally also bound the total size of the entries.
+
+    ``hits``, ``misses`` and ``evictions`` count this instance's activity;
+    :meth:`stats` adds the current number and total size of the entries.
+    """
+
+    def __init__(self, directory: str, max_entries: int = 256,
+                 max_bytes: Optional[int] = None) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.directory = os.path.expanduser(directory)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(rule: str, text: str) -> str:
+        """The cache key for ``text`` parsed with grammar rule ``rule``
+        ('domain' or 'problem')."""
+        h = hashlib.sha256()
+        h.update(("%s\0%d\0%s\0" % (_version(), CACHE_FORMAT, rule)).encode("utf-8"))
+        h.update(text.encode("utf-8"))
+        return h.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def load(self, key: str) -> Optional[Any]:
+        """Return the model stored under ``key``, or None on a miss. A
+        corrupt, truncated, foreign or unreadable entry is dropped and counts
+        as a miss."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                model = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+                ImportError, IndexError, TypeError, ValueError):
+            self.misses += 1
+            self._discard(path)
+            return None
+        try:
+            os.utime(path)  # refresh recency for LRU eviction
+        except OSError:
+            pass  # evicted by another process since the read; the model stands
+        self.hits += 1
+        return model
+
+    def store(self, key: str, model: Any) -> None:
+        """Store ``model`` under ``key`` (atomically), then evict down to the
+        configured bounds."""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            self._discard(tmp)
+            raise
+        self._evict()
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        """``(mtime, size, path)`` for every entry, oldest first."""
+        out = []
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        for name in names:
+            if not name.endswith(_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:  # pragma: no cover - raced with another process
+                continue
+            out.append((st.st_mtime, st.st_size, path))
+        out.sort()
+        return out
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        while entries and (len(entries) > self.max_entries or
+                           (self.max_bytes is not None and total > self.max_bytes)):
+            _, size, path = entries.pop(0)
+            self._discard(path)
+            total -= size
+            self.evictions += 1
+
+    @staticmethod
+    def _discard(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        """Remove every entry (the counters are left untouched)."""
+        for _, _, path in self._entries():
+            self._discard(path)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters plus the current entry count and size."""
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+        }
+
+
+def default_cache() -> Optional[ParseCache]:
+    """The cache named by ``$PDDLPY_CACHE_DIR``, or None when it is unset or
+    empty. Used by the CLI and the MCP server so the cache stays opt-in."""
+    directory = os.environ.get(CACHE_DIR_ENV)
+    return ParseCache(directory) if directory else None
@@ -7,9 +7,16 @@ Three subcommands over a domain/problem pair, all emitting JSON on stdout:
     pddlpy solve    DOMAIN PROBLEM [--planner NAME]
     pddlpy validate DOMAIN PROBLEM             # diagnostics (#94)
 
+``parse --batch DOMAIN PROBLEM_OR_DIR...`` parses many problems for one
+domain over a process pool (see ``pddlpy.batch``) and streams one JSON
+summary per line, each tagged with its ``problem`` path, as parses complete.
+
+Set ``PDDLPY_CACHE_DIR`` to reuse parsed models across runs (see
+``pddlpy.cache``).
+
 Exit codes: 0 success; 1 solve found no plan / validate found issues;
 2 bad input (missing file, unknown operator/planner, unsupported
-:requirements).
+:requirements; with --batch, any problem that failed to parse).
 """
 from __future__ import annotations
 
@@ -18,10 +25,12 @@ import json
 import sys
 from typing import List, Optional
 
-from pddlpy.diagnostics import diagnose
-from pddlpy.pddl import DomainProblem
+from pddlpy.cache import default_cache
 from pddlpy.planning import PlannerError, get, registry
-from pddlpy.serialize import domain_problem_dict, operator_dict, plan_dict
+
+# pddlpy.pddl, pddlpy.diagnostics and pddlpy.serialize load the generated
+# ANTLR parser; they are imported in main() once the arguments are valid,
+# so --help and usage errors return without loading it.
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -39,7 +48,16 @@ def build_parser() -> argparse.ArgumentParser:
     ):
         cmd = sub.add_parser(name, help=help_)
         cmd.add_argument("domain", help="path to the domain PDDL file")
-        cmd.add_argument("problem", help="path to the problem PDDL file")
+        if name == "parse":
+            cmd.add_argument("problem", nargs="+",
+                             help="path to the problem PDDL file (with --batch: "
+                                  "problem files and/or directories of them)")
+            cmd.add_argument("--batch", action="store_true",
+                             help="parse every problem in parallel; JSON Lines output")
+            cmd.add_argument("--workers", type=int, default=None,
+                             help="--batch process pool size (default: CPU count)")
+        else:
+            cmd.add_argument("problem", help="path to the problem PDDL file")
         if name == "ground":
             cmd.add_argument("operator", help="operator name to ground")
         if name == "solve":
@@ -53,9 +71,19 @@ def build_parser() -> argparse.ArgumentParser:
 
 
 def main(argv: Optional[List[str]] = None) -> int:
-    args = build_parser().parse_args(argv)
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "parse":
+        if args.batch:
+            return _parse_batch(args)
+        if len(args.problem) > 1:
+            parser.error("parse takes one problem file; use --batch for several")
+        args.problem = args.problem[0]
 
     if args.command == "validate":
+        from pddlpy.diagnostics import diagnose
+
         try:
             result = diagnose(args.domain, args.problem)
         except FileNotFoundError as exc:
@@ -64,8 +92,11 @@ def main(argv: Optional[List[str]] = None) -> int:
         print(json.dumps(result, indent=2))
         return 0 if not result["issues"] else 1
 
+    from pddlpy.pddl import DomainProblem
+    from pddlpy.serialize import domain_problem_dict, operator_dict, plan_dict
+
     try:
-        dp = DomainProblem(args.domain, args.problem)
+        dp = DomainProblem(args.domain, args.problem, cache=default_cache())
     except FileNotFoundError as exc:
         print("pddlpy: error: %s" % exc, file=sys.stderr)
         return 2
@@ -98,5 +129,27 @@ def main(argv: Optional[List[str]] = None) -> int:
     return 0
 
 
+def _parse_batch(args: argparse.Namespace) -> int:
+    from pddlpy.batch import parse_many, problem_files
+    from pddlpy.serialize import domain_problem_dict
+
+    problems = problem_files(args.problem, exclude=[args.domain])
+    try:
+        results = parse_many(args.domain, problems, workers=args.workers,
+                             cache=default_cache())
+    except (FileNotFoundError, ValueError) as exc:
+        print("pddlpy: error: %s" % exc, file=sys.stderr)
+        return 2
+    failed = False
+    for result in results:
+        if result.problem is None:
+            failed = True
+            line = {"problem": result.path, "error": result.error}
+        else:
+            line = {"problem": result.path, **domain_problem_dict(result.problem)}
+        print(json.dumps(line), flush=True)
+    return 2 if failed else 0
+
+
 if __name__ == "__main__":  # pragma: no cover
     sys.exit(main())
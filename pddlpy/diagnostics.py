@@ -15,12 +15,18 @@ from __future__ import annotations
 
 from typing import Any, Dict, Iterator, List, Set, Tuple
 
-from antlr4 import CommonTokenStream, FileStream
+from antlr4 import ParseTreeWalker
 from antlr4.error.ErrorListener import ErrorListener
 
-from pddlpy.pddl import DomainProblem
-from pddlpy.pddlLexer import pddlLexer
-from pddlpy.pddlParser import pddlParser
+from pddlpy.pddl import (
+    Domain,
+    DomainListener,
+    DomainProblem,
+    ProblemListener,
+    _as_text,
+    _parse_tree,
+    _read_text,
+)
 from pddlpy.planning import DurativeValidationError, atom_tuple, validate_durative_actions
 
 
@@ -35,20 +41,6 @@ class _CollectingErrorListener(ErrorListener):
         self.errors.append("line %d:%d %s" % (line, column, msg))
 
 
-def _syntax_errors(path: str, rule: str) -> List[str]:
-    """Parse ``path`` with the grammar rule ``rule`` ('domain' or 'problem')
-    and return the collected syntax errors."""
-    collector = _CollectingErrorListener()
-    lexer = pddlLexer(FileStream(path, encoding="utf-8"))  # UTF-8 PDDL, #103
-    lexer.removeErrorListeners()
-    lexer.addErrorListener(collector)
-    parser = pddlParser(CommonTokenStream(lexer))
-    parser.removeErrorListeners()
-    parser.addErrorListener(collector)
-    getattr(parser, rule)()
-    return collector.errors
-
-
 def _condition_atoms(dp: DomainProblem) -> Iterator[Tuple[str, Any]]:
     """Yield ``(where, atom)`` for every atom referenced by the model:
     init, goal, and each (durative) action's conditions and effects."""
@@ -82,7 +74,35 @@ def _issue(severity: str, check: str, message: str) -> Dict[str, str]:
 
 
 def diagnose(domainfile: str, problemfile: str) -> Dict[str, Any]:
-    """Validate a domain/problem pair; returns ``{"valid": bool, "issues": [...]}``.
+    """Validate a domain/problem file pair; returns ``{"valid": bool, "issues": [...]}``.
+    Files are read as UTF-8 (#103); see :func:`diagnose_strings`.
+    """
+    return diagnose_strings(_read_text(domainfile), _read_text(problemfile))
+
+
+def diagnose_bytes(domain_data: Any, problem_data: Any) -> Dict[str, Any]:
+    """Validate a domain/problem pair given as UTF-8 encoded buffers
+    (``bytes``, ``bytearray`` or ``memoryview``), as
+    ``DomainProblem.from_bytes`` takes them. A buffer that is not valid
+    UTF-8 is an ``encoding`` error at its byte offset, and skips the other
+    checks; see :func:`diagnose_strings` for the rest.
+    """
+    issues: List[Dict[str, str]] = []
+    texts = []
+    for data, which in ((domain_data, "domain file"), (problem_data, "problem file")):
+        try:
+            texts.append(_as_text(data))
+        except UnicodeDecodeError as err:
+            issues.append(_issue("error", "encoding", "%s: byte %d: invalid UTF-8 (%s)"
+                                 % (which, err.start, err.reason)))
+    if issues:
+        return {"valid": False, "issues": issues}
+    return diagnose_strings(texts[0], texts[1])
+
+
+def diagnose_strings(domain_text: str, problem_text: str) -> Dict[str, Any]:
+    """Validate a domain/problem pair given as PDDL source text; returns
+    ``{"valid": bool, "issues": [...]}`` without touching the filesystem.
 
     Each issue is ``{"severity": "error"|"warning", "check": ..., "message": ...}``.
     ``valid`` is False when any error-severity issue is present (warnings —
@@ -92,14 +112,22 @@ def diagnose(domainfile: str, problemfile: str) -> Dict[str, Any]:
     """
     issues: List[Dict[str, str]] = []
 
-    for path, rule, which in ((domainfile, "domain", "domain file"),
-                              (problemfile, "problem", "problem file")):
-        for err in _syntax_errors(path, rule):
+    # Each file is parsed exactly once: the collecting error listener is
+    # attached to the parse whose tree then builds the model.
+    trees = []
+    for text, rule, which in ((domain_text, "domain", "domain file"),
+                              (problem_text, "problem", "problem file")):
+        collector = _CollectingErrorListener()
+        trees.append(_parse_tree(text, rule, collector))
+        for err in collector.errors:
             issues.append(_issue("error", "syntax", "%s: %s" % (which, err)))
     if issues:
         return {"valid": False, "issues": issues}
 
-    dp = DomainProblem(domainfile, problemfile)
+    domain_model, problem_model = DomainListener(), ProblemListener()
+    ParseTreeWalker().walk(domain_model, trees[0])
+    ParseTreeWalker().walk(problem_model, trees[1])
+    dp = DomainProblem._from_models(Domain._from_listener(domain_model), problem_model)
 
     # Atoms over predicates the domain never declares.
     declared = dp.predicates()
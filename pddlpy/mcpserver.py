@@ -1,12 +1,14 @@
 """MCP server (#86): parse / ground / solve as Model Context Protocol tools.
 
 The runtime counterpart of the static Agent Skill in ``skills/pddlpy/`` —
-an LLM/agent connects over stdio and drives the library through three
-tools that mirror the CLI subcommands (#85) and return the same JSON
-shapes from ``pddlpy.serialize``.
+an LLM/agent connects over stdio and drives the library through tools that
+mirror the CLI subcommands (#85) and return the same JSON shapes from
+``pddlpy.serialize``. ``validate_text`` takes the PDDL source itself, so an
+agent repairing PDDL it wrote need not save it to disk first.
 
 Requires the optional ``mcp`` dependency: ``pip install pddlpy[mcp]``.
-Run with the ``pddlpy-mcp`` console script (stdio transport).
+Run with the ``pddlpy-mcp`` console script (stdio transport). Parsed models
+are cached on disk when ``PDDLPY_CACHE_DIR`` is set (see ``pddlpy.cache``).
 """
 from __future__ import annotations
 
@@ -14,16 +16,19 @@ from typing import Any, Dict
 
 from mcp.server.fastmcp import FastMCP
 
-from pddlpy.diagnostics import diagnose
-from pddlpy.pddl import DomainProblem
+from pddlpy.cache import default_cache
 from pddlpy.planning import get, registry
-from pddlpy.serialize import domain_problem_dict, operator_dict, plan_dict
+
+# The tools import pddlpy.pddl, pddlpy.diagnostics and pddlpy.serialize on
+# first call: they load the generated ANTLR parser, which need not delay the
+# server's start-up handshake.
 
 server = FastMCP(
     "pddlpy",
     instructions=(
-        "Parse, ground and solve PDDL domain/problem pairs. All tools take "
-        "filesystem paths to a domain file and a problem file."
+        "Parse, ground and solve PDDL domain/problem pairs. The tools take "
+        "filesystem paths to a domain file and a problem file, except "
+        "validate_text, which takes the PDDL source text."
     ),
 )
 
@@ -33,7 +38,10 @@ def parse(domain_file: str, problem_file: str) -> Dict[str, Any]:
     """Parse a PDDL domain/problem pair and return an object-model summary:
     requirements, objects, types, predicates, operators, initial state,
     goals, numeric fluents and metric."""
-    dp = DomainProblem(domain_file, problem_file)
+    from pddlpy.pddl import DomainProblem
+    from pddlpy.serialize import domain_problem_dict
+
+    dp = DomainProblem(domain_file, problem_file, cache=default_cache())
     return domain_problem_dict(dp)
 
 
@@ -41,7 +49,10 @@ def parse(domain_file: str, problem_file: str) -> Dict[str, Any]:
 def ground(domain_file: str, problem_file: str, operator: str) -> Dict[str, Any]:
     """Ground one operator of a PDDL domain/problem pair and return every
     grounded instance with its parameters, preconditions and effects."""
-    dp = DomainProblem(domain_file, problem_file)
+    from pddlpy.pddl import DomainProblem
+    from pddlpy.serialize import operator_dict
+
+    dp = DomainProblem(domain_file, problem_file, cache=default_cache())
     if operator not in dp.operators():
         raise ValueError(
             "unknown operator %r; known: %s" % (operator, sorted(dp.operators()))
@@ -62,7 +73,10 @@ def solve(domain_file: str, problem_file: str, planner: str = "astar") -> Dict[s
         raise ValueError(
             "unknown planner %r; known: %s" % (planner, registry.names())
         )
-    dp = DomainProblem(domain_file, problem_file)
+    from pddlpy.pddl import DomainProblem
+    from pddlpy.serialize import plan_dict
+
+    dp = DomainProblem(domain_file, problem_file, cache=default_cache())
     plan = get(planner).solve(dp)
     return {"planner": planner, **plan_dict(plan)}
 
@@ -74,9 +88,21 @@ def validate(domain_file: str, problem_file: str) -> Dict[str, Any]:
     unknown objects, operators grounding to zero instances, and malformed
     durative actions. Returns {valid, issues:[{severity, check, message}]}.
     Run this after writing or editing PDDL, before ground/solve."""
+    from pddlpy.diagnostics import diagnose
+
     return diagnose(domain_file, problem_file)
 
 
+@server.tool()
+def validate_text(domain: str, problem: str) -> Dict[str, Any]:
+    """Like validate, for PDDL given as text rather than file paths: pass the
+    full domain and problem source. Returns {valid, issues:[{severity,
+    check, message}]}."""
+    from pddlpy.diagnostics import diagnose_strings
+
+    return diagnose_strings(domain, problem)
+
+
 def main() -> None:
     """Run the server on stdio."""
     server.run()
@@ -0,0 +1,223 @@
+"""Parallel grounding of a problem's operators over a process pool.
+
+Building a :class:`~pddlpy.planning.GroundedTask` grounds every operator
+binding in one interpreter, and for large problems substituting the
+bindings into the operators' atoms and condition trees dominates. With
+``GroundedTask(dp, workers=4)`` (or ``registry.get("astar", workers=4)``)
+that work is spread over a process pool instead::
+
+    from pddlpy.parallel import ground_parallel
+
+    actions = ground_parallel(dp, workers=4)   # the same list as sequential
+
+The parent only cuts the work into tasks, without binding anything: one
+per operator, except that an operator with a large share of the (cartesian)
+bindings is split by partitioning the domain of its first parameter, each
+task taking the bindings of some of its values. Each worker gets the domain
+and problem models and the binder once, when it starts; per operator it
+runs the binder's join once, keeps the bindings of its task's values and
+returns one compact, picklable :class:`GroundRecord` for each, with its
+position in the join. The parent turns them back into ``Operator``
+instances in exactly the order ``ground_operator`` yields them, so plans and
+their tie-breaking do not depend on ``workers``. The binder is sent to the
+workers, so it must pickle; a :class:`~pddlpy.binding.ReachabilityBinder`
+redoes its analysis in each.
+"""
+from __future__ import annotations
+
+import gc
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, cast
+
+from pddlpy.binding import VariableBinder
+from pddlpy.pddl import (
+    CondEffect,
+    Condition,
+    Domain,
+    DomainProblem,
+    GroundAtom,
+    NumericConstraint,
+    NumericEffect,
+    Operator,
+)
+
+#: Tasks per worker the operators are cut into, so that one slow task does
+#: not leave the other workers idle at the end.
+_TASKS_PER_WORKER = 4
+
+#: The problem a worker process grounds against, set by :func:`_start`.
+_problem: Optional[DomainProblem] = None
+
+#: A worker's bindings of each operator it has joined, in binder order.
+_bindings: Dict[str, List[Dict[str, str]]] = {}
+
+#: One task: an operator name, and which of ``parts`` groups of its first
+#: parameter's values to ground (``0`` of ``1`` for all of its bindings).
+Task = Tuple[str, int, int]
+
+
+class GroundRecord(NamedTuple):
+    """One grounded operator, as plain tuples: what a worker sends back.
+    ``args`` are the parameter values in the operator's parameter order;
+    ``precondition`` is set only when it is not a simple conjunction, and
+    ``cond`` only for conditional effects."""
+    name: str
+    args: Tuple[str, ...]
+    pre_pos: Tuple[GroundAtom, ...]
+    pre_neg: Tuple[GroundAtom, ...]
+    add: Tuple[GroundAtom, ...]
+    dele: Tuple[GroundAtom, ...]
+    pre_num: Tuple[NumericConstraint, ...]
+    num: Tuple[NumericEffect, ...]
+    precondition: Optional[Condition]
+    cond: Tuple[CondEffect, ...]
+
+
+def to_record(gop: Operator) -> GroundRecord:
+    """The :class:`GroundRecord` of grounded operator ``gop``. The
+    precondition tree of a simple conjunction is left out: the flat sets
+    say the same, and the tree is cheaper to ground again than to unpickle."""
+    return GroundRecord(
+        cast(str, gop.operator_name), tuple(cast(Dict[str, str], gop.variable_list).values()),
+        tuple(gop.precondition_pos), tuple(gop.precondition_neg),
+        tuple(gop.effect_pos), tuple(gop.effect_neg),
+        tuple(gop.precondition_num), tuple(gop.effect_num),
+        None if gop.simple_conjunction else gop.precondition,
+        tuple(gop.conditional_effects))
+
+
+def from_record(record: GroundRecord, op: Operator, dp: DomainProblem) -> Operator:
+    """Rebuild the grounded ``Operator`` of ``record``; ``op`` is the lifted
+    operator of ``dp`` it was grounded from."""
+    binding = dict(zip(op.variable_list, record.args))
+    gop = Operator(record.name)
+    gop.variable_list = cast(Dict[str, Optional[str]], binding)
+    gop.precondition_connective = op.precondition_connective
+    gop.simple_conjunction = op.simple_conjunction
+    gop.precondition_pos = set(record.pre_pos)
+    gop.precondition_neg = set(record.pre_neg)
+    gop.effect_pos = set(record.add)
+    gop.effect_neg = set(record.dele)
+    gop.precondition_num = list(record.pre_num)
+    gop.effect_num = list(record.num)
+    gop.precondition = record.precondition
+    if op.simple_conjunction and op.precondition_tree is not None:
+        gop.precondition = op.precondition_tree.ground(binding, dp)
+    gop.conditional_effects = list(record.cond)
+    return gop
+
+
+def ground_parallel(dp: DomainProblem, workers: Optional[int] = None) -> List[Operator]:
+    """Ground every operator of ``dp``, as ``ground_operator`` over
+    ``operators()`` does, across ``workers`` processes.
+
+    workers -- size of the process pool; ``None`` uses every CPU and ``1``
+               runs the same tasks, records included, in this process.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    tasks = partition(dp, workers * _TASKS_PER_WORKER)
+    if workers == 1:
+        bindings: Dict[str, List[Dict[str, str]]] = {}
+        results = [_run(dp, bindings, task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_start,
+                                 initargs=(dp.domain, dp.problem, dp.binder)) as pool:
+            results = list(pool.map(_ground, tasks))
+    operators = dp.domain.operators
+    slots: Dict[str, Dict[int, Operator]] = {name: {} for name in dp.operators()}
+    with _paused_gc():
+        for (name, _, _), (positions, records) in zip(tasks, results):
+            op, slot = operators[name], slots[name]
+            for i, record in zip(positions, records):
+                slot[i] = from_record(record, op, dp)
+    return [slot[i] for slot in slots.values() for i in sorted(slot)]
+
+
+def partition(dp: DomainProblem, target: int) -> List[Task]:
+    """Cut the operators of ``dp`` into about ``target`` tasks, in
+    ``operators()`` order, without binding them.
+
+    An operator gets a share of the tasks proportional to its number of
+    cartesian bindings, at most one per value of its first parameter; with
+    more than one, each task takes the bindings of a contiguous group of
+    those values (see :func:`_owners`).
+    """
+    operators = dp.domain.operators
+    sizes = {name: _cartesian(dp, op) for name, op in operators.items()}
+    total = max(1, sum(sizes.values()))
+    tasks: List[Task] = []
+    for name, op in operators.items():
+        parts = max(1, min(len(_first_values(dp, op)), -(-target * sizes[name] // total)))
+        tasks.extend((name, part, parts) for part in range(parts))
+    return tasks
+
+
+def _cartesian(dp: DomainProblem, op: Operator) -> int:
+    """The number of bindings of ``op`` before any pruning."""
+    size = 1
+    for t in op.variable_list.values():
+        size *= len(dp.candidate_objects(t))
+    return size
+
+
+def _first_values(dp: DomainProblem, op: Operator) -> List[str]:
+    """The objects that can bind the first parameter of ``op``, if any."""
+    return dp.candidate_objects(next(iter(op.variable_list.values()))) if op.variable_list else []
+
+
+def _owners(dp: DomainProblem, op: Operator, parts: int) -> Dict[str, int]:
+    """Which of ``parts`` tasks grounds the bindings of each value of the
+    first parameter of ``op``: contiguous groups, in candidate order. A
+    value the binder yields outside them goes to task ``0``."""
+    values = _first_values(dp, op)
+    return {value: k * parts // len(values) for k, value in enumerate(values)}
+
+
+def _run(dp: DomainProblem, bindings: Dict[str, List[Dict[str, str]]],
+         task: Task) -> Tuple[List[int], List[GroundRecord]]:
+    """Ground one task: the binder-order positions of its bindings within
+    the operator, and their records. ``bindings`` memoizes the binder's
+    join of each operator across the tasks run with it."""
+    name, part, parts = task
+    op = dp.domain.operators[name]
+    rows = bindings.get(name)
+    if rows is None:
+        rows = bindings[name] = list(dp.binder.bind(dp, op))
+    if parts == 1:
+        positions = list(range(len(rows)))
+    else:
+        first = next(iter(op.variable_list))
+        owner = _owners(dp, op, parts)
+        positions = [i for i, row in enumerate(rows) if owner.get(row[first], 0) == part]
+    with _paused_gc():
+        return positions, [to_record(dp.ground_binding(name, rows[i])) for i in positions]
+
+
+@contextmanager
+def _paused_gc() -> Iterator[None]:
+    """Pause the cyclic collector while building many acyclic objects: left
+    on, its passes over the growing heap cost more than the building."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _start(domain: Any, problem: Any,
+           binder: VariableBinder) -> None:  # pragma: no cover - runs in the workers
+    """Worker initializer: attach the models and binder shipped once per process."""
+    global _problem
+    _problem = DomainProblem._from_models(Domain._from_listener(domain), problem, binder)
+
+
+def _ground(task: Task) -> Tuple[List[int], List[GroundRecord]]:  # pragma: no cover - runs in the workers
+    """Worker entry point: ground one task into positions and records."""
+    return _run(cast(DomainProblem, _problem), _bindings, task)
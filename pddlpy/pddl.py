@@ -34,6 +34,7 @@ from typing import (
     AbstractSet,
     Any,
     Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -43,12 +44,18 @@ from typing import (
     cast,
 )
 
-from antlr4 import CommonTokenStream, FileStream, ParseTreeWalker
+from antlr4 import CommonTokenStream, InputStream, ParseTreeWalker
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorListener import ConsoleErrorListener
+from antlr4.error.Errors import ParseCancellationException
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
 
-from .binding import CartesianBinder, StaticPrunedBinder, VariableBinder
+from .binding import FactIndex, StaticPrunedBinder, VariableBinder
+from .cache import ParseCache
 from .pddlLexer import pddlLexer
 from .pddlListener import pddlListener
 from .pddlParser import pddlParser
+from .symbols import SymbolTable
 
 #: A binding of variable names to values, e.g. {"?x": "a"}.
 VarVals = Dict[str, str]
@@ -267,6 +274,12 @@ class Condition():
         """Predicate literals referenced anywhere in this subtree (diagnostics)."""
         return iter(())
 
+    def conjuncts(self) -> Tuple[List[Atom], List[Atom]]:
+        """The ``(positive, negative)`` literals this condition guarantees:
+        those reached from the root through ``and`` nodes only, which every
+        state satisfying it must agree with. The binders prune on them."""
+        return [], []
+
 
 class Lit(Condition):
     """A predicate literal, e.g. ``(on ?x ?y)``."""
@@ -283,6 +296,9 @@ class Lit(Condition):
     def atoms(self) -> Iterator[Atom]:
         yield self.atom
 
+    def conjuncts(self) -> Tuple[List[Atom], List[Atom]]:
+        return [self.atom], []
+
     def __repr__(self) -> str:
         return repr(self.atom)
 
@@ -305,6 +321,9 @@ class Not(Condition):
     def atoms(self) -> Iterator[Atom]:
         yield from self.child.atoms()
 
+    def conjuncts(self) -> Tuple[List[Atom], List[Atom]]:
+        return ([], [self.child.atom]) if isinstance(self.child, Lit) else ([], [])
+
     def __repr__(self) -> str:
         return "(not %r)" % (self.child,)
 
@@ -328,6 +347,15 @@ class And(Condition):
         for c in self.children:
             yield from c.atoms()
 
+    def conjuncts(self) -> Tuple[List[Atom], List[Atom]]:
+        pos: List[Atom] = []
+        neg: List[Atom] = []
+        for c in self.children:
+            p, n = c.conjuncts()
+            pos += p
+            neg += n
+        return pos, neg
+
     def __repr__(self) -> str:
         return "(and %s)" % " ".join(repr(c) for c in self.children)
 
@@ -648,9 +676,10 @@ def _build_condition(gd: Any) -> Condition:
 
 def _is_simple_conjunction(cond: Condition) -> bool:
     """True if ``cond`` is a plain conjunction of literals / negated literals /
-    numeric constraints — the shape the static-pruning binder can join safely.
-    Anything with a disjunction, quantifier, equality or nested negation forces
-    the binder onto the full cartesian product."""
+    numeric constraints, whose flat ``precondition_pos`` / ``precondition_neg``
+    summary the binders can join directly. For anything with a disjunction,
+    quantifier, equality or nested negation they join only the tree's
+    guaranteed ``conjuncts()`` and expand the remaining parameters."""
     if isinstance(cond, (Lit, NumericCond)):
         return True
     if isinstance(cond, Not):
@@ -814,6 +843,10 @@ class DurativeAction():
         condition_pos / condition_neg -- dicts keyed by 'start'/'over'/'end',
                     each a set of (grounded: tuple / ungrounded: Atom) condition
                     atoms.
+        condition_trees -- (lifted) dict keyed like condition_pos, each a
+                    list of the Condition trees of that time point's timed
+                    conditions; the binders prune on their guaranteed
+                    conjuncts, as for an Operator's precondition_tree.
         effect_pos / effect_neg -- dicts keyed by 'start'/'end', each a set of
                     effect atoms to add / delete at that time point.
     """
@@ -826,6 +859,7 @@ class DurativeAction():
         self.duration: Optional[float] = None
         self.condition_pos: Dict[str, set] = {t: set() for t in self.CONDITION_TIMES}
         self.condition_neg: Dict[str, set] = {t: set() for t in self.CONDITION_TIMES}
+        self.condition_trees: Dict[str, List[Condition]] = {t: [] for t in self.CONDITION_TIMES}
         self.effect_pos: Dict[str, set] = {t: set() for t in self.EFFECT_TIMES}
         self.effect_neg: Dict[str, set] = {t: set() for t in self.EFFECT_TIMES}
 
@@ -937,6 +971,7 @@ class DomainListener(pddlListener):
         da = self.scopes[-1]
         da.condition_pos[time] |= set(scope.atoms)
         da.condition_neg[time] |= set(scope.negatoms)
+        da.condition_trees[time].append(_build_condition(ctx.goalDesc()))
 
     def enterTimedEffect(self, ctx):
         # (at start|end cEffect): collect the effect atoms into a fresh Scope.
@@ -1195,10 +1230,336 @@ class ProblemListener(pddlListener):
             self.objects = dict( vs )
 
 
+def _read_text(path: str) -> str:
+    """Read a PDDL file as UTF-8 text. ANTLR's FileStream defaults to ASCII;
+    PDDL files may carry UTF-8 (typically in comments) -- see #103. Bytes are
+    decoded without newline translation, exactly as FileStream would."""
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8")
+
+
+def _parse_tree(text: str, rule: str, error_listener: Any = None,
+                sll: bool = True) -> Any:
+    """Lex and parse ``text`` with the grammar rule ``rule`` ('domain' or
+    'problem') and return the parse tree. With ``error_listener``, syntax
+    errors are reported to it instead of ANTLR's default stderr console.
+
+    Parsing is two-stage: the fast SLL prediction mode with a bail-out error
+    strategy first, and only if that fails -- a syntax error, or input SLL
+    cannot decide -- a rewind and full LL reparse with the usual error
+    reporting and recovery. ``sll=False`` goes straight to LL.
+    """
+    lexer = pddlLexer(InputStream(text))
+    if error_listener is not None:
+        lexer.removeErrorListeners()
+        lexer.addErrorListener(error_listener)
+    stream = CommonTokenStream(lexer)
+    parser = pddlParser(stream)
+    if sll:
+        parser.removeErrorListeners()
+        parser._errHandler = BailErrorStrategy()
+        parser._interp.predictionMode = PredictionMode.SLL
+        try:
+            return getattr(parser, rule)()
+        except ParseCancellationException:
+            parser.reset()  # rewinds the token stream; tokens are not re-lexed
+            parser.addErrorListener(ConsoleErrorListener.INSTANCE)
+            parser._errHandler = DefaultErrorStrategy()
+            parser._interp.predictionMode = PredictionMode.LL
+    if error_listener is not None:
+        parser.removeErrorListeners()
+        parser.addErrorListener(error_listener)
+    return getattr(parser, rule)()
+
+
+def _walk(text: str, rule: str, listener: Any) -> Any:
+    """Parse ``text`` (see ``_parse_tree``) and walk the tree with
+    ``listener``, which is returned."""
+    ParseTreeWalker().walk(listener, _parse_tree(text, rule))
+    return listener
+
+
+#: Parser backends accepted by ``DomainProblem(backend=...)``.
+BACKENDS = ("antlr", "sexpr")
+
+
+def _parse(text: str, rule: str, listener_cls: Any, backend: str) -> Any:
+    """Build the ``rule`` model of ``text`` with ``backend``. The S-expression
+    fast path hands anything it does not accept (including every syntax
+    error) back to ANTLR, which owns error reporting and recovery."""
+    if backend == "sexpr":
+        from . import sexpr  # sexpr builds on the model classes defined here
+        try:
+            return sexpr.build(text, rule)
+        except sexpr.Unsupported:
+            pass
+    return _walk(text, rule, listener_cls())
+
+
+def _as_text(data: Any) -> str:
+    """Decode an in-memory PDDL buffer (bytes, bytearray or memoryview) as
+    UTF-8, the encoding files are read with (#103)."""
+    return str(data, "utf-8")
+
+
+def _load_text(text: str, rule: str, listener_cls: Any,
+               cache: Optional[ParseCache], backend: str = "antlr") -> Any:
+    """Parse ``text`` into a fresh ``listener_cls`` model, going through
+    ``cache`` (keyed by the content) when one is given. Both backends build
+    the same model, so cache entries are shared."""
+    if cache is None:
+        return _parse(text, rule, listener_cls, backend)
+    key = cache.key(rule, text)
+    model = cache.load(key)
+    if model is None:
+        model = _parse(text, rule, listener_cls, backend)
+        cache.store(key, model)
+    return model
+
+
+def _load(path: str, rule: str, listener_cls: Any,
+          cache: Optional[ParseCache], backend: str = "antlr") -> Any:
+    """Parse the file at ``path``; see ``_load_text``."""
+    return _load_text(_read_text(path), rule, listener_cls, cache, backend)
+
+
+class _TrackedDict(dict):
+    """A dict that counts its mutations, so an index derived from it can tell
+    when it has gone stale (see ``_tracked``)."""
+
+    version = 0
+
+    def _bump(self) -> None:
+        self.version += 1
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._bump()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        self._bump()
+        super().__delitem__(key)
+
+    def __ior__(self, other: Any) -> "_TrackedDict":  # type: ignore[override,misc]
+        self._bump()
+        return super().__ior__(other)
+
+    def clear(self) -> None:
+        self._bump()
+        super().clear()
+
+    def pop(self, *args: Any) -> Any:
+        self._bump()
+        return super().pop(*args)
+
+    def popitem(self) -> Any:
+        self._bump()
+        return super().popitem()
+
+    def setdefault(self, *args: Any) -> Any:
+        self._bump()
+        return super().setdefault(*args)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self._bump()
+        super().update(*args, **kwargs)
+
+
+class _TrackedSet(set):
+    """A set that counts its mutations, as ``_TrackedDict`` does (see
+    ``_tracked_set``)."""
+
+    version = 0
+
+    def _bump(self) -> None:
+        self.version += 1
+
+    def add(self, item: Any) -> None:
+        self._bump()
+        super().add(item)
+
+    def discard(self, item: Any) -> None:
+        self._bump()
+        super().discard(item)
+
+    def remove(self, item: Any) -> None:
+        self._bump()
+        super().remove(item)
+
+    def pop(self) -> Any:
+        self._bump()
+        return super().pop()
+
+    def clear(self) -> None:
+        self._bump()
+        super().clear()
+
+    def update(self, *others: Any) -> None:
+        self._bump()
+        super().update(*others)
+
+    def difference_update(self, *others: Any) -> None:
+        self._bump()
+        super().difference_update(*others)
+
+    def intersection_update(self, *others: Any) -> None:
+        self._bump()
+        super().intersection_update(*others)
+
+    def symmetric_difference_update(self, other: Any) -> None:
+        self._bump()
+        super().symmetric_difference_update(other)
+
+    def __ior__(self, other: Any) -> "_TrackedSet":  # type: ignore[override,misc]
+        self._bump()
+        return super().__ior__(other)  # type: ignore[return-value]
+
+    def __iand__(self, other: Any) -> "_TrackedSet":  # type: ignore[override,misc]
+        self._bump()
+        return super().__iand__(other)  # type: ignore[return-value]
+
+    def __isub__(self, other: Any) -> "_TrackedSet":  # type: ignore[override,misc]
+        self._bump()
+        return super().__isub__(other)  # type: ignore[return-value]
+
+    def __ixor__(self, other: Any) -> "_TrackedSet":  # type: ignore[override,misc]
+        self._bump()
+        return super().__ixor__(other)  # type: ignore[return-value]
+
+
+def _tracked(owner: Any, attr: str) -> _TrackedDict:
+    """``owner.<attr>`` as a ``_TrackedDict``, swapped in for a plain dict on
+    first use (and again if the attribute is later reassigned)."""
+    d = getattr(owner, attr)
+    if not isinstance(d, _TrackedDict):
+        d = _TrackedDict(d)
+        setattr(owner, attr, d)
+    return d
+
+
+def _tracked_set(owner: Any, attr: str) -> _TrackedSet:
+    """``owner.<attr>`` as a ``_TrackedSet``, as ``_tracked`` does for dicts."""
+    s = getattr(owner, attr)
+    if not isinstance(s, _TrackedSet):
+        s = _TrackedSet(s)
+        setattr(owner, attr, s)
+    return s
+
+
+def _check_backend(backend: str) -> None:
+    if backend not in BACKENDS:
+        raise ValueError("unknown parser backend %r (expected one of %s)"
+                         % (backend, ", ".join(BACKENDS)))
+
+
+class Domain():
+    """A parsed PDDL domain that many problems can share (see
+    ``DomainProblem.from_domain``). The domain file is parsed once; data
+    derived from it — the static predicates and the subtype closure — is
+    computed on first use and then reused by every attached problem.
+
+    The model is shared read-only: mutating ``listener`` after problems have
+    been attached affects all of them and is not reflected in data already
+    derived.
+
+    Attributes:
+        listener -- the ``DomainListener`` model (``DomainProblem.domain``).
+        cache / backend -- how the domain was parsed; problems attached
+                    with ``from_domain`` are parsed the same way.
+    """
+
+    def __init__(self, domainfile: str, cache: Optional[ParseCache] = None,
+                 backend: str = "antlr") -> None:
+        _check_backend(backend)
+        self._setup(_load(domainfile, "domain", DomainListener, cache, backend),
+                    cache, backend)
+
+    @classmethod
+    def from_string(cls, text: str, cache: Optional[ParseCache] = None,
+                    backend: str = "antlr") -> "Domain":
+        """Parse a domain from PDDL source text instead of a file."""
+        _check_backend(backend)
+        return cls._from_listener(_load_text(text, "domain", DomainListener, cache, backend),
+                                  cache, backend)
+
+    @classmethod
+    def _from_listener(cls, listener: Any, cache: Optional[ParseCache] = None,
+                       backend: str = "antlr") -> "Domain":
+        domain = cls.__new__(cls)
+        domain._setup(listener, cache, backend)
+        return domain
+
+    def _setup(self, listener: Any, cache: Optional[ParseCache], backend: str) -> None:
+        self.cache = cache
+        self.backend = backend
+        self.listener = listener
+        self._static: Optional[frozenset] = None
+        self._closure: Any = None
+        self._closure_key: Tuple[Any, int] = (None, -1)
+
+    def problems(self, problemfiles: Iterable[str],
+                 binder: Optional[VariableBinder] = None) -> Iterator["DomainProblem"]:
+        """Yield a ``DomainProblem`` per problem file, in order, all sharing
+        this domain. Problems are parsed lazily as the iterator advances."""
+        for problemfile in problemfiles:
+            yield DomainProblem.from_domain(self, problemfile, binder)
+
+    def static_predicates(self) -> frozenset:
+        """Declared predicates that no action adds or deletes (#12); see
+        ``DomainProblem.static_predicates``."""
+        if self._static is None:
+            modified = set()
+            for op in self.listener.operators.values():
+                # Walk the effect tree so predicates touched only inside a
+                # conditional (when) or universal (forall) effect are still
+                # counted as modified, hence non-static (#10).
+                if op.effect_tree is not None:
+                    modified |= op.effect_tree.predicates()
+            for da in self.listener.durative_operators.values():
+                for time in da.EFFECT_TIMES:
+                    for a in da.effect_pos[time] | da.effect_neg[time]:
+                        modified.add(a.predicate[0])
+            self._static = frozenset(set(self.listener.predicates) - modified)
+        return self._static
+
+    def subtypes_of(self, t: str) -> frozenset:
+        """All transitive subtypes of ``t`` (#22), excluding ``t`` itself."""
+        return self.type_closure()[1].get(t, frozenset())
+
+    def type_closure(self) -> Tuple[Dict[str, frozenset], Dict[Any, frozenset]]:
+        """The transitive closure of the type hierarchy, as two maps: each
+        declared type to all its supertypes, and each type to all its
+        subtypes. A chain ends at a type with no declared parent, whose
+        parent (``None`` or an undeclared name) is still included; a cyclic
+        hierarchy makes the types on the cycle their own supertypes.
+
+        Built in one pass over the hierarchy and rebuilt only after
+        ``listener.types`` is mutated or reassigned.
+        """
+        types = _tracked(self.listener, "types")
+        if self._closure_key[0] is not types or self._closure_key[1] != types.version:
+            supertypes: Dict[str, frozenset] = {}
+            subtypes: Dict[Any, Set[str]] = {}
+            for sub, sup in types.items():
+                chain = set()
+                while sup not in chain:
+                    chain.add(sup)
+                    subtypes.setdefault(sup, set()).add(sub)
+                    if sup not in types:
+                        break
+                    sup = types[sup]
+                supertypes[sub] = frozenset(chain)
+            self._closure = (supertypes, {t: frozenset(s) for t, s in subtypes.items()})
+            self._closure_key = (types, types.version)
+        return self._closure
+
+
 class DomainProblem():
 
     def __init__(self, domainfile: str, problemfile: str,
-                 binder: Optional[VariableBinder] = None) -> None:
+                 binder: Optional[VariableBinder] = None,
+                 cache: Optional[ParseCache] = None,
+                 backend: str = "antlr") -> None:
         """Parses a PDDL domain and problem files and
         returns an object representing them.
 
@@ -1207,27 +1568,74 @@ class DomainProblem():
         binder -- variable binding strategy for ground_operator (#12); defaults
                   to StaticPrunedBinder. Pass a custom VariableBinder, or set
                   the .binder attribute later, to override grounding.
+        cache -- an optional ``pddlpy.cache.ParseCache``; when given, each
+                 file's parsed model is looked up by content hash and ANTLR
+                 only runs on a miss.
+        backend -- 'antlr' (the default) or 'sexpr', a hand-written
+                   S-expression parser that builds the same model without an
+                   ANTLR parse tree and falls back to ANTLR on anything it
+                   does not accept, including syntax errors.
+        """
+        self._attach(Domain(domainfile, cache, backend),
+                     _load(problemfile, "problem", ProblemListener, cache, backend),
+                     binder)
+
+    @classmethod
+    def from_strings(cls, domain_text: str, problem_text: str,
+                     binder: Optional[VariableBinder] = None,
+                     cache: Optional[ParseCache] = None,
+                     backend: str = "antlr") -> "DomainProblem":
+        """Parse a domain and a problem from PDDL source text, with no
+        filesystem round trip. The other arguments are as for the
+        constructor.
+        """
+        return cls._from_models(
+            Domain.from_string(domain_text, cache, backend),
+            _load_text(problem_text, "problem", ProblemListener, cache, backend),
+            binder)
+
+    @classmethod
+    def from_bytes(cls, domain_data: Any, problem_data: Any,
+                   binder: Optional[VariableBinder] = None,
+                   cache: Optional[ParseCache] = None,
+                   backend: str = "antlr") -> "DomainProblem":
+        """Like ``from_strings`` for UTF-8 encoded buffers: ``bytes``,
+        ``bytearray`` or ``memoryview``.
         """
-        # domain
-        # ANTLR's FileStream defaults to ASCII; PDDL files may carry UTF-8
-        # (typically in comments) -- see #103.
-        inp = FileStream(domainfile, encoding="utf-8")
-        lexer = pddlLexer(inp)
-        stream = CommonTokenStream(lexer)
-        parser = pddlParser(stream)
-        tree = parser.domain()
-        self.domain = DomainListener()
-        walker = ParseTreeWalker()
-        walker.walk(self.domain, tree)
-        # problem
-        inp = FileStream(problemfile, encoding="utf-8")
-        lexer = pddlLexer(inp)
-        stream = CommonTokenStream(lexer)
-        parser = pddlParser(stream)
-        tree = parser.problem()
-        self.problem = ProblemListener()
-        walker = ParseTreeWalker()
-        walker.walk(self.problem, tree)
+        return cls.from_strings(_as_text(domain_data), _as_text(problem_data),
+                                binder, cache, backend)
+
+    @classmethod
+    def from_domain(cls, domain: "Domain", problemfile: str,
+                    binder: Optional[VariableBinder] = None) -> "DomainProblem":
+        """Pair an already-parsed ``Domain`` with a problem file, parsing only
+        the problem (with the domain's cache and backend). The domain model
+        and its derived data are shared, read-only, by every problem attached
+        to it; see ``Domain.problems`` for the batch form.
+        """
+        return cls._from_models(
+            domain,
+            _load(problemfile, "problem", ProblemListener, domain.cache, domain.backend),
+            binder)
+
+    @classmethod
+    def _from_models(cls, domain: "Domain", problem: Any,
+                     binder: Optional[VariableBinder] = None) -> "DomainProblem":
+        dp = cls.__new__(cls)
+        dp._attach(domain, problem, binder)
+        return dp
+
+    def _attach(self, domain: "Domain", problem: Any,
+                binder: Optional[VariableBinder]) -> None:
+        self._shared = domain
+        self.domain = domain.listener
+        self.problem = problem
+        self._index: Dict[Any, List[str]] = {}
+        self._index_sources: Tuple[Any, ...] = ()
+        self._index_key: Tuple[int, ...] = ()
+        self._symbols: Optional[SymbolTable] = None
+        self._init_index: Optional[FactIndex] = None
+        self._init_key: Tuple[Any, int] = (None, 0)
         # Variable binding strategy used by ground_operator (#12).
         self.binder: VariableBinder = binder if binder is not None else StaticPrunedBinder()
 
@@ -1284,38 +1692,60 @@ class DomainProblem():
         """
         op = self.domain.operators[op_name]
         for st in self.binder.bind( self, op ):
-            gop = Operator(op_name)
-            # grounded values are object names; widen to the field's lifted type
-            gop.variable_list = cast(Dict[str, Optional[str]], st)
-            gop.precondition_connective = op.precondition_connective
-            gop.precondition_pos = set( [ a.ground( st ) for a in op.precondition_pos ] )
-            gop.precondition_neg = set( [ a.ground( st ) for a in op.precondition_neg ] )
-            gop.effect_pos = set( [ a.ground( st ) for a in op.effect_pos ] )
-            gop.effect_neg = set( [ a.ground( st ) for a in op.effect_neg ] )
-            gop.precondition_num = [ c.ground( st ) for c in op.precondition_num ]
-            gop.effect_num = [ e.ground( st ) for e in op.effect_num ]
-            # ADL (#10): ground the full precondition tree (expanding
-            # quantifiers over the world objects) and compile the effect tree
-            # into unconditional + conditional grounded effects.
-            if op.precondition_tree is not None:
-                gop.precondition = op.precondition_tree.ground( st, self )
-            if op.effect_tree is not None:
-                out = GroundEffects()
-                op.effect_tree.compile( st, self, out, None )
-                gop.effect_pos = out.add
-                gop.effect_neg = out.dele
-                gop.effect_num = out.num
-                gop.conditional_effects = out.cond
-            yield gop
+            yield self.ground_binding( op_name, st )
+
+    def ground_operators(self, workers: Optional[int] = None) -> List[Operator]:
+        """Returns a list of every grounded operator, in the order
+        ground_operator yields them for each of operators() in turn.
+
+        workers -- when set, ground over a process pool of that size with
+                   pddlpy.parallel.ground_parallel; the list is the same.
+        """
+        if workers is None:
+            return [gop for name in self.operators() for gop in self.ground_operator(name)]
+        from .parallel import ground_parallel  # parallel builds on this module
+        return ground_parallel(self, workers)
+
+    def ground_binding(self, op_name: str, binding: Dict[str, str]) -> Operator:
+        """Returns the Operator instance grounding action ``op_name`` under
+        one ``{param_name: object_name}`` binding, as ground_operator yields
+        it. The binding is not checked against the binder.
+        """
+        op = self.domain.operators[op_name]
+        gop = Operator(op_name)
+        # grounded values are object names; widen to the field's lifted type
+        gop.variable_list = cast(Dict[str, Optional[str]], binding)
+        gop.precondition_connective = op.precondition_connective
+        gop.simple_conjunction = op.simple_conjunction
+        gop.precondition_pos = set( [ a.ground( binding ) for a in op.precondition_pos ] )
+        gop.precondition_neg = set( [ a.ground( binding ) for a in op.precondition_neg ] )
+        gop.effect_pos = set( [ a.ground( binding ) for a in op.effect_pos ] )
+        gop.effect_neg = set( [ a.ground( binding ) for a in op.effect_neg ] )
+        gop.precondition_num = [ c.ground( binding ) for c in op.precondition_num ]
+        gop.effect_num = [ e.ground( binding ) for e in op.effect_num ]
+        # ADL (#10): ground the full precondition tree (expanding
+        # quantifiers over the world objects) and compile the effect tree
+        # into unconditional + conditional grounded effects.
+        if op.precondition_tree is not None:
+            gop.precondition = op.precondition_tree.ground( binding, self )
+        if op.effect_tree is not None:
+            out = GroundEffects()
+            op.effect_tree.compile( binding, self, out, None )
+            gop.effect_pos = out.add
+            gop.effect_neg = out.dele
+            gop.effect_num = out.num
+            gop.conditional_effects = out.cond
+        return gop
 
     def ground_durative_operator(self, op_name: str) -> Iterator[DurativeAction]:
         """Returns an iterator of grounded DurativeAction instances (#23).
 
-        Durative actions always use the cartesian binder: their conditions are
-        time-tagged and static-precondition pruning does not apply.
+        Bindings come from the binder's ``bind_durative``: the default binder
+        joins the static conditions of every time point against the initial
+        state, as for instantaneous actions.
         """
         op = self.domain.durative_operators[op_name]
-        for st in CartesianBinder().bind( self, op ):
+        for st in self.binder.bind_durative( self, op ):
             yield op.ground( st )
 
     def _is_subtype(self, ot, t):
@@ -1329,39 +1759,45 @@ class DomainProblem():
         # the implicit None root and match an untyped parameter.
         if t is None:
             return ot is None
-        seen = set()
-        while ot is not None and ot not in seen:
-            if ot == t:
-                return True
-            seen.add(ot)
-            ot = self.domain.types.get(ot)
-        return False
+        return ot == t or t in self._shared.type_closure()[0].get(ot, ())
 
     def candidate_objects(self, t) -> List[str]:
         """Returns the objects that can bind a parameter of type ``t``: any
         object whose type is ``t`` or a (transitive) subtype of it (#22).
         Used by the variable binders (#12).
         """
-        return [ k for k,v in self.worldobjects().items() if self._is_subtype(v, t) ]
+        return list(self._objects_by_type().get(t, ()))
+
+    def _objects_by_type(self) -> Dict[Any, List[str]]:
+        """Index of ``candidate_objects`` for every type at once: each object
+        is filed under its own type and all its supertypes, untyped objects
+        under ``None``. Rebuilt only when the objects or the type hierarchy
+        change."""
+        supertypes = self._shared.type_closure()[0]
+        dobjs = _tracked(self.domain, "objects")
+        pobjs = _tracked(self.problem, "objects")
+        # The index holds its sources, so their ids stay unique while it lives.
+        sources = (supertypes, dobjs, pobjs)
+        key = (*map(id, sources), dobjs.version, pobjs.version)
+        if key != self._index_key:
+            index: Dict[Any, List[str]] = {}
+            for obj, ot in self.worldobjects().items():
+                index.setdefault(ot, []).append(obj)
+                if ot is not None:
+                    for sup in supertypes.get(ot, ()):
+                        if sup is not None and sup != ot:
+                            index.setdefault(sup, []).append(obj)
+            self._index, self._index_sources, self._index_key = index, sources, key
+        return self._index
 
     def static_predicates(self) -> set:
         """Returns the set of static predicate names (#12): predicates declared
         in the domain that no action (instantaneous or durative) ever adds or
         deletes. Their truth is fixed by the initial state, so the grounder can
-        use them to prune bindings that can never become applicable.
+        use them to prune bindings that can never become applicable. Computed
+        once per ``Domain``.
         """
-        modified = set()
-        for op in self.domain.operators.values():
-            # Walk the effect tree so predicates touched only inside a
-            # conditional (when) or universal (forall) effect are still counted
-            # as modified, hence non-static (#10).
-            if op.effect_tree is not None:
-                modified |= op.effect_tree.predicates()
-        for da in self.domain.durative_operators.values():
-            for time in da.EFFECT_TIMES:
-                for a in da.effect_pos[time] | da.effect_neg[time]:
-                    modified.add(a.predicate[0])
-        return set(self.domain.predicates) - modified
+        return set(self._shared.static_predicates())
 
     def types(self) -> Dict[str, Optional[str]]:
         """Returns the declared type hierarchy as a dict mapping each subtype to
@@ -1376,24 +1812,26 @@ class DomainProblem():
         ``t`` itself. E.g. for the logistics hierarchy ``subtypes_of('physobj')``
         is ``{'package', 'vehicle', 'truck', 'airplane'}``.
         """
-        hierarchy = self.domain.types
-        result = set()
-        changed = True
-        while changed:
-            changed = False
-            for sub, sup in hierarchy.items():
-                if sub in result:
-                    continue
-                if sup == t or sup in result:
-                    result.add(sub)
-                    changed = True
-        return result
+        return set(self._shared.subtypes_of(t))
 
     def initialstate(self) -> set:
         """Returns a set of atoms (Atom objects) corresponding to the initial
         state defined in the problem file.
         """
-        return self.problem.initialstate
+        return _tracked_set(self.problem, "initialstate")
+
+    def init_index(self) -> FactIndex:
+        """Returns the initial-state atoms, as ground tuples, in a
+        ``FactIndex`` (by predicate and by argument) for the binders' joins.
+        Built on first use; rebuilt if the initial state is replaced or
+        mutated.
+        """
+        init = _tracked_set(self.problem, "initialstate")
+        source, version = self._init_key
+        if self._init_index is None or source is not init or version != init.version:
+            self._init_index = FactIndex(a.ground({}) for a in init)
+            self._init_key = (init, init.version)
+        return self._init_index
 
     def goals(self) -> set:
         """Returns a set of atoms (Atom objects) corresponding to the goals
@@ -1405,7 +1843,25 @@ class DomainProblem():
         """Returns a dictionary of key value pairs where the key is the name of
         an object and the value is it's type (None in case is untyped.)
         """
-        return dict( self.domain.objects.items() | self.problem.objects.items() )
+        return {**self.domain.objects, **self.problem.objects}
+
+    def symbols(self) -> SymbolTable:
+        """Returns the symbol table of this problem: dense integer IDs for its
+        predicates, objects and ground atoms, used by the planning layer
+        instead of string tuples. Created on first use — seeded, in sorted
+        order, with the declared predicates, the world objects and the
+        initial-state atoms — and extended as actions are grounded against it.
+        """
+        if self._symbols is None:
+            table = SymbolTable()
+            for name in sorted(self.domain.predicates):
+                table.predicate_id(name)
+            for name in sorted(self.worldobjects()):
+                table.object_id(name)
+            for atom in sorted(tuple(a.predicate) for a in self.initialstate()):
+                table.atom_id(atom)
+            self._symbols = table
+        return self._symbols
 
 
 
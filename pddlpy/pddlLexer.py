@@ -0,0 +1,511 @@
+# Generated from pddl.g4 by ANTLR 4.13.2
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+    from typing import TextIO
+else:
+    from typing.io import TextIO
+
+
+def serializedATN():
+    return [
+        4,0,75,1058,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
+        13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
+        19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
+        26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
+        32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
+        39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,
+        45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,
+        52,7,52,2,53,7,53,2,54,7,54,2,55,7,55,2,56,7,56,2,57,7,57,2,58,7,
+        58,2,59,7,59,2,60,7,60,2,61,7,61,2,62,7,62,2,63,7,63,2,64,7,64,2,
+        65,7,65,2,66,7,66,2,67,7,67,2,68,7,68,2,69,7,69,2,70,7,70,2,71,7,
+        71,2,72,7,72,2,73,7,73,2,74,7,74,2,75,7,75,2,76,7,76,2,77,7,77,1,
+        0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,3,1,3,1,3,1,3,1,3,1,
+        3,1,3,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,5,1,5,1,6,1,6,1,6,1,
+        6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,7,1,7,1,7,1,7,1,7,1,
+        7,1,7,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,
+        9,1,9,1,9,1,9,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,11,1,11,1,11,
+        1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,12,1,12,1,12,1,12,1,12,
+        1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,13,1,13,1,13,1,13,1,13,1,13,
+        1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,14,1,14,1,14,1,14,1,14,1,14,
+        1,14,1,14,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,
+        1,15,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,
+        1,16,1,16,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,18,1,18,1,18,
+        1,18,1,19,1,19,1,19,1,20,1,20,1,20,1,20,1,21,1,21,1,21,1,21,1,21,
+        1,21,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,23,1,23,1,23,1,23,1,23,
+        1,23,1,23,1,24,1,24,1,25,1,25,1,25,1,25,1,25,1,25,1,25,1,25,1,25,
+        1,25,1,25,1,25,1,25,1,25,1,25,1,25,1,25,1,26,1,26,1,26,1,26,1,26,
+        1,26,1,26,1,26,1,26,1,26,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,
+        1,27,1,27,1,27,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,
+        1,28,1,29,1,29,1,29,1,30,1,30,1,30,1,30,1,30,1,31,1,31,1,31,1,31,
+        1,31,1,31,1,32,1,32,1,32,1,32,1,33,1,33,1,33,1,33,1,34,1,34,1,34,
+        1,34,1,34,1,34,1,34,1,34,1,34,1,35,1,35,1,35,1,35,1,35,1,36,1,36,
+        1,37,1,37,1,38,1,38,1,39,1,39,1,40,1,40,1,41,1,41,1,41,1,42,1,42,
+        1,42,1,43,1,43,1,43,1,43,1,43,1,43,1,43,1,44,1,44,1,44,1,44,1,44,
+        1,44,1,44,1,44,1,44,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,
+        1,45,1,45,1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,47,1,47,
+        1,47,1,47,1,47,1,47,1,47,1,47,1,47,1,48,1,48,1,48,1,48,1,48,1,48,
+        1,48,1,48,1,48,1,48,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,50,
+        1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,51,1,51,1,51,1,51,1,51,1,51,
+        1,51,1,51,1,51,1,52,1,52,1,52,1,52,1,52,1,52,1,53,1,53,1,53,1,53,
+        1,53,1,53,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,55,1,55,1,55,
+        1,55,1,55,1,55,1,55,1,55,1,55,1,56,1,56,1,56,1,56,1,56,1,56,1,56,
+        1,56,1,56,1,57,1,57,1,57,1,57,1,57,1,57,1,57,1,57,1,57,1,57,1,57,
+        1,58,1,58,1,58,1,58,1,58,1,58,1,58,1,58,1,58,1,58,1,58,1,58,1,59,
+        1,59,1,59,1,59,1,59,1,59,1,59,1,60,1,60,1,60,1,60,1,60,1,60,1,60,
+        1,60,1,60,1,61,1,61,1,61,1,61,1,61,1,61,1,61,1,62,1,62,1,62,1,62,
+        1,62,1,62,1,62,1,62,1,62,1,62,1,62,1,62,1,62,1,63,1,63,1,63,1,63,
+        1,63,1,63,1,63,1,63,1,63,1,63,1,63,1,63,1,63,1,63,1,63,1,64,1,64,
+        1,64,1,64,1,64,1,64,1,64,1,64,1,64,1,64,1,64,1,64,1,64,1,64,1,64,
+        1,64,1,65,1,65,1,65,1,65,1,65,1,65,1,65,1,65,1,65,1,65,1,65,1,65,
+        1,65,1,65,1,66,1,66,1,66,1,66,1,66,1,66,1,66,1,66,1,66,1,66,1,66,
+        1,66,1,67,1,67,1,67,1,67,1,67,1,67,1,67,1,67,1,67,1,67,1,67,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,
+        1,68,3,68,991,8,68,1,69,1,69,5,69,995,8,69,10,69,12,69,998,9,69,
+        1,70,1,70,5,70,1002,8,70,10,70,12,70,1005,9,70,1,71,1,71,1,72,1,
+        72,3,72,1011,8,72,1,73,1,73,1,73,5,73,1016,8,73,10,73,12,73,1019,
+        9,73,1,74,4,74,1022,8,74,11,74,12,74,1023,1,74,1,74,4,74,1028,8,
+        74,11,74,12,74,1029,3,74,1032,8,74,1,75,1,75,1,76,1,76,5,76,1038,
+        8,76,10,76,12,76,1041,9,76,1,76,3,76,1044,8,76,1,76,1,76,3,76,1048,
+        8,76,1,76,1,76,1,77,4,77,1053,8,77,11,77,12,77,1054,1,77,1,77,0,
+        0,78,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,8,17,9,19,10,21,11,23,12,25,
+        13,27,14,29,15,31,16,33,17,35,18,37,19,39,20,41,21,43,22,45,23,47,
+        24,49,25,51,26,53,27,55,28,57,29,59,30,61,31,63,32,65,33,67,34,69,
+        35,71,36,73,37,75,38,77,39,79,40,81,41,83,42,85,43,87,44,89,45,91,
+        46,93,47,95,48,97,49,99,50,101,51,103,52,105,53,107,54,109,55,111,
+        56,113,57,115,58,117,59,119,60,121,61,123,62,125,63,127,64,129,65,
+        131,66,133,67,135,68,137,69,139,70,141,71,143,0,145,0,147,72,149,
+        73,151,0,153,74,155,75,1,0,30,2,0,68,68,100,100,2,0,69,69,101,101,
+        2,0,70,70,102,102,2,0,73,73,105,105,2,0,78,78,110,110,2,0,79,79,
+        111,111,2,0,77,77,109,109,2,0,65,65,97,97,2,0,67,67,99,99,2,0,84,
+        84,116,116,2,0,88,88,120,120,2,0,82,82,114,114,2,0,81,81,113,113,
+        2,0,85,85,117,117,2,0,83,83,115,115,2,0,89,89,121,121,2,0,80,80,
+        112,112,2,0,72,72,104,104,2,0,66,66,98,98,2,0,76,76,108,108,2,0,
+        86,86,118,118,2,0,87,87,119,119,2,0,71,71,103,103,2,0,74,74,106,
+        106,2,0,90,90,122,122,4,0,9,10,13,13,32,32,40,41,2,0,65,90,97,122,
+        3,0,45,45,48,57,95,95,2,0,10,10,13,13,3,0,9,10,13,13,32,32,1083,
+        0,1,1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,
+        1,0,0,0,0,13,1,0,0,0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,
+        1,0,0,0,0,23,1,0,0,0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,
+        1,0,0,0,0,33,1,0,0,0,0,35,1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,
+        1,0,0,0,0,43,1,0,0,0,0,45,1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,
+        1,0,0,0,0,53,1,0,0,0,0,55,1,0,0,0,0,57,1,0,0,0,0,59,1,0,0,0,0,61,
+        1,0,0,0,0,63,1,0,0,0,0,65,1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,
+        1,0,0,0,0,73,1,0,0,0,0,75,1,0,0,0,0,77,1,0,0,0,0,79,1,0,0,0,0,81,
+        1,0,0,0,0,83,1,0,0,0,0,85,1,0,0,0,0,87,1,0,0,0,0,89,1,0,0,0,0,91,
+        1,0,0,0,0,93,1,0,0,0,0,95,1,0,0,0,0,97,1,0,0,0,0,99,1,0,0,0,0,101,
+        1,0,0,0,0,103,1,0,0,0,0,105,1,0,0,0,0,107,1,0,0,0,0,109,1,0,0,0,
+        0,111,1,0,0,0,0,113,1,0,0,0,0,115,1,0,0,0,0,117,1,0,0,0,0,119,1,
+        0,0,0,0,121,1,0,0,0,0,123,1,0,0,0,0,125,1,0,0,0,0,127,1,0,0,0,0,
+        129,1,0,0,0,0,131,1,0,0,0,0,133,1,0,0,0,0,135,1,0,0,0,0,137,1,0,
+        0,0,0,139,1,0,0,0,0,141,1,0,0,0,0,147,1,0,0,0,0,149,1,0,0,0,0,153,
+        1,0,0,0,0,155,1,0,0,0,1,157,1,0,0,0,3,159,1,0,0,0,5,166,1,0,0,0,
+        7,168,1,0,0,0,9,175,1,0,0,0,11,184,1,0,0,0,13,186,1,0,0,0,15,200,
+        1,0,0,0,17,207,1,0,0,0,19,214,1,0,0,0,21,225,1,0,0,0,23,232,1,0,
+        0,0,25,243,1,0,0,0,27,255,1,0,0,0,29,268,1,0,0,0,31,276,1,0,0,0,
+        33,288,1,0,0,0,35,302,1,0,0,0,37,310,1,0,0,0,39,314,1,0,0,0,41,317,
+        1,0,0,0,43,321,1,0,0,0,45,327,1,0,0,0,47,334,1,0,0,0,49,341,1,0,
+        0,0,51,343,1,0,0,0,53,360,1,0,0,0,55,370,1,0,0,0,57,381,1,0,0,0,
+        59,392,1,0,0,0,61,395,1,0,0,0,63,400,1,0,0,0,65,406,1,0,0,0,67,410,
+        1,0,0,0,69,414,1,0,0,0,71,423,1,0,0,0,73,428,1,0,0,0,75,430,1,0,
+        0,0,77,432,1,0,0,0,79,434,1,0,0,0,81,436,1,0,0,0,83,438,1,0,0,0,
+        85,441,1,0,0,0,87,444,1,0,0,0,89,451,1,0,0,0,91,460,1,0,0,0,93,471,
+        1,0,0,0,95,480,1,0,0,0,97,489,1,0,0,0,99,499,1,0,0,0,101,507,1,0,
+        0,0,103,515,1,0,0,0,105,524,1,0,0,0,107,530,1,0,0,0,109,536,1,0,
+        0,0,111,544,1,0,0,0,113,553,1,0,0,0,115,562,1,0,0,0,117,573,1,0,
+        0,0,119,585,1,0,0,0,121,592,1,0,0,0,123,601,1,0,0,0,125,608,1,0,
+        0,0,127,621,1,0,0,0,129,636,1,0,0,0,131,652,1,0,0,0,133,666,1,0,
+        0,0,135,678,1,0,0,0,137,990,1,0,0,0,139,992,1,0,0,0,141,999,1,0,
+        0,0,143,1006,1,0,0,0,145,1010,1,0,0,0,147,1012,1,0,0,0,149,1021,
+        1,0,0,0,151,1033,1,0,0,0,153,1035,1,0,0,0,155,1052,1,0,0,0,157,158,
+        5,40,0,0,158,2,1,0,0,0,159,160,7,0,0,0,160,161,7,1,0,0,161,162,7,
+        2,0,0,162,163,7,3,0,0,163,164,7,4,0,0,164,165,7,1,0,0,165,4,1,0,
+        0,0,166,167,5,41,0,0,167,6,1,0,0,0,168,169,7,0,0,0,169,170,7,5,0,
+        0,170,171,7,6,0,0,171,172,7,7,0,0,172,173,7,3,0,0,173,174,7,4,0,
+        0,174,8,1,0,0,0,175,176,5,58,0,0,176,177,7,8,0,0,177,178,7,5,0,0,
+        178,179,7,4,0,0,179,180,7,9,0,0,180,181,7,1,0,0,181,182,7,10,0,0,
+        182,183,7,9,0,0,183,10,1,0,0,0,184,185,5,45,0,0,185,12,1,0,0,0,186,
+        187,5,58,0,0,187,188,7,11,0,0,188,189,7,1,0,0,189,190,7,12,0,0,190,
+        191,7,13,0,0,191,192,7,3,0,0,192,193,7,11,0,0,193,194,7,1,0,0,194,
+        195,7,6,0,0,195,196,7,1,0,0,196,197,7,4,0,0,197,198,7,9,0,0,198,
+        199,7,14,0,0,199,14,1,0,0,0,200,201,5,58,0,0,201,202,7,9,0,0,202,
+        203,7,15,0,0,203,204,7,16,0,0,204,205,7,1,0,0,205,206,7,14,0,0,206,
+        16,1,0,0,0,207,208,7,1,0,0,208,209,7,3,0,0,209,210,7,9,0,0,210,211,
+        7,17,0,0,211,212,7,1,0,0,212,213,7,11,0,0,213,18,1,0,0,0,214,215,
+        5,58,0,0,215,216,7,2,0,0,216,217,7,13,0,0,217,218,7,4,0,0,218,219,
+        7,8,0,0,219,220,7,9,0,0,220,221,7,3,0,0,221,222,7,5,0,0,222,223,
+        7,4,0,0,223,224,7,14,0,0,224,20,1,0,0,0,225,226,7,4,0,0,226,227,
+        7,13,0,0,227,228,7,6,0,0,228,229,7,18,0,0,229,230,7,1,0,0,230,231,
+        7,11,0,0,231,22,1,0,0,0,232,233,5,58,0,0,233,234,7,8,0,0,234,235,
+        7,5,0,0,235,236,7,4,0,0,236,237,7,14,0,0,237,238,7,9,0,0,238,239,
+        7,7,0,0,239,240,7,4,0,0,240,241,7,9,0,0,241,242,7,14,0,0,242,24,
+        1,0,0,0,243,244,5,58,0,0,244,245,7,16,0,0,245,246,7,11,0,0,246,247,
+        7,1,0,0,247,248,7,0,0,0,248,249,7,3,0,0,249,250,7,8,0,0,250,251,
+        7,7,0,0,251,252,7,9,0,0,252,253,7,1,0,0,253,254,7,14,0,0,254,26,
+        1,0,0,0,255,256,5,58,0,0,256,257,7,8,0,0,257,258,7,5,0,0,258,259,
+        7,4,0,0,259,260,7,14,0,0,260,261,7,9,0,0,261,262,7,11,0,0,262,263,
+        7,7,0,0,263,264,7,3,0,0,264,265,7,4,0,0,265,266,7,9,0,0,266,267,
+        7,14,0,0,267,28,1,0,0,0,268,269,5,58,0,0,269,270,7,7,0,0,270,271,
+        7,8,0,0,271,272,7,9,0,0,272,273,7,3,0,0,273,274,7,5,0,0,274,275,
+        7,4,0,0,275,30,1,0,0,0,276,277,5,58,0,0,277,278,7,16,0,0,278,279,
+        7,7,0,0,279,280,7,11,0,0,280,281,7,7,0,0,281,282,7,6,0,0,282,283,
+        7,1,0,0,283,284,7,9,0,0,284,285,7,1,0,0,285,286,7,11,0,0,286,287,
+        7,14,0,0,287,32,1,0,0,0,288,289,5,58,0,0,289,290,7,16,0,0,290,291,
+        7,11,0,0,291,292,7,1,0,0,292,293,7,8,0,0,293,294,7,5,0,0,294,295,
+        7,4,0,0,295,296,7,0,0,0,296,297,7,3,0,0,297,298,7,9,0,0,298,299,
+        7,3,0,0,299,300,7,5,0,0,300,301,7,4,0,0,301,34,1,0,0,0,302,303,5,
+        58,0,0,303,304,7,1,0,0,304,305,7,2,0,0,305,306,7,2,0,0,306,307,7,
+        1,0,0,307,308,7,8,0,0,308,309,7,9,0,0,309,36,1,0,0,0,310,311,7,7,
+        0,0,311,312,7,4,0,0,312,313,7,0,0,0,313,38,1,0,0,0,314,315,7,5,0,
+        0,315,316,7,11,0,0,316,40,1,0,0,0,317,318,7,4,0,0,318,319,7,5,0,
+        0,319,320,7,9,0,0,320,42,1,0,0,0,321,322,7,3,0,0,322,323,7,6,0,0,
+        323,324,7,16,0,0,324,325,7,19,0,0,325,326,7,15,0,0,326,44,1,0,0,
+        0,327,328,7,1,0,0,328,329,7,10,0,0,329,330,7,3,0,0,330,331,7,14,
+        0,0,331,332,7,9,0,0,332,333,7,14,0,0,333,46,1,0,0,0,334,335,7,2,
+        0,0,335,336,7,5,0,0,336,337,7,11,0,0,337,338,7,7,0,0,338,339,7,19,
+        0,0,339,340,7,19,0,0,340,48,1,0,0,0,341,342,5,61,0,0,342,50,1,0,
+        0,0,343,344,5,58,0,0,344,345,7,0,0,0,345,346,7,13,0,0,346,347,7,
+        11,0,0,347,348,7,7,0,0,348,349,7,9,0,0,349,350,7,3,0,0,350,351,7,
+        20,0,0,351,352,7,1,0,0,352,353,5,45,0,0,353,354,7,7,0,0,354,355,
+        7,8,0,0,355,356,7,9,0,0,356,357,7,3,0,0,357,358,7,5,0,0,358,359,
+        7,4,0,0,359,52,1,0,0,0,360,361,5,58,0,0,361,362,7,0,0,0,362,363,
+        7,13,0,0,363,364,7,11,0,0,364,365,7,7,0,0,365,366,7,9,0,0,366,367,
+        7,3,0,0,367,368,7,5,0,0,368,369,7,4,0,0,369,54,1,0,0,0,370,371,5,
+        58,0,0,371,372,7,8,0,0,372,373,7,5,0,0,373,374,7,4,0,0,374,375,7,
+        0,0,0,375,376,7,3,0,0,376,377,7,9,0,0,377,378,7,3,0,0,378,379,7,
+        5,0,0,379,380,7,4,0,0,380,56,1,0,0,0,381,382,7,16,0,0,382,383,7,
+        11,0,0,383,384,7,1,0,0,384,385,7,2,0,0,385,386,7,1,0,0,386,387,7,
+        11,0,0,387,388,7,1,0,0,388,389,7,4,0,0,389,390,7,8,0,0,390,391,7,
+        1,0,0,391,58,1,0,0,0,392,393,7,7,0,0,393,394,7,9,0,0,394,60,1,0,
+        0,0,395,396,7,5,0,0,396,397,7,20,0,0,397,398,7,1,0,0,398,399,7,11,
+        0,0,399,62,1,0,0,0,400,401,7,14,0,0,401,402,7,9,0,0,402,403,7,7,
+        0,0,403,404,7,11,0,0,404,405,7,9,0,0,405,64,1,0,0,0,406,407,7,1,
+        0,0,407,408,7,4,0,0,408,409,7,0,0,0,409,66,1,0,0,0,410,411,7,7,0,
+        0,411,412,7,19,0,0,412,413,7,19,0,0,413,68,1,0,0,0,414,415,5,58,
+        0,0,415,416,7,0,0,0,416,417,7,1,0,0,417,418,7,11,0,0,418,419,7,3,
+        0,0,419,420,7,20,0,0,420,421,7,1,0,0,421,422,7,0,0,0,422,70,1,0,
+        0,0,423,424,7,21,0,0,424,425,7,17,0,0,425,426,7,1,0,0,426,427,7,
+        4,0,0,427,72,1,0,0,0,428,429,5,42,0,0,429,74,1,0,0,0,430,431,5,43,
+        0,0,431,76,1,0,0,0,432,433,5,47,0,0,433,78,1,0,0,0,434,435,5,62,
+        0,0,435,80,1,0,0,0,436,437,5,60,0,0,437,82,1,0,0,0,438,439,5,62,
+        0,0,439,440,5,61,0,0,440,84,1,0,0,0,441,442,5,60,0,0,442,443,5,61,
+        0,0,443,86,1,0,0,0,444,445,7,7,0,0,445,446,7,14,0,0,446,447,7,14,
+        0,0,447,448,7,3,0,0,448,449,7,22,0,0,449,450,7,4,0,0,450,88,1,0,
+        0,0,451,452,7,14,0,0,452,453,7,8,0,0,453,454,7,7,0,0,454,455,7,19,
+        0,0,455,456,7,1,0,0,456,457,5,45,0,0,457,458,7,13,0,0,458,459,7,
+        16,0,0,459,90,1,0,0,0,460,461,7,14,0,0,461,462,7,8,0,0,462,463,7,
+        7,0,0,463,464,7,19,0,0,464,465,7,1,0,0,465,466,5,45,0,0,466,467,
+        7,0,0,0,467,468,7,5,0,0,468,469,7,21,0,0,469,470,7,4,0,0,470,92,
+        1,0,0,0,471,472,7,3,0,0,472,473,7,4,0,0,473,474,7,8,0,0,474,475,
+        7,11,0,0,475,476,7,1,0,0,476,477,7,7,0,0,477,478,7,14,0,0,478,479,
+        7,1,0,0,479,94,1,0,0,0,480,481,7,0,0,0,481,482,7,1,0,0,482,483,7,
+        8,0,0,483,484,7,11,0,0,484,485,7,1,0,0,485,486,7,7,0,0,486,487,7,
+        14,0,0,487,488,7,1,0,0,488,96,1,0,0,0,489,490,5,63,0,0,490,491,7,
+        0,0,0,491,492,7,13,0,0,492,493,7,11,0,0,493,494,7,7,0,0,494,495,
+        7,9,0,0,495,496,7,3,0,0,496,497,7,5,0,0,497,498,7,4,0,0,498,98,1,
+        0,0,0,499,500,7,16,0,0,500,501,7,11,0,0,501,502,7,5,0,0,502,503,
+        7,18,0,0,503,504,7,19,0,0,504,505,7,1,0,0,505,506,7,6,0,0,506,100,
+        1,0,0,0,507,508,5,58,0,0,508,509,7,0,0,0,509,510,7,5,0,0,510,511,
+        7,6,0,0,511,512,7,7,0,0,512,513,7,3,0,0,513,514,7,4,0,0,514,102,
+        1,0,0,0,515,516,5,58,0,0,516,517,7,5,0,0,517,518,7,18,0,0,518,519,
+        7,23,0,0,519,520,7,1,0,0,520,521,7,8,0,0,521,522,7,9,0,0,522,523,
+        7,14,0,0,523,104,1,0,0,0,524,525,5,58,0,0,525,526,7,3,0,0,526,527,
+        7,4,0,0,527,528,7,3,0,0,528,529,7,9,0,0,529,106,1,0,0,0,530,531,
+        5,58,0,0,531,532,7,22,0,0,532,533,7,5,0,0,533,534,7,7,0,0,534,535,
+        7,19,0,0,535,108,1,0,0,0,536,537,5,58,0,0,537,538,7,6,0,0,538,539,
+        7,1,0,0,539,540,7,9,0,0,540,541,7,11,0,0,541,542,7,3,0,0,542,543,
+        7,8,0,0,543,110,1,0,0,0,544,545,7,6,0,0,545,546,7,3,0,0,546,547,
+        7,4,0,0,547,548,7,3,0,0,548,549,7,6,0,0,549,550,7,3,0,0,550,551,
+        7,24,0,0,551,552,7,1,0,0,552,112,1,0,0,0,553,554,7,6,0,0,554,555,
+        7,7,0,0,555,556,7,10,0,0,556,557,7,3,0,0,557,558,7,6,0,0,558,559,
+        7,3,0,0,559,560,7,24,0,0,560,561,7,1,0,0,561,114,1,0,0,0,562,563,
+        7,9,0,0,563,564,7,5,0,0,564,565,7,9,0,0,565,566,7,7,0,0,566,567,
+        7,19,0,0,567,568,5,45,0,0,568,569,7,9,0,0,569,570,7,3,0,0,570,571,
+        7,6,0,0,571,572,7,1,0,0,572,116,1,0,0,0,573,574,7,3,0,0,574,575,
+        7,14,0,0,575,576,5,45,0,0,576,577,7,20,0,0,577,578,7,3,0,0,578,579,
+        7,5,0,0,579,580,7,19,0,0,580,581,7,7,0,0,581,582,7,9,0,0,582,583,
+        7,1,0,0,583,584,7,0,0,0,584,118,1,0,0,0,585,586,7,7,0,0,586,587,
+        7,19,0,0,587,588,7,21,0,0,588,589,7,7,0,0,589,590,7,15,0,0,590,591,
+        7,14,0,0,591,120,1,0,0,0,592,593,7,14,0,0,593,594,7,5,0,0,594,595,
+        7,6,0,0,595,596,7,1,0,0,596,597,7,9,0,0,597,598,7,3,0,0,598,599,
+        7,6,0,0,599,600,7,1,0,0,600,122,1,0,0,0,601,602,7,21,0,0,602,603,
+        7,3,0,0,603,604,7,9,0,0,604,605,7,17,0,0,605,606,7,3,0,0,606,607,
+        7,4,0,0,607,124,1,0,0,0,608,609,7,7,0,0,609,610,7,9,0,0,610,611,
+        5,45,0,0,611,612,7,6,0,0,612,613,7,5,0,0,613,614,7,14,0,0,614,615,
+        7,9,0,0,615,616,5,45,0,0,616,617,7,5,0,0,617,618,7,4,0,0,618,619,
+        7,8,0,0,619,620,7,1,0,0,620,126,1,0,0,0,621,622,7,14,0,0,622,623,
+        7,5,0,0,623,624,7,6,0,0,624,625,7,1,0,0,625,626,7,9,0,0,626,627,
+        7,3,0,0,627,628,7,6,0,0,628,629,7,1,0,0,629,630,5,45,0,0,630,631,
+        7,7,0,0,631,632,7,2,0,0,632,633,7,9,0,0,633,634,7,1,0,0,634,635,
+        7,11,0,0,635,128,1,0,0,0,636,637,7,14,0,0,637,638,7,5,0,0,638,639,
+        7,6,0,0,639,640,7,1,0,0,640,641,7,9,0,0,641,642,7,3,0,0,642,643,
+        7,6,0,0,643,644,7,1,0,0,644,645,5,45,0,0,645,646,7,18,0,0,646,647,
+        7,1,0,0,647,648,7,2,0,0,648,649,7,5,0,0,649,650,7,11,0,0,650,651,
+        7,1,0,0,651,130,1,0,0,0,652,653,7,7,0,0,653,654,7,19,0,0,654,655,
+        7,21,0,0,655,656,7,7,0,0,656,657,7,15,0,0,657,658,7,14,0,0,658,659,
+        5,45,0,0,659,660,7,21,0,0,660,661,7,3,0,0,661,662,7,9,0,0,662,663,
+        7,17,0,0,663,664,7,3,0,0,664,665,7,4,0,0,665,132,1,0,0,0,666,667,
+        7,17,0,0,667,668,7,5,0,0,668,669,7,19,0,0,669,670,7,0,0,0,670,671,
+        5,45,0,0,671,672,7,0,0,0,672,673,7,13,0,0,673,674,7,11,0,0,674,675,
+        7,3,0,0,675,676,7,4,0,0,676,677,7,22,0,0,677,134,1,0,0,0,678,679,
+        7,17,0,0,679,680,7,5,0,0,680,681,7,19,0,0,681,682,7,0,0,0,682,683,
+        5,45,0,0,683,684,7,7,0,0,684,685,7,2,0,0,685,686,7,9,0,0,686,687,
+        7,1,0,0,687,688,7,11,0,0,688,136,1,0,0,0,689,690,5,58,0,0,690,691,
+        7,14,0,0,691,692,7,9,0,0,692,693,7,11,0,0,693,694,7,3,0,0,694,695,
+        7,16,0,0,695,991,7,14,0,0,696,697,5,58,0,0,697,698,7,9,0,0,698,699,
+        7,15,0,0,699,700,7,16,0,0,700,701,7,3,0,0,701,702,7,4,0,0,702,991,
+        7,22,0,0,703,704,5,58,0,0,704,705,7,4,0,0,705,706,7,1,0,0,706,707,
+        7,22,0,0,707,708,7,7,0,0,708,709,7,9,0,0,709,710,7,3,0,0,710,711,
+        7,20,0,0,711,712,7,1,0,0,712,713,5,45,0,0,713,714,7,16,0,0,714,715,
+        7,11,0,0,715,716,7,1,0,0,716,717,7,8,0,0,717,718,7,5,0,0,718,719,
+        7,4,0,0,719,720,7,0,0,0,720,721,7,3,0,0,721,722,7,9,0,0,722,723,
+        7,3,0,0,723,724,7,5,0,0,724,725,7,4,0,0,725,991,7,14,0,0,726,727,
+        5,58,0,0,727,728,7,0,0,0,728,729,7,3,0,0,729,730,7,14,0,0,730,731,
+        7,23,0,0,731,732,7,13,0,0,732,733,7,4,0,0,733,734,7,8,0,0,734,735,
+        7,9,0,0,735,736,7,3,0,0,736,737,7,20,0,0,737,738,7,1,0,0,738,739,
+        5,45,0,0,739,740,7,16,0,0,740,741,7,11,0,0,741,742,7,1,0,0,742,743,
+        7,8,0,0,743,744,7,5,0,0,744,745,7,4,0,0,745,746,7,0,0,0,746,747,
+        7,3,0,0,747,748,7,9,0,0,748,749,7,3,0,0,749,750,7,5,0,0,750,751,
+        7,4,0,0,751,991,7,14,0,0,752,753,5,58,0,0,753,754,7,1,0,0,754,755,
+        7,12,0,0,755,756,7,13,0,0,756,757,7,7,0,0,757,758,7,19,0,0,758,759,
+        7,3,0,0,759,760,7,9,0,0,760,991,7,15,0,0,761,762,5,58,0,0,762,763,
+        7,1,0,0,763,764,7,10,0,0,764,765,7,3,0,0,765,766,7,14,0,0,766,767,
+        7,9,0,0,767,768,7,1,0,0,768,769,7,4,0,0,769,770,7,9,0,0,770,771,
+        7,3,0,0,771,772,7,7,0,0,772,773,7,19,0,0,773,774,5,45,0,0,774,775,
+        7,16,0,0,775,776,7,11,0,0,776,777,7,1,0,0,777,778,7,8,0,0,778,779,
+        7,5,0,0,779,780,7,4,0,0,780,781,7,0,0,0,781,782,7,3,0,0,782,783,
+        7,9,0,0,783,784,7,3,0,0,784,785,7,5,0,0,785,786,7,4,0,0,786,991,
+        7,14,0,0,787,788,5,58,0,0,788,789,7,13,0,0,789,790,7,4,0,0,790,791,
+        7,3,0,0,791,792,7,20,0,0,792,793,7,1,0,0,793,794,7,11,0,0,794,795,
+        7,14,0,0,795,796,7,7,0,0,796,797,7,19,0,0,797,798,5,45,0,0,798,799,
+        7,16,0,0,799,800,7,11,0,0,800,801,7,1,0,0,801,802,7,8,0,0,802,803,
+        7,5,0,0,803,804,7,4,0,0,804,805,7,0,0,0,805,806,7,3,0,0,806,807,
+        7,9,0,0,807,808,7,3,0,0,808,809,7,5,0,0,809,810,7,4,0,0,810,991,
+        7,14,0,0,811,812,5,58,0,0,812,813,7,12,0,0,813,814,7,13,0,0,814,
+        815,7,7,0,0,815,816,7,4,0,0,816,817,7,9,0,0,817,818,7,3,0,0,818,
+        819,7,2,0,0,819,820,7,3,0,0,820,821,7,1,0,0,821,822,7,0,0,0,822,
+        823,5,45,0,0,823,824,7,16,0,0,824,825,7,11,0,0,825,826,7,1,0,0,826,
+        827,7,8,0,0,827,828,7,5,0,0,828,829,7,4,0,0,829,830,7,0,0,0,830,
+        831,7,3,0,0,831,832,7,9,0,0,832,833,7,3,0,0,833,834,7,5,0,0,834,
+        835,7,4,0,0,835,991,7,14,0,0,836,837,5,58,0,0,837,838,7,8,0,0,838,
+        839,7,5,0,0,839,840,7,4,0,0,840,841,7,0,0,0,841,842,7,3,0,0,842,
+        843,7,9,0,0,843,844,7,3,0,0,844,845,7,5,0,0,845,846,7,4,0,0,846,
+        847,7,7,0,0,847,848,7,19,0,0,848,849,5,45,0,0,849,850,7,1,0,0,850,
+        851,7,2,0,0,851,852,7,2,0,0,852,853,7,1,0,0,853,854,7,8,0,0,854,
+        855,7,9,0,0,855,991,7,14,0,0,856,857,5,58,0,0,857,858,7,2,0,0,858,
+        859,7,19,0,0,859,860,7,13,0,0,860,861,7,1,0,0,861,862,7,4,0,0,862,
+        863,7,9,0,0,863,991,7,14,0,0,864,865,5,58,0,0,865,866,7,4,0,0,866,
+        867,7,13,0,0,867,868,7,6,0,0,868,869,7,1,0,0,869,870,7,11,0,0,870,
+        871,7,3,0,0,871,872,7,8,0,0,872,873,5,45,0,0,873,874,7,2,0,0,874,
+        875,7,19,0,0,875,876,7,13,0,0,876,877,7,1,0,0,877,878,7,4,0,0,878,
+        879,7,9,0,0,879,991,7,14,0,0,880,881,5,58,0,0,881,882,7,7,0,0,882,
+        883,7,8,0,0,883,884,7,9,0,0,884,885,7,3,0,0,885,886,7,5,0,0,886,
+        887,7,4,0,0,887,888,5,45,0,0,888,889,7,8,0,0,889,890,7,5,0,0,890,
+        891,7,14,0,0,891,892,7,9,0,0,892,991,7,14,0,0,893,894,5,58,0,0,894,
+        895,7,7,0,0,895,896,7,0,0,0,896,991,7,19,0,0,897,898,5,58,0,0,898,
+        899,7,0,0,0,899,900,7,13,0,0,900,901,7,11,0,0,901,902,7,7,0,0,902,
+        903,7,9,0,0,903,904,7,3,0,0,904,905,7,20,0,0,905,906,7,1,0,0,906,
+        907,5,45,0,0,907,908,7,7,0,0,908,909,7,8,0,0,909,910,7,9,0,0,910,
+        911,7,3,0,0,911,912,7,5,0,0,912,913,7,4,0,0,913,991,7,14,0,0,914,
+        915,5,58,0,0,915,916,7,0,0,0,916,917,7,1,0,0,917,918,7,11,0,0,918,
+        919,7,3,0,0,919,920,7,20,0,0,920,921,7,1,0,0,921,922,7,0,0,0,922,
+        923,5,45,0,0,923,924,7,16,0,0,924,925,7,11,0,0,925,926,7,1,0,0,926,
+        927,7,0,0,0,927,928,7,3,0,0,928,929,7,8,0,0,929,930,7,7,0,0,930,
+        931,7,9,0,0,931,932,7,1,0,0,932,991,7,14,0,0,933,934,5,58,0,0,934,
+        935,7,9,0,0,935,936,7,3,0,0,936,937,7,6,0,0,937,938,7,1,0,0,938,
+        939,7,0,0,0,939,940,5,45,0,0,940,941,7,3,0,0,941,942,7,4,0,0,942,
+        943,7,3,0,0,943,944,7,9,0,0,944,945,7,3,0,0,945,946,7,7,0,0,946,
+        947,7,19,0,0,947,948,5,45,0,0,948,949,7,19,0,0,949,950,7,3,0,0,950,
+        951,7,9,0,0,951,952,7,1,0,0,952,953,7,11,0,0,953,954,7,7,0,0,954,
+        955,7,19,0,0,955,991,7,14,0,0,956,957,5,58,0,0,957,958,7,16,0,0,
+        958,959,7,11,0,0,959,960,7,1,0,0,960,961,7,2,0,0,961,962,7,1,0,0,
+        962,963,7,11,0,0,963,964,7,1,0,0,964,965,7,4,0,0,965,966,7,8,0,0,
+        966,967,7,1,0,0,967,991,7,14,0,0,968,969,5,58,0,0,969,970,7,8,0,
+        0,970,971,7,5,0,0,971,972,7,4,0,0,972,973,7,14,0,0,973,974,7,9,0,
+        0,974,975,7,11,0,0,975,976,7,7,0,0,976,977,7,3,0,0,977,978,7,4,0,
+        0,978,979,7,9,0,0,979,991,7,14,0,0,980,981,5,58,0,0,981,982,7,14,
+        0,0,982,983,7,1,0,0,983,984,7,6,0,0,984,985,7,7,0,0,985,986,7,4,
+        0,0,986,987,7,9,0,0,987,988,7,3,0,0,988,989,7,8,0,0,989,991,7,14,
+        0,0,990,689,1,0,0,0,990,696,1,0,0,0,990,703,1,0,0,0,990,726,1,0,
+        0,0,990,752,1,0,0,0,990,761,1,0,0,0,990,787,1,0,0,0,990,811,1,0,
+        0,0,990,836,1,0,0,0,990,856,1,0,0,0,990,864,1,0,0,0,990,880,1,0,
+        0,0,990,893,1,0,0,0,990,897,1,0,0,0,990,914,1,0,0,0,990,933,1,0,
+        0,0,990,956,1,0,0,0,990,968,1,0,0,0,990,980,1,0,0,0,991,138,1,0,
+        0,0,992,996,3,143,71,0,993,995,3,145,72,0,994,993,1,0,0,0,995,998,
+        1,0,0,0,996,994,1,0,0,0,996,997,1,0,0,0,997,140,1,0,0,0,998,996,
+        1,0,0,0,999,1003,3,143,71,0,1000,1002,8,25,0,0,1001,1000,1,0,0,0,
+        1002,1005,1,0,0,0,1003,1001,1,0,0,0,1003,1004,1,0,0,0,1004,142,1,
+        0,0,0,1005,1003,1,0,0,0,1006,1007,7,26,0,0,1007,144,1,0,0,0,1008,
+        1011,3,143,71,0,1009,1011,7,27,0,0,1010,1008,1,0,0,0,1010,1009,1,
+        0,0,0,1011,146,1,0,0,0,1012,1013,5,63,0,0,1013,1017,3,143,71,0,1014,
+        1016,3,145,72,0,1015,1014,1,0,0,0,1016,1019,1,0,0,0,1017,1015,1,
+        0,0,0,1017,1018,1,0,0,0,1018,148,1,0,0,0,1019,1017,1,0,0,0,1020,
+        1022,3,151,75,0,1021,1020,1,0,0,0,1022,1023,1,0,0,0,1023,1021,1,
+        0,0,0,1023,1024,1,0,0,0,1024,1031,1,0,0,0,1025,1027,5,46,0,0,1026,
+        1028,3,151,75,0,1027,1026,1,0,0,0,1028,1029,1,0,0,0,1029,1027,1,
+        0,0,0,1029,1030,1,0,0,0,1030,1032,1,0,0,0,1031,1025,1,0,0,0,1031,
+        1032,1,0,0,0,1032,150,1,0,0,0,1033,1034,2,48,57,0,1034,152,1,0,0,
+        0,1035,1039,5,59,0,0,1036,1038,8,28,0,0,1037,1036,1,0,0,0,1038,1041,
+        1,0,0,0,1039,1037,1,0,0,0,1039,1040,1,0,0,0,1040,1047,1,0,0,0,1041,
+        1039,1,0,0,0,1042,1044,5,13,0,0,1043,1042,1,0,0,0,1043,1044,1,0,
+        0,0,1044,1045,1,0,0,0,1045,1048,5,10,0,0,1046,1048,5,0,0,1,1047,
+        1043,1,0,0,0,1047,1046,1,0,0,0,1048,1049,1,0,0,0,1049,1050,6,76,
+        0,0,1050,154,1,0,0,0,1051,1053,7,29,0,0,1052,1051,1,0,0,0,1053,1054,
+        1,0,0,0,1054,1052,1,0,0,0,1054,1055,1,0,0,0,1055,1056,1,0,0,0,1056,
+        1057,6,77,0,0,1057,156,1,0,0,0,13,0,990,996,1003,1010,1017,1023,
+        1029,1031,1039,1043,1047,1054,1,6,0,0
+    ]
+
+class pddlLexer(Lexer):
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    T__0 = 1
+    T__1 = 2
+    T__2 = 3
+    T__3 = 4
+    T__4 = 5
+    T__5 = 6
+    T__6 = 7
+    T__7 = 8
+    T__8 = 9
+    T__9 = 10
+    T__10 = 11
+    T__11 = 12
+    T__12 = 13
+    T__13 = 14
+    T__14 = 15
+    T__15 = 16
+    T__16 = 17
+    T__17 = 18
+    T__18 = 19
+    T__19 = 20
+    T__20 = 21
+    T__21 = 22
+    T__22 = 23
+    T__23 = 24
+    T__24 = 25
+    T__25 = 26
+    T__26 = 27
+    T__27 = 28
+    T__28 = 29
+    T__29 = 30
+    T__30 = 31
+    T__31 = 32
+    T__32 = 33
+    T__33 = 34
+    T__34 = 35
+    T__35 = 36
+    T__36 = 37
+    T__37 = 38
+    T__38 = 39
+    T__39 = 40
+    T__40 = 41
+    T__41 = 42
+    T__42 = 43
+    T__43 = 44
+    T__44 = 45
+    T__45 = 46
+    T__46 = 47
+    T__47 = 48
+    T__48 = 49
+    T__49 = 50
+    T__50 = 51
+    T__51 = 52
+    T__52 = 53
+    T__53 = 54
+    T__54 = 55
+    T__55 = 56
+    T__56 = 57
+    T__57 = 58
+    T__58 = 59
+    T__59 = 60
+    T__60 = 61
+    T__61 = 62
+    T__62 = 63
+    T__63 = 64
+    T__64 = 65
+    T__65 = 66
+    T__66 = 67
+    T__67 = 68
+    REQUIRE_KEY = 69
+    NAME = 70
+    URI = 71
+    VARIABLE = 72
+    NUMBER = 73
+    LINE_COMMENT = 74
+    WHITESPACE = 75
+
+    channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
+
+    modeNames = [ "DEFAULT_MODE" ]
+
+    literalNames = [ "<INVALID>",
+            "'('", "'define'", "')'", "'domain'", "':context'", "'-'", "':requirements'", 
+            "':types'", "'either'", "':functions'", "'number'", "':constants'", 
+            "':predicates'", "':constraints'", "':action'", "':parameters'", 
+            "':precondition'", "':effect'", "'and'", "'or'", "'not'", "'imply'", 
+            "'exists'", "'forall'", "'='", "':durative-action'", "':duration'", 
+            "':condition'", "'preference'", "'at'", "'over'", "'start'", 
+            "'end'", "'all'", "':derived'", "'when'", "'*'", "'+'", "'/'", 
+            "'>'", "'<'", "'>='", "'<='", "'assign'", "'scale-up'", "'scale-down'", 
+            "'increase'", "'decrease'", "'?duration'", "'problem'", "':domain'", 
+            "':objects'", "':init'", "':goal'", "':metric'", "'minimize'", 
+            "'maximize'", "'total-time'", "'is-violated'", "'always'", "'sometime'", 
+            "'within'", "'at-most-once'", "'sometime-after'", "'sometime-before'", 
+            "'always-within'", "'hold-during'", "'hold-after'" ]
+
+    symbolicNames = [ "<INVALID>",
+            "REQUIRE_KEY", "NAME", "URI", "VARIABLE", "NUMBER", "LINE_COMMENT", 
+            "WHITESPACE" ]
+
+    ruleNames = [ "T__0", "T__1", "T__2", "T__3", "T__4", "T__5", "T__6", 
+                  "T__7", "T__8", "T__9", "T__10", "T__11", "T__12", "T__13", 
+                  "T__14", "T__15", "T__16", "T__17", "T__18", "T__19", 
+                  "T__20", "T__21", "T__22", "T__23", "T__24", "T__25", 
+                  "T__26", "T__27", "T__28", "T__29", "T__30", "T__31", 
+                  "T__32", "T__33", "T__34", "T__35", "T__36", "T__37", 
+                  "T__38", "T__39", "T__40", "T__41", "T__42", "T__43", 
+                  "T__44", "T__45", "T__46", "T__47", "T__48", "T__49", 
+                  "T__50", "T__51", "T__52", "T__53", "T__54", "T__55", 
+                  "T__56", "T__57", "T__58", "T__59", "T__60", "T__61", 
+                  "T__62", "T__63", "T__64", "T__65", "T__66", "T__67", 
+                  "REQUIRE_KEY", "NAME", "URI", "LETTER", "ANY_CHAR", "VARIABLE", 
+                  "NUMBER", "DIGIT", "LINE_COMMENT", "WHITESPACE" ]
+
+    grammarFileName = "pddl.g4"
+
+    def __init__(self, input=None, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = LexerATNSimulator(self, self.atn, self.decisionsToDFA, PredictionContextCache())
+        self._actions = None
+        self._predicates = None
+
+
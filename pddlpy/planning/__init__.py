@@ -11,6 +11,7 @@ from .base import (
     UnsupportedRequirementsError,
     validate_requirements,
 )
+from .bitset import BitState, PackedTask
 from .costs import TOTAL_COST, action_cost, plan_cost
 from .durative import (
     DurativeState,
@@ -18,34 +19,78 @@ from .durative import (
     validate_durative_action,
     validate_durative_actions,
 )
-from .grounding import GroundedTask
+from .grounding import GroundedTask, SearchTask
+from .heuristics import (
+    HFF,
+    HAdd,
+    Heuristic,
+    HMax,
+    LMCut,
+    RelaxedTask,
+    make_heuristic,
+    register_heuristic,
+)
+from .landmarks import Landmark, LandmarkGraph, LMCount, Ordering, landmark_graph
+from .lazy import LazyGroundedTask
+from .lifted import LiftedAction, LiftedPlanner, LiftedTask
+from .pdb import CanonicalPDB, PatternDatabase, PDBStore
 from .registry import get, register, registry
 from .search import (
     STRIPS_CAPABILITIES,
     AStarPlanner,
     BFSPlanner,
+    CostAStarPlanner,
     GBFSPlanner,
+    LazyGBFSPlanner,
     UniformCostPlanner,
 )
-from .state import Plan, State, atom_tuple
+from .state import CompiledAction, Plan, State, atom_tuple, compile_action
+from .successors import SuccessorGenerator
 from .temporal import (
     TEMPORAL_CAPABILITIES,
+    CompiledDurative,
     ScheduledAction,
     TemporalPlan,
     TemporalPlanner,
     TemporalTask,
     apply_durative,
+    compile_durative,
 )
 
 __all__ = [
     "State",
     "Plan",
     "atom_tuple",
+    "CompiledAction",
+    "compile_action",
     "DurativeState",
     "DurativeValidationError",
     "validate_durative_action",
     "validate_durative_actions",
     "GroundedTask",
+    "SearchTask",
+    "LazyGroundedTask",
+    "LiftedTask",
+    "LiftedAction",
+    "Heuristic",
+    "RelaxedTask",
+    "HMax",
+    "HAdd",
+    "HFF",
+    "LMCut",
+    "Landmark",
+    "LandmarkGraph",
+    "Ordering",
+    "landmark_graph",
+    "LMCount",
+    "PatternDatabase",
+    "CanonicalPDB",
+    "PDBStore",
+    "make_heuristic",
+    "register_heuristic",
+    "BitState",
+    "PackedTask",
+    "SuccessorGenerator",
     "Planner",
     "PlannerError",
     "UnsupportedRequirementsError",
@@ -56,7 +101,10 @@ __all__ = [
     "BFSPlanner",
     "AStarPlanner",
     "GBFSPlanner",
+    "LazyGBFSPlanner",
     "UniformCostPlanner",
+    "CostAStarPlanner",
+    "LiftedPlanner",
     "STRIPS_CAPABILITIES",
     "action_cost",
     "plan_cost",
@@ -66,5 +114,7 @@ __all__ = [
     "TemporalTask",
     "ScheduledAction",
     "apply_durative",
+    "CompiledDurative",
+    "compile_durative",
     "TEMPORAL_CAPABILITIES",
 ]
@@ -17,7 +17,9 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Dict, FrozenSet, Optional, Set
 
-from .grounding import GroundedTask
+from .bitset import PackedTask
+from .grounding import GroundedTask, SearchTask
+from .lazy import DEFAULT_CACHE_SIZE, LazyGroundedTask
 
 if TYPE_CHECKING:
     from pddlpy.pddl import DomainProblem
@@ -93,12 +95,29 @@ class Planner(ABC):
 
     ``capabilities`` is the set of ``:requirements`` keywords the planner can
     handle. ``prepare`` enforces requirements + capabilities and returns a
-    ``GroundedTask`` ready for search.
+    ``SearchTask`` ready for search: a ``GroundedTask`` — a
+    :class:`~pddlpy.planning.PackedTask` over bitset states when the planner
+    was built with ``packed=True``, grounded over a process pool of
+    ``workers`` processes when that is set — or a
+    :class:`~pddlpy.planning.LazyGroundedTask` keeping up to ``cache_size``
+    actions when built with ``lazy=True``. A lazy task has no grounded
+    action list, so the best-first planners accept ``lazy=True`` only with
+    the goal-count heuristic.
     """
 
     #: requirement keywords this planner supports
     capabilities: FrozenSet[str] = frozenset()
 
+    def __init__(self, packed: bool = False, workers: Optional[int] = None,
+                 lazy: bool = False,
+                 cache_size: Optional[int] = DEFAULT_CACHE_SIZE) -> None:
+        if lazy and (packed or workers is not None):
+            raise ValueError("a lazy task is neither packed nor grounded in parallel")
+        self.packed = packed
+        self.workers = workers
+        self.lazy = lazy
+        self.cache_size = cache_size
+
     def check_capabilities(self, domainproblem: "DomainProblem") -> None:
         """Raise if the domain declares a requirement beyond this planner's
         capabilities."""
@@ -109,11 +128,15 @@ class Planner(ABC):
                 % (type(self).__name__, sorted(unsupported))
             )
 
-    def prepare(self, domainproblem: "DomainProblem") -> GroundedTask:
-        """Run #9 + capability checks, then build the GroundedTask."""
+    def prepare(self, domainproblem: "DomainProblem") -> SearchTask:
+        """Run #9 + capability checks, then build the task to search."""
         validate_requirements(domainproblem)
         self.check_capabilities(domainproblem)
-        return GroundedTask(domainproblem)
+        if self.lazy:
+            return LazyGroundedTask(domainproblem, self.cache_size)
+        if self.packed:
+            return PackedTask(domainproblem, self.workers)
+        return GroundedTask(domainproblem, self.workers)
 
     @abstractmethod
     def solve(self, domainproblem: "DomainProblem") -> "Optional[Plan]":
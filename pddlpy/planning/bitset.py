@@ -0,0 +1,226 @@
+"""Packed bitset states: a planning state as one Python ``int``.
+
+Bit ``i`` of a :class:`BitState` is set when atom ``i`` of the task's
+:class:`~pddlpy.symbols.SymbolTable` holds. :class:`PackedTask` precomputes
+each grounded action's precondition, delete and add masks, so a STRIPS
+applicability test is two ``&`` operations and a successor is
+``(bits & keep) | add`` — no set is built, and hashing a state hashes a
+single int.
+
+    task = PackedTask(domainproblem)
+    for action, succ in task.successors(task.initial):
+        ...
+
+Planners search over packed states when constructed with ``packed=True``,
+e.g. ``registry.get("astar", packed=True)``. Plans are identical to the
+``State`` path's. Actions the masks cannot express — a non-conjunctive
+precondition tree, numeric preconditions or effects, conditional effects —
+keep a slower generic path and mix freely with mask-only actions.
+"""
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .grounding import GroundedTask
+from .state import CompiledAction, GroundAtom, Valuation, atom_tuple
+
+if TYPE_CHECKING:
+    from pddlpy.pddl import DomainProblem, Operator
+    from pddlpy.symbols import SymbolTable
+
+
+def _mask(ids: Iterable[int]) -> int:
+    bits = 0
+    for i in ids:
+        bits |= 1 << i
+    return bits
+
+
+def _bit_ids(bits: int) -> FrozenSet[int]:
+    """The indices of the set bits of ``bits``."""
+    ids = []
+    while bits:
+        low = bits & -bits
+        ids.append(low.bit_length() - 1)
+        bits ^= low
+    return frozenset(ids)
+
+
+class _BitView(AbstractSet[GroundAtom]):
+    """A read-only set of ground atoms over a bitmask, for the model's
+    condition trees."""
+
+    __slots__ = ("_bits", "_symbols")
+
+    def __init__(self, bits: int, symbols: "SymbolTable") -> None:
+        self._bits = bits
+        self._symbols = symbols
+
+    def __contains__(self, atom: object) -> bool:
+        i = self._symbols.find_atom(atom)  # type: ignore[arg-type]
+        return i is not None and (self._bits >> i) & 1 == 1
+
+    def __iter__(self) -> Iterator[GroundAtom]:
+        return iter(self._symbols.atoms_of(_bit_ids(self._bits)))
+
+    def __len__(self) -> int:
+        return self._bits.bit_count()
+
+
+class _PackedAction:
+    """A grounded action as masks over the task's atom index. ``generic`` is
+    the compiled action when the masks alone do not describe it."""
+
+    __slots__ = ("operator", "pre", "neg", "keep", "add", "generic")
+
+    def __init__(self, action: CompiledAction) -> None:
+        self.operator = action.operator
+        # A precondition tree is authoritative (the flat sets may hold atoms
+        # from inside disjunctions or quantifiers), so it gets empty masks.
+        tree = action.precondition is not None
+        self.pre = 0 if tree else _mask(action.pre_pos)
+        self.neg = 0 if tree else _mask(action.pre_neg)
+        self.keep = ~_mask(action.dele)
+        self.add = _mask(action.add)
+        plain = not (tree or action.pre_num or action.num or action.cond)
+        self.generic: Optional[CompiledAction] = None if plain else action
+
+
+class BitState:
+    """An immutable, hashable planning state packed into an ``int`` bitmask
+    over a symbol table's atom IDs, plus a numeric fluent valuation.
+
+    Mirrors :class:`~pddlpy.planning.State`'s read API (``atoms``,
+    ``fluents``, ``ids``, membership, iteration), so plan-cost and action-cost
+    helpers accept either. Use :class:`PackedTask` to generate successors.
+    """
+
+    __slots__ = ("bits", "_fluents", "_symbols", "_hash")
+
+    def __init__(self, bits: int, symbols: "SymbolTable",
+                 fluents: Optional[Valuation] = None) -> None:
+        self.bits = bits
+        self._symbols = symbols
+        self._fluents: Valuation = fluents if fluents is not None else {}
+        self._hash: Optional[int] = None
+
+    @property
+    def atoms(self) -> FrozenSet[GroundAtom]:
+        return self._symbols.atoms_of(self.ids)
+
+    @property
+    def ids(self) -> FrozenSet[int]:
+        """The atoms as IDs in :attr:`symbols`."""
+        return _bit_ids(self.bits)
+
+    @property
+    def fluents(self) -> Valuation:
+        return self._fluents
+
+    @property
+    def symbols(self) -> "SymbolTable":
+        return self._symbols
+
+    def __contains__(self, atom: Any) -> bool:
+        i = self._symbols.find_atom(atom_tuple(atom))
+        return i is not None and (self.bits >> i) & 1 == 1
+
+    def __iter__(self) -> Iterator[GroundAtom]:
+        return iter(self.atoms)
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, BitState) and self.bits == other.bits
+                and self._symbols is other._symbols and self._fluents == other._fluents)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = (hash((self.bits, frozenset(self._fluents.items())))
+                          if self._fluents else hash(self.bits))
+        return self._hash
+
+    def __repr__(self) -> str:
+        if self._fluents:
+            return "BitState(%s, %s)" % (sorted(self.atoms), dict(sorted(self._fluents.items())))
+        return "BitState(%s)" % sorted(self.atoms)
+
+
+class PackedTask(GroundedTask):
+    """A :class:`GroundedTask` whose states are :class:`BitState` bitmasks.
+
+    Attributes (in addition to ``GroundedTask``'s):
+        initial   -- the initial ``BitState``.
+        goal_mask -- the goal atoms as a bitmask.
+    """
+
+    def __init__(self, domainproblem: "DomainProblem",
+                 workers: Optional[int] = None) -> None:
+        super().__init__(domainproblem, workers)
+        self.initial: BitState = BitState(  # type: ignore[assignment]
+            _mask(self.symbols.atom_ids(map(atom_tuple, domainproblem.initialstate()))),
+            self.symbols, dict(domainproblem.initial_numeric()))
+        self.goal_mask = _mask(self.goal_ids)
+        self._packed: List[_PackedAction] = [_PackedAction(a) for a in self.compiled]
+
+    def successors(self, state: BitState) -> Iterator[Tuple["Operator", BitState]]:  # type: ignore[override]
+        """Yield ``(action, successor_state)`` for every applicable action."""
+        bits = state.bits
+        fluents = state.fluents
+        symbols = self.symbols
+        packed = self._packed
+        for i in self.generator.candidates_bits(bits):
+            action = packed[i]
+            pre = action.pre
+            if bits & pre != pre or bits & action.neg:
+                continue
+            if action.generic is None:
+                yield action.operator, BitState((bits & action.keep) | action.add,
+                                                symbols, fluents)
+                continue
+            succ = self._apply_generic(action.generic, bits, fluents)
+            if succ is not None:
+                yield action.operator, succ
+
+    def _apply_generic(self, action: CompiledAction, bits: int,
+                       fluents: Valuation) -> Optional[BitState]:
+        """Applicability beyond the masks and full effect application, as in
+        ``State``: the precondition tree, numeric conditions and effects, and
+        conditional effects evaluated against the pre-state."""
+        view = _BitView(bits, self.symbols)
+        if action.precondition is not None:
+            if not action.precondition.holds(view, fluents):
+                return None
+        elif not all(test(fluents) for test in action.pre_num):
+            return None
+        add, delete, num_effects = action.add, action.dele, action.num
+        fired = [ce for ce in action.cond if ce[0].holds(view, fluents)]
+        if fired:
+            add = add.union(*(ce[1] for ce in fired))
+            delete = delete.union(*(ce[2] for ce in fired))
+            num_effects = num_effects + tuple(e for ce in fired for e in ce[3])
+        if num_effects:
+            updates = [update(fluents) for update in num_effects]
+            fluents = dict(fluents)
+            for key, value in updates:
+                fluents[key] = value
+        return BitState((bits & ~_mask(delete)) | _mask(add), self.symbols, fluents)
+
+    def is_goal(self, state: BitState) -> bool:  # type: ignore[override]
+        """True if ``state`` satisfies the goal."""
+        return state.bits & self.goal_mask == self.goal_mask
+
+    def goal_count(self, state: BitState) -> int:  # type: ignore[override]
+        """Number of goal atoms not yet satisfied in ``state``."""
+        return (self.goal_mask & ~state.bits).bit_count()
@@ -7,39 +7,101 @@ without re-deriving it (PRD §5.2).
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterator, List, Tuple
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
-from .state import State
+from .state import CompiledAction, State, atom_tuple, compile_action
+from .successors import SuccessorGenerator
 
 if TYPE_CHECKING:
     from pddlpy.pddl import DomainProblem, Operator
 
 
-class GroundedTask:
-    """A fully grounded planning task derived from a parsed ``DomainProblem``.
+class SearchTask(ABC):
+    """What search needs of a task: its initial state and goal, over the
+    problem's :class:`~pddlpy.symbols.SymbolTable`, and a successor
+    function. :class:`GroundedTask` grounds every action up front;
+    :class:`~pddlpy.planning.LazyGroundedTask` grounds them on demand.
 
     Attributes:
-        initial -- the initial ``State``.
-        goals   -- the goal atoms (as parsed; checked via ``State.satisfies``).
-        actions -- the list of all grounded ``Operator`` instances.
+        initial  -- the initial ``State``.
+        goals    -- the goal atoms (as parsed; checked via ``State.satisfies``).
+        symbols  -- the ``SymbolTable`` the task's states are expressed in.
+        goal_ids -- the goal atoms as IDs in ``symbols``.
     """
 
     def __init__(self, domainproblem: "DomainProblem") -> None:
         self.domainproblem = domainproblem
+        self.symbols = domainproblem.symbols()
         self.initial: State = State.from_problem(domainproblem)
         self.goals = domainproblem.goals()
-        self.actions: List["Operator"] = [
-            gop
-            for name in domainproblem.operators()
-            for gop in domainproblem.ground_operator(name)
-        ]
+        self.goal_ids: FrozenSet[int] = self.symbols.atom_ids(map(atom_tuple, self.goals))
 
+    @abstractmethod
     def successors(self, state: State) -> Iterator[Tuple["Operator", State]]:
         """Yield ``(action, successor_state)`` for every applicable action."""
-        for action in self.actions:
-            if state.applicable(action):
-                yield action, state.apply(action)
+        raise NotImplementedError  # pragma: no cover - abstract
+
+    @abstractmethod
+    def step_cost(self, operator: "Operator", state: State) -> float:
+        """The cost of applying one of this task's actions in ``state``."""
+        raise NotImplementedError  # pragma: no cover - abstract
 
     def is_goal(self, state: State) -> bool:
         """True if ``state`` satisfies the goal."""
-        return state.satisfies(self.goals)
+        return self.goal_ids <= state.ids
+
+    def goal_count(self, state: State) -> int:
+        """Number of goal atoms not yet satisfied in ``state`` — the
+        goal-count heuristic (admissible for unit costs)."""
+        return len(self.goal_ids - state.ids)
+
+
+class GroundedTask(SearchTask):
+    """A fully grounded planning task derived from a parsed ``DomainProblem``.
+
+    Search runs on atom IDs: every state of the task, and every action's
+    preconditions and effects, are interned once in the problem's
+    :class:`~pddlpy.symbols.SymbolTable`, and each action is compiled once
+    into a :class:`~pddlpy.planning.CompiledAction`, so expanding a state
+    normalizes nothing. The ``Operator`` objects are kept for plans, which
+    are built from them as before.
+
+    Attributes (in addition to ``SearchTask``'s):
+        actions  -- the list of all grounded ``Operator`` instances.
+        compiled -- the ``CompiledAction`` of each action, in the same order.
+        generator -- the ``SuccessorGenerator`` over ``actions``.
+
+    With ``workers`` set, the operators are grounded over a process pool of
+    that size (``DomainProblem.ground_operators``; ``1`` runs its tasks in
+    this process); the actions and their order are the same.
+    """
+
+    def __init__(self, domainproblem: "DomainProblem",
+                 workers: Optional[int] = None) -> None:
+        super().__init__(domainproblem)
+        self.actions: List["Operator"] = domainproblem.ground_operators(workers)
+        self.compiled: List[CompiledAction] = [
+            compile_action(op, self.symbols) for op in self.actions]
+        self.generator = SuccessorGenerator(self.compiled)
+        self._by_operator: Dict["Operator", CompiledAction] = {
+            action.operator: action for action in self.compiled}
+
+    def successors(self, state: State) -> Iterator[Tuple["Operator", State]]:
+        """Yield ``(action, successor_state)`` for every applicable action.
+        ``state`` must be over this task's ``symbols``. Only the candidates
+        the successor generator finds are tested."""
+        compiled = self.compiled
+        for i in self.generator.candidates(state.ids):
+            action = compiled[i]
+            if state._applicable(action):
+                yield action.operator, state._apply(action)
+
+    def step_cost(self, operator: "Operator", state: State) -> float:
+        """The cost of applying one of this task's actions in ``state``, as
+        :func:`~pddlpy.planning.action_cost` but from the compiled record:
+        constant costs are read, not re-evaluated."""
+        action = self._by_operator[operator]
+        if action.cost is not None:
+            return action.cost
+        return action.cost_fn(state.fluents)
@@ -0,0 +1,355 @@
+"""State heuristics for the best-first planners.
+
+A heuristic is built once per task and then called on each state it
+evaluates::
+
+    h = make_heuristic("ff", task)
+    h(task.initial)          # -> estimated cost to the goal, or inf
+
+The best-first planners take one by name — ``AStarPlanner(heuristic="hmax")``,
+``GBFSPlanner(heuristic="ff")`` — and the registry has presets such as
+``astar-hmax`` and ``gbfs-ff``. Built in:
+
+* ``goal-count`` — unsatisfied goal atoms (the default).
+* ``hmax``  — delete-relaxation h_max: the costliest goal, each atom costing
+  its cheapest achiever plus its costliest precondition. Admissible.
+* ``hadd``  — h_add: as h_max, but costs add up. Informative, not admissible.
+* ``ff``    — h_FF: the cost of a relaxed plan extracted from the h_add best
+  supporters. Not admissible. The relaxed plan's actions applicable in the
+  state are its preferred operators (:meth:`Heuristic.preferred`).
+* ``lmcut`` — LM-cut: a sum of disjoint action-landmark costs found by
+  repeated h_max cuts. Admissible and at least h_max; ``astar-lmcut`` uses
+  it over action costs.
+
+The relaxed heuristics share a :class:`RelaxedTask`: the grounded actions'
+positive preconditions (for an ADL tree, its guaranteed conjuncts) and add
+effects (conditional ones included, unconditionally), with an index from
+each atom to the actions that need it, precomputed once. Evaluating a state
+runs a priority-queue exploration from its atoms — each popped atom updates
+the pending-precondition counters of the actions that need it, and an
+action whose last precondition arrives updates its adds — so an evaluation
+touches each action at most once. Negative and numeric conditions are
+ignored, which keeps the relaxation sound; ``inf`` means the goal is
+unreachable even relaxed, and the planners prune such states.
+"""
+from __future__ import annotations
+
+import heapq
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Type
+
+from pddlpy.symbols import GroundAtom
+
+from .costs import TOTAL_COST
+from .numeric import cost_reads
+from .state import CompiledAction, atom_tuple
+
+if TYPE_CHECKING:
+    from pddlpy.pddl import Operator
+
+    from .grounding import GroundedTask, SearchTask
+
+INF = float("inf")
+
+
+class Heuristic(ABC):
+    """A state evaluator for one task. ``unit`` costs every action 1;
+    otherwise action costs are used. A state-dependent cost that reads only
+    functions no action changes (say ``(distance ?a ?b)``) is the same in
+    every state, so it is read from the initial state; any other counts as
+    0, which keeps admissible heuristics admissible."""
+
+    def __init__(self, task: "SearchTask", unit: bool = True) -> None:
+        self.task = task
+        self.unit = unit
+
+    @abstractmethod
+    def __call__(self, state: Any) -> float:
+        """The estimated cost from ``state`` to the goal, or ``inf``."""
+        raise NotImplementedError  # pragma: no cover - abstract
+
+    def reach(self, parent: Any, succ: Any) -> None:
+        """Search reached ``succ`` from ``parent`` and is about to evaluate
+        it. Path-dependent heuristics carry their state along here; the
+        others ignore it."""
+
+    def preferred(self, state: Any) -> Set["Operator"]:
+        """The operators applicable in ``state`` that its last evaluation
+        suggests trying first; none by default."""
+        return set()
+
+
+class GoalCount(Heuristic):
+    """Number of goal atoms not yet satisfied."""
+
+    def __call__(self, state: Any) -> float:
+        return self.task.goal_count(state)
+
+
+class RelaxedTask:
+    """The delete relaxation of a grounded task, indexed for exploration.
+
+    Attributes (index them by relaxed action):
+        pre      -- each action's positive precondition atom IDs.
+        add      -- each action's add effect atom IDs.
+        cost     -- each action's cost.
+        actions  -- the ``CompiledAction`` each relaxed action comes from.
+        needed_by -- atom ID -> the relaxed actions it is a precondition of.
+        goal     -- the goal atom IDs.
+    """
+
+    def __init__(self, task: "GroundedTask", unit: bool = True) -> None:
+        symbols = task.symbols
+        self.actions = list(task.compiled)
+        self.pre: List[Tuple[int, ...]] = []
+        self.add: List[Tuple[int, ...]] = []
+        self.cost: List[float] = []
+        self.needed_by: Dict[int, List[int]] = {}
+        written = set() if unit else _written_fluents(self.actions)
+        fluents = task.initial.fluents
+        for j, action in enumerate(self.actions):
+            if action.precondition is None:
+                pre = action.pre_pos
+            else:
+                pos = action.precondition.conjuncts()[0]
+                pre = symbols.atom_ids(atom_tuple(a.predicate) for a in pos)
+            add = set(action.add)
+            for cond in action.cond:
+                add.update(cond[1])
+            self.pre.append(tuple(pre))
+            self.add.append(tuple(sorted(add)))
+            self.cost.append(1.0 if unit else _relaxed_cost(action, written, fluents))
+            for atom in pre:
+                self.needed_by.setdefault(atom, []).append(j)
+        self.goal: Tuple[int, ...] = tuple(task.goal_ids)
+
+    def explore(self, ids: Any, combine: str, costs: Optional[List[float]] = None,
+                full: bool = False) -> Tuple[Dict[int, float], Dict[int, int]]:
+        """Cost every atom reachable from ``ids`` under the relaxation.
+
+        ``combine`` is ``"max"`` (h_max) or ``"sum"`` (h_add): how an
+        action's precondition costs combine. ``costs`` replaces the action
+        costs. Returns each reached atom's cost and the relaxed action that
+        first achieved it at that cost (its best supporter). Stops once
+        every goal is costed, unless ``full``.
+        """
+        action_cost = self.cost if costs is None else costs
+        cost: Dict[int, float] = dict.fromkeys(ids, 0.0)
+        supporter: Dict[int, int] = {}
+        heap: List[Tuple[float, int]] = [(0.0, atom) for atom in cost]
+        pending = [len(p) for p in self.pre]
+        reached = [0.0] * len(self.pre)
+        use_max = combine == "max"
+        goals = set(self.goal) - cost.keys()
+
+        def achieve(j: int) -> None:
+            c = reached[j] + action_cost[j]
+            for atom in self.add[j]:
+                if c < cost.get(atom, INF):
+                    cost[atom] = c
+                    supporter[atom] = j
+                    heapq.heappush(heap, (c, atom))
+
+        for j, n in enumerate(pending):
+            if n == 0:
+                achieve(j)
+        while heap and (goals or full):
+            c, atom = heapq.heappop(heap)
+            if c > cost[atom]:
+                continue  # pragma: no cover - stale heap entry (lazy deletion)
+            goals.discard(atom)
+            for j in self.needed_by.get(atom, ()):
+                reached[j] = max(reached[j], c) if use_max else reached[j] + c
+                pending[j] -= 1
+                if pending[j] == 0:
+                    achieve(j)
+        return cost, supporter
+
+
+def _written_fluents(actions: List[CompiledAction]) -> Set[GroundAtom]:
+    """The function heads some action changes, ``total-cost`` aside."""
+    written: Set[GroundAtom] = set()
+    for action in actions:
+        op = action.operator
+        effects = list(op.effect_num)
+        for ce in getattr(op, "conditional_effects", ()):
+            effects.extend(ce.num)
+        written.update(eff.head.head for eff in effects)
+    written.discard(TOTAL_COST)
+    return written
+
+
+def _relaxed_cost(action: CompiledAction, written: Set[GroundAtom], fluents: Any) -> float:
+    """``action``'s cost: a state-dependent one is read from ``fluents`` if
+    it reads only functions no action changes, else taken as 0."""
+    if action.cost is not None:
+        return action.cost
+    reads = cost_reads(action.operator.effect_num)
+    if reads is None or reads & written:
+        return 0.0
+    return action.cost_fn(fluents)
+
+
+class _Relaxed(Heuristic):
+    """Base of the relaxed heuristics: one :class:`RelaxedTask` per task."""
+
+    def __init__(self, task: "GroundedTask", unit: bool = True) -> None:
+        super().__init__(task, unit)
+        self.relaxed = RelaxedTask(task, unit)
+
+
+class HMax(_Relaxed):
+    """h_max: the costliest goal under max-combined precondition costs."""
+
+    def __call__(self, state: Any) -> float:
+        cost, _ = self.relaxed.explore(state.ids, "max")
+        return max((cost.get(g, INF) for g in self.relaxed.goal), default=0.0)
+
+
+class HAdd(_Relaxed):
+    """h_add: the summed goal costs under summed precondition costs."""
+
+    def __call__(self, state: Any) -> float:
+        cost, _ = self.relaxed.explore(state.ids, "sum")
+        return sum(cost.get(g, INF) for g in self.relaxed.goal)
+
+
+class HFF(_Relaxed):
+    """h_FF: the cost of a relaxed plan built backwards from the goals
+    through the h_add best supporters. After each call ``relaxed_plan``
+    holds its actions (as indices into ``relaxed.actions``); its actions
+    whose preconditions all hold in the state are the preferred
+    operators."""
+
+    def __init__(self, task: "GroundedTask", unit: bool = True) -> None:
+        super().__init__(task, unit)
+        self.relaxed_plan: Set[int] = set()
+
+    def __call__(self, state: Any) -> float:
+        relaxed = self.relaxed
+        cost, supporter = relaxed.explore(state.ids, "sum")
+        if any(g not in cost for g in relaxed.goal):
+            self.relaxed_plan = set()
+            return INF
+        plan: Set[int] = set()
+        marked: Set[int] = set()
+        stack = list(relaxed.goal)
+        while stack:
+            atom = stack.pop()
+            if atom in marked or atom not in supporter:
+                continue  # already handled, or true in the state
+            marked.add(atom)
+            j = supporter[atom]
+            if j not in plan:
+                plan.add(j)
+                stack.extend(relaxed.pre[j])
+        self.relaxed_plan = plan
+        return sum(relaxed.cost[j] for j in plan)
+
+    def preferred(self, state: Any) -> Set["Operator"]:
+        relaxed = self.relaxed
+        ids = state.ids
+        return {relaxed.actions[j].operator for j in self.relaxed_plan
+                if all(p in ids for p in relaxed.pre[j])}
+
+
+class LMCut(_Relaxed):
+    """LM-cut: admissible, and usually much tighter than h_max.
+
+    Repeatedly computes h_max under the remaining action costs, points each
+    action at its costliest precondition (its precondition choice), and
+    cuts the justification graph this gives between the atoms reachable
+    from the state and those that reach the costliest goal at zero cost.
+    The cut is a disjunctive action landmark: its cheapest action's cost is
+    added to the estimate and taken off every action in it. Stops when
+    h_max reaches 0. Build with ``unit=False`` for action costs.
+    """
+
+    def __init__(self, task: "GroundedTask", unit: bool = True) -> None:
+        super().__init__(task, unit)
+        relaxed = self.relaxed
+        self._achievers: Dict[int, List[int]] = {}
+        for j, add in enumerate(relaxed.add):
+            for atom in add:
+                self._achievers.setdefault(atom, []).append(j)
+        self._roots = [j for j, pre in enumerate(relaxed.pre) if not pre]
+
+    def __call__(self, state: Any) -> float:
+        relaxed = self.relaxed
+        costs = list(relaxed.cost)
+        total = 0.0
+        while True:
+            hmax, _ = relaxed.explore(state.ids, "max", costs, full=True)
+            if any(g not in hmax for g in relaxed.goal):
+                return INF
+            top = max(relaxed.goal, key=hmax.__getitem__, default=None)
+            if top is None or hmax[top] == 0:
+                return total
+            cut = self._cut(state.ids, hmax, costs, top)
+            m = min(costs[j] for j in cut)
+            total += m
+            for j in cut:
+                costs[j] -= m
+
+    def _cut(self, ids: Any, hmax: Dict[int, float], costs: List[float], top: int) -> Set[int]:
+        """The actions leading from the state's side of the justification
+        graph into the goal zone of ``top``."""
+        relaxed = self.relaxed
+        choice: Dict[int, int] = {}
+        for j, pre in enumerate(relaxed.pre):
+            if pre and all(p in hmax for p in pre):
+                choice[j] = max(pre, key=hmax.__getitem__)
+        # The goal zone: atoms from which ``top`` is reached at zero cost.
+        zone = {top}
+        stack = [top]
+        while stack:
+            atom = stack.pop()
+            for j in self._achievers.get(atom, ()):
+                if costs[j] == 0 and j in choice and choice[j] not in zone:
+                    zone.add(choice[j])
+                    stack.append(choice[j])
+        # The state's side: forward from the state, short of the zone. State
+        # atoms cost 0 under h_max, so none is in the zone.
+        cut: Set[int] = set()
+        seen = set(ids)
+        stack = list(seen)
+
+        def follow(j: int) -> None:
+            for atom in relaxed.add[j]:
+                if atom in zone:
+                    cut.add(j)
+                elif atom not in seen:
+                    seen.add(atom)
+                    stack.append(atom)
+
+        for j in self._roots:
+            follow(j)
+        while stack:
+            atom = stack.pop()
+            for j in relaxed.needed_by.get(atom, ()):
+                if choice.get(j) == atom:
+                    follow(j)
+        return cut
+
+
+#: Heuristics by name, for the planners' ``heuristic`` parameter.
+HEURISTICS: Dict[str, Type[Heuristic]] = {
+    "goal-count": GoalCount,
+    "hmax": HMax,
+    "hadd": HAdd,
+    "ff": HFF,
+    "lmcut": LMCut,
+}
+
+
+def register_heuristic(name: str, heuristic_cls: Type[Heuristic]) -> None:
+    """Make ``heuristic_cls`` selectable as ``heuristic=name``."""
+    HEURISTICS[name] = heuristic_cls
+
+
+def make_heuristic(name: str, task: "SearchTask", unit: bool = True) -> Heuristic:
+    """Build the heuristic registered as ``name`` for ``task``."""
+    if name not in HEURISTICS:
+        raise KeyError("no heuristic registered as %r; known: %s"
+                       % (name, sorted(HEURISTICS)))
+    return HEURISTICS[name](task, unit)
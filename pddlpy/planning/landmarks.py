@@ -0,0 +1,273 @@
+"""Fact landmarks and the landmark-count heuristic.
+
+A landmark is an atom every plan makes true at some point. The
+:class:`LandmarkGraph` of a task holds its fact landmarks and the orderings
+between them::
+
+    graph = landmark_graph(task)         # cached per problem
+    for i, lm in enumerate(graph):
+        print(lm.fact, [graph.landmarks[j].fact for j in graph.parents(i)])
+
+Landmarks are the h^m ones for m = 1, found by propagating labels through
+the delete relaxation (:class:`~pddlpy.planning.heuristics.RelaxedTask`):
+the label of an atom is the set of atoms every relaxed plan reaching it
+achieves first — the intersection, over its achievers, of the union of
+their preconditions' labels. The goals' labels are the landmarks. Every
+``q`` in the label of a landmark ``p`` is ordered before it
+(``natural``). The preconditions shared by every action that can achieve
+``p`` before ``p`` ever held are landmarks too, and must hold just before
+``p`` is first reached (``greedy-necessary``).
+
+:class:`LMCount` (``heuristic="lmcount"``, e.g. ``GBFSPlanner(heuristic=
+"lmcount")`` or the ``gbfs-lmcount`` preset) counts the landmarks still to
+reach on the path to a state, plus those reached that must be reached again:
+false goals, and greedy-necessary landmarks of ones not yet reached. It is
+path-dependent: search tells it each transition through
+:meth:`~pddlpy.planning.heuristics.Heuristic.reach`, and it carries the
+accepted landmarks of each state (those reached after all their parents)
+as a bitmask. Not admissible.
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+from weakref import WeakKeyDictionary
+
+from pddlpy.symbols import GroundAtom
+
+from .heuristics import INF, Heuristic, RelaxedTask, register_heuristic
+
+if TYPE_CHECKING:
+    from pddlpy.pddl import DomainProblem
+
+    from .grounding import GroundedTask
+
+#: Ordering kinds.
+NATURAL = "natural"
+GREEDY_NECESSARY = "greedy-necessary"
+
+
+class Landmark(NamedTuple):
+    """A fact landmark: an atom ID of the task's symbol table, its ground
+    tuple, and whether it is a goal and holds initially."""
+    atom: int
+    fact: GroundAtom
+    goal: bool
+    initial: bool
+
+
+class Ordering(NamedTuple):
+    """Landmark ``before`` must be reached before landmark ``after`` (both
+    indices into ``LandmarkGraph.landmarks``); ``kind`` is ``natural`` or
+    ``greedy-necessary``."""
+    before: int
+    after: int
+    kind: str
+
+
+class LandmarkGraph:
+    """The fact landmarks of a grounded task and their orderings.
+
+    Attributes:
+        landmarks -- the ``Landmark`` list, in atom-ID order.
+        orderings -- the ``Ordering`` list.
+        reachable -- False if some goal is unreachable even relaxed; the
+                     task is then unsolvable and has no landmarks.
+        initial_ids / goal_ids -- the atoms the graph was built for.
+    """
+
+    def __init__(self, task: "GroundedTask", relaxed: Optional[RelaxedTask] = None) -> None:
+        relaxed = relaxed if relaxed is not None else RelaxedTask(task)
+        self.initial_ids: FrozenSet[int] = frozenset(task.initial.ids)
+        self.goal_ids: FrozenSet[int] = frozenset(task.goal_ids)
+        labels = _labels(relaxed, self.initial_ids)
+        self.reachable = all(g in labels for g in self.goal_ids)
+        natural: Set[Tuple[int, int]] = set()
+        greedy: Set[Tuple[int, int]] = set()
+        found: Set[int] = set()
+        pending = sorted(self.goal_ids) if self.reachable else []
+        achievers: Dict[int, List[int]] = {}
+        for j, add in enumerate(relaxed.add):
+            for atom in add:
+                achievers.setdefault(atom, []).append(j)
+        while pending:
+            p = pending.pop()
+            if p in found:
+                continue
+            found.add(p)
+            for q in labels[p] - {p}:
+                natural.add((q, p))
+                pending.append(q)
+            if p in self.initial_ids:
+                continue
+            for q in _shared_preconditions(relaxed, labels, achievers.get(p, ()), p):
+                greedy.add((q, p))
+                pending.append(q)
+        symbols = task.symbols
+        self.landmarks: List[Landmark] = [
+            Landmark(atom, symbols.atoms[atom], atom in self.goal_ids,
+                     atom in self.initial_ids)
+            for atom in sorted(found)]
+        self._index = {lm.atom: i for i, lm in enumerate(self.landmarks)}
+        index = self._index
+        self.orderings: List[Ordering] = sorted(
+            [Ordering(index[q], index[p], GREEDY_NECESSARY) for q, p in greedy]
+            + [Ordering(index[q], index[p], NATURAL) for q, p in natural - greedy])
+        self._parents: List[List[int]] = [[] for _ in self.landmarks]
+        self._children: List[List[int]] = [[] for _ in self.landmarks]
+        for o in self.orderings:
+            self._parents[o.after].append(o.before)
+            self._children[o.before].append(o.after)
+
+    def __len__(self) -> int:
+        return len(self.landmarks)
+
+    def __iter__(self) -> Iterator[Landmark]:
+        return iter(self.landmarks)
+
+    def index(self, fact: GroundAtom, symbols: Any) -> int:
+        """The index of the landmark for ``fact``, a ground tuple in the
+        task's ``symbols``; KeyError if it is not a landmark."""
+        atom = symbols.find_atom(fact)
+        if atom not in self._index:
+            raise KeyError("%r is not a landmark" % (fact,))
+        return self._index[atom]
+
+    def parents(self, i: int) -> List[int]:
+        """The landmarks ordered before landmark ``i``."""
+        return self._parents[i]
+
+    def children(self, i: int) -> List[int]:
+        """The landmarks ordered after landmark ``i``."""
+        return self._children[i]
+
+
+def _labels(relaxed: RelaxedTask, ids: FrozenSet[int]) -> Dict[int, FrozenSet[int]]:
+    """Each relaxed-reachable atom's h^1 landmarks (itself included), by
+    propagating labels from ``ids`` to a fixpoint; labels only shrink once
+    set."""
+    label: Dict[int, FrozenSet[int]] = {p: frozenset((p,)) for p in ids}
+    pending = [len(pre) for pre in relaxed.pre]
+    # (atom, first): ``first`` when the atom has just been labelled.
+    queue: Deque[Tuple[int, bool]] = deque((p, True) for p in label)
+
+    def update(j: int) -> None:
+        through = frozenset().union(*(label[q] for q in relaxed.pre[j]))
+        for p in relaxed.add[j]:
+            if p in ids:
+                continue
+            new = through | {p}
+            old = label.get(p)
+            if old is None:
+                label[p] = new
+                queue.append((p, True))
+            elif not old <= new:
+                label[p] = old & new
+                queue.append((p, False))
+
+    for j, n in enumerate(pending):
+        if n == 0:
+            update(j)
+    while queue:
+        p, first = queue.popleft()
+        for j in relaxed.needed_by.get(p, ()):
+            if first:
+                pending[j] -= 1
+            if pending[j] == 0:
+                update(j)
+    return label
+
+
+def _shared_preconditions(relaxed: RelaxedTask, labels: Dict[int, FrozenSet[int]],
+                          achievers: Any, p: int) -> FrozenSet[int]:
+    """The preconditions shared by every achiever of ``p`` that can be
+    applied before ``p`` first holds (one whose preconditions do not
+    need ``p``)."""
+    shared: Optional[FrozenSet[int]] = None
+    for j in achievers:
+        pre = relaxed.pre[j]
+        if any(q not in labels or p in labels[q] for q in pre):
+            continue
+        shared = frozenset(pre) if shared is None else shared & frozenset(pre)
+    return shared or frozenset()
+
+
+#: Landmark graphs by problem (weakly held).
+_GRAPHS: "WeakKeyDictionary[DomainProblem, LandmarkGraph]" = WeakKeyDictionary()
+
+
+def landmark_graph(task: "GroundedTask") -> LandmarkGraph:
+    """The :class:`LandmarkGraph` of ``task``, cached per problem: built on
+    first use, and rebuilt if the problem's initial state or goal changed."""
+    graph = _GRAPHS.get(task.domainproblem)
+    if (graph is None or graph.initial_ids != task.initial.ids
+            or graph.goal_ids != task.goal_ids):
+        graph = _GRAPHS[task.domainproblem] = LandmarkGraph(task)
+    return graph
+
+
+class LMCount(Heuristic):
+    """The landmark-count heuristic over :func:`landmark_graph`.
+
+    A state's accepted landmarks are those of its parent plus those true in
+    it whose parents in the graph were all accepted; a state reached along
+    several paths keeps the landmarks accepted on all of them. The estimate
+    is the number of unaccepted landmarks plus the accepted ones required
+    again: false goals, and false landmarks greedy-necessarily ordered
+    before an unaccepted one. Unit counts; ``unit`` is ignored.
+    """
+
+    def __init__(self, task: "GroundedTask", unit: bool = True) -> None:
+        super().__init__(task, unit)
+        self.graph = graph = landmark_graph(task)
+        self._atoms = [lm.atom for lm in graph]
+        self._parents = [sum(1 << j for j in graph.parents(i)) for i in range(len(graph))]
+        self._goal = sum(1 << i for i, lm in enumerate(graph) if lm.goal)
+        self._greedy = [0] * len(graph)
+        for o in graph.orderings:
+            if o.kind == GREEDY_NECESSARY:
+                self._greedy[o.before] |= 1 << o.after
+        self._accepted: Dict[Any, int] = {}
+
+    def reach(self, parent: Any, succ: Any) -> None:
+        before = self._accepted.get(parent, 0)
+        accepted = before
+        ids = succ.ids
+        parents = self._parents
+        for i, atom in enumerate(self._atoms):
+            if atom in ids and parents[i] & ~before == 0:
+                accepted |= 1 << i
+        previous = self._accepted.get(succ)
+        self._accepted[succ] = accepted if previous is None else previous & accepted
+
+    def __call__(self, state: Any) -> float:
+        if not self.graph.reachable:
+            return INF
+        ids = state.ids
+        accepted = self._accepted.get(state)
+        if accepted is None:
+            # A state search did not reach: accept what holds in it.
+            accepted = sum(1 << i for i, atom in enumerate(self._atoms) if atom in ids)
+            self._accepted[state] = accepted
+        h = len(self._atoms) - accepted.bit_count()
+        unaccepted = ~accepted
+        for i, atom in enumerate(self._atoms):
+            if accepted >> i & 1 and atom not in ids and (
+                    self._goal >> i & 1 or self._greedy[i] & unaccepted):
+                h += 1
+        return h
+
+
+register_heuristic("lmcount", LMCount)
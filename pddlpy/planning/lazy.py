@@ -0,0 +1,186 @@
+"""On-demand grounding: a task that grounds only the actions search touches.
+
+A :class:`GroundedTask` grounds and compiles every action before the first
+expansion. When search visits a small part of a large task most of that is
+wasted, in startup time and in memory. :class:`LazyGroundedTask` grounds
+nothing up front: expanding a state joins each lifted operator's
+preconditions against that state's atoms — static ones through the
+problem's ``init_index()``, the others through an index of the state's
+fluent atoms — and grounds and compiles only the bindings that come out.
+Compiled actions are kept in a bounded least-recently-used cache, so
+revisiting similar states does not ground them again::
+
+    task = LazyGroundedTask(dp, cache_size=10000)
+    for action, succ in task.successors(task.initial):
+        ...
+    task.cache_info()   # CacheInfo(hits=..., misses=..., maxsize=10000, currsize=...)
+
+Planners build one when constructed with ``lazy=True``, e.g.
+``registry.get("astar", lazy=True, cache_size=10000)``. Only the
+goal-count heuristic runs on one: the relaxed heuristics (``hmax``,
+``ff``, ``lmcut``, ``lmcount``, ``pdb``) read every grounded action, which a
+lazy task never has, so a best-first planner built with ``lazy=True`` and
+any other heuristic raises ValueError.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from pddlpy.binding import FactIndex, StaticPrunedBinder
+
+from .grounding import SearchTask
+from .state import CompiledAction, GroundAtom, State, compile_action
+
+if TYPE_CHECKING:
+    from pddlpy.pddl import DomainProblem, Operator
+
+#: Grounded actions a lazy task keeps compiled by default.
+DEFAULT_CACHE_SIZE = 100000
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a lazy task's action cache, as ``functools.lru_cache``
+    reports them."""
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class _StateFacts(FactIndex):
+    """The atoms of one state, for joins: static predicates are answered by
+    the initial state's index, the rest by an index of the fluent atoms."""
+
+    def __init__(self, fluent: List[GroundAtom], static: AbstractSet[str],
+                 init: FactIndex) -> None:
+        super().__init__(fluent)
+        self._static = static
+        self._init = init
+
+    def atoms(self, predicate: str) -> List[GroundAtom]:
+        if predicate in self._static:
+            return self._init.atoms(predicate)
+        return super().atoms(predicate)
+
+    def lookup(self, predicate: str, position: int, value: str) -> List[GroundAtom]:
+        if predicate in self._static:
+            return self._init.lookup(predicate, position, value)
+        return super().lookup(predicate, position, value)
+
+    def distinct(self, predicate: str, position: int) -> int:
+        if predicate in self._static:
+            return self._init.distinct(predicate, position)
+        return super().distinct(predicate, position)
+
+
+class LazyGroundedTask(SearchTask):
+    """A :class:`~pddlpy.planning.SearchTask` that grounds actions on
+    demand.
+
+    ``initial``, ``goals``, ``goal_ids`` and ``symbols`` are as for
+    ``GroundedTask``; there is no ``actions``, ``compiled`` or
+    ``generator``, since the actions are never all known. ``successors``
+    binds each operator against the state and tests only the resulting
+    bindings, so it yields the same successors as the eager task, though
+    not in the same order. The problem's binder (``dp.binder``) decides
+    which bindings exist: one with a ``bind_in`` join (a
+    :class:`~pddlpy.binding.StaticPrunedBinder`) binds against the state
+    directly; for any other, the state join is kept to the bindings its
+    ``bind`` enumerates, listed once per operator.
+
+    cache_size -- how many compiled actions to keep; the least recently used
+                  is evicted past it. ``None`` keeps every action grounded.
+                  The cache is the only thing that holds groundings.
+    """
+
+    def __init__(self, domainproblem: "DomainProblem",
+                 cache_size: Optional[int] = DEFAULT_CACHE_SIZE) -> None:
+        if cache_size is not None and cache_size < 0:
+            raise ValueError("cache_size must not be negative")
+        super().__init__(domainproblem)
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, Tuple[str, ...]], CompiledAction]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._static = domainproblem.static_predicates()
+        # Bindings allowed by a binder that cannot join against a state.
+        self._allowed: Dict[str, Set[Tuple[str, ...]]] = {}
+
+    def successors(self, state: State) -> Iterator[Tuple["Operator", State]]:
+        """Yield ``(action, successor_state)`` for every applicable action,
+        grounding the ones not in the cache."""
+        dp = self.domainproblem
+        facts = self._facts(state)
+        for name, op in dp.domain.operators.items():
+            for binding in self._bind(name, op, facts):
+                action = self._action(name, binding)
+                if state._applicable(action):
+                    yield action.operator, state._apply(action)
+
+    def step_cost(self, operator: "Operator", state: State) -> float:
+        key = (operator.operator_name, tuple(operator.variable_list.values()))
+        action = self._cache.get(key)  # type: ignore[arg-type]
+        if action is None:
+            action = compile_action(operator, self.symbols)
+        if action.cost is not None:
+            return action.cost
+        return action.cost_fn(state.fluents)
+
+    def cache_info(self) -> CacheInfo:
+        """Hits, misses and size of the action cache."""
+        return CacheInfo(self._hits, self._misses, self.cache_size, len(self._cache))
+
+    def _facts(self, state: State) -> _StateFacts:
+        atoms = self.symbols.atoms
+        static = self._static
+        fluent = [atoms[i] for i in state.ids if atoms[i][0] not in static]
+        return _StateFacts(fluent, static, self.domainproblem.init_index())
+
+    def _bind(self, name: str, op: "Operator", facts: _StateFacts) -> Iterator[Dict[str, str]]:
+        """The bindings of ``op`` the problem's binder allows whose
+        guaranteed positive preconditions hold in ``facts``."""
+        dp = self.domainproblem
+        binder = dp.binder
+        if isinstance(binder, StaticPrunedBinder):
+            yield from binder.bind_in(dp, op, facts)
+            return
+        allowed = self._allowed.get(name)
+        if allowed is None:
+            allowed = self._allowed[name] = {
+                tuple(b[v] for v in op.variable_list) for b in binder.bind(dp, op)}
+        for binding in _JOIN.bind_in(dp, op, facts):
+            if tuple(binding.values()) in allowed:
+                yield binding
+
+    def _action(self, name: str, binding: Dict[str, str]) -> CompiledAction:
+        """The compiled action of operator ``name`` under ``binding``, from
+        the cache or grounded now."""
+        key = (name, tuple(binding.values()))
+        cache = self._cache
+        action = cache.get(key)
+        if action is not None:
+            self._hits += 1
+            cache.move_to_end(key)
+            return action
+        self._misses += 1
+        action = compile_action(self.domainproblem.ground_binding(name, binding), self.symbols)
+        if self.cache_size != 0:
+            cache[key] = action
+            if self.cache_size is not None and len(cache) > self.cache_size:
+                cache.popitem(last=False)
+        return action
+
+
+#: The state join used under binders that have none of their own.
+_JOIN = StaticPrunedBinder()
@@ -0,0 +1,186 @@
+"""Lifted successor generation, for tasks too large to ground.
+
+Even on demand, a :class:`~pddlpy.planning.LazyGroundedTask` builds an
+``Operator`` for every action it applies. :class:`LiftedTask` keeps the
+operators lifted: expanding a state joins each operator's precondition atoms
+against the state's atoms (the database join of
+:meth:`~pddlpy.binding.StaticPrunedBinder.bind_in`, over ``Atom.predicate``
+patterns), and a STRIPS operator is applied straight from its lifted
+negative preconditions and effects under each binding. States leave out
+the static atoms, which large tasks are mostly made of. Actions are named by
+:class:`LiftedAction` ``(operator, args)`` pairs; only the ones in the plan
+found are ever grounded.
+
+Operators outside that fragment — numeric conditions or effects,
+conditional or universal effects, a precondition that is not a plain
+conjunction — are still joined lifted, but each binding the join yields is
+grounded to test and apply it, and then dropped: it is compiled with
+:func:`~pddlpy.planning.compile_action`, which keeps no record of it.
+
+The ``lifted`` planner searches a ``LiftedTask`` greedily on the goal
+count::
+
+    plan = registry.get("lifted").solve(dp)
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple
+
+from pddlpy.binding import StaticPrunedBinder
+
+from .base import Planner, validate_requirements
+from .costs import plan_cost
+from .lazy import _StateFacts
+from .registry import register
+from .search import ADL_CAPABILITIES
+from .state import Plan, State, atom_tuple, compile_action
+
+if TYPE_CHECKING:
+    from pddlpy.pddl import Atom, DomainProblem, Operator
+
+#: Parent-pointer map used to reconstruct a plan.
+_CameFrom = Dict[State, Tuple[State, "LiftedAction"]]
+
+
+class LiftedAction(NamedTuple):
+    """An action of a lifted task: operator ``name`` applied to ``args``,
+    its parameter values in order."""
+    name: str
+    args: Tuple[str, ...]
+
+
+class _Template(NamedTuple):
+    """What applying a STRIPS operator needs beyond its join: the lifted
+    negative preconditions, add and delete effects."""
+    pre_neg: List["Atom"]
+    add: List["Atom"]
+    dele: List["Atom"]
+
+
+class LiftedTask:
+    """Initial state, goals and a successor function over lifted operators.
+
+    ``successors`` yields ``(LiftedAction, successor)`` pairs — the same
+    transitions a ``GroundedTask`` has, without grounding the task; use
+    :meth:`operator` to ground the actions of a plan. States hold only the
+    atoms of fluent predicates: the static ones (``static_ids``) are the
+    same in every state, and joins read them from ``init_index()``, so they
+    are neither stored nor hashed per state. ``goal_ids`` likewise lists the
+    fluent goals only.
+    """
+
+    def __init__(self, domainproblem: "DomainProblem") -> None:
+        self.domainproblem = domainproblem
+        self.symbols = domainproblem.symbols()
+        self.goals = domainproblem.goals()
+        self._static = domainproblem.static_predicates()
+        init = State.from_problem(domainproblem)
+        atoms = self.symbols.atoms
+        self.static_ids: FrozenSet[int] = frozenset(
+            i for i in init.ids if atoms[i][0] in self._static)
+        self.initial: State = State.from_ids(init.ids - self.static_ids, self.symbols,
+                                             init.fluents)
+        goal_ids = self.symbols.atom_ids(map(atom_tuple, self.goals))
+        static_goals = frozenset(i for i in goal_ids if atoms[i][0] in self._static)
+        self.goal_ids: FrozenSet[int] = goal_ids - static_goals
+        # A static goal holds in every state or in none.
+        self._unreachable = len(static_goals - self.static_ids)
+        self._binder = StaticPrunedBinder()
+        self._templates: Dict[str, Optional[_Template]] = {
+            name: _template(op) for name, op in domainproblem.domain.operators.items()}
+
+    def successors(self, state: State) -> Iterator[Tuple[LiftedAction, State]]:
+        """Yield ``(action, successor_state)`` for every applicable action."""
+        dp = self.domainproblem
+        symbols = self.symbols
+        ids = state.ids
+        atoms = symbols.atoms
+        facts = _StateFacts([atoms[i] for i in ids], self._static, dp.init_index())
+        full: Optional[State] = None
+        for name, op in dp.domain.operators.items():
+            template = self._templates[name]
+            for binding in self._binder.bind_in(dp, op, facts):
+                action = LiftedAction(name, tuple(binding.values()))
+                if template is None:
+                    # The grounded test and the guards of conditional
+                    # effects may read static atoms, so both run on the full
+                    # state; no action changes them, so they are dropped again.
+                    if full is None:
+                        full = State.from_ids(ids | self.static_ids, symbols, state.fluents)
+                    compiled = compile_action(dp.ground_binding(name, binding), symbols)
+                    if full._applicable(compiled):
+                        succ = full._apply(compiled)
+                        yield action, State.from_ids(succ.ids - self.static_ids, symbols,
+                                                     succ.fluents)
+                    continue
+                if any(symbols.find_atom(a.ground(binding)) in ids for a in template.pre_neg):
+                    continue
+                dele = symbols.atom_ids(a.ground(binding) for a in template.dele)
+                add = symbols.atom_ids(a.ground(binding) for a in template.add)
+                yield action, State.from_ids((ids - dele) | add, symbols, state.fluents)
+
+    def is_goal(self, state: State) -> bool:
+        """True if ``state`` satisfies the goal."""
+        return not self._unreachable and self.goal_ids <= state.ids
+
+    def goal_count(self, state: State) -> int:
+        """Number of goal atoms not yet satisfied in ``state``."""
+        return self._unreachable + len(self.goal_ids - state.ids)
+
+    def operator(self, action: LiftedAction) -> "Operator":
+        """The grounded ``Operator`` of ``action``."""
+        op = self.domainproblem.domain.operators[action.name]
+        return self.domainproblem.ground_binding(action.name,
+                                                 dict(zip(op.variable_list, action.args)))
+
+
+def _template(op: "Operator") -> Optional[_Template]:
+    """The :class:`_Template` of ``op``, or None if it is not plain STRIPS."""
+    if (not op.simple_conjunction or op.precondition_num or op.effect_num
+            or (op.effect_tree is not None
+                and "conditional-effects" in op.effect_tree.features())):
+        return None
+    return _Template(list(op.precondition_neg), list(op.effect_pos), list(op.effect_neg))
+
+
+def _reconstruct(came_from: _CameFrom, state: State) -> List[LiftedAction]:
+    """Walk parent pointers back to the start, returning the action list."""
+    actions: List[LiftedAction] = []
+    while state in came_from:
+        state, action = came_from[state]
+        actions.append(action)
+    actions.reverse()
+    return actions
+
+
+class LiftedPlanner(Planner):
+    """Greedy best-first search on the goal count over a :class:`LiftedTask`:
+    the task is never grounded, only the plan found is. Not optimal."""
+
+    capabilities = ADL_CAPABILITIES
+
+    def solve(self, domainproblem: "DomainProblem") -> Optional[Plan]:
+        validate_requirements(domainproblem)
+        self.check_capabilities(domainproblem)
+        task = LiftedTask(domainproblem)
+        start = task.initial
+        counter = itertools.count()  # tie-breaker; keeps States out of compares
+        frontier: List[Tuple[int, int, State]] = [(task.goal_count(start), next(counter), start)]
+        seen = {start}
+        came_from: _CameFrom = {}
+        while frontier:
+            _, _, state = heapq.heappop(frontier)
+            if task.is_goal(state):
+                actions = [task.operator(a) for a in _reconstruct(came_from, state)]
+                return Plan(actions, cost=plan_cost(state, actions))
+            for action, succ in task.successors(state):
+                if succ not in seen:
+                    seen.add(succ)
+                    came_from[succ] = (state, action)
+                    heapq.heappush(frontier, (task.goal_count(succ), next(counter), succ))
+        return None
+
+
+register("lifted", LiftedPlanner)
@@ -0,0 +1,166 @@
+"""Numeric expressions, constraints and effects compiled to closures.
+
+The object model evaluates a numeric expression by walking its tree
+(``Expr.value``) and dispatches an effect's operator by string comparison on
+every ``NumericEffect.apply``. Grounded actions are applied many times
+during search, so the planning layer compiles each tree once into a Python
+closure: constant subexpressions are folded, a fluent read becomes one dict
+lookup, and the effect's operator is resolved up front::
+
+    cost = compile_expr(effect.expr)          # Valuation -> float
+    cost(state.fluents)
+
+Nodes are recognized by their attributes rather than by class, so this
+module does not import the object model (or the parser) at run time; an
+unrecognized node falls back to its own ``value`` method.
+"""
+from __future__ import annotations
+
+import operator as _operator
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pddlpy.symbols import GroundAtom
+
+from .costs import TOTAL_COST
+
+if TYPE_CHECKING:
+    from pddlpy.pddl import NumericConstraint, NumericEffect
+
+#: A numeric fluent valuation: ground function head -> value.
+Valuation = Dict[GroundAtom, float]
+#: A compiled expression.
+Reader = Callable[[Valuation], float]
+#: A compiled numeric precondition.
+Test = Callable[[Valuation], bool]
+#: A compiled numeric effect: returns ``(ground_head, new_value)``.
+Update = Callable[[Valuation], Tuple[GroundAtom, float]]
+
+_ARITH: Dict[str, Callable[[float, float], float]] = {
+    "+": _operator.add, "-": _operator.sub, "*": _operator.mul, "/": _operator.truediv}
+_COMPARE: Dict[str, Callable[[float, float], bool]] = {
+    ">": _operator.gt, "<": _operator.lt, "=": _operator.eq,
+    ">=": _operator.ge, "<=": _operator.le}
+
+
+def _fold(expr: Any) -> Union[float, Reader]:
+    """Compile ``expr``: a float when it is constant, else a closure."""
+    if hasattr(expr, "num"):
+        return float(expr.num)
+    if hasattr(expr, "head"):
+        head = expr.head
+        return lambda valuation: valuation.get(head, 0.0)
+    if hasattr(expr, "operand"):
+        operand = _fold(expr.operand)
+        if isinstance(operand, float):
+            return -operand
+        return lambda valuation: -operand(valuation)
+    if hasattr(expr, "left"):
+        fn = _ARITH[expr.op]
+        left, right = _fold(expr.left), _fold(expr.right)
+        if isinstance(left, float) and isinstance(right, float):
+            try:
+                return fn(left, right)
+            except ArithmeticError:
+                pass  # keep the error where the model raises it: on evaluation
+        lhs, rhs = _reader(left), _reader(right)
+        return lambda valuation: fn(lhs(valuation), rhs(valuation))
+    return expr.value  # type: ignore[no-any-return]
+
+
+def _reader(folded: Union[float, Reader]) -> Reader:
+    if isinstance(folded, float):
+        return lambda valuation: folded
+    return folded
+
+
+def compile_expr(expr: Any) -> Reader:
+    """Compile a ground numeric expression into ``valuation -> float``."""
+    return _reader(_fold(expr))
+
+
+def compile_constraint(constraint: "NumericConstraint") -> Test:
+    """Compile a ground numeric precondition into ``valuation -> bool``."""
+    cmp = _COMPARE[constraint.comp]
+    lhs, rhs = compile_expr(constraint.lhs), compile_expr(constraint.rhs)
+    return lambda valuation: cmp(lhs(valuation), rhs(valuation))
+
+
+def compile_effect(effect: "NumericEffect") -> Update:
+    """Compile a ground numeric effect into ``valuation -> (head, value)``,
+    the contract of ``NumericEffect.apply``."""
+    key = effect.head.head
+    rhs = compile_expr(effect.expr)
+    op = effect.op
+    if op == "assign":
+        return lambda valuation: (key, rhs(valuation))
+    if op == "increase":
+        return lambda valuation: (key, valuation.get(key, 0.0) + rhs(valuation))
+    if op == "decrease":
+        return lambda valuation: (key, valuation.get(key, 0.0) - rhs(valuation))
+    if op == "scale-up":
+        return lambda valuation: (key, valuation.get(key, 0.0) * rhs(valuation))
+    if op == "scale-down":
+        return lambda valuation: (key, valuation.get(key, 0.0) / rhs(valuation))
+    raise ValueError("unknown assign op: %s" % op)  # pragma: no cover - grammar
+
+
+def compile_cost(effects: Iterable["NumericEffect"]) -> Tuple[Optional[float], Reader]:
+    """The step cost of an action with numeric ``effects``: the sum of its
+    ``(increase (total-cost) expr)`` effects, or 1.0 without one (as
+    ``action_cost``). Returns ``(constant, reader)``; ``constant`` is the
+    cost when no term reads a fluent, else None."""
+    terms = [_fold(eff.expr) for eff in effects
+             if eff.head.head == TOTAL_COST and eff.op == "increase"]
+    if not terms:
+        return 1.0, lambda valuation: 1.0
+    if all(isinstance(t, float) for t in terms):
+        total = _total(t for t in terms if isinstance(t, float))
+        return total, lambda valuation: total
+    readers = [_reader(t) for t in terms]
+    return None, lambda valuation: _total(r(valuation) for r in readers)
+
+
+def cost_reads(effects: Iterable["NumericEffect"]) -> Optional[FrozenSet[GroundAtom]]:
+    """The ground function heads the step cost of ``compile_cost(effects)``
+    reads, or None if a term has a node this module does not recognize."""
+    heads: FrozenSet[GroundAtom] = frozenset()
+    for eff in effects:
+        if eff.head.head == TOTAL_COST and eff.op == "increase":
+            read = _reads(eff.expr)
+            if read is None:
+                return None
+            heads |= read
+    return heads
+
+
+def _reads(expr: Any) -> Optional[FrozenSet[GroundAtom]]:
+    if hasattr(expr, "num"):
+        return frozenset()
+    if hasattr(expr, "head"):
+        return frozenset([expr.head])
+    if hasattr(expr, "operand"):
+        return _reads(expr.operand)
+    if hasattr(expr, "left"):
+        left, right = _reads(expr.left), _reads(expr.right)
+        if left is None or right is None:
+            return None
+        return left | right
+    return None
+
+
+def _total(values: Iterable[float]) -> float:
+    # Left-to-right float addition, exactly as ``action_cost`` sums.
+    total = 0.0
+    for value in values:
+        total += value
+    return total
@@ -0,0 +1,492 @@
+"""Pattern database heuristics, with an on-disk store.
+
+A pattern is a set of atoms. Projecting a grounded task onto one keeps
+only those atoms in states, preconditions and effects; the projection's
+states are the bitmasks over the pattern, few enough to search them all.
+A :class:`PatternDatabase` holds the projection's goal distance for every
+one of them in an ``array('d')``, indexed by that bitmask, so evaluating a
+state is one lookup::
+
+    pdb = PatternDatabase.build(task, pattern)
+    pdb.value(state.ids)
+
+The projection keeps only what every real transition agrees with: the
+positive and negative preconditions (an ADL tree's guaranteed conjuncts),
+and for an action with conditional effects, every combination of them
+firing. Numeric conditions are dropped. Distances in it are therefore
+admissible estimates.
+
+:class:`CanonicalPDB` (``heuristic="pdb"``, preset ``astar-pdb``) selects a
+pattern collection and combines its PDBs canonically: patterns no action
+affects together are additive, and the estimate is the largest sum over a
+maximal set of pairwise additive ones. ``selection`` is ``"ipdb"`` (hill
+climbing from one pattern per goal atom: each step adds the extension of
+a pattern by one causally relevant atom that raises the estimate on the
+most states sampled by random walks) or ``"greedy"`` (one pattern, the
+goal atoms and then causally relevant atoms breadth-first, up to the size
+bound).
+
+A :class:`PDBStore` keeps PDBs on disk, keyed by a SHA-256 of the
+projection itself: the pattern's atoms (as tuples, not IDs), then the goal
+and the projected actions as bitmasks over the pattern. A projected action
+is its precondition, negative precondition and outcome masks and its cost;
+action names play no part, so actions that project alike are one, and the
+key does not depend on how the task numbers its atoms. A later run whose
+problem projects the same way — the same problem, or another of its family
+that differs only outside the pattern, e.g. in its initial state — loads
+the table instead of searching::
+
+    h = CanonicalPDB(task, store=PDBStore("~/.cache/pddlpy-pdb"))
+
+The ``pdb`` heuristic uses the store named by ``$PDDLPY_PDB_DIR``, if set.
+Entries are a JSON header line and the raw table.
+"""
+from __future__ import annotations
+
+import hashlib
+import heapq
+import itertools
+import json
+import os
+import random
+import sys
+import tempfile
+from array import array
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from pddlpy.symbols import GroundAtom
+
+from .heuristics import INF, Heuristic, RelaxedTask, register_heuristic
+from .state import atom_tuple
+
+if TYPE_CHECKING:
+
+    from .grounding import GroundedTask
+
+#: Bumped whenever the stored layout changes, so old entries miss.
+PDB_FORMAT = 1
+
+#: Environment variable naming the store used by the ``pdb`` heuristic.
+PDB_DIR_ENV = "PDDLPY_PDB_DIR"
+
+_SUFFIX = ".pdb"
+
+
+class _Operator(NamedTuple):
+    """A grounded action as projections need it: atom-ID preconditions,
+    its possible ``(add, delete)`` outcomes, the atoms they touch, and its
+    cost."""
+    pre: FrozenSet[int]
+    neg: FrozenSet[int]
+    outcomes: Tuple[Tuple[FrozenSet[int], FrozenSet[int]], ...]
+    affects: FrozenSet[int]
+    cost: float
+
+
+def _operators(task: "GroundedTask", unit: bool) -> List[_Operator]:
+    """The task's actions as :class:`_Operator` records."""
+    relaxed = RelaxedTask(task, unit)
+    symbols = task.symbols
+    out = []
+    for action, cost in zip(relaxed.actions, relaxed.cost):
+        if action.precondition is None:
+            pre, neg = action.pre_pos, action.pre_neg
+        else:
+            pos_atoms, neg_atoms = action.precondition.conjuncts()
+            pre = symbols.atom_ids(atom_tuple(a.predicate) for a in pos_atoms)
+            neg = symbols.atom_ids(atom_tuple(a.predicate) for a in neg_atoms)
+        outcomes = []
+        for fired in itertools.product((False, True), repeat=len(action.cond)):
+            add, dele = set(action.add), set(action.dele)
+            for on, cond in zip(fired, action.cond):
+                if on:
+                    add |= cond[1]
+                    dele |= cond[2]
+            outcomes.append((frozenset(add), frozenset(dele)))
+        affects = frozenset().union(*(add | dele for add, dele in outcomes))
+        out.append(_Operator(pre, neg, tuple(outcomes), affects, cost))
+    return out
+
+
+class _Projection(NamedTuple):
+    """A task projected onto a pattern: goal and actions as bitmasks over
+    the pattern's atoms, deduplicated, dropping actions that change none."""
+    goal: int
+    actions: Tuple[Tuple[int, int, Tuple[Tuple[int, int], ...], float], ...]
+
+
+def _project(pattern: Sequence[int], goal_ids: FrozenSet[int],
+             operators: Iterable[_Operator]) -> _Projection:
+    bit = {atom: 1 << i for i, atom in enumerate(pattern)}
+
+    def mask(ids: Iterable[int]) -> int:
+        return sum(bit[a] for a in ids if a in bit)
+
+    actions = set()
+    for op in operators:
+        outcomes = tuple(sorted({(mask(add), mask(dele)) for add, dele in op.outcomes}))
+        if any(add or dele for add, dele in outcomes):
+            actions.add((mask(op.pre), mask(op.neg), outcomes, op.cost))
+    return _Projection(mask(goal_ids), tuple(sorted(actions)))
+
+
+def _distances(size: int, projection: _Projection) -> "array[float]":
+    """Goal distances of all ``2**size`` abstract states (Dijkstra over the
+    reversed transitions)."""
+    n = 1 << size
+    back: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
+    for pre, neg, outcomes, cost in projection.actions:
+        for s in range(n):
+            if s & pre == pre and not s & neg:
+                for add, dele in outcomes:
+                    t = (s & ~dele) | add
+                    if t != s:
+                        back[t].append((s, cost))
+    goal = projection.goal
+    dist = array("d", [INF]) * n
+    heap = []
+    for s in range(n):
+        if s & goal == goal:
+            dist[s] = 0.0
+            heap.append((0.0, s))
+    while heap:
+        d, t = heapq.heappop(heap)
+        if d > dist[t]:
+            continue  # pragma: no cover - stale heap entry (lazy deletion)
+        for s, cost in back[t]:
+            if d + cost < dist[s]:
+                dist[s] = d + cost
+                heapq.heappush(heap, (d + cost, s))
+    return dist
+
+
+class PatternDatabase:
+    """The goal distances of a task's projection onto a pattern.
+
+    Attributes:
+        atoms     -- the pattern, as atom IDs; bit ``i`` of an abstract state
+                     is ``atoms[i]``.
+        facts     -- the same atoms as ground tuples.
+        distances -- ``array('d')`` of ``2**len(atoms)`` goal distances
+                     (``inf`` for abstract dead ends).
+        key       -- the SHA-256 of the projection, as :class:`PDBStore`
+                     files it.
+    """
+
+    def __init__(self, atoms: Sequence[int], facts: Sequence[GroundAtom],
+                 distances: "array[float]", key: str) -> None:
+        if len(distances) != 1 << len(atoms):
+            raise ValueError("a pattern of %d atoms needs %d distances, not %d"
+                             % (len(atoms), 1 << len(atoms), len(distances)))
+        self.atoms = tuple(atoms)
+        self.facts = tuple(facts)
+        self.distances = distances
+        self.key = key
+
+    @classmethod
+    def build(cls, task: "GroundedTask", pattern: Iterable[int], unit: bool = True,
+              store: Optional["PDBStore"] = None,
+              operators: Optional[List[_Operator]] = None,
+              save: bool = True) -> "PatternDatabase":
+        """The PDB of ``task`` projected onto the atom IDs ``pattern``;
+        loaded from ``store`` if it has it, else computed (and stored, with
+        ``save``). ``operators`` reuses a collection's :func:`_operators`."""
+        if operators is None:
+            operators = _operators(task, unit)
+        symbols = task.symbols
+        atoms = sorted(set(pattern), key=lambda a: symbols.atoms[a])
+        facts = [symbols.atoms[a] for a in atoms]
+        projection = _project(atoms, frozenset(task.goal_ids), operators)
+        key = _key(facts, projection)
+        if store is not None:
+            distances = store.load(key, len(atoms))
+            if distances is not None:
+                return cls(atoms, facts, distances, key)
+        pdb = cls(atoms, facts, _distances(len(atoms), projection), key)
+        if store is not None and save:
+            store.store(pdb)
+        return pdb
+
+    def __len__(self) -> int:
+        return len(self.distances)
+
+    def index(self, ids: Any) -> int:
+        """The abstract state of the atom-ID set ``ids``."""
+        return sum(1 << i for i, atom in enumerate(self.atoms) if atom in ids)
+
+    def value(self, ids: Any) -> float:
+        """The goal distance of the abstract state of ``ids``."""
+        return self.distances[self.index(ids)]
+
+
+def _key(facts: Sequence[GroundAtom], projection: _Projection) -> str:
+    h = hashlib.sha256()
+    h.update(("%d\0" % PDB_FORMAT).encode("utf-8"))
+    h.update(repr((tuple(facts), projection)).encode("utf-8"))
+    return h.hexdigest()
+
+
+class PDBStore:
+    """A directory of pattern databases keyed by their projection.
+
+    directory -- where entries live; created on first use. ``~`` expands.
+
+    ``hits`` and ``misses`` count this instance's lookups. A corrupt entry
+    is dropped and counts as a miss. ``key in store`` tells whether an
+    entry exists.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = os.path.expanduser(directory)
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and os.path.exists(self._path(key))
+
+    def load(self, key: str, size: int) -> Optional["array[float]"]:
+        """The distances stored under ``key`` for a pattern of ``size``
+        atoms, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                header = json.loads(f.readline())
+                distances = array("d")
+                distances.frombytes(f.read())
+            if (header["format"] != PDB_FORMAT or len(distances) != 1 << size
+                    or header["byteorder"] not in ("little", "big")):
+                raise ValueError("wrong layout")
+            if header["byteorder"] != sys.byteorder:
+                distances.byteswap()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            self.misses += 1
+            _discard(path)
+            return None
+        self.hits += 1
+        return distances
+
+    def store(self, pdb: PatternDatabase) -> None:
+        """Write ``pdb`` under its key (atomically)."""
+        os.makedirs(self.directory, exist_ok=True)
+        header = {"format": PDB_FORMAT, "byteorder": sys.byteorder,
+                  "pattern": [list(fact) for fact in pdb.facts]}
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json.dumps(header).encode("utf-8") + b"\n")
+                f.write(pdb.distances.tobytes())
+            os.replace(tmp, self._path(pdb.key))
+        except BaseException:
+            _discard(tmp)
+            raise
+
+
+def _discard(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:  # pragma: no cover - raced with another process
+        pass
+
+
+def default_store() -> Optional[PDBStore]:
+    """The store named by ``$PDDLPY_PDB_DIR``, or None when it is unset or
+    empty."""
+    directory = os.environ.get(PDB_DIR_ENV)
+    return PDBStore(directory) if directory else None
+
+
+class CanonicalPDB(Heuristic):
+    """The canonical combination of a selected pattern collection's PDBs.
+    Admissible; build with ``unit=False`` for action costs.
+
+    selection        -- ``"ipdb"`` or ``"greedy"`` (see the module notes).
+    max_pattern_size -- atoms per pattern; a PDB has ``2**size`` entries.
+    max_states       -- bound on the entries of the whole collection (ipdb).
+    samples          -- random-walk states ipdb scores candidates on.
+    store            -- a :class:`PDBStore` to load and save PDBs through;
+                        by default the one of :func:`default_store`.
+    seed             -- seeds the random walks.
+
+    Attributes: ``patterns`` (tuples of atom IDs), ``pdbs`` and ``cliques``
+    (the maximal additive subsets, as indices into ``pdbs``).
+    """
+
+    task: "GroundedTask"
+
+    def __init__(self, task: "GroundedTask", unit: bool = True, selection: str = "ipdb",
+                 max_pattern_size: int = 8, max_states: int = 1 << 16, samples: int = 50,
+                 store: Optional[PDBStore] = None, seed: int = 0) -> None:
+        super().__init__(task, unit)
+        if selection not in ("ipdb", "greedy"):
+            raise ValueError("unknown pattern selection %r" % selection)
+        self.store = store if store is not None else default_store()
+        self._operators = _operators(task, unit)
+        self._changed: Set[int] = set().union(*(op.affects for op in self._operators))
+        self._built: Dict[FrozenSet[int], PatternDatabase] = {}
+        if selection == "greedy":
+            patterns = [self._greedy(max_pattern_size)]
+        else:
+            patterns = self._ipdb(max_pattern_size, max_states, samples, random.Random(seed))
+        self._use(patterns)
+        # Only the collection's own PDBs are worth keeping, not the
+        # candidates selection tried on the way.
+        if self.store is not None:
+            for pdb in self.pdbs:
+                if pdb.key not in self.store:
+                    self.store.store(pdb)
+
+    def __call__(self, state: Any) -> float:
+        return self._estimate(self.pdbs, self.cliques, state.ids)
+
+    def _pdb(self, pattern: FrozenSet[int]) -> PatternDatabase:
+        pdb = self._built.get(pattern)
+        if pdb is None:
+            pdb = self._built[pattern] = PatternDatabase.build(
+                self.task, pattern, self.unit, self.store, self._operators, save=False)
+        return pdb
+
+    def _use(self, patterns: List[FrozenSet[int]]) -> None:
+        self.pdbs = [self._pdb(p) for p in patterns]
+        self.patterns = [pdb.atoms for pdb in self.pdbs]
+        self.cliques = _cliques(patterns, self._operators)
+
+    @staticmethod
+    def _estimate(pdbs: List[PatternDatabase], cliques: List[List[int]], ids: Any) -> float:
+        values = [pdb.value(ids) for pdb in pdbs]
+        if INF in values:
+            return INF
+        return max((sum(values[i] for i in clique) for clique in cliques), default=0.0)
+
+    def _relevant(self, pattern: FrozenSet[int]) -> Set[int]:
+        """Atoms some action changes that are preconditions of an action
+        affecting ``pattern``."""
+        out: Set[int] = set()
+        for op in self._operators:
+            if op.affects & pattern:
+                out.update((op.pre | op.neg) & self._changed)
+        return out - pattern
+
+    def _goals(self) -> List[int]:
+        """The goal atoms worth a pattern: all but those that hold already
+        and that no action changes."""
+        initial = self.task.initial.ids
+        return sorted(g for g in self.task.goal_ids if g in self._changed or g not in initial)
+
+    def _greedy(self, max_size: int) -> FrozenSet[int]:
+        pattern: List[int] = []
+        frontier = self._goals()
+        while frontier and len(pattern) < max_size:
+            atom = frontier.pop(0)
+            if atom not in pattern:
+                pattern.append(atom)
+                frontier.extend(sorted(self._relevant(frozenset([atom]))))
+        return frozenset(pattern)
+
+    def _ipdb(self, max_size: int, max_states: int, samples: int,
+              rng: random.Random) -> List[FrozenSet[int]]:
+        collection = [frozenset([g]) for g in self._goals()]
+        self._use(collection)
+        states = [s.ids for s in self._samples(samples, rng)]
+        while True:
+            # Per sample, each PDB's value and the current estimate.
+            values = [[pdb.value(ids) for pdb in self.pdbs] for ids in states]
+            current = [self._estimate(self.pdbs, self.cliques, ids) for ids in states]
+            total = sum(len(pdb) for pdb in self.pdbs)
+            best, best_score = None, 0
+            for pattern in collection:
+                if len(pattern) >= max_size or total + (2 << len(pattern)) > max_states:
+                    continue
+                for atom in sorted(self._relevant(pattern)):
+                    candidate = pattern | {atom}
+                    if candidate in collection:
+                        continue
+                    score = self._score(candidate, collection, states, values, current)
+                    if score > best_score:
+                        best, best_score = candidate, score
+            if best is None:
+                return collection
+            collection.append(best)
+            self._use(collection)
+
+    def _score(self, candidate: FrozenSet[int], collection: List[FrozenSet[int]],
+               states: List[Any], values: List[List[float]], current: List[float]) -> int:
+        """On how many sampled states adding ``candidate`` raises the
+        estimate. The new maximal additive sets are the current ones cut
+        down to the patterns additive with it, plus it."""
+        clash: Set[int] = set()
+        for op in self._operators:
+            if op.affects & candidate:
+                clash.update(i for i, p in enumerate(collection) if op.affects & p)
+        cliques = {tuple(i for i in clique if i not in clash) for clique in self.cliques}
+        pdb = self._pdb(candidate)
+        score = 0
+        for ids, row, h in zip(states, values, current):
+            if h == INF:
+                continue
+            value = pdb.value(ids)
+            if value == INF or value + max(sum(row[i] for i in c) for c in cliques) > h:
+                score += 1
+        return score
+
+    def _samples(self, count: int, rng: random.Random) -> List[Any]:
+        """States at the end of random walks from the initial state, of a
+        length drawn up to twice the initial estimate."""
+        task = self.task
+        h = self(task.initial)
+        length = 2 * int(h) if h != INF else 0
+        states = []
+        for _ in range(count):
+            state = task.initial
+            for _ in range(rng.randint(0, max(length, 1))):
+                succs = [succ for _, succ in task.successors(state)]
+                if not succs:
+                    break
+                state = rng.choice(succs)
+            states.append(state)
+        return states
+
+
+def _cliques(patterns: Sequence[FrozenSet[int]], operators: Iterable[_Operator]) -> List[List[int]]:
+    """The maximal sets of pairwise additive patterns: no action affects
+    two patterns of one set."""
+    n = len(patterns)
+    clash: List[Set[int]] = [set() for _ in range(n)]
+    for op in operators:
+        touched = [i for i, p in enumerate(patterns) if op.affects & p]
+        for i in touched:
+            clash[i].update(j for j in touched if j != i)
+    out: List[List[int]] = []
+
+    def extend(clique: List[int], candidates: Set[int], excluded: Set[int]) -> None:
+        if not candidates and not excluded:
+            out.append(clique)
+            return
+        for i in sorted(candidates):
+            compatible = set(range(n)) - clash[i] - {i}
+            extend(clique + [i], candidates & compatible, excluded & compatible)
+            candidates = candidates - {i}
+            excluded = excluded | {i}
+
+    extend([], set(range(n)), set())
+    return out
+
+
+register_heuristic("pdb", CanonicalPDB)
@@ -4,6 +4,10 @@
     registry.register("astar", AStarPlanner)
     planner = registry.get("astar")     # -> an AStarPlanner instance
     plan = planner.solve(domainproblem)
+
+A name can also preset constructor arguments, e.g.
+``register("astar-hmax", AStarPlanner, heuristic="hmax")``; arguments given
+to ``get`` override the presets.
 """
 from __future__ import annotations
 
@@ -14,13 +18,15 @@ if TYPE_CHECKING:
 
 
 class PlannerRegistry:
-    """Maps short names to ``Planner`` subclasses."""
+    """Maps short names to ``Planner`` subclasses, with preset arguments."""
 
     def __init__(self) -> None:
         self._planners: Dict[str, Type["Planner"]] = {}
+        self._presets: Dict[str, Dict[str, Any]] = {}
 
-    def register(self, name: str, planner_cls: Type["Planner"]) -> None:
+    def register(self, name: str, planner_cls: Type["Planner"], **presets: Any) -> None:
         self._planners[name] = planner_cls
+        self._presets[name] = presets
 
     def get(self, name: str, *args: Any, **kwargs: Any) -> "Planner":
         """Return a new planner instance registered under ``name``."""
@@ -29,7 +35,7 @@ class PlannerRegistry:
                 "no planner registered as %r; known: %s"
                 % (name, sorted(self._planners))
             )
-        return self._planners[name](*args, **kwargs)
+        return self._planners[name](*args, **{**self._presets[name], **kwargs})
 
     def names(self) -> List[str]:
         return sorted(self._planners)
@@ -38,9 +44,10 @@ class PlannerRegistry:
 registry = PlannerRegistry()
 
 
-def register(name: str, planner_cls: Type["Planner"]) -> None:
-    """Register ``planner_cls`` under ``name`` in the default registry."""
-    registry.register(name, planner_cls)
+def register(name: str, planner_cls: Type["Planner"], **presets: Any) -> None:
+    """Register ``planner_cls`` under ``name`` in the default registry,
+    built with ``presets`` as keyword arguments."""
+    registry.register(name, planner_cls, **presets)
 
 
 def get(name: str, *args: Any, **kwargs: Any) -> "Planner":
@@ -1,35 +1,52 @@
 """Blind- and heuristic-search reference planners over STRIPS.
 
 These prove the ``Planner`` contract; they are not performance entrants
-(PRD §4). All reuse the shared ``GroundedTask`` successor function.
+(PRD §4). All reuse the shared ``GroundedTask`` successor function; built
+with ``packed=True`` they search a ``PackedTask`` over bitset states instead.
 
 * ``BFSPlanner``        — breadth-first; optimal for unit-cost STRIPS.
 * ``AStarPlanner``      — A* with the goal-count heuristic; optimal &
   admissible for unit costs.
 * ``GBFSPlanner``       — greedy best-first; fast but not optimal.
+* ``LazyGBFSPlanner``   — greedy best-first with deferred evaluation and
+  preferred operators (``lazy-gbfs``, h_FF by default).
+* ``CostAStarPlanner``  — A* over action costs, LM-cut by default
+  (``astar-lmcut``, or ``astar-pdb`` with pattern databases); cost-optimal
+  like ``UniformCostPlanner``.
 * ``UniformCostPlanner`` — Dijkstra over action costs; cost-optimal for
   action-cost domains (#3).
+
+The A* and greedy planners take ``heuristic=`` any name from
+:mod:`pddlpy.planning.heuristics` (``goal-count``, ``hmax``, ``hadd``,
+``ff``, ``lmcut``, ``lmcount`` from :mod:`pddlpy.planning.landmarks`,
+``pdb`` from :mod:`pddlpy.planning.pdb`); A* stays optimal with an
+admissible one. The registry presets ``astar-hmax``, ``gbfs-hadd``,
+``gbfs-ff``, ``gbfs-lmcount`` and ``astar-pdb``.
 """
 from __future__ import annotations
 
 import heapq
 import itertools
 from collections import deque
-from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from .base import Planner
-from .costs import action_cost, plan_cost
+from .costs import plan_cost
+from .grounding import SearchTask
+from .heuristics import INF, make_heuristic
 from .registry import register
-from .state import Plan, State, atom_tuple
+from .state import Plan, State
 
 if TYPE_CHECKING:
     from pddlpy.pddl import DomainProblem, Operator
 
-    from .state import GroundAtom
-
 #: Parent-pointer map used to reconstruct a plan.
 _CameFrom = Dict[State, Tuple[State, "Operator"]]
 
+#: A lazy open-list entry: (parent's h, tie-breaker, state, parent, action);
+#: the start has no parent.
+_LazyEntry = Tuple[float, int, State, Optional[State], Optional["Operator"]]
+
 #: Requirements the reference planners can handle. Numeric fluents (#11) and
 #: action costs (#3) are supported because State evaluates numeric
 #: preconditions/effects during successor generation; the goal-count heuristic
@@ -62,12 +79,6 @@ def _reconstruct(came_from: _CameFrom, state: State) -> List["Operator"]:
     return actions
 
 
-def goal_count(goal_atoms: "FrozenSet[GroundAtom]", state: State) -> int:
-    """Heuristic: number of goal atoms not yet satisfied (admissible for
-    unit costs)."""
-    return len(goal_atoms - state.atoms)
-
-
 class BFSPlanner(Planner):
     """Breadth-first search. Returns a shortest (fewest-action) plan."""
 
@@ -97,24 +108,36 @@ class BFSPlanner(Planner):
 
 class _BestFirstPlanner(Planner):
     """Shared best-first core; subclasses define the node priority and the
-    per-step cost."""
+    per-step cost. ``heuristic`` names the state heuristic (see
+    :mod:`pddlpy.planning.heuristics`); states it rates ``inf`` are pruned.
+    Other keyword arguments are as for ``Planner``."""
 
     capabilities = ADL_CAPABILITIES
+    #: Whether the search (and so its heuristic) counts every step as 1.
+    unit_cost = True
+
+    def __init__(self, heuristic: str = "goal-count", **options: Any) -> None:
+        super().__init__(**options)
+        if self.lazy and heuristic != "goal-count":
+            raise ValueError("a lazy task has no grounded actions for %r" % heuristic)
+        self.heuristic = heuristic
 
     def _priority(self, g: float, h: float) -> float:
         raise NotImplementedError  # pragma: no cover - abstract
 
-    def _step_cost(self, action: "Operator", state: State) -> float:
+    def _step_cost(self, task: SearchTask, action: "Operator", state: State) -> float:
         """Cost of one transition. Unit by default; cost-aware planners
         override."""
         return 1
 
     def solve(self, domainproblem: "DomainProblem") -> Optional[Plan]:
         task = self.prepare(domainproblem)
-        goal_atoms = frozenset(atom_tuple(a) for a in task.goals)
+        heuristic = make_heuristic(self.heuristic, task, unit=self.unit_cost)
         start = task.initial
         counter = itertools.count()  # tie-breaker; keeps States out of compares
-        h0 = goal_count(goal_atoms, start)
+        h0 = heuristic(start)
+        if h0 == INF:
+            return None
         frontier: List[Tuple[float, float, int, State]] = [
             (self._priority(0, h0), 0, next(counter), start)
         ]
@@ -128,11 +151,14 @@ class _BestFirstPlanner(Planner):
             if g > best_g.get(state, g):
                 continue  # pragma: no cover - stale heap entry (lazy deletion)
             for action, succ in task.successors(state):
-                ng = g + self._step_cost(action, state)
+                ng = g + self._step_cost(task, action, state)
                 if ng < best_g.get(succ, ng + 1):
                     best_g[succ] = ng
                     came_from[succ] = (state, action)
-                    h = goal_count(goal_atoms, succ)
+                    heuristic.reach(state, succ)
+                    h = heuristic(succ)
+                    if h == INF:
+                        continue  # a dead end even relaxed
                     heapq.heappush(
                         frontier, (self._priority(ng, h), ng, next(counter), succ)
                     )
@@ -153,19 +179,105 @@ class GBFSPlanner(_BestFirstPlanner):
         return h
 
 
+class LazyGBFSPlanner(GBFSPlanner):
+    """Greedy best-first search with deferred evaluation.
+
+    Successors are queued with their parent's estimate and evaluated only
+    when expanded, so the heuristic runs once per expanded state rather
+    than once per generated one. Successors reached through one of the
+    parent's preferred operators (:meth:`~pddlpy.planning.heuristics.
+    Heuristic.preferred`; h_FF's are the applicable actions of its relaxed
+    plan) are also queued in a second open list. Expansion alternates
+    between the two, taking from whichever has been used less; each time
+    the best estimate so far improves, the preferred list gets ``boost``
+    extra turns. ``preferred=False`` searches the single list. Not
+    optimal.
+    """
+
+    def __init__(self, heuristic: str = "ff", preferred: bool = True, boost: int = 1000,
+                 **options: Any) -> None:
+        super().__init__(heuristic, **options)
+        self.preferred = preferred
+        self.boost = boost
+
+    def solve(self, domainproblem: "DomainProblem") -> Optional[Plan]:
+        task = self.prepare(domainproblem)
+        heuristic = make_heuristic(self.heuristic, task, unit=self.unit_cost)
+        counter = itertools.count()  # tie-breaker; keeps States out of compares
+        # The regular open list, then the preferred one.
+        open_lists: Tuple[List[_LazyEntry], List[_LazyEntry]] = (
+            [(0, next(counter), task.initial, None, None)], [])
+        turns = [0, 0]  # per list, the expansions it has had, less boosts
+        closed: Set[State] = set()
+        came_from: _CameFrom = {}
+        best = INF
+        while open_lists[0] or open_lists[1]:
+            which = 1 if open_lists[1] and (turns[1] <= turns[0] or not open_lists[0]) else 0
+            turns[which] += 1
+            _, _, state, parent, action = heapq.heappop(open_lists[which])
+            if state in closed:
+                continue
+            closed.add(state)
+            if parent is not None and action is not None:
+                came_from[state] = (parent, action)
+                heuristic.reach(parent, state)
+            if task.is_goal(state):
+                actions = _reconstruct(came_from, state)
+                return Plan(actions, cost=plan_cost(state, actions))
+            h = heuristic(state)
+            if h == INF:
+                continue  # a dead end even relaxed
+            if h < best:
+                if best < INF:
+                    turns[1] -= self.boost
+                best = h
+            preferred = heuristic.preferred(state) if self.preferred else set()
+            for op, succ in task.successors(state):
+                if succ in closed:
+                    continue
+                entry = (h, next(counter), succ, state, op)
+                heapq.heappush(open_lists[0], entry)
+                if op in preferred:
+                    heapq.heappush(open_lists[1], entry)
+        return None
+
+
 class UniformCostPlanner(_BestFirstPlanner):
     """Dijkstra over action costs (f = g, h ignored). Cost-optimal for
     action-cost domains (#3); falls back to unit cost when a domain declares
     none."""
 
+    unit_cost = False
+
     def _priority(self, g: float, h: float) -> float:
         return g
 
-    def _step_cost(self, action: "Operator", state: State) -> float:
-        return action_cost(action, state)
+    def _step_cost(self, task: SearchTask, action: "Operator", state: State) -> float:
+        return task.step_cost(action, state)
+
+
+class CostAStarPlanner(AStarPlanner):
+    """A* over action costs (f = g + h, g summed as by
+    ``UniformCostPlanner``), with the heuristic built over action costs too.
+    Cost-optimal with an admissible heuristic; the default is LM-cut."""
+
+    unit_cost = False
+
+    def __init__(self, heuristic: str = "lmcut", **options: Any) -> None:
+        super().__init__(heuristic, **options)
+
+    def _step_cost(self, task: SearchTask, action: "Operator", state: State) -> float:
+        return task.step_cost(action, state)
 
 
 register("bfs", BFSPlanner)
 register("astar", AStarPlanner)
 register("gbfs", GBFSPlanner)
 register("ucs", UniformCostPlanner)
+register("astar-hmax", AStarPlanner, heuristic="hmax")
+register("gbfs-hadd", GBFSPlanner, heuristic="hadd")
+register("gbfs-ff", GBFSPlanner, heuristic="ff")
+register("astar-lmcut", CostAStarPlanner)
+register("gbfs-lmcount", GBFSPlanner, heuristic="lmcount")
+register("astar-pdb", CostAStarPlanner, heuristic="pdb")
+register("lazy-gbfs", LazyGBFSPlanner)
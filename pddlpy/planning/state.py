@@ -9,19 +9,35 @@ from __future__ import annotations
 
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
     Any,
     Dict,
+    FrozenSet,
     Iterable,
     Iterator,
     List,
     Mapping,
+    NamedTuple,
     Optional,
     Tuple,
     Union,
 )
+from weakref import WeakKeyDictionary
+
+from pddlpy.symbols import SymbolTable
+
+from .numeric import (
+    Reader,
+    Test,
+    Update,
+    Valuation,
+    compile_constraint,
+    compile_cost,
+    compile_effect,
+)
 
 if TYPE_CHECKING:
-    from pddlpy.pddl import DomainProblem, DurativeAction, Operator
+    from pddlpy.pddl import Condition, DomainProblem, DurativeAction, Operator
 
     #: Any grounded action a plan step can carry — instantaneous or durative
     #: (#84); both expose ``operator_name`` and ``variable_list``.
@@ -29,8 +45,6 @@ if TYPE_CHECKING:
 
 #: A ground atom, e.g. ``("on", "a", "b")``.
 GroundAtom = Tuple[str, ...]
-#: A numeric fluent valuation: ground function head -> value.
-Valuation = Dict[GroundAtom, float]
 
 
 def atom_tuple(atom: Any) -> GroundAtom:
@@ -48,6 +62,132 @@ def atom_tuple(atom: Any) -> GroundAtom:
     return tuple(atom)
 
 
+class _AtomView(AbstractSet[GroundAtom]):
+    """A read-only set of ground atoms over a state's atom IDs, for the model's
+    condition trees (``Condition.holds`` tests tuple membership) without
+    translating the whole state back to tuples."""
+
+    __slots__ = ("_ids", "_symbols")
+
+    def __init__(self, ids: FrozenSet[int], symbols: SymbolTable) -> None:
+        self._ids = ids
+        self._symbols = symbols
+
+    def __contains__(self, atom: object) -> bool:
+        i = self._symbols.find_atom(atom)  # type: ignore[arg-type]
+        return i is not None and i in self._ids
+
+    def __iter__(self) -> Iterator[GroundAtom]:
+        return iter(self._symbols.atoms_of(self._ids))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class CompiledAction(NamedTuple):
+    """A grounded action compiled once for search: its atoms interned in a
+    ``SymbolTable`` as frozen ID sets, its numeric conditions and effects
+    compiled to closures (:mod:`pddlpy.planning.numeric`), and its step cost
+    pre-evaluated where it is constant. Build with :func:`compile_action`.
+
+    Fields:
+        operator     -- the grounded ``Operator``, for plans.
+        precondition -- the ADL precondition tree, or None when the flat
+                        sets describe the precondition (a plain conjunction).
+        pre_pos / pre_neg -- atom IDs that must / must not hold.
+        pre_num      -- compiled numeric preconditions (flat form).
+        add / dele   -- atom IDs added / deleted.
+        num          -- compiled numeric effects.
+        cond         -- ``(condition, add, dele, num)`` per conditional effect.
+        cost         -- the step cost if constant, else None.
+        cost_fn      -- the step cost as ``valuation -> float``.
+    """
+
+    operator: "Operator"
+    precondition: Optional["Condition"]
+    pre_pos: FrozenSet[int]
+    pre_neg: FrozenSet[int]
+    pre_num: Tuple[Test, ...]
+    add: FrozenSet[int]
+    dele: FrozenSet[int]
+    num: Tuple[Update, ...]
+    cond: Tuple[Tuple["Condition", FrozenSet[int], FrozenSet[int], Tuple[Update, ...]], ...]
+    cost: Optional[float]
+    cost_fn: Reader
+
+    @property
+    def constant_cost(self) -> bool:
+        """True if the step cost does not depend on the state."""
+        return self.cost is not None
+
+
+def compile_action(operator: "Operator", symbols: SymbolTable) -> CompiledAction:
+    """Compile a grounded ``operator`` against ``symbols``.
+
+    Each call builds a new record: ``GroundedTask`` compiles each action
+    once and keeps it in ``task.compiled``. ``State.applicable`` /
+    ``State.apply`` on a bare operator compile it on first use and keep the
+    record for as long as the state's symbol table lives, compiling it again
+    if the operator changes (see ``_snapshot``). A record in
+    ``task.compiled`` is not: mutating a task's actions needs a new task.
+    """
+    intern = symbols.atom_ids
+    cost, cost_fn = compile_cost(operator.effect_num)
+    return CompiledAction(
+        operator=operator,
+        # A plain conjunction is fully described by the flat sets, which test
+        # faster than walking the tree; anything richer keeps the tree.
+        precondition=(None if getattr(operator, "simple_conjunction", False)
+                      else getattr(operator, "precondition", None)),
+        pre_pos=intern(map(atom_tuple, operator.precondition_pos)),
+        pre_neg=intern(map(atom_tuple, operator.precondition_neg)),
+        pre_num=tuple(map(compile_constraint, operator.precondition_num)),
+        add=intern(map(atom_tuple, operator.effect_pos)),
+        dele=intern(map(atom_tuple, operator.effect_neg)),
+        num=tuple(map(compile_effect, operator.effect_num)),
+        cond=tuple(
+            (ce.condition, intern(map(atom_tuple, ce.add)),
+             intern(map(atom_tuple, ce.dele)), tuple(map(compile_effect, ce.num)))
+            for ce in getattr(operator, "conditional_effects", ())
+        ),
+        cost=cost,
+        cost_fn=cost_fn,
+    )
+
+
+def _compiled(operator: "Operator", symbols: SymbolTable) -> CompiledAction:
+    """The record of ``operator`` in ``symbols``, compiled on first use and
+    again whenever the operator has changed since."""
+    memo = _COMPILED.get(symbols)
+    if memo is None:
+        memo = _COMPILED[symbols] = {}
+    snapshot = _snapshot(operator)
+    entry = memo.get(operator)
+    if entry is None or entry[0] != snapshot:
+        entry = memo[operator] = (snapshot, compile_action(operator, symbols))
+    return entry[1]
+
+
+def _snapshot(operator: "Operator") -> Tuple[Any, ...]:
+    """What ``compile_action`` reads from ``operator``: the atom sets by
+    value; the numeric constraints and effects, the precondition tree and
+    the conditional effects as the objects they are (so replacing one is
+    seen, changing one in place is not)."""
+    return (frozenset(operator.precondition_pos), frozenset(operator.precondition_neg),
+            frozenset(operator.effect_pos), frozenset(operator.effect_neg),
+            tuple(operator.precondition_num), tuple(operator.effect_num),
+            getattr(operator, "simple_conjunction", False),
+            getattr(operator, "precondition", None),
+            tuple(getattr(operator, "conditional_effects", ())))
+
+
+#: Records compiled for bare operators, per symbol table (weakly held), each
+#: with the ``_snapshot`` of the operator it was compiled from. No record
+#: refers to its table, so the records go when the table does.
+_COMPILED: "WeakKeyDictionary[SymbolTable, Dict[Any, Tuple[Tuple[Any, ...], CompiledAction]]]" = (
+    WeakKeyDictionary())
+
+
 class State:
     """An immutable, hashable planning state.
 
@@ -55,36 +195,69 @@ class State:
     and, for numeric domains (#11), a valuation mapping ground function heads
     to numbers, e.g. ``{("fuel", "truck"): 100.0}``. Suitable as a key in
     search open/closed sets.
+
+    Internally the atoms are the integer IDs of a
+    :class:`~pddlpy.symbols.SymbolTable` — the task's when the state comes
+    from a ``GroundedTask`` or ``from_problem``, a new one otherwise — so
+    successor generation, hashing and comparison never touch the strings.
+    ``atoms`` translates back on demand. States over different tables still
+    compare (and hash) equal when they hold the same atoms.
     """
 
-    __slots__ = ("_atoms", "_fluents", "_key")
+    __slots__ = ("_ids", "_symbols", "_fluents", "_hash", "_atoms")
 
     def __init__(
         self,
         atoms: Iterable[Any] = (),
         fluents: Optional[Mapping[GroundAtom, float]] = None,
+        symbols: Optional[SymbolTable] = None,
     ) -> None:
-        self._atoms: frozenset[GroundAtom] = frozenset(atom_tuple(a) for a in atoms)
-        self._fluents: Valuation = dict(fluents or {})
-        self._key: Tuple[frozenset[GroundAtom], frozenset] = (
-            self._atoms,
-            frozenset(self._fluents.items()),
-        )
+        if symbols is None:
+            symbols = SymbolTable()
+        self._init(symbols.atom_ids(map(atom_tuple, atoms)), symbols, dict(fluents or {}))
+
+    def _init(self, ids: FrozenSet[int], symbols: SymbolTable, fluents: Valuation) -> None:
+        self._ids = ids
+        self._symbols = symbols
+        self._fluents = fluents
+        self._hash: Optional[int] = None
+        self._atoms: Optional[FrozenSet[GroundAtom]] = None
 
     @property
-    def atoms(self) -> frozenset[GroundAtom]:
+    def atoms(self) -> FrozenSet[GroundAtom]:
+        if self._atoms is None:
+            self._atoms = self._symbols.atoms_of(self._ids)
         return self._atoms
 
     @property
     def fluents(self) -> Valuation:
         return self._fluents
 
+    @property
+    def ids(self) -> FrozenSet[int]:
+        """The atoms as IDs in :attr:`symbols`."""
+        return self._ids
+
+    @property
+    def symbols(self) -> SymbolTable:
+        return self._symbols
+
     # -- constructors -----------------------------------------------------
     @classmethod
     def from_problem(cls, domainproblem: "DomainProblem") -> "State":
         """Build the initial state (atoms + numeric fluents) from a parsed
-        ``DomainProblem``."""
-        return cls(domainproblem.initialstate(), domainproblem.initial_numeric())
+        ``DomainProblem``, over its symbol table."""
+        return cls(domainproblem.initialstate(), domainproblem.initial_numeric(),
+                   domainproblem.symbols())
+
+    @classmethod
+    def from_ids(cls, ids: FrozenSet[int], symbols: SymbolTable,
+                 fluents: Optional[Valuation] = None) -> "State":
+        """Build a state directly from atom IDs in ``symbols``. ``fluents`` is
+        shared, not copied: states never mutate their valuation."""
+        state = cls.__new__(cls)
+        state._init(ids, symbols, fluents if fluents is not None else {})
+        return state
 
     # -- planning operations (resolve #21) -------------------------------
     def applicable(self, operator: "Operator") -> bool:
@@ -95,16 +268,18 @@ class State:
         structure — and any numeric comparison — is evaluated against this
         state. Operators built without a tree fall back to the legacy STRIPS
         conjunctive check (all positive preconditions hold, no negative one
-        holds, every numeric precondition satisfied).
+        holds, every numeric precondition satisfied) — as do operators whose
+        ``simple_conjunction`` flag says the tree is just that conjunction.
         """
-        precondition = getattr(operator, "precondition", None)
-        if precondition is not None:
-            return bool(precondition.holds(self._atoms, self._fluents))
-        pos = {atom_tuple(a) for a in operator.precondition_pos}
-        neg = {atom_tuple(a) for a in operator.precondition_neg}
-        if not (pos <= self._atoms and neg.isdisjoint(self._atoms)):
+        return self._applicable(_compiled(operator, self._symbols))
+
+    def _applicable(self, action: CompiledAction) -> bool:
+        if action.precondition is not None:
+            return bool(action.precondition.holds(
+                _AtomView(self._ids, self._symbols), self._fluents))
+        if not (action.pre_pos <= self._ids and action.pre_neg.isdisjoint(self._ids)):
             return False
-        return all(c.holds(self._fluents) for c in operator.precondition_num)
+        return all(test(self._fluents) for test in action.pre_num)
 
     def apply(self, operator: "Operator") -> "State":
         """Return the successor ``State`` after applying a grounded operator.
@@ -113,48 +288,66 @@ class State:
         (add-after-delete), matching STRIPS semantics. Numeric effects are
         evaluated against the pre-state valuation (simultaneous semantics).
         """
-        add = {atom_tuple(a) for a in operator.effect_pos}
-        delete = {atom_tuple(a) for a in operator.effect_neg}
-        num_effects = list(operator.effect_num)
+        return self._apply(_compiled(operator, self._symbols))
+
+    def _apply(self, action: CompiledAction) -> "State":
+        add, delete, num_effects = action.add, action.dele, action.num
         # ADL conditional effects (#10): a (when C E) / universal effect fires
         # only if its guard C holds in the pre-state (simultaneous semantics).
-        for ce in getattr(operator, "conditional_effects", ()):
-            if ce.condition.holds(self._atoms, self._fluents):
-                add |= {atom_tuple(a) for a in ce.add}
-                delete |= {atom_tuple(a) for a in ce.dele}
-                num_effects.extend(ce.num)
+        if action.cond:
+            view = _AtomView(self._ids, self._symbols)
+            fired = [ce for ce in action.cond if ce[0].holds(view, self._fluents)]
+            if fired:
+                add = add.union(*(ce[1] for ce in fired))
+                delete = delete.union(*(ce[2] for ce in fired))
+                num_effects = num_effects + tuple(e for ce in fired for e in ce[3])
         fluents: Valuation = self._fluents
         if num_effects:
-            updates = [eff.apply(self._fluents) for eff in num_effects]
+            updates = [update(self._fluents) for update in num_effects]
             fluents = dict(self._fluents)
             for key, value in updates:
                 fluents[key] = value
-        return State((self._atoms - delete) | add, fluents)
+        return State.from_ids((self._ids - delete) | add, self._symbols, fluents)
 
     def satisfies(self, goals: Iterable[Any]) -> bool:
-        """True if every (positive) goal atom holds in this state."""
-        return {atom_tuple(a) for a in goals} <= self._atoms
+        """True if every (positive) goal atom holds in this state. Only
+        looks atoms up: asking about one never interns it."""
+        find, ids = self._symbols.find_atom, self._ids
+        return all(find(atom_tuple(goal)) in ids for goal in goals)
 
     # -- container protocol ----------------------------------------------
     def __contains__(self, atom: Any) -> bool:
-        return atom_tuple(atom) in self._atoms
+        i = self._symbols.find_atom(atom_tuple(atom))
+        return i is not None and i in self._ids
 
     def __iter__(self) -> Iterator[GroundAtom]:
-        return iter(self._atoms)
+        return iter(self.atoms)
 
     def __len__(self) -> int:
-        return len(self._atoms)
+        return len(self._ids)
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, State) and self._key == other._key
+        if not isinstance(other, State):
+            return False
+        if self._symbols is other._symbols:
+            same = self._ids == other._ids
+        else:
+            same = self.atoms == other.atoms
+        return same and self._fluents == other._fluents
 
     def __hash__(self) -> int:
-        return hash(self._key)
+        # Summing the atoms' own hashes (kept by the table) makes the hash
+        # independent of which table the IDs come from.
+        if self._hash is None:
+            hashes = self._symbols.atom_hashes
+            self._hash = hash((sum(hashes[i] for i in self._ids),
+                               frozenset(self._fluents.items())))
+        return self._hash
 
     def __repr__(self) -> str:
         if self._fluents:
-            return "State(%s, %s)" % (sorted(self._atoms), dict(sorted(self._fluents.items())))
-        return "State(%s)" % sorted(self._atoms)
+            return "State(%s, %s)" % (sorted(self.atoms), dict(sorted(self._fluents.items())))
+        return "State(%s)" % sorted(self.atoms)
 
 
 class Plan:
@@ -0,0 +1,126 @@
+"""Successor generator: a trie over precondition atoms.
+
+Testing every grounded action against every expanded state costs
+O(|actions|) per expansion. :class:`SuccessorGenerator` compiles the
+actions' positive preconditions into a trie once, in the spirit of Fast
+Downward's successor generator: each action is inserted along the path of
+its precondition atom IDs, and a query walks only the branches whose atom
+holds in the state. The result — the candidates — includes every action
+whose positive conjunctive preconditions match, and possibly others::
+
+    generator = SuccessorGenerator(task.compiled)
+    for i in generator.candidates(state.ids):
+        ...                        # index into task.compiled
+
+Atoms are ordered by how many actions need them, most shared first, so
+actions with common preconditions share a prefix; small subtrees stay
+unsplit buckets. Candidates still go through the caller's full
+applicability test (``State._applicable``, or the masks of a
+``PackedTask``), which also covers negative and numeric preconditions.
+Actions with a non-conjunctive precondition tree (ADL ``or``, ``imply``,
+quantifiers) sit at the root: they are always candidates and get the full
+tree evaluation.
+
+Candidates are returned in action order, so search visits successors in
+the same order as a linear scan and finds the same plans.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from typing import Dict, FrozenSet, List, Sequence, Tuple
+
+from .state import CompiledAction
+
+#: Subtrees with at most this many actions are not split further: their
+#: actions are candidates as soon as the path to them matches, and the
+#: caller's own precondition test settles the rest. Below this size a trie
+#: walk costs more than testing the actions directly.
+_BUCKET = 8
+
+
+class _Node:
+    """A trie node: ``actions`` are candidates once the path to the node
+    matches; ``children`` continue the path by one more atom."""
+
+    __slots__ = ("actions", "children", "keys", "masks")
+
+    def __init__(self) -> None:
+        self.actions: List[int] = []
+        self.children: Dict[int, "_Node"] = {}
+        self.keys: FrozenSet[int] = frozenset()
+        self.masks: List[Tuple[int, _Node]] = []
+
+
+class SuccessorGenerator:
+    """Candidate actions for a state, by trie lookup over atom IDs.
+
+    ``actions`` are compiled grounded actions; candidates are reported as
+    indices into that sequence, for set-based states (:meth:`candidates`) or
+    bitset states (:meth:`candidates_bits`). Every applicable action is a
+    candidate; a candidate is not necessarily applicable.
+    """
+
+    def __init__(self, actions: Sequence[CompiledAction]) -> None:
+        counts: Counter[int] = Counter()
+        for action in actions:
+            if action.precondition is None:
+                counts.update(action.pre_pos)
+
+        def rank(atom: int) -> Tuple[int, int]:
+            return (-counts[atom], atom)
+
+        self._paths = [sorted(action.pre_pos, key=rank) if action.precondition is None
+                       else [] for action in actions]
+        self.size = 0
+        self.root = self._build(list(range(len(actions))), 0)
+        del self._paths
+
+    def _build(self, indices: List[int], depth: int) -> _Node:
+        node = _Node()
+        self.size += 1
+        if len(indices) <= _BUCKET:
+            node.actions = indices
+            return node
+        groups: Dict[int, List[int]] = {}
+        for i in indices:
+            path = self._paths[i]
+            if len(path) > depth:
+                groups.setdefault(path[depth], []).append(i)
+            else:
+                node.actions.append(i)
+        node.children = {atom: self._build(group, depth + 1) for atom, group in groups.items()}
+        node.keys = frozenset(node.children)
+        node.masks = [(1 << atom, child) for atom, child in node.children.items()]
+        return node
+
+    def candidates(self, ids: FrozenSet[int]) -> List[int]:
+        """Indices, in order, of the candidate actions for the atom-ID set
+        ``ids``: a superset of the actions whose positive preconditions all
+        hold there. Bucketed subtrees and actions with a precondition tree
+        come back unchecked, so callers must still test each candidate."""
+        out = list(self.root.actions)
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            children = node.children
+            for atom in node.keys & ids:
+                child = children[atom]
+                out.extend(child.actions)
+                if child.keys:
+                    stack.append(child)
+        out.sort()
+        return out
+
+    def candidates_bits(self, bits: int) -> List[int]:
+        """As :meth:`candidates`, for a state packed into a bitmask."""
+        out = list(self.root.actions)
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            for bit, child in node.masks:
+                if bits & bit:
+                    out.extend(child.actions)
+                    if child.masks:
+                        stack.append(child)
+        out.sort()
+        return out
@@ -35,15 +35,20 @@ from typing import (
     Iterable,
     Iterator,
     List,
+    NamedTuple,
     Optional,
     Tuple,
 )
+from weakref import WeakKeyDictionary
+
+from pddlpy.symbols import SymbolTable
 
 from .base import Planner, validate_requirements
 from .durative import validate_durative_actions
 from .registry import register
 from .search import STRIPS_CAPABILITIES
-from .state import Plan, State, atom_tuple
+from .state import CompiledAction, Plan, State, atom_tuple, compile_action
+from .successors import SuccessorGenerator
 
 if TYPE_CHECKING:
     from pddlpy.pddl import DomainProblem, DurativeAction, Operator
@@ -104,20 +109,58 @@ class TemporalPlan(Plan):
         )
 
 
-def _holds(state: State, pos: Iterable[Any], neg: Iterable[Any]) -> bool:
-    """Conjunctive check: every atom in ``pos`` holds, none in ``neg`` does."""
-    return {atom_tuple(a) for a in pos} <= state.atoms and {
-        atom_tuple(a) for a in neg
-    }.isdisjoint(state.atoms)
+class CompiledDurative(NamedTuple):
+    """A grounded durative action compiled once for search: each time
+    point's conditions and effects as frozen atom-ID sets in the task's
+    ``SymbolTable``. Build with :func:`compile_durative`."""
+
+    action: "DurativeAction"
+    duration: float
+    start_pos: FrozenSet[int]
+    start_neg: FrozenSet[int]
+    over_pos: FrozenSet[int]
+    over_neg: FrozenSet[int]
+    end_pos: FrozenSet[int]
+    end_neg: FrozenSet[int]
+    start_add: FrozenSet[int]
+    start_del: FrozenSet[int]
+    end_add: FrozenSet[int]
+    end_del: FrozenSet[int]
+
+
+def compile_durative(action: "DurativeAction", symbols: SymbolTable) -> CompiledDurative:
+    """Compile a grounded durative ``action`` against ``symbols``. Like
+    :func:`~pddlpy.planning.compile_action`, each call builds a new record;
+    :func:`apply_durative` keeps one per action and table, compiling it
+    again if the action changes."""
+
+    def intern(atoms: Iterable[Any]) -> FrozenSet[int]:
+        return symbols.atom_ids(map(atom_tuple, atoms))
+
+    return CompiledDurative(
+        action, float(action.duration or 0.0),
+        intern(action.condition_pos["start"]), intern(action.condition_neg["start"]),
+        intern(action.condition_pos["over"]), intern(action.condition_neg["over"]),
+        intern(action.condition_pos["end"]), intern(action.condition_neg["end"]),
+        intern(action.effect_pos["start"]), intern(action.effect_neg["start"]),
+        intern(action.effect_pos["end"]), intern(action.effect_neg["end"]),
+    )
 
 
-def _apply_effects(state: State, add: Iterable[Any], delete: Iterable[Any]) -> State:
-    """Add-after-delete effect application, preserving the numeric valuation."""
-    return State(
-        (state.atoms - {atom_tuple(a) for a in delete})
-        | {atom_tuple(a) for a in add},
-        state.fluents,
-    )
+#: Records compiled by ``apply_durative``, per symbol table (weakly held),
+#: each with the ``_snapshot`` of the action it was compiled from.
+_COMPILED: "WeakKeyDictionary[SymbolTable, Dict[Any, Tuple[Tuple[Any, ...], CompiledDurative]]]" = (
+    WeakKeyDictionary())
+
+
+def _snapshot(action: "DurativeAction") -> Tuple[Any, ...]:
+    """What ``compile_durative`` reads from ``action``, by value, so that a
+    changed action is compiled again."""
+    return (action.duration,
+            *(frozenset(action.condition_pos[t]) for t in action.CONDITION_TIMES),
+            *(frozenset(action.condition_neg[t]) for t in action.CONDITION_TIMES),
+            *(frozenset(action.effect_pos[t]) for t in action.EFFECT_TIMES),
+            *(frozenset(action.effect_neg[t]) for t in action.EFFECT_TIMES))
 
 
 def apply_durative(state: State, action: "DurativeAction") -> Optional[State]:
@@ -129,25 +172,42 @@ def apply_durative(state: State, action: "DurativeAction") -> Optional[State]:
     effects — with no concurrent activity, that state holds for the whole
     duration and at the end point).
     """
-    if not _holds(state, action.condition_pos["start"], action.condition_neg["start"]):
+    memo = _COMPILED.get(state.symbols)
+    if memo is None:
+        memo = _COMPILED[state.symbols] = {}
+    snapshot = _snapshot(action)
+    entry = memo.get(action)
+    if entry is None or entry[0] != snapshot:
+        entry = memo[action] = (snapshot, compile_durative(action, state.symbols))
+    return _apply_durative(state, entry[1])
+
+
+def _apply_durative(state: State, action: CompiledDurative) -> Optional[State]:
+    ids = state.ids
+    if not (action.start_pos <= ids and action.start_neg.isdisjoint(ids)):
         return None
-    mid = _apply_effects(state, action.effect_pos["start"], action.effect_neg["start"])
-    if not _holds(mid, action.condition_pos["over"], action.condition_neg["over"]):
+    # Add-after-delete at each time point; the valuation is carried through.
+    mid = (ids - action.start_del) | action.start_add
+    if not (action.over_pos <= mid and action.over_neg.isdisjoint(mid)):
         return None
-    if not _holds(mid, action.condition_pos["end"], action.condition_neg["end"]):
+    if not (action.end_pos <= mid and action.end_neg.isdisjoint(mid)):
         return None
-    return _apply_effects(mid, action.effect_pos["end"], action.effect_neg["end"])
+    return State.from_ids((mid - action.end_del) | action.end_add, state.symbols, state.fluents)
 
 
 class TemporalTask:
     """The temporal counterpart of ``GroundedTask``: initial state, goals and
     every grounded action — durative, plus instantaneous ones as zero-duration
-    steps (so mixed domains work)."""
+    steps (so mixed domains work). Both kinds are compiled once: ``compiled``
+    holds the instantaneous actions' ``CompiledAction`` records and
+    ``compiled_durative`` the durative actions' ``CompiledDurative``."""
 
     def __init__(self, domainproblem: "DomainProblem") -> None:
         self.domainproblem = domainproblem
+        self.symbols = domainproblem.symbols()
         self.initial: State = State.from_problem(domainproblem)
         self.goals = domainproblem.goals()
+        self.goal_ids: FrozenSet[int] = self.symbols.atom_ids(map(atom_tuple, self.goals))
         self.durative: List["DurativeAction"] = [
             g
             for name in domainproblem.durative_operators()
@@ -158,20 +218,26 @@ class TemporalTask:
             for name in domainproblem.operators()
             for g in domainproblem.ground_operator(name)
         ]
+        self.compiled: List[CompiledAction] = [
+            compile_action(op, self.symbols) for op in self.instantaneous]
+        self.compiled_durative: List[CompiledDurative] = [
+            compile_durative(da, self.symbols) for da in self.durative]
+        self._generator = SuccessorGenerator(self.compiled)
 
     def successors(self, state: State) -> Iterator[Tuple["PlanAction", float, State]]:
         """Yield ``(action, duration, successor)`` for every executable action."""
-        for op in self.instantaneous:
-            if state.applicable(op):
-                yield op, 0.0, state.apply(op)
-        for da in self.durative:
-            succ = apply_durative(state, da)
+        for i in self._generator.candidates(state.ids):
+            op = self.compiled[i]
+            if state._applicable(op):
+                yield op.operator, 0.0, state._apply(op)
+        for da in self.compiled_durative:
+            succ = _apply_durative(state, da)
             if succ is not None:
-                yield da, float(da.duration or 0.0), succ
+                yield da.action, da.duration, succ
 
     def is_goal(self, state: State) -> bool:
         """True if ``state`` satisfies the goal."""
-        return state.satisfies(self.goals)
+        return self.goal_ids <= state.ids
 
 
 def _schedule(came_from: _CameFrom, state: State) -> TemporalPlan:
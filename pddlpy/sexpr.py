@@ -0,0 +1,757 @@
+"""Hand-written S-expression parser backend for the object model.
+
+PDDL is an S-expression language, so the model can be built without ANTLR:
+a regex tokenizer plus a recursive-descent builder that produces the very
+same ``DomainListener`` / ``ProblemListener`` objects the ANTLR listeners
+build (operators, durative operators, types, numeric init, metric, ...),
+without materializing a parse tree or running a tree walker.
+
+The fast path accepts a strict subset of the grammar in ``pddl.g4`` and
+reproduces the listeners' behaviour on it exactly, quirks included (e.g.
+only a lowercase ``not`` marks an atom negative in the flat summary sets).
+Anything outside that subset — a syntax error, a token the ANTLR lexer would
+split differently, or a construct the listeners do not model (``:derived``,
+``:constraints``, ``:context``, preferences, quantified/conditional durative
+conditions) — raises :class:`Unsupported`. Callers then re-parse with ANTLR,
+which owns error reporting and recovery; see ``DomainProblem(backend=...)``.
+"""
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from .pddl import (
+    AddDel,
+    And,
+    Atom,
+    BinOp,
+    Condition,
+    DomainListener,
+    DurativeAction,
+    EffAnd,
+    Effect,
+    Equality,
+    Exists,
+    Expr,
+    Fluent,
+    Forall,
+    Lit,
+    Neg,
+    Not,
+    Num,
+    NumEff,
+    NumericCond,
+    NumericConstraint,
+    NumericEffect,
+    Operator,
+    Or,
+    ProblemListener,
+    Universal,
+    When,
+    _is_simple_conjunction,
+    _unconditional_effects,
+)
+
+#: A parsed S-expression: a token (str), or a parenthesized list of nodes.
+Node = Any
+
+
+class Unsupported(Exception):
+    """The input is malformed or outside the fast path's subset; re-parse it
+    with the ANTLR backend."""
+
+
+# Literal tokens of the grammar (matched case-insensitively by the lexer).
+# A word spelling one of these is that keyword, never a NAME -- except 'at'
+# and 'over', which the grammar also accepts as names.
+_KEYWORDS = frozenset("""
+    define domain :context - :requirements :types either :functions number
+    :constants :predicates :constraints :action :parameters :precondition
+    :effect and or not imply exists forall = :durative-action :duration
+    :condition preference at over start end all :derived when * + / > < >=
+    <= assign scale-up scale-down increase decrease ?duration problem :domain
+    :objects :init :goal :metric minimize maximize total-time is-violated
+    always sometime within at-most-once sometime-after sometime-before
+    always-within hold-during hold-after
+""".split())
+
+_REQUIRE_KEYS = frozenset("""
+    :strips :typing :negative-preconditions :disjunctive-preconditions
+    :equality :existential-preconditions :universal-preconditions
+    :quantified-preconditions :conditional-effects :fluents :numeric-fluents
+    :action-costs :adl :durative-actions :derived-predicates
+    :timed-initial-literals :preferences :semantics
+""".split())  # ':constraints' lexes as the section keyword, not a requirement
+
+_ASSIGN_OPS = frozenset(("assign", "scale-up", "scale-down", "increase", "decrease"))
+_BINARY_OPS = frozenset(("*", "+", "-", "/"))
+_BINARY_COMPS = frozenset((">", "<", "=", ">=", "<="))
+
+_NAME = re.compile(r"[A-Za-z][A-Za-z0-9_-]*\Z")
+_VARIABLE = re.compile(r"\?[A-Za-z][A-Za-z0-9_-]*\Z")
+_NUMBER = re.compile(r"[0-9]+(?:\.[0-9]+)?\Z")
+
+_URI = re.compile(r"[A-Za-z][^ \t\r\n()]*\Z")
+
+# A letter-led word runs up to whitespace or a parenthesis -- like ANTLR's
+# URI rule, it swallows ';' -- and anything else stops at a comment.
+_TOKEN = re.compile(r"""
+    (?P<ws>[ \t\r\n]+)
+  | (?P<comment>;[^\r\n]*(?:\r?\n|\Z))
+  | (?P<paren>[()])
+  | (?P<word>[A-Za-z][^ \t\r\n()]*|[^ \t\r\n();]+)
+""", re.VERBOSE)
+
+
+def _tokenize(text: str) -> List[str]:
+    """Split ``text`` into '(' / ')' / word tokens, dropping whitespace and
+    comments. Each word must be exactly one token of the ANTLR lexer (longest
+    match, keywords first), otherwise the input is handed back to ANTLR."""
+    tokens: List[str] = []
+    for m in _TOKEN.finditer(text):
+        kind = m.lastgroup
+        if kind in ("ws", "comment"):
+            continue
+        tok = m.group()
+        if kind == "word":
+            low = tok.lower()
+            if not (low in _KEYWORDS or low in _REQUIRE_KEYS or _URI.match(tok)
+                    or _VARIABLE.match(tok) or _NUMBER.match(tok)):
+                raise Unsupported("unrecognized token %r" % tok)
+        tokens.append(tok)
+    return tokens
+
+
+def _read(text: str) -> List[Node]:
+    """Parse ``text`` into exactly one top-level list."""
+    stack: List[List[Node]] = [[]]
+    for tok in _tokenize(text):
+        if tok == "(":
+            stack.append([])
+        elif tok == ")":
+            if len(stack) == 1:
+                raise Unsupported("unbalanced ')'")
+            done = stack.pop()
+            stack[-1].append(done)
+        else:
+            stack[-1].append(tok)
+    top = stack[0]
+    if len(stack) != 1 or len(top) != 1 or not isinstance(top[0], list):
+        raise Unsupported("expected a single parenthesized definition")
+    return top[0]
+
+
+# -- token helpers ------------------------------------------------------------
+
+def _text(node: Node) -> str:
+    """The ANTLR ``getText()`` of a node: its tokens concatenated."""
+    if isinstance(node, str):
+        return node
+    return "(" + "".join(_text(c) for c in node) + ")"
+
+
+def _kw(node: Node, *words: str) -> bool:
+    """True if ``node`` is a keyword token among ``words`` (any case)."""
+    return isinstance(node, str) and node.lower() in words
+
+
+def _head(node: Node) -> Optional[str]:
+    """The lowercased keyword heading a list node, if any."""
+    if isinstance(node, list) and node and isinstance(node[0], str):
+        low = node[0].lower()
+        if low in _KEYWORDS:
+            return low
+    return None
+
+
+def _is_name(node: Node) -> bool:
+    if not isinstance(node, str):
+        return False
+    low = node.lower()
+    if low in _KEYWORDS:
+        return low in ("at", "over")
+    return _NAME.match(node) is not None
+
+
+def _name(node: Node) -> str:
+    if not _is_name(node):
+        raise Unsupported("expected a name, got %r" % (node,))
+    return node
+
+
+def _is_var(node: Node) -> bool:
+    return (isinstance(node, str) and node.lower() != "?duration"
+            and _VARIABLE.match(node) is not None)
+
+
+def _is_number(node: Node) -> bool:
+    return isinstance(node, str) and _NUMBER.match(node) is not None
+
+
+def _is_term(node: Node) -> bool:
+    return _is_name(node) or _is_var(node)
+
+
+def _list(node: Node) -> List[Node]:
+    if not isinstance(node, list):
+        raise Unsupported("expected a list, got %r" % (node,))
+    return node
+
+
+def _expect(cond: bool, what: str) -> None:
+    if not cond:
+        raise Unsupported(what)
+
+
+# -- typed lists --------------------------------------------------------------
+
+def _r_type(node: Node) -> str:
+    """``primType`` or ``(either primType+)``, as ANTLR's getText renders it."""
+    if isinstance(node, list):
+        _expect(len(node) >= 2 and _kw(node[0], "either"), "bad type")
+        for t in node[1:]:
+            _name(t)
+        return _text(node)
+    return _name(node)
+
+
+def _typed_list(nodes: List[Node], item: Callable[[Node], bool]) -> Dict[str, Optional[str]]:
+    """A typedVariableList / typedNameList (``item`` is ``_is_var`` or
+    ``_is_name``) in the listeners' insertion order: the trailing untyped
+    items first, then each ``x y - type`` group."""
+    pending: List[str] = []
+    groups: List[Tuple[List[str], str]] = []
+    i = 0
+    while i < len(nodes):
+        n = nodes[i]
+        if _kw(n, "-"):
+            _expect(bool(pending) and i + 1 < len(nodes), "dangling '-'")
+            groups.append((pending, _r_type(nodes[i + 1])))
+            pending = []
+            i += 2
+            continue
+        _expect(item(n), "bad typed list entry %r" % (n,))
+        pending.append(n)
+        i += 1
+    out: Dict[str, Optional[str]] = {}
+    for v in pending:
+        out[v] = None
+    for vs, t in groups:
+        for v in vs:
+            out[v] = t
+    return out
+
+
+def _var_list(node: Node) -> Dict[str, Optional[str]]:
+    return _typed_list(_list(node), _is_var)
+
+
+def _name_list(nodes: List[Node]) -> Dict[str, Optional[str]]:
+    return _typed_list(nodes, _is_name)
+
+
+# -- numeric expressions ------------------------------------------------------
+
+def _fhead(node: Node) -> Tuple[str, ...]:
+    """``(functionSymbol term*)`` or a bare ``functionSymbol``."""
+    if isinstance(node, str):
+        return (_name(node),)
+    _expect(bool(node), "empty function head")
+    name = _name(node[0])
+    for t in node[1:]:
+        _expect(_is_term(t), "bad function argument %r" % (t,))
+    return tuple([name] + node[1:])
+
+
+def _fexp(node: Node) -> Expr:
+    if isinstance(node, str):
+        if _is_number(node):
+            return Num(node)
+        return Fluent(_fhead(node))
+    _expect(bool(node), "empty expression")
+    head = node[0]
+    if isinstance(head, str) and head in _BINARY_OPS:
+        if len(node) == 3:
+            return BinOp(head, _fexp(node[1]), _fexp(node[2]))
+        _expect(head == "-" and len(node) == 2, "bad arithmetic expression")
+        return Neg(_fexp(node[1]))
+    return Fluent(_fhead(node))
+
+
+def _fexp_da(node: Node) -> None:
+    """Validate an ``fExpDA`` (a duration-aware expression; not modelled)."""
+    if _kw(node, "?duration"):
+        return
+    if isinstance(node, list) and node and isinstance(node[0], str) \
+            and node[0] in _BINARY_OPS:
+        if len(node) == 3:
+            _fexp_da(node[1])
+            _fexp_da(node[2])
+            return
+        _expect(node[0] == "-" and len(node) == 2, "bad duration expression")
+        _fexp_da(node[1])
+        return
+    _fexp(node)
+
+
+def _fcomp(node: List[Node]) -> NumericConstraint:
+    _expect(len(node) == 3, "bad comparison")
+    return NumericConstraint(node[0], _fexp(node[1]), _fexp(node[2]))
+
+
+# -- goal descriptions ---------------------------------------------------------
+
+class _Flat():
+    """The flat summary a listener Scope accumulates while walking a goal:
+    atoms split by the negative-scope stack, plus every numeric comparison."""
+
+    def __init__(self) -> None:
+        self.atoms: List[Atom] = []
+        self.negatoms: List[Atom] = []
+        self.numerics: List[NumericConstraint] = []
+
+
+def _atom(node: List[Node], arg: Callable[[Node], bool]) -> List[str]:
+    _expect(bool(node), "empty atom")
+    pred = [_name(node[0])]
+    for t in node[1:]:
+        _expect(arg(t), "bad atom argument %r" % (t,))
+        pred.append(t)
+    return pred
+
+
+def _goal(node: Node, neg: bool, flat: _Flat) -> Condition:
+    """Build the Condition tree of a goalDesc and record its flat atoms the
+    way ``enterGoalDesc`` / ``enterAtomicTermFormula`` / ``enterFComp`` do."""
+    node = _list(node)
+    _expect(bool(node), "empty goal")
+    head = node[0]
+    kw = _head(node)
+    if kw is None or kw in ("at", "over"):
+        pred = _atom(node, _is_term)
+        (flat.negatoms if neg else flat.atoms).append(Atom(pred))
+        return Lit(Atom(list(pred)))
+    # enterGoalDesc: only the exact lowercase token opens a negative scope.
+    neg = neg or head == "not"
+    args = node[1:]
+    if kw == "and":
+        return And([_goal(g, neg, flat) for g in args])
+    if kw == "or":
+        return Or([_goal(g, neg, flat) for g in args])
+    if kw == "not":
+        _expect(len(args) == 1, "bad not")
+        return Not(_goal(args[0], neg, flat))
+    if kw == "imply":
+        _expect(len(args) == 2, "bad imply")
+        cond = _goal(args[0], neg, flat)
+        return Or([Not(cond), _goal(args[1], neg, flat)])
+    if kw in ("exists", "forall"):
+        _expect(len(args) == 2, "bad quantifier")
+        varlist = _var_list(args[0])
+        body = _goal(args[1], neg, flat)
+        return Exists(varlist, body) if kw == "exists" else Forall(varlist, body)
+    if kw == "=" and len(args) == 2 and _is_term(args[0]) and _is_term(args[1]):
+        # '(' '=' term term ')' precedes fComp in the grammar.
+        return Equality(args[0], args[1])
+    if kw in _BINARY_COMPS:
+        flat.numerics.append(_fcomp(node))
+        return NumericCond(_fcomp(node))
+    raise Unsupported("unsupported goal %r" % head)
+
+
+# -- effects -------------------------------------------------------------------
+
+def _peffect(node: Node) -> Effect:
+    node = _list(node)
+    kw = _head(node)
+    if kw in _ASSIGN_OPS:
+        _expect(len(node) == 3, "bad assignment")
+        return NumEff(NumericEffect(kw, Fluent(_fhead(node[1])), _fexp(node[2])))
+    if kw == "not":
+        _expect(len(node) == 2, "bad negated effect")
+        inner = _list(node[1])
+        _expect(_head(inner) in (None, "at", "over"), "bad negated effect")
+        return AddDel(Atom(_atom(inner, _is_term)), False)
+    _expect(kw in (None, "at", "over"), "unsupported effect")
+    return AddDel(Atom(_atom(node, _is_term)), True)
+
+
+def _condeffect(node: Node) -> Effect:
+    if _head(node) == "and":
+        return EffAnd([_peffect(p) for p in node[1:]])
+    return _peffect(node)
+
+
+def _ceffect(node: Node) -> Effect:
+    kw = _head(node)
+    if kw == "forall":
+        _expect(len(node) == 3, "bad forall effect")
+        return Universal(_var_list(node[1]), _effect(node[2]))
+    if kw == "when":
+        _expect(len(node) == 3, "bad when effect")
+        return When(_goal(node[1], False, _Flat()), _condeffect(node[2]))
+    return _peffect(node)
+
+
+def _effect(node: Node) -> Effect:
+    if _head(node) == "and":
+        return EffAnd([_ceffect(c) for c in node[1:]])
+    return _ceffect(node)
+
+
+def _da_atoms(node: Node, pos: Set[Atom], neg: Set[Atom]) -> None:
+    """Collect the atoms a durative ``at start|end`` cEffect contributes, as
+    the listener's timed-effect Scope does: a pEffect's atom is negative only
+    under an exact lowercase ``not``; a when-guard's atoms follow the goal
+    rules; numeric assignments contribute nothing, and neither does a forall,
+    whose nested effect collects into a Scope of its own."""
+    kw = _head(node)
+    if kw == "forall":
+        _ceffect(node)
+        return
+    if kw == "when":
+        _expect(len(node) == 3, "bad when effect")
+        flat = _Flat()
+        _goal(node[1], False, flat)
+        pos.update(flat.atoms)
+        neg.update(flat.negatoms)
+        cond = node[2]
+        for p in (cond[1:] if _head(cond) == "and" else [cond]):
+            _da_peffect(p, pos, neg)
+        return
+    _da_peffect(node, pos, neg)
+
+
+def _da_peffect(node: Node, pos: Set[Atom], neg: Set[Atom]) -> None:
+    eff = _peffect(node)
+    if isinstance(eff, AddDel):
+        lowercase_not = not eff.add and node[0] == "not"
+        (neg if lowercase_not else pos).add(eff.atom)
+
+
+# -- domain ----------------------------------------------------------------------
+
+# Section order in 'domain'; :requirements and :context may come either way
+# round (the rule's two alternatives), and only structure defs repeat.
+_DOMAIN_SECTIONS = {":requirements": 0, ":context": 0, ":types": 1,
+                    ":constants": 2, ":predicates": 3, ":functions": 4,
+                    ":action": 5, ":durative-action": 5}
+
+
+def _requirements(node: List[Node]) -> List[str]:
+    _expect(len(node) >= 2, "empty :requirements")
+    out = []
+    for r in node[1:]:
+        _expect(isinstance(r, str) and r.lower() in _REQUIRE_KEYS, "bad requirement")
+        out.append(r.lower())
+    return out
+
+
+def _context(node: List[Node]) -> None:
+    """Validate ``(:context name - URI ...)``; the listeners ignore it."""
+    bindings = node[1:]
+    _expect(bool(bindings) and len(bindings) % 3 == 0, "bad :context")
+    for i in range(0, len(bindings), 3):
+        _name(bindings[i])
+        uri = bindings[i + 2]
+        _expect(_kw(bindings[i + 1], "-") and isinstance(uri, str) and not _is_name(uri)
+                and uri.lower() not in _KEYWORDS and _URI.match(uri) is not None,
+                "bad namespace binding")
+
+
+def _functions(node: List[Node], dl: DomainListener) -> None:
+    after_skeleton = False
+    i = 1
+    while i < len(node):
+        n = node[i]
+        if _kw(n, "-"):
+            _expect(after_skeleton and i + 1 < len(node) and _kw(node[i + 1], "number"),
+                    "bad function type")
+            after_skeleton = False
+            i += 2
+            continue
+        skel = _list(n)
+        _expect(bool(skel), "empty function skeleton")
+        _typed_list(skel[1:], _is_var)
+        dl.functions[_name(skel[0])] = _function_params(skel[1:])
+        after_skeleton = True
+        i += 1
+
+
+def _function_params(nodes: List[Node]) -> List[Tuple[str, Optional[str]]]:
+    """``enterAtomicFunctionSkeleton``'s ordered (param, type) list: untyped
+    trailing variables first, then each typed group (duplicates kept)."""
+    pending: List[str] = []
+    params: List[Tuple[str, Optional[str]]] = []
+    i = 0
+    while i < len(nodes):
+        if _kw(nodes[i], "-"):
+            t = _r_type(nodes[i + 1])
+            params.extend((v, t) for v in pending)
+            pending = []
+            i += 2
+            continue
+        pending.append(nodes[i])
+        i += 1
+    return [(v, None) for v in pending] + params
+
+
+def _action(node: List[Node]) -> Operator:
+    _expect(len(node) >= 4 and _kw(node[2], ":parameters"), "bad :action")
+    op = Operator(_name(node[1]))
+    op.variable_list = _var_list(node[3])
+    rest = node[4:]
+    if rest and _kw(rest[0], ":precondition"):
+        _expect(len(rest) >= 2, "missing precondition")
+        if rest[1] != []:
+            flat = _Flat()
+            tree = _goal(rest[1], False, flat)
+            op.precondition_pos = set(flat.atoms)
+            op.precondition_neg = set(flat.negatoms)
+            op.precondition_connective = "or" if _head(rest[1]) == "or" else "and"
+            op.precondition_num = list(flat.numerics)
+            op.precondition_tree = tree
+            op.simple_conjunction = _is_simple_conjunction(tree)
+        rest = rest[2:]
+    if rest and _kw(rest[0], ":effect"):
+        _expect(len(rest) >= 2, "missing effect")
+        if rest[1] != []:
+            eff = _effect(rest[1])
+            op.effect_tree = eff
+            op.effect_pos, op.effect_neg, op.effect_num = _unconditional_effects(eff)
+        rest = rest[2:]
+    _expect(not rest, "unexpected action body")
+    return op
+
+
+def _duration(node: Node, da: DurativeAction) -> None:
+    """A (simple) durationConstraint; the last literal duration wins, as in
+    ``enterSimpleDurationConstraint``."""
+    node = _list(node)
+    if not node:
+        return
+    if _head(node) == "and":
+        _expect(len(node) >= 2, "empty duration conjunction")
+        for c in node[1:]:
+            _simple_duration(_list(c), da)
+        return
+    _simple_duration(node, da)
+
+
+def _simple_duration(node: List[Node], da: DurativeAction) -> None:
+    kw = _head(node)
+    if kw == "at":
+        _expect(len(node) == 3 and _kw(node[1], "start", "end"), "bad timed duration")
+        _simple_duration(_list(node[2]), da)
+        return
+    _expect(kw in ("<=", ">=", "=") and len(node) == 3 and _kw(node[1], "?duration"),
+            "bad duration constraint")
+    value = node[2]
+    if _is_number(value):
+        da.duration = float(value)
+    else:
+        _fexp(value)
+
+
+def _da_condition(node: Node, da: DurativeAction) -> None:
+    kw = _head(node)
+    if kw == "and":
+        for c in node[1:]:
+            _da_condition(c, da)
+        return
+    node = _list(node)
+    if kw == "at" and len(node) == 3 and _kw(node[1], "start", "end"):
+        time = node[1].lower()
+    elif kw == "over" and len(node) == 3 and _kw(node[1], "all"):
+        time = "over"
+    else:
+        raise Unsupported("unsupported durative condition")
+    flat = _Flat()
+    tree = _goal(node[2], False, flat)
+    da.condition_pos[time] |= set(flat.atoms)
+    da.condition_neg[time] |= set(flat.negatoms)
+    da.condition_trees[time].append(tree)
+
+
+def _da_effect(node: Node, da: DurativeAction) -> None:
+    kw = _head(node)
+    if kw == "and":
+        for c in node[1:]:
+            _da_effect(c, da)
+        return
+    node = _list(node)
+    if kw in _ASSIGN_OPS:
+        # '(' assignOp fHead fExpDA ')': validated, contributes no atoms. ANTLR
+        # reads increase/decrease here as an untimed timedEffect, which the
+        # listener cannot handle, so those stay on the ANTLR path.
+        _expect(kw not in ("increase", "decrease") and len(node) == 3,
+                "unsupported durative assignment")
+        _fhead(node[1])
+        _fexp_da(node[2])
+        return
+    _expect(kw == "at" and len(node) == 3 and _kw(node[1], "start", "end"),
+            "unsupported durative effect")
+    time = node[1].lower()
+    body = node[2]
+    if _head(body) in _ASSIGN_OPS:
+        # cEffect assignment or fAssignDA: validated, contributes no atoms.
+        _expect(len(body) == 3, "bad timed assignment")
+        _fhead(body[1])
+        _fexp_da(body[2])
+        return
+    pos: Set[Atom] = set()
+    neg: Set[Atom] = set()
+    _da_atoms(body, pos, neg)
+    da.effect_pos[time] |= pos
+    da.effect_neg[time] |= neg
+
+
+def _durative(node: List[Node]) -> DurativeAction:
+    _expect(len(node) == 10 and _kw(node[2], ":parameters") and _kw(node[4], ":duration")
+            and _kw(node[6], ":condition") and _kw(node[8], ":effect"),
+            "bad :durative-action")
+    da = DurativeAction(_name(node[1]))
+    da.variable_list = _var_list(node[3])
+    _duration(node[5], da)
+    if node[7] != []:
+        _da_condition(node[7], da)
+    if node[9] != []:
+        _da_effect(node[9], da)
+    return da
+
+
+def build_domain(text: str) -> DomainListener:
+    """Build the domain model of ``text``; raises :class:`Unsupported`."""
+    root = _read(text)
+    _expect(len(root) >= 2 and _kw(root[0], "define"), "expected (define ...)")
+    decl = _list(root[1])
+    _expect(len(decl) == 2 and _kw(decl[0], "domain"), "expected (domain NAME)")
+    _name(decl[1])
+    dl = DomainListener()
+    stage = 0
+    seen: Set[str] = set()
+    for section in root[2:]:
+        kw = _head(section) or ""
+        order = _DOMAIN_SECTIONS.get(kw, -1)
+        _expect(order >= stage and (kw not in seen or order == 5),
+                "unsupported or misplaced section %r" % (kw,))
+        stage = order
+        seen.add(kw)
+        section = _list(section)
+        if kw == ":requirements":
+            dl.requirements.update(_requirements(section))
+        elif kw == ":context":
+            _context(section)
+        elif kw == ":types":
+            dl.types = _name_list(section[1:])
+            dl.typesdef = True
+        elif kw == ":constants":
+            dl.objects = _name_list(section[1:])
+        elif kw == ":predicates":
+            _expect(len(section) >= 2, "empty :predicates")
+            for skel in section[1:]:
+                skel = _list(skel)
+                _expect(bool(skel), "empty predicate skeleton")
+                _var_list(skel[1:])
+                dl.predicates.add(_name(skel[0]))
+        elif kw == ":functions":
+            _functions(section, dl)
+        elif kw == ":action":
+            op = _action(section)
+            dl.operators[op.operator_name] = op
+        else:
+            da = _durative(section)
+            dl.durative_operators[da.operator_name] = da
+    dl.exitDomain(None)
+    return dl
+
+
+# -- problem ---------------------------------------------------------------------
+
+def _init(node: List[Node], pl: ProblemListener) -> None:
+    atoms = []
+    for el in node[1:]:
+        el = _list(el)
+        kw = _head(el)
+        if kw == "=":
+            _expect(len(el) == 3 and _is_number(el[2]), "bad numeric init")
+            pl.init_numeric[_fhead(el[1])] = float(el[2])
+            continue
+        if kw == "at" and len(el) == 3 and _is_number(el[1]):
+            el = _list(el[2])  # timed initial literal: the listener keeps the atom
+            kw = _head(el)
+        if kw == "not":
+            _expect(len(el) == 2, "bad negated init")
+            el = _list(el[1])
+            kw = _head(el)
+        _expect(kw in (None, "at", "over"), "unsupported init element")
+        atoms.append(Atom(_atom(el, _is_name)))
+    pl.initialstate = set(atoms)
+
+
+def _metric_fexp(node: Node) -> None:
+    if isinstance(node, str):
+        _expect(_is_number(node) or _is_name(node) or _kw(node, "total-time"),
+                "bad metric")
+        return
+    _expect(bool(node), "empty metric")
+    head = node[0]
+    if isinstance(head, str) and head in _BINARY_OPS:
+        n = len(node) - 1
+        _expect(n == 2 or (head == "-" and n == 1) or (head in ("*", "/") and n >= 2),
+                "bad metric expression")
+        for c in node[1:]:
+            _metric_fexp(c)
+    elif _kw(head, "is-violated"):
+        _expect(len(node) == 2 and _is_name(node[1]), "bad is-violated")
+    else:
+        _name(head)
+        for c in node[1:]:
+            _name(c)
+
+
+def build_problem(text: str) -> ProblemListener:
+    """Build the problem model of ``text``; raises :class:`Unsupported`."""
+    root = _read(text)
+    _expect(len(root) >= 5 and _kw(root[0], "define"), "expected (define ...)")
+    decl = _list(root[1])
+    _expect(len(decl) == 2 and _kw(decl[0], "problem"), "expected (problem NAME)")
+    _name(decl[1])
+    pl = ProblemListener()
+    sections = [_list(s) for s in root[2:]]
+    # ':context' goes either right before ':domain' or after ':requirements'.
+    context = _head(sections[0]) == ":context"
+    if context:
+        _context(sections.pop(0))
+    dom = sections.pop(0)
+    _expect(len(dom) == 2 and _kw(dom[0], ":domain"), "expected (:domain NAME)")
+    _name(dom[1])
+    if sections and _head(sections[0]) == ":requirements":
+        _requirements(sections.pop(0))
+    if not context and sections and _head(sections[0]) == ":context":
+        _context(sections.pop(0))
+    if sections and _head(sections[0]) == ":objects":
+        pl.objects = _name_list(sections.pop(0)[1:])
+    _expect(len(sections) >= 2 and _head(sections[0]) == ":init"
+            and _head(sections[1]) == ":goal", "expected :init then :goal")
+    _init(sections[0], pl)
+    goal = sections[1]
+    _expect(len(goal) == 2, "bad :goal")
+    flat = _Flat()
+    _goal(goal[1], False, flat)
+    pl.goals = set(flat.atoms + flat.negatoms)
+    rest = sections[2:]
+    if rest:
+        metric = rest.pop(0)
+        _expect(_head(metric) == ":metric" and len(metric) == 3
+                and _kw(metric[1], "minimize", "maximize"), "unsupported problem section")
+        _metric_fexp(metric[2])
+        pl.metric = (metric[1].lower(), _text(metric[2]))
+    _expect(not rest, "unexpected problem section")
+    pl.exitProblem(None)
+    return pl
+
+
+def build(text: str, rule: str) -> Union[DomainListener, ProblemListener]:
+    """Build the ``rule`` ('domain' or 'problem') model of ``text``."""
+    return build_domain(text) if rule == "domain" else build_problem(text)
@@ -0,0 +1,102 @@
+"""Symbol interning: dense integer IDs for predicates, objects and ground
+atoms.
+
+The object model spells ground atoms as tuples of strings, e.g.
+``("on", "a", "b")``. Hashing and comparing those tuples is the inner loop of
+search, so the planning layer works on integer IDs instead: a
+:class:`SymbolTable` maps each predicate, object and ground atom to a small
+int on first sight, and back again at the boundary where plans and states
+are shown to the caller::
+
+    symbols = domainproblem.symbols()
+    i = symbols.atom_id(("on", "a", "b"))     # interns on first use
+    symbols.atom(i)                           # -> ('on', 'a', 'b')
+    symbols.find_atom(("on", "b", "a"))       # -> None if never interned
+
+IDs are dense (``0 .. len - 1``) and stable for the life of the table, so
+they can index lists and bitsets. A table only grows; it is not thread-safe.
+
+This module sits beside ``pddlpy.pddl`` and ``pddlpy.planning`` and imports
+neither, so both can use it without breaking the layering.
+"""
+from __future__ import annotations
+
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+#: A ground atom, e.g. ``("on", "a", "b")``.
+GroundAtom = Tuple[str, ...]
+
+
+class SymbolTable():
+    """Interns predicates, objects and ground atoms as dense integer IDs.
+
+    Attributes (read-only; index them by ID):
+        predicates / objects -- the interned names.
+        atoms        -- the interned ground atoms.
+        atom_terms   -- each atom as ``(predicate_id, object_id, ...)``.
+        atom_hashes  -- each atom's ``hash``, so a set of atom IDs can be
+                        hashed consistently with the atoms it stands for.
+    """
+
+    def __init__(self) -> None:
+        self.predicates: List[str] = []
+        self.objects: List[str] = []
+        self.atoms: List[GroundAtom] = []
+        self.atom_terms: List[Tuple[int, ...]] = []
+        self.atom_hashes: List[int] = []
+        self._predicate_ids: Dict[str, int] = {}
+        self._object_ids: Dict[str, int] = {}
+        self._atom_ids: Dict[GroundAtom, int] = {}
+
+    def predicate_id(self, name: str) -> int:
+        """The ID of predicate ``name``, interning it if new."""
+        i = self._predicate_ids.get(name)
+        if i is None:
+            i = self._predicate_ids[name] = len(self.predicates)
+            self.predicates.append(name)
+        return i
+
+    def object_id(self, name: str) -> int:
+        """The ID of object (or constant) ``name``, interning it if new."""
+        i = self._object_ids.get(name)
+        if i is None:
+            i = self._object_ids[name] = len(self.objects)
+            self.objects.append(name)
+        return i
+
+    def atom_id(self, atom: GroundAtom) -> int:
+        """The ID of ground atom ``atom`` (a tuple), interning it — and its
+        predicate and objects — if new."""
+        i = self._atom_ids.get(atom)
+        if i is None:
+            i = self._atom_ids[atom] = len(self.atoms)
+            self.atoms.append(atom)
+            self.atom_terms.append(
+                (self.predicate_id(atom[0]), *map(self.object_id, atom[1:])))
+            self.atom_hashes.append(hash(atom))
+        return i
+
+    def find_atom(self, atom: GroundAtom) -> Optional[int]:
+        """The ID of ``atom`` if it has been interned, else None."""
+        return self._atom_ids.get(atom)
+
+    def atom(self, i: int) -> GroundAtom:
+        """The ground atom with ID ``i``."""
+        return self.atoms[i]
+
+    def atom_ids(self, atoms: Iterable[GroundAtom]) -> FrozenSet[int]:
+        """Intern every atom in ``atoms``; return their IDs."""
+        return frozenset(map(self.atom_id, atoms))
+
+    def atoms_of(self, ids: Iterable[int]) -> FrozenSet[GroundAtom]:
+        """Translate atom IDs back to ground atoms."""
+        atoms = self.atoms
+        return frozenset(atoms[i] for i in ids)
+
+    def __len__(self) -> int:
+        """The number of interned atoms."""
+        return len(self.atoms)
+
+    def __repr__(self) -> str:
+        return "SymbolTable(%d predicates, %d objects, %d atoms)" % (
+            len(self.predicates), len(self.objects), len(self.atoms))
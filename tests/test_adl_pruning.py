@@ -0,0 +1,97 @@
+"""Static pruning for ADL operators: the binders join the guaranteed
+top-level conjuncts of a precondition tree (Condition.conjuncts) instead of
+falling back to the cartesian product, and never drop an applicable
+grounding."""
+import os
+from collections import deque
+
+import pytest
+
+from pddlpy import DomainProblem
+from pddlpy.binding import CartesianBinder, ReachabilityBinder
+from pddlpy.pddl import And, Atom, Equality, Exists, Forall, Lit, Not, Or
+from pddlpy.planning import BFSPlanner, GroundedTask
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+
+DOMAIN = (
+    "(define (domain depots) (:requirements :adl)\n"
+    " (:types truck place crate)\n"
+    " (:predicates (road ?a ?b - place) (closed ?a - place) (at ?t - truck ?a - place)\n"
+    "  (on ?c - crate ?t - truck) (dirty ?c - crate) (visited ?a - place))\n"
+    " (:action drive :parameters (?t - truck ?a ?b - place)\n"
+    "  :precondition (and (at ?t ?a) (and (road ?a ?b) (not (closed ?b)))\n"
+    "                     (not (= ?a ?b))\n"
+    "                     (forall (?c - crate) (imply (on ?c ?t) (not (dirty ?c)))))\n"
+    "  :effect (and (not (at ?t ?a)) (at ?t ?b) (visited ?b)))\n"
+    " (:action inspect :parameters (?t - truck ?a - place)\n"
+    "  :precondition (or (at ?t ?a) (road ?a ?a))\n"
+    "  :effect (visited ?a)))")
+
+
+def _problem(places):
+    names = " ".join("p%d" % i for i in range(places))
+    roads = " ".join("(road p%d p%d)" % (i, i + 1) for i in range(places - 1))
+    return ("(define (problem depots-%d) (:domain depots)\n"
+            " (:objects t1 t2 - truck %s - place c1 - crate)\n"
+            " (:init (at t1 p0) (at t2 p0) (on c1 t1) %s (road p0 p2) (closed p1))\n"
+            " (:goal (visited p%d)))" % (places, names, roads, places - 1))
+
+
+def _dp(name, **kw):
+    return DomainProblem(os.path.join(CORPUS, "%s-domain.pddl" % name),
+                         os.path.join(CORPUS, "%s-problem.pddl" % name), **kw)
+
+
+def _key(op):
+    return (op.operator_name, tuple(sorted(op.variable_list.items())))
+
+
+def test_conjuncts_follow_and_nodes_only():
+    p, q, r = Atom(["p", "?x"]), Atom(["q", "?x"]), Atom(["r"])
+    tree = And([Lit(p), And([Not(Lit(q)), Lit(r)]), Or([Lit(q), Lit(r)]),
+                Not(Equality("?x", "a")), Not(And([Lit(p)])),
+                Forall({"?y": None}, Lit(q)), Exists({"?y": None}, Lit(p))])
+    assert tree.conjuncts() == ([p, r], [q])
+    assert Or([Lit(p)]).conjuncts() == ([], [])
+    assert Lit(p).conjuncts() == ([p], [])
+
+
+def test_adl_operator_is_pruned_on_its_static_conjuncts():
+    dp = DomainProblem.from_strings(DOMAIN, _problem(6))
+    cart = DomainProblem.from_strings(DOMAIN, _problem(6), binder=CartesianBinder())
+    drive = dp.domain.operators["drive"]
+    assert not drive.simple_conjunction
+    got = list(dp.ground_operator("drive"))
+    # road and closed are static: 6 roads, minus the one into the closed p1,
+    # for each of the 2 trucks; the cartesian product is 2 * 6 * 6.
+    assert len(got) == 2 * 5
+    assert len(list(cart.ground_operator("drive"))) == 2 * 6 * 6
+    # a disjunction guarantees nothing, so inspect is not pruned
+    assert len(list(dp.ground_operator("inspect"))) == 2 * 6
+
+
+@pytest.mark.parametrize("binder", [None, ReachabilityBinder])
+def test_adl_pruning_keeps_every_applicable_action(binder):
+    kw = {} if binder is None else {"binder": binder()}
+    full = GroundedTask(DomainProblem.from_strings(DOMAIN, _problem(6),
+                                                   binder=CartesianBinder()))
+    kept = {_key(op) for op in GroundedTask(
+        DomainProblem.from_strings(DOMAIN, _problem(6), **kw)).actions}
+    seen = {full.initial}
+    frontier = deque([full.initial])
+    while frontier:
+        for op, succ in full.successors(frontier.popleft()):
+            assert _key(op) in kept
+            if succ not in seen:
+                seen.add(succ)
+                frontier.append(succ)
+    plan = BFSPlanner().solve(DomainProblem.from_strings(DOMAIN, _problem(6), **kw))
+    assert len(plan) == 4  # around the closed p1: p0, p2, p3, p4, p5
+
+
+@pytest.mark.parametrize("name", ["rooms", "briefcase"])
+def test_corpus_adl_domains_solve_the_same(name):
+    plain = BFSPlanner().solve(_dp(name, binder=CartesianBinder()))
+    pruned = BFSPlanner().solve(_dp(name))
+    assert plain is not None and len(pruned) == len(plain)
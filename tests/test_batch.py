@@ -0,0 +1,89 @@
+"""Parallel batch parsing (pddlpy.batch and ``pddlpy parse --batch``):
+results stream back per file, match a serial parse, and a bad file yields an
+error result instead of ending the batch."""
+import json
+import os
+import pickle
+import shutil
+
+import pytest
+
+from pddlpy import Domain, DomainProblem
+from pddlpy.batch import parse_many, problem_files
+from pddlpy.cli import main
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+DOMAIN = os.path.join(CORPUS, "blocksworld-domain.pddl")
+PROBLEMS = [os.path.join(CORPUS, name)
+            for name in ("blocksworld-problem.pddl", "blocksworld-upper-problem.pddl")]
+
+
+def _atoms(atoms):
+    return sorted(str(a) for a in atoms)
+
+
+def test_pool_matches_serial_parse():
+    problems = PROBLEMS * 5  # more than workers * backlog: exercises the window
+    results = list(parse_many(DOMAIN, problems, workers=2))
+    assert sorted(r.path for r in results) == sorted(problems)
+    domains = {id(r.problem.domain) for r in results}
+    assert len(domains) == 1
+    for result in results:
+        serial = DomainProblem(DOMAIN, result.path)
+        assert result.error is None
+        assert result.problem.worldobjects() == serial.worldobjects()
+        assert _atoms(result.problem.initialstate()) == _atoms(serial.initialstate())
+        assert _atoms(result.problem.goals()) == _atoms(serial.goals())
+
+
+def test_serial_mode_keeps_order_and_reports_errors():
+    domain = Domain(DOMAIN, backend="sexpr")
+    missing = os.path.join(CORPUS, "nosuch-problem.pddl")
+    results = list(parse_many(domain, [PROBLEMS[0], missing, PROBLEMS[1]], workers=1))
+    assert [r.path for r in results] == [PROBLEMS[0], missing, PROBLEMS[1]]
+    assert results[1].problem is None
+    assert results[1].error.startswith("FileNotFoundError:")
+    assert results[0].problem.domain is domain.listener
+    # The compact problem model is what crosses the process boundary.
+    assert pickle.loads(pickle.dumps(results[2].problem.problem)).objects
+
+
+def test_rejects_bad_workers_eagerly():
+    with pytest.raises(ValueError, match="workers"):
+        parse_many(DOMAIN, PROBLEMS, workers=0)
+
+
+def test_problem_files(tmp_path):
+    for name in ("b.pddl", "a.pddl", "notes.txt", "domain.pddl"):
+        (tmp_path / name).write_text("")
+    files = problem_files([str(tmp_path), PROBLEMS[0]],
+                          exclude=[str(tmp_path / "domain.pddl")])
+    assert files == [str(tmp_path / "a.pddl"), str(tmp_path / "b.pddl"), PROBLEMS[0]]
+
+
+def test_cli_batch(capsys, tmp_path):
+    for path in PROBLEMS:
+        shutil.copy(path, tmp_path)
+    shutil.copy(DOMAIN, tmp_path)
+    code = main(["parse", "--batch", "--workers", "1",
+                 str(tmp_path / "blocksworld-domain.pddl"), str(tmp_path)])
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert code == 0
+    assert [os.path.basename(line["problem"]) for line in lines] == [
+        "blocksworld-problem.pddl", "blocksworld-upper-problem.pddl"]
+    assert all("initial_state" in line for line in lines)
+
+
+def test_cli_batch_errors(capsys):
+    code = main(["parse", "--batch", "--workers", "1", DOMAIN, "nosuch.pddl"])
+    out = json.loads(capsys.readouterr().out)
+    assert code == 2 and out["problem"] == "nosuch.pddl" and "error" in out
+    assert main(["parse", "--batch", "nosuch-domain.pddl", *PROBLEMS]) == 2
+    assert "nosuch-domain.pddl" in capsys.readouterr().err
+
+
+def test_cli_parse_needs_batch_for_several_problems(capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(["parse", DOMAIN, *PROBLEMS])
+    assert exc.value.code == 2
+    assert "--batch" in capsys.readouterr().err
@@ -113,8 +113,8 @@ def _make(tmp_path, domain_text, problem_text):
 
 
 def test_disjunctive_precondition_not_pruned(tmp_path):
-    # (or ...) falls back to cartesian; q is static and absent from init but the
-    # binding is still produced (consuming the full generator covers the return).
+    # (or ...) guarantees no conjunct, so nothing is pruned: q is static and
+    # absent from init but the binding is still produced.
     dp = _make(
         tmp_path,
         "(define (domain d) (:requirements :strips :disjunctive-preconditions)\n"
@@ -0,0 +1,115 @@
+"""Packed bitset states (pddlpy.planning.bitset): a PackedTask searches over
+int bitmasks and must find exactly the plans the set-based task finds."""
+import os
+
+import pytest
+
+from pddlpy import DomainProblem
+from pddlpy.planning import (
+    AStarPlanner,
+    BFSPlanner,
+    BitState,
+    GBFSPlanner,
+    GroundedTask,
+    PackedTask,
+    UniformCostPlanner,
+    get,
+)
+from pddlpy.planning.bitset import _BitView
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(__file__)), "examples", "pddl")
+
+
+def _dp(name, directory=CORPUS):
+    return DomainProblem(os.path.join(directory, "%s-domain.pddl" % name),
+                         os.path.join(directory, "%s-problem.pddl" % name))
+
+
+PROBLEMS = [
+    ("blocksworld", CORPUS), ("gripper", CORPUS), ("logistics", CORPUS),
+    ("briefcase", CORPUS), ("rooms", CORPUS), ("numeric-transport", CORPUS),
+    ("courier", EXAMPLES), ("travel", EXAMPLES),
+]
+
+
+@pytest.mark.parametrize("planner_cls", [BFSPlanner, AStarPlanner, GBFSPlanner,
+                                         UniformCostPlanner])
+@pytest.mark.parametrize("name,directory", PROBLEMS)
+def test_packed_plans_match_set_states(planner_cls, name, directory):
+    dp = _dp(name, directory)
+    plain = planner_cls().solve(dp)
+    packed = planner_cls(packed=True).solve(dp)
+    assert plain is not None and packed is not None
+    assert packed.action_names() == plain.action_names()
+    assert packed.cost == plain.cost
+
+
+@pytest.mark.parametrize("name,directory", PROBLEMS)
+def test_successors_match_set_states(name, directory):
+    dp = _dp(name, directory)
+    plain, packed = GroundedTask(dp), PackedTask(dp)
+    assert packed.initial.atoms == plain.initial.atoms
+    assert packed.initial.fluents == plain.initial.fluents
+    assert packed.goal_count(packed.initial) == plain.goal_count(plain.initial)
+    expected = [(plain.actions.index(op), succ.atoms, succ.fluents)
+                for op, succ in plain.successors(plain.initial)]
+    got = [(packed.actions.index(op), succ.atoms, succ.fluents)
+           for op, succ in packed.successors(packed.initial)]
+    assert got == expected
+
+
+def test_bitstate_reads_like_a_state():
+    dp = _dp("gripper")
+    plain, packed = GroundedTask(dp), PackedTask(dp)
+    state = packed.initial
+    assert state.symbols is packed.symbols
+    assert {packed.symbols.atom(i) for i in state.ids} == plain.initial.atoms
+    assert set(state) == plain.initial.atoms and len(state) == len(plain.initial)
+    atom = next(iter(plain.initial.atoms))
+    assert atom in state and ("no-such", "atom") not in state
+    assert state == BitState(state.bits, packed.symbols)
+    assert hash(state) == hash(BitState(state.bits, packed.symbols))
+    assert state != BitState(state.bits, GroundedTask(_dp("gripper")).symbols)
+    assert state != plain.initial
+    assert repr(state) == "BitState(%s)" % sorted(plain.initial.atoms)
+    assert not packed.is_goal(state)
+
+
+def test_bitstate_with_fluents():
+    packed = PackedTask(_dp("numeric-transport"))
+    state = packed.initial
+    assert state.fluents
+    other = BitState(state.bits, packed.symbols, dict(state.fluents))
+    assert other == state and hash(other) == hash(state)
+    assert state != BitState(state.bits, packed.symbols)
+    assert repr(state).endswith(", %s)" % dict(sorted(state.fluents.items())))
+
+
+def test_bit_view():
+    packed = PackedTask(_dp("blocksworld"))
+    state = packed.initial
+    view = _BitView(state.bits, packed.symbols)
+    assert set(view) == state.atoms and len(view) == len(state)
+    assert ("no-such", "atom") not in view
+
+
+def test_registry_passes_packed():
+    planner = get("astar", packed=True)
+    assert planner.packed
+    assert isinstance(planner.prepare(_dp("gripper")), PackedTask)
+    assert type(get("astar").prepare(_dp("gripper"))) is GroundedTask
+
+
+def test_numeric_precondition_gates_packed_successors(tmp_path):
+    # 50 fuel: a->b costs 30, then b->c costs 40 and is refused.
+    problem = tmp_path / "p.pddl"
+    problem.write_text(
+        "(define (problem nt-low) (:domain numeric-transport)\n"
+        " (:objects truck - vehicle a b c - location)\n"
+        " (:init (at truck a) (road a b) (road b c)\n"
+        "        (= (fuel truck) 50) (= (fuel-cost a b) 30) (= (fuel-cost b c) 40))\n"
+        " (:goal (at truck c)))"
+    )
+    dp = DomainProblem(os.path.join(CORPUS, "numeric-transport-domain.pddl"), str(problem))
+    assert BFSPlanner(packed=True).solve(dp) is None
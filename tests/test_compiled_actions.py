@@ -0,0 +1,189 @@
+"""Compiled grounded actions: frozen ID sets, numeric closures and step costs
+computed once per action, agreeing with the object model's own evaluation."""
+import gc
+import os
+import weakref
+
+import pytest
+
+from pddlpy import DomainProblem
+from pddlpy.pddl import BinOp, Fluent, Neg, Num, NumericConstraint, NumericEffect
+from pddlpy.planning import (
+    CompiledAction,
+    GroundedTask,
+    State,
+    TemporalTask,
+    UniformCostPlanner,
+    action_cost,
+    apply_durative,
+    compile_action,
+    compile_durative,
+)
+from pddlpy.planning.numeric import (
+    compile_constraint,
+    compile_cost,
+    compile_effect,
+    compile_expr,
+    cost_reads,
+)
+from pddlpy.symbols import SymbolTable
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+
+VALUATION = {("fuel", "t"): 7.0, ("cost", "a", "b"): 2.0}
+FUEL = Fluent(("fuel", "t"))
+COST = Fluent(("cost", "a", "b"))
+
+
+def _dp(name):
+    return DomainProblem(os.path.join(CORPUS, "%s-domain.pddl" % name),
+                         os.path.join(CORPUS, "%s-problem.pddl" % name))
+
+
+@pytest.mark.parametrize("expr", [
+    Num(3), FUEL, Fluent(("missing",)), Neg(FUEL), Neg(Num(2)),
+    BinOp("+", FUEL, COST), BinOp("-", Num(10), FUEL), BinOp("*", Num(2), Num(4)),
+    BinOp("/", FUEL, BinOp("+", COST, Num(1))), BinOp("-", Neg(Num(1)), Num(1)),
+])
+def test_expressions_match_the_model(expr):
+    assert compile_expr(expr)(VALUATION) == expr.value(VALUATION)
+
+
+def test_constant_division_by_zero_raises_on_evaluation():
+    reader = compile_expr(BinOp("/", Num(1), Num(0)))
+    with pytest.raises(ZeroDivisionError):
+        reader({})
+
+
+def test_unknown_expression_nodes_use_their_own_value():
+    class Twice:
+        def value(self, valuation):
+            return 2 * valuation[("fuel", "t")]
+
+    assert compile_expr(Twice())(VALUATION) == 14.0
+
+
+@pytest.mark.parametrize("comp", [">", "<", "=", ">=", "<="])
+def test_constraints_match_the_model(comp):
+    for rhs in (Num(6), Num(7), Num(8)):
+        constraint = NumericConstraint(comp, FUEL, rhs)
+        assert compile_constraint(constraint)(VALUATION) == constraint.holds(VALUATION)
+
+
+@pytest.mark.parametrize("op", ["assign", "increase", "decrease", "scale-up", "scale-down"])
+def test_effects_match_the_model(op):
+    for head in (FUEL, Fluent(("missing",))):
+        effect = NumericEffect(op, head, BinOp("+", COST, Num(2)))
+        assert compile_effect(effect)(VALUATION) == effect.apply(VALUATION)
+
+
+def test_step_costs():
+    total = Fluent(("total-cost",))
+    assert compile_cost([])[0] == 1.0
+    assert compile_cost([NumericEffect("decrease", FUEL, Num(1))])[1]({}) == 1.0
+    constant, reader = compile_cost([NumericEffect("increase", total, Num(2)),
+                                     NumericEffect("increase", total, Num(3))])
+    assert constant == 5.0 and reader(VALUATION) == 5.0
+    constant, reader = compile_cost([NumericEffect("increase", total, COST),
+                                     NumericEffect("increase", total, Num(3))])
+    assert constant is None and reader(VALUATION) == 5.0
+    assert cost_reads([NumericEffect("increase", total, BinOp("+", Neg(COST), Num(1))),
+                       NumericEffect("decrease", FUEL, FUEL)]) == {("cost", "a", "b")}
+    assert cost_reads([NumericEffect("increase", total, BinOp("*", COST, object()))]) is None
+    assert cost_reads([NumericEffect("increase", total, object())]) is None
+
+
+def test_compiled_actions_are_immutable():
+    task = GroundedTask(_dp("travel"))
+    action = task.compiled[0]
+    assert isinstance(action, CompiledAction) and action.operator is task.actions[0]
+    with pytest.raises(AttributeError):
+        action.add = frozenset()
+    again = compile_action(action.operator, task.symbols)
+    assert again is not action and (again.pre_pos, again.add) == (action.pre_pos, action.add)
+    other = compile_action(action.operator, SymbolTable())
+    assert other is not action and other.operator is action.operator
+
+
+def test_changed_operators_are_compiled_again():
+    task = GroundedTask(_dp("logistics"))
+    state = task.initial
+    op = next(op for op in task.actions if state.applicable(op))
+    before = state.apply(op)
+    op.effect_pos = op.effect_pos | {("marked",)}
+    assert ("marked",) in state.apply(op) and ("marked",) not in before
+    atom = next(iter(op.precondition_pos))
+    op.precondition_pos.discard(atom)
+    op.precondition_pos.add(("never",))
+    assert not state.applicable(op)
+
+    temporal = TemporalTask(_dp("temporal-weld"))
+    action = next(a for a in temporal.durative if apply_durative(temporal.initial, a))
+    action.condition_pos["start"] = {("never",)}
+    assert apply_durative(temporal.initial, action) is None
+
+
+@pytest.mark.parametrize("name", ["logistics", "temporal-charge"])
+def test_tasks_are_not_kept_alive(name):
+    dp = _dp(name)
+    if name == "logistics":
+        task = GroundedTask(dp)
+        for op in task.actions:
+            task.initial.applicable(op)
+    else:
+        task = TemporalTask(dp)
+        for action in task.durative:
+            apply_durative(task.initial, action)
+    refs = [weakref.ref(dp), weakref.ref(task), weakref.ref(task.symbols)]
+    del dp, task
+    gc.collect()
+    assert [ref() for ref in refs] == [None, None, None]
+
+
+def test_state_dependent_step_cost():
+    dp = _dp("travel")
+    task = GroundedTask(dp)
+    assert not any(a.constant_cost for a in task.compiled)
+    for op in task.actions:
+        assert task.step_cost(op, task.initial) == action_cost(op, task.initial)
+    plan = UniformCostPlanner().solve(dp)
+    assert plan is not None and plan.cost == 2.0
+
+
+def test_constant_step_cost(tmp_path):
+    domain = tmp_path / "d.pddl"
+    domain.write_text(
+        "(define (domain hops) (:requirements :action-costs)\n"
+        " (:predicates (at ?l) (road ?a ?b) (highway ?a ?b))\n"
+        " (:functions (total-cost))\n"
+        " (:action walk :parameters (?a ?b) :precondition (and (at ?a) (road ?a ?b))\n"
+        "  :effect (and (not (at ?a)) (at ?b) (increase (total-cost) 1)))\n"
+        " (:action drive :parameters (?a ?b) :precondition (and (at ?a) (highway ?a ?b))\n"
+        "  :effect (and (not (at ?a)) (at ?b) (increase (total-cost) (* 2 3)))))")
+    problem = tmp_path / "p.pddl"
+    problem.write_text(
+        "(define (problem p) (:domain hops) (:objects a b c)\n"
+        " (:init (at a) (road a b) (road b c) (highway a c) (= (total-cost) 0))\n"
+        " (:goal (at c)) (:metric minimize (total-cost)))")
+    dp = DomainProblem(str(domain), str(problem))
+    task = GroundedTask(dp)
+    assert all(a.constant_cost for a in task.compiled)
+    assert {a.operator.operator_name: a.cost for a in task.compiled} == {
+        "walk": 1.0, "drive": 6.0}
+    for op in task.actions:
+        assert task.step_cost(op, task.initial) == action_cost(op, task.initial)
+    plan = UniformCostPlanner().solve(dp)
+    assert plan.cost == 2.0 and len(plan) == 2
+
+
+def test_durative_actions_are_compiled_once():
+    dp = _dp("temporal-charge")
+    task = TemporalTask(dp)
+    assert len(task.compiled_durative) == len(task.durative)
+    for compiled, action in zip(task.compiled_durative, task.durative):
+        assert compiled.action is action
+        assert compile_durative(action, task.symbols).start_add == compiled.start_add
+        expected = apply_durative(State(task.initial.atoms, task.initial.fluents), action)
+        got = apply_durative(task.initial, action)
+        assert (got is None) == (expected is None)
+        assert got is None or got.atoms == expected.atoms
@@ -3,7 +3,9 @@ import os
 
 import pytest
 
-from pddlpy.diagnostics import diagnose
+import pddlpy.diagnostics
+import pddlpy.pddl
+from pddlpy.diagnostics import diagnose, diagnose_bytes, diagnose_strings
 
 CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
 
@@ -106,3 +108,45 @@ def test_domain_without_predicates_skips_declaration_check(w):
                        " (:init (p o1)) (:goal (p o1)))")
     report = diagnose(dom, prob)
     assert ("error", "undeclared_predicate") not in _checks(report)
+
+
+@pytest.mark.parametrize("name", ["blocksworld", "logistics", "durative-action"])
+def test_each_file_parsed_once(name, monkeypatch):
+    rules = []
+    real = pddlpy.pddl._parse_tree
+
+    def counting(text, rule, *args):
+        rules.append(rule)
+        return real(text, rule, *args)
+
+    monkeypatch.setattr(pddlpy.diagnostics, "_parse_tree", counting)
+    monkeypatch.setattr(pddlpy.pddl, "_parse_tree", counting)
+    assert diagnose(*_files(name))["valid"] is True
+    assert rules == ["domain", "problem"]
+
+
+def test_syntax_errors_in_both_files_reported(w, capsys):
+    d = w("d.pddl", "(define (domain toy) (:predicates (p ?x) (r ?x)) (:action a")
+    p = w("p.pddl", "(define (problem t) (:domain toy) (:init (p o1)) (:goal (r o1)")
+    report = diagnose(d, p)
+    assert _checks(report) == [("error", "syntax"), ("error", "syntax")]
+    assert report["issues"][0]["message"].startswith("domain file: line 1:")
+    assert report["issues"][1]["message"].startswith("problem file: line 1:")
+    assert capsys.readouterr().err == ""  # errors are collected, not printed
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_diagnose_bytes(wrap):
+    domain, problem = (open(f, "rb").read() for f in _files("blocksworld"))
+    assert diagnose_bytes(wrap(domain), wrap(problem)) == {"valid": True, "issues": []}
+    broken = b"(define (domain toy) (:predicates (p)))"
+    assert diagnose_bytes(wrap(broken), wrap(GOOD_PROBLEM.encode())) == diagnose_strings(
+        broken.decode(), GOOD_PROBLEM)
+
+
+def test_diagnose_bytes_reports_invalid_utf8_by_offset():
+    report = diagnose_bytes(b"(define (domain t\xff))", b"(\xc3")
+    assert report["valid"] is False
+    assert _checks(report) == [("error", "encoding"), ("error", "encoding")]
+    assert report["issues"][0]["message"].startswith("domain file: byte 17: invalid UTF-8")
+    assert report["issues"][1]["message"].startswith("problem file: byte 1: invalid UTF-8")
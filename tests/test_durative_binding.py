@@ -0,0 +1,143 @@
+"""Durative-action grounding through the binder: static conditions of every
+time point are joined against the initial state (and, with
+ReachabilityBinder, against the relaxed-reachable atoms) instead of binding
+over the full cartesian product."""
+import os
+
+import pytest
+
+from pddlpy import DomainProblem
+from pddlpy.binding import CartesianBinder, ReachabilityBinder, VariableBinder
+from pddlpy.planning import TemporalTask
+from pddlpy.planning.registry import get
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+
+FLEET = (
+    "(define (domain fleet) (:requirements :strips :typing :durative-actions)\n"
+    " (:types truck depot)\n"
+    " (:predicates (at ?t - truck ?d - depot) (road ?a ?b - depot) (open ?d - depot)\n"
+    "  (fuelled ?t - truck) (hot ?t - truck) (serviced ?t - truck))\n"
+    " (:durative-action drive :parameters (?t - truck ?a ?b - depot)\n"
+    "  :duration (= ?duration 3)\n"
+    "  :condition (and (at start (at ?t ?a)) (over all (road ?a ?b)) (at end (open ?b)))\n"
+    "  :effect (and (at start (not (at ?t ?a))) (at end (at ?t ?b))))\n"
+    " (:durative-action service :parameters (?t - truck ?d - depot)\n"
+    "  :duration (= ?duration 2)\n"
+    "  :condition (and (at start (at ?t ?d)) (at start (fuelled ?t)) (at end (hot ?t)))\n"
+    "  :effect (and (at start (hot ?t)) (at end (serviced ?t)))))")
+
+
+def _fleet(binder=None, depots=5):
+    names = " ".join("d%d" % i for i in range(depots))
+    roads = " ".join("(road d%d d%d)" % (i, i + 1) for i in range(depots - 1))
+    opened = " ".join("(open d%d)" % i for i in range(depots) if i != 2)
+    problem = ("(define (problem fleet-%d) (:domain fleet)\n"
+               " (:objects t1 t2 - truck %s - depot)\n"
+               " (:init (at t1 d0) (at t2 d0) (fuelled t1) %s %s)\n"
+               " (:goal (and (serviced t1) (at t1 d1))))" % (depots, names, roads, opened))
+    return DomainProblem.from_strings(FLEET, problem, binder=binder)
+
+
+def _dp(domain, problem, binder=None):
+    return DomainProblem(os.path.join(CORPUS, domain), os.path.join(CORPUS, problem),
+                         binder=binder)
+
+
+def _bindings(dp, name):
+    return sorted(tuple(g.variable_list.values()) for g in dp.ground_durative_operator(name))
+
+
+def test_static_conditions_of_every_time_point_prune():
+    dp = _fleet()
+    # over-all road and at-end open are static: 4 roads, minus the one into
+    # the closed d2, per truck; the cartesian product is 2 * 5 * 5.
+    assert len(_bindings(dp, "drive")) == 2 * 3
+    assert len(_bindings(_fleet(CartesianBinder()), "drive")) == 2 * 5 * 5
+    assert ("t1", "d1", "d2") not in _bindings(dp, "drive")
+
+
+def test_unsatisfiable_static_condition_grounds_nothing():
+    assert _bindings(_dp("temporal-weld-domain.pddl", "temporal-weld-notorch-problem.pddl"),
+                     "steady-weld") == []
+    assert _bindings(_dp("temporal-weld-domain.pddl", "temporal-weld-problem.pddl"),
+                     "steady-weld") == [("p1",)]
+
+
+def test_reachability_prunes_durative_actions():
+    binder = ReachabilityBinder()
+    dp = _fleet(binder)
+    # The closed d2 cuts the road: no truck gets past d1.
+    assert _bindings(dp, "drive") == [("t1", "d0", "d1"), ("t2", "d0", "d1")]
+    # t2 is never fuelled, so only t1 is serviced; service's at-end (hot ?t)
+    # is met by its own at-start effect.
+    assert _bindings(dp, "service") == [("t1", "d0"), ("t1", "d1")]
+    # (fuelled ?t) is static, so static pruning already keeps t1 only.
+    assert binder.pruned(dp) == {"drive": 2 * 3 - 2, "service": 5 - 2}
+    reached, _ = binder.reachable(dp)
+    assert ("serviced", "t1") in reached and ("at", "t2", "d1") in reached
+
+
+def test_reachability_across_instantaneous_and_durative_actions():
+    binder = ReachabilityBinder()
+    domain = os.path.join(CORPUS, "temporal-charge-domain.pddl")
+    with open(domain) as f:
+        dp = DomainProblem.from_strings(f.read(), (
+            "(define (problem p) (:domain charge) (:objects phone toaster - device)"
+            " (:init (unplugged phone)) (:goal (charged phone)))"), binder=binder)
+    assert _bindings(dp, "charge-battery") == [("phone",)]
+    assert binder.pruned(dp) == {"plug": 1, "charge-battery": 1}
+
+
+@pytest.mark.parametrize("binder", [None, ReachabilityBinder])
+def test_temporal_plans_are_unchanged(binder):
+    def problems(binder):
+        return (_fleet(binder),
+                _dp("temporal-weld-domain.pddl", "temporal-weld-problem.pddl", binder),
+                _dp("temporal-charge-domain.pddl", "temporal-charge-problem.pddl", binder),
+                _dp("temporal-weld-domain.pddl", "temporal-weld-notorch-problem.pddl", binder))
+
+    planner = get("temporal")
+    for pruned, full in zip(problems(binder and binder()), problems(CartesianBinder())):
+        plan, reference = planner.solve(pruned), planner.solve(full)
+        assert (plan is None) == (reference is None)
+        assert plan is None or plan.makespan == reference.makespan
+
+
+def test_custom_binders_bind_durative_actions_cartesian():
+    class Everything(VariableBinder):
+        def bind(self, dp, operator):
+            yield from CartesianBinder().bind(dp, operator)
+
+    task = TemporalTask(_fleet(Everything()))
+    assert len(task.durative) == 2 * 5 * 5 + 2 * 5
+
+
+def _timed(condition, backend):
+    domain = (
+        "(define (domain timed) (:requirements :typing :durative-actions :adl)\n"
+        " (:types item spot)\n"
+        " (:predicates (clear ?s - spot) (free ?i - item) (near ?i - item ?s - spot)\n"
+        "  (lit ?s - spot) (done ?s - spot))\n"
+        " (:durative-action sweep :parameters (?s - spot)\n"
+        "  :duration (= ?duration 1)\n"
+        "  :condition (and (at start (clear ?s)) %s)\n"
+        "  :effect (at end (done ?s))))" % condition)
+    problem = ("(define (problem p) (:domain timed) (:objects i1 i2 - item a b - spot)\n"
+               " (:init (clear a) (clear b) (free i1) (near i2 a))\n"
+               " (:goal (done b)))")
+    return DomainProblem.from_strings(domain, problem, backend=backend)
+
+
+@pytest.mark.parametrize("backend", ["antlr", "sexpr"])
+def test_timed_forall_binds_its_parameters_only(backend):
+    dp = _timed("(over all (forall (?i - item) (free ?i)))", backend)
+    assert _bindings(dp, "sweep") == [("a",), ("b",)]
+
+
+@pytest.mark.parametrize("backend", ["antlr", "sexpr"])
+def test_timed_disjunctions_do_not_prune(backend):
+    dp = _timed("(at start (or (lit ?s) (clear ?s)))", backend)
+    assert _bindings(dp, "sweep") == [("a",), ("b",)]
+    dp = _timed("(at start (or (lit ?s) (exists (?i - item) (near ?i ?s))))", backend)
+    assert _bindings(dp, "sweep") == [("a",), ("b",)]
@@ -9,6 +9,7 @@ import os
 import pytest
 
 from pddlpy import DomainProblem
+from pddlpy.binding import CartesianBinder
 from pddlpy.pddl import Atom, DurativeAction
 from pddlpy.planning import (
     DurativeState,
@@ -72,6 +73,7 @@ def test_applicable_at_start_true():
 
 def test_applicable_at_start_false_missing_positive():
     dp = _dp()
+    dp.binder = CartesianBinder()  # the default binder prunes go(b, a): no (road b a)
     ds = DurativeState.from_problem(dp)
     # go b->a needs (at b) at start, which the init lacks.
     assert ds.applicable(_grounded(dp, **{"?from": "b", "?to": "a"})) is False
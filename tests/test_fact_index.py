@@ -0,0 +1,109 @@
+"""Indexed static joins: the initial state is indexed once per DomainProblem
+(FactIndex), and StaticPrunedBinder joins the most selective precondition
+first, yielding exactly the bindings the static preconditions allow."""
+import os
+
+import pytest
+
+from pddlpy import DomainProblem
+from pddlpy.binding import CartesianBinder, FactIndex, StaticPrunedBinder, _join_order
+from pddlpy.pddl import Atom
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+
+
+def _dp(name):
+    return DomainProblem(os.path.join(CORPUS, "%s-domain.pddl" % name),
+                         os.path.join(CORPUS, "%s-problem.pddl" % name))
+
+
+def test_index_by_predicate_and_argument():
+    index = FactIndex([("road", "b", "c"), ("road", "a", "b"), ("road", "a", "c"), ("at", "a")])
+    assert len(index) == 4 and ("at", "a") in index and ("at", "b") not in index
+    assert index.atoms("road") == [("road", "a", "b"), ("road", "a", "c"), ("road", "b", "c")]
+    assert index.lookup("road", 1, "a") == [("road", "a", "b"), ("road", "a", "c")]
+    assert index.lookup("road", 2, "a") == [] and index.atoms("missing") == []
+    assert index.distinct("road", 1) == 2 and index.distinct("road", 2) == 2
+    assert index.add(("road", "c", "a")) and not index.add(("road", "c", "a"))
+    assert index.distinct("road", 1) == 3 and set(index) == set(FactIndex(index))
+
+
+def test_init_index_is_built_once_and_follows_the_initial_state():
+    dp = _dp("logistics")
+    index = dp.init_index()
+    assert dp.init_index() is index
+    assert set(index) == {a.ground({}) for a in dp.initialstate()}
+    dp.problem.initialstate = set(dp.initialstate())
+    assert dp.init_index() is not index
+    index = dp.init_index()
+    dp.initialstate().pop()
+    assert dp.init_index() is not index and len(dp.init_index()) == len(index) - 1
+    index = dp.init_index()
+    old = next(iter(dp.initialstate()))
+    dp.initialstate().remove(old)
+    dp.initialstate().add(Atom(["fresh", "atom"]))
+    assert len(dp.init_index()) == len(index)
+    assert ("fresh", "atom") in dp.init_index() and old.ground({}) not in dp.init_index()
+
+
+def test_join_starts_from_the_most_selective_atom():
+    dp = _dp("logistics")
+    drive = dp.domain.operators["drive-truck"]
+    static = [a for a in drive.precondition_pos if a.predicate[0] in dp.static_predicates()]
+    order = _join_order(static, dp.init_index())
+    assert [a.predicate[0] for a in order] == ["in-city", "in-city"]
+    # The second in-city shares ?city with the first, so it is joined on it.
+    shared = {"?city"}
+    assert shared <= set(order[0].predicate) and shared <= set(order[1].predicate)
+
+
+@pytest.mark.parametrize("name", ["logistics", "gripper", "blocksworld", "travel",
+                                  "numeric-transport"])
+def test_bindings_are_exactly_the_statically_consistent_ones(name):
+    dp = _dp(name)
+    static = dp.static_predicates()
+    init = {a.ground({}) for a in dp.initialstate()}
+    for op in dp.domain.operators.values():
+        expected = [b for b in CartesianBinder().bind(dp, op)
+                    if all(a.ground(b) in init for a in op.precondition_pos
+                           if a.predicate[0] in static)
+                    and not any(a.ground(b) in init for a in op.precondition_neg
+                                if a.predicate[0] in static)]
+        got = list(StaticPrunedBinder().bind(dp, op))
+        assert sorted(map(sorted, map(dict.items, got))) == \
+            sorted(map(sorted, map(dict.items, expected)))
+        assert all(list(b) == list(op.variable_list) for b in got)
+
+
+def test_bindings_are_deterministic():
+    first, second = _dp("logistics"), _dp("logistics")
+    for name, op in first.domain.operators.items():
+        assert list(StaticPrunedBinder().bind(first, op)) == \
+            list(StaticPrunedBinder().bind(second, second.domain.operators[name]))
+
+
+def test_join_checks_every_argument_of_the_selected_bucket(tmp_path):
+    domain = tmp_path / "d.pddl"
+    domain.write_text(
+        "(define (domain links) (:requirements :strips) (:constants c)\n"
+        " (:predicates (at ?x) (link ?a ?b) (tag ?a) (tag ?a ?b))\n"
+        " (:action loop :parameters (?a) :precondition (and (at ?a) (link ?a ?a))\n"
+        "  :effect (not (at ?a)))\n"
+        " (:action to-c :parameters (?a ?t) :precondition (and (at ?a) (tag ?a) (link ?t ?a)\n"
+        "  (link ?a c)) :effect (not (at ?a)))\n"
+        " (:action pair :parameters (?a ?b) :precondition (and (at ?a) (tag ?a ?b))\n"
+        "  :effect (not (at ?a))))")
+    problem = tmp_path / "p.pddl"
+    problem.write_text(
+        "(define (problem p) (:domain links) (:objects a b d e)\n"
+        " (:init (at a) (link a a) (link a b) (link b c) (link d c) (link e c)\n"
+        "  (link a d) (link a c) (link b b) (tag a) (tag b) (tag a d))\n"
+        " (:goal (at b)))")
+    dp = DomainProblem(str(domain), str(problem))
+
+    def bindings(name):
+        return sorted(tuple(b.values()) for b in dp.binder.bind(dp, dp.domain.operators[name]))
+
+    assert bindings("loop") == [("a",), ("b",)]
+    assert bindings("to-c") == [("a", "a"), ("b", "a"), ("b", "b")]
+    assert bindings("pair") == [("a", "d")]
@@ -0,0 +1,65 @@
+"""Cold-start budget for the console scripts: ``pddlpy --help`` and
+``pddlpy-mcp`` must not load the generated ANTLR parser (or anything else
+that is only needed once a file is parsed), measured with
+``python -X importtime`` in a fresh interpreter."""
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+#: Modules that only a parse needs. antlr4 deserializes the grammar's ATN
+#: when the generated parser is imported, which dominated start-up.
+HEAVY = {"antlr4", "pddlpy.pddl", "pddlpy.pddlParser", "pddlpy.pddlLexer",
+         "pddlpy.diagnostics", "pddlpy.serialize", "pddlpy.sexpr"}
+
+#: Generous wall-clock budget (microseconds) for pddlpy's share of start-up;
+#: about 40ms here, against ~200ms when the parser was imported eagerly.
+BUDGET_US = 150_000
+
+
+def _importtime(code):
+    """Run ``code`` under ``-X importtime``; map each imported module to its
+    (self, cumulative) import time in microseconds."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True, env=env, cwd=ROOT)
+    assert proc.returncode == 0, proc.stderr
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|")
+        times.setdefault(name.strip(), (int(self_us), int(cumulative)))
+    return times
+
+
+def test_cli_help():
+    times = _importtime("import sys\nfrom pddlpy.cli import main\n"
+                        "try:\n    main(['--help'])\nexcept SystemExit as e:\n"
+                        "    sys.exit(e.code)\n")
+    assert not HEAVY & set(times)
+    assert "importlib.metadata" not in times
+    assert times["pddlpy"][1] + times["pddlpy.cli"][1] < BUDGET_US
+
+
+def test_mcp_server():
+    pytest.importorskip("mcp")
+    times = _importtime("import pddlpy.mcpserver")
+    assert not HEAVY & set(times)
+    # The mcp SDK's own import cost is outside pddlpy's control; budget the
+    # pddlpy modules' own time.
+    own = sum(t[0] for name, t in times.items() if name.split(".")[0] == "pddlpy")
+    assert own < BUDGET_US
+
+
+def test_lazy_package_attributes():
+    import pddlpy
+    from pddlpy.pddl import Domain, DomainProblem
+
+    assert pddlpy.DomainProblem is DomainProblem and pddlpy.Domain is Domain
+    assert {"Domain", "DomainProblem"} <= set(dir(pddlpy))
+    with pytest.raises(AttributeError, match="nope"):
+        pddlpy.nope
@@ -0,0 +1,84 @@
+"""Parsing and diagnosing PDDL held in memory: strings and UTF-8 buffers go
+straight to the parser, with no filesystem round trip."""
+import os
+
+import pytest
+
+import pddlpy.pddl
+from pddlpy import Domain, DomainProblem
+from pddlpy.cache import ParseCache
+from pddlpy.diagnostics import diagnose, diagnose_strings
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+
+DOMAIN = """; café domain -- UTF-8 in a comment (#103)
+(define (domain toy) (:predicates (p ?x) (q))
+  (:action a :parameters (?x) :precondition (p ?x) :effect (q)))"""
+PROBLEM = "(define (problem t1) (:domain toy) (:objects o) (:init (p o)) (:goal (q)))"
+
+
+def _texts(name):
+    out = []
+    for kind in ("domain", "problem"):
+        with open(os.path.join(CORPUS, "%s-%s.pddl" % (name, kind)), encoding="utf-8") as f:
+            out.append(f.read())
+    return out
+
+
+@pytest.fixture
+def no_files(monkeypatch):
+    def boom(path):
+        raise AssertionError("read %s from disk" % path)
+
+    monkeypatch.setattr(pddlpy.pddl, "_read_text", boom)
+
+
+def test_from_strings_matches_files():
+    files = DomainProblem(*(os.path.join(CORPUS, "logistics-%s.pddl" % k)
+                            for k in ("domain", "problem")))
+    text = DomainProblem.from_strings(*_texts("logistics"))
+    assert set(text.operators()) == set(files.operators())
+    assert text.worldobjects() == files.worldobjects()
+    assert sorted(map(str, text.initialstate())) == sorted(map(str, files.initialstate()))
+    assert len(list(text.ground_operator("drive-truck"))) == 16
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_from_bytes(wrap, no_files):
+    dp = DomainProblem.from_bytes(wrap(DOMAIN.encode("utf-8")),
+                                  wrap(PROBLEM.encode("utf-8")))
+    assert list(dp.operators()) == ["a"]
+    assert [op.variable_list for op in dp.ground_operator("a")] == [{"?x": "o"}]
+
+
+def test_from_strings_backend_and_cache(tmp_path, no_files):
+    cache = ParseCache(str(tmp_path))
+    for _ in range(2):
+        dp = DomainProblem.from_strings(DOMAIN, PROBLEM, cache=cache, backend="sexpr")
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert dp.static_predicates() == {"p"}
+    with pytest.raises(ValueError, match="backend"):
+        DomainProblem.from_strings(DOMAIN, PROBLEM, backend="yacc")
+
+
+def test_domain_from_string(no_files):
+    domain = Domain.from_string(DOMAIN)
+    assert domain.listener.predicates == {"p", "q"}
+    assert domain.static_predicates() == {"p"}
+
+
+@pytest.mark.parametrize("name", ["blocksworld", "durative-action", "numeric-transport"])
+def test_diagnose_strings_matches_diagnose(name):
+    paths = [os.path.join(CORPUS, "%s-%s.pddl" % (name, k)) for k in ("domain", "problem")]
+    assert diagnose_strings(*_texts(name)) == diagnose(*paths)
+
+
+def test_diagnose_strings_reports_issues(no_files):
+    assert diagnose_strings(DOMAIN, PROBLEM) == {"valid": True, "issues": []}
+    out = diagnose_strings(DOMAIN, PROBLEM.replace("(p o)", "(r zz)"))
+    assert out["valid"] is False
+    assert [i["check"] for i in out["issues"]] == [
+        "undeclared_predicate", "unknown_object", "zero_groundings"]
+    out = diagnose_strings(DOMAIN.replace(":effect", ":effect ("), PROBLEM)
+    assert [i["check"] for i in out["issues"]] == ["syntax"]
+    assert out["issues"][0]["message"].startswith("domain file: line")
@@ -0,0 +1,156 @@
+"""Fact landmarks (LandmarkGraph / landmark_graph) and the landmark-count
+heuristic: every plan reaches every landmark, in the graph's order."""
+import os
+
+import pytest
+
+from pddlpy import DomainProblem
+from pddlpy.planning import (
+    BFSPlanner,
+    GBFSPlanner,
+    GroundedTask,
+    LandmarkGraph,
+    LMCount,
+    landmark_graph,
+    registry,
+)
+from pddlpy.planning.heuristics import INF
+from pddlpy.planning.landmarks import GREEDY_NECESSARY, NATURAL
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+NAMES = ["logistics", "gripper", "blocksworld", "briefcase", "rooms",
+         "numeric-transport", "travel"]
+
+
+def _dp(name):
+    return DomainProblem(os.path.join(CORPUS, "%s-domain.pddl" % name),
+                         os.path.join(CORPUS, "%s-problem.pddl" % name))
+
+
+def _trace(dp, plan):
+    state = GroundedTask(dp).initial
+    states = [state]
+    for op in plan:
+        state = state.apply(op)
+        states.append(state)
+    return states
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_plans_reach_every_landmark_in_order(name):
+    dp = _dp(name)
+    task = GroundedTask(dp)
+    graph = landmark_graph(task)
+    assert graph.reachable and {lm.atom for lm in graph if lm.goal} == task.goal_ids
+    for planner in (BFSPlanner(), registry.get("gbfs-ff")):
+        states = _trace(dp, planner.solve(dp))
+        first = {}
+        for lm in graph:
+            first[lm.atom] = min(i for i, s in enumerate(states) if lm.fact in s.atoms)
+            assert lm.initial == (first[lm.atom] == 0)
+        for o in graph.orderings:
+            before, after = graph.landmarks[o.before], graph.landmarks[o.after]
+            assert first[before.atom] <= first[after.atom]
+            if o.kind == GREEDY_NECESSARY:
+                assert before.fact in states[first[after.atom] - 1].atoms
+
+
+def test_graph_api_and_cache():
+    dp = _dp("gripper")
+    task = GroundedTask(dp)
+    graph = landmark_graph(task)
+    assert landmark_graph(GroundedTask(dp)) is graph
+    assert isinstance(graph, LandmarkGraph) and len(graph) == len(list(graph))
+    robby = graph.index(("at-robby", "roomb"), task.symbols)
+    ball = graph.index(("at", "ball1", "roomb"), task.symbols)
+    assert robby in graph.parents(ball) and ball in graph.children(robby)
+    kinds = {(o.before, o.after): o.kind for o in graph.orderings}
+    assert kinds[robby, ball] == GREEDY_NECESSARY
+    assert kinds[graph.index(("at", "ball1", "rooma"), task.symbols), ball] == NATURAL
+    with pytest.raises(KeyError):
+        graph.index(("at", "ball1", "left"), task.symbols)
+
+    task.initial = next(succ for _, succ in task.successors(task.initial)
+                        if succ != task.initial)
+    moved = landmark_graph(task)
+    assert moved is not graph and moved.initial_ids == task.initial.ids
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_lmcount_plans_are_valid(name):
+    dp = _dp(name)
+    plan = registry.get("gbfs-lmcount").solve(dp)
+    states = _trace(dp, plan)
+    assert states[-1].satisfies(dp.goals())
+    h = LMCount(GroundedTask(dp))
+    h(states[0])
+    for parent, succ in zip(states, states[1:]):
+        h.reach(parent, succ)
+    assert h(states[-1]) == 0
+
+
+def test_lmcount_tracks_accepted_landmarks():
+    dp = _dp("gripper")
+    task = GroundedTask(dp)
+    h = LMCount(task)
+    n = len(h.graph)
+    initial = task.initial
+    assert h(initial) == n - sum(lm.initial for lm in h.graph)
+    moves = {tuple(op.variable_list.values()): succ for op, succ in task.successors(initial)
+             if op.operator_name == "move"}
+    there = moves[("rooma", "roomb")]
+    h.reach(initial, there)
+    assert h(there) == h(initial) - 1
+    # Moving back leaves (at-robby roomb) accepted but needed again before
+    # the balls can get there.
+    back = next(succ for op, succ in task.successors(there) if op.operator_name == "move")
+    h.reach(there, back)
+    assert back == initial and h(back) == h(there) + 1
+    # Reached again along a path that never accepted it: the sets intersect.
+    h.reach(initial, there)
+    h.reach(initial, initial)
+    assert h(initial) == n - sum(lm.initial for lm in h.graph)
+
+
+def test_fewer_expansions_and_dead_ends(monkeypatch, tmp_path):
+    dp = _dp("logistics")
+    expanded = []
+    successors = GroundedTask.successors
+
+    def counting(self, state):
+        expanded.append(state)
+        return successors(self, state)
+
+    monkeypatch.setattr(GroundedTask, "successors", counting)
+    GBFSPlanner().solve(dp)
+    blind = len(expanded)
+    del expanded[:]
+    GBFSPlanner(heuristic="lmcount").solve(dp)
+    assert len(expanded) * 2 < blind
+    monkeypatch.undo()
+
+    stuck = DomainProblem.from_strings(
+        "(define (domain walk) (:requirements :strips)\n"
+        " (:predicates (at ?x) (road ?a ?b))\n"
+        " (:action go :parameters (?a ?b) :precondition (and (at ?a) (road ?a ?b))\n"
+        "  :effect (and (at ?b) (not (at ?a)))))",
+        "(define (problem p) (:domain walk) (:objects a b c)\n"
+        " (:init (at a) (road a b)) (:goal (at c)))")
+    task = GroundedTask(stuck)
+    assert not landmark_graph(task).reachable and len(landmark_graph(task)) == 0
+    assert LMCount(task)(task.initial) == INF
+    assert registry.get("gbfs-lmcount").solve(stuck) is None
+
+
+def test_actions_without_preconditions():
+    dp = DomainProblem.from_strings(
+        "(define (domain d) (:requirements :strips)\n"
+        " (:predicates (ready) (done))\n"
+        " (:action prepare :parameters () :precondition (and) :effect (ready))\n"
+        " (:action finish :parameters () :precondition (ready) :effect (done)))",
+        "(define (problem p) (:domain d) (:init) (:goal (done)))")
+    task = GroundedTask(dp)
+    graph = landmark_graph(task)
+    ready, done = (graph.index(fact, task.symbols) for fact in [("ready",), ("done",)])
+    assert graph.orderings == [(ready, done, GREEDY_NECESSARY)]
+    assert LMCount(task)(task.initial) == 2
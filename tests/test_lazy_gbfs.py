@@ -0,0 +1,109 @@
+"""Lazy greedy best-first search (LazyGBFSPlanner / ``lazy-gbfs``):
+successors queued with their parent's estimate, evaluated on expansion,
+with a boosted open list of preferred operators."""
+import os
+
+import pytest
+
+from pddlpy import DomainProblem
+from pddlpy.planning import (
+    HFF,
+    GroundedTask,
+    LazyGBFSPlanner,
+    make_heuristic,
+    registry,
+)
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+NAMES = ["logistics", "gripper", "blocksworld", "briefcase", "rooms",
+         "numeric-transport", "travel"]
+
+
+def _dp(name):
+    return DomainProblem(os.path.join(CORPUS, "%s-domain.pddl" % name),
+                         os.path.join(CORPUS, "%s-problem.pddl" % name))
+
+
+def _valid(dp, plan):
+    state = GroundedTask(dp).initial
+    for op in plan:
+        assert state.applicable(op)
+        state = state.apply(op)
+    return state.satisfies(dp.goals())
+
+
+def _evaluations(monkeypatch):
+    evaluated = []
+    call = HFF.__call__
+
+    def counting(self, state):
+        evaluated.append(state)
+        return call(self, state)
+
+    monkeypatch.setattr(HFF, "__call__", counting)
+    return evaluated
+
+
+@pytest.mark.parametrize("name", NAMES)
+@pytest.mark.parametrize("preferred", [True, False])
+def test_plans_are_valid(name, preferred):
+    dp = _dp(name)
+    assert _valid(dp, registry.get("lazy-gbfs", preferred=preferred).solve(dp))
+
+
+@pytest.mark.parametrize("heuristic", ["goal-count", "lmcount", "hadd"])
+def test_any_heuristic(heuristic):
+    dp = _dp("logistics")
+    assert _valid(dp, LazyGBFSPlanner(heuristic=heuristic).solve(dp))
+
+
+def test_goal_count_on_a_lazy_task():
+    dp = _dp("gripper")
+    assert _valid(dp, LazyGBFSPlanner(heuristic="goal-count", lazy=True).solve(dp))
+    with pytest.raises(ValueError):
+        LazyGBFSPlanner(lazy=True)
+
+
+def test_evaluates_expanded_states_only(monkeypatch):
+    evaluated = _evaluations(monkeypatch)
+    registry.get("gbfs-ff").solve(_dp("logistics"))
+    eager_count = len(evaluated)
+    del evaluated[:]
+    plan = registry.get("lazy-gbfs", preferred=False).solve(_dp("logistics"))
+    assert plan and len(evaluated) < eager_count
+    assert len(set(evaluated)) == len(evaluated)  # each state at most once
+
+    # The preferred operators lead almost straight to the goal.
+    single = len(evaluated)
+    del evaluated[:]
+    plan = registry.get("lazy-gbfs").solve(_dp("logistics"))
+    assert len(evaluated) < single and len(evaluated) <= len(plan) + 2
+
+
+def test_preferred_operators():
+    task = GroundedTask(_dp("gripper"))
+    ff = make_heuristic("ff", task)
+    state = task.initial
+    ff(state)
+    preferred = ff.preferred(state)
+    assert preferred
+    assert preferred <= {op for op, _ in task.successors(state)}
+    assert preferred <= {ff.relaxed.actions[j].operator for j in ff.relaxed_plan}
+    assert make_heuristic("goal-count", task).preferred(state) == set()
+
+
+def test_unsolvable():
+    domain = (
+        "(define (domain walk) (:requirements :strips)\n"
+        " (:predicates (at ?x) (road ?a ?b))\n"
+        " (:action go :parameters (?a ?b) :precondition (and (at ?a) (road ?a ?b))\n"
+        "  :effect (and (at ?b) (not (at ?a)))))")
+
+    def solve(init, **options):
+        return LazyGBFSPlanner(**options).solve(DomainProblem.from_strings(
+            domain, "(define (problem p) (:domain walk) (:objects a b c d)\n"
+                    " (:init (at a) %s) (:goal (at d)))" % init))
+
+    assert solve("(road a b)") is None  # a dead end from the start
+    assert solve("(road a b) (road b c) (road c a)", heuristic="goal-count") is None
+    assert len(solve("(road a b) (road a c) (road c d)")) == 2
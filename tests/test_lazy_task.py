@@ -0,0 +1,146 @@
+"""On-demand grounding (LazyGroundedTask): each expansion joins the lifted
+operators against the state and grounds only what comes out, keeping the
+compiled actions in a bounded LRU cache."""
+import gc
+import os
+import weakref
+from collections import deque
+
+import pytest
+
+from pddlpy import DomainProblem
+from pddlpy.binding import CartesianBinder, StaticPrunedBinder, VariableBinder
+from pddlpy.planning import (
+    BFSPlanner,
+    GroundedTask,
+    LazyGroundedTask,
+    SearchTask,
+    UniformCostPlanner,
+    registry,
+)
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+
+
+def _dp(name):
+    return DomainProblem(os.path.join(CORPUS, "%s-domain.pddl" % name),
+                         os.path.join(CORPUS, "%s-problem.pddl" % name))
+
+
+def _moves(task, state):
+    return sorted((op.operator_name, tuple(op.variable_list.values()), hash(succ))
+                  for op, succ in task.successors(state))
+
+
+@pytest.mark.parametrize("name", ["logistics", "gripper", "blocksworld", "briefcase",
+                                  "rooms", "numeric-transport", "travel"])
+def test_same_successors_as_the_grounded_task(name):
+    dp = _dp(name)
+    eager, lazy = GroundedTask(dp), LazyGroundedTask(dp, cache_size=8)
+    assert lazy.initial == eager.initial and lazy.goal_ids == eager.goal_ids
+    seen = {eager.initial}
+    frontier = deque([eager.initial])
+    while frontier and len(seen) < 300:
+        state = frontier.popleft()
+        assert _moves(lazy, state) == _moves(eager, state)
+        for _, succ in eager.successors(state):
+            if succ not in seen:
+                seen.add(succ)
+                frontier.append(succ)
+
+
+def test_planners_search_lazily():
+    for name in ("logistics", "gripper", "briefcase"):
+        dp = _dp(name)
+        assert len(BFSPlanner(lazy=True).solve(dp)) == len(BFSPlanner().solve(dp))
+    for name in ("travel", "gripper"):
+        dp = _dp(name)
+        assert UniformCostPlanner(lazy=True).solve(dp).cost == \
+            UniformCostPlanner(lazy=True, cache_size=0).solve(dp).cost == \
+            UniformCostPlanner().solve(dp).cost
+    assert isinstance(registry.get("astar", lazy=True, cache_size=4).prepare(dp),
+                      LazyGroundedTask)
+
+
+def test_nothing_is_grounded_up_front():
+    task = LazyGroundedTask(_dp("logistics"))
+    assert task.cache_info() == (0, 0, 100000, 0)
+    assert isinstance(task, SearchTask) and not isinstance(task, GroundedTask)
+    assert not hasattr(task, "actions")
+
+
+def test_only_the_cache_holds_groundings():
+    task = LazyGroundedTask(_dp("logistics"), cache_size=2)
+    refs, state = set(), task.initial
+    for _ in range(5):
+        moves = list(task.successors(state))
+        refs.update(weakref.ref(op) for op, _ in moves)
+        state = moves[-1][1]
+    del moves
+    gc.collect()
+    assert len(refs) > 2 and sum(ref() is not None for ref in refs) <= 2
+
+
+class _NoTruck1(VariableBinder):
+    """Static pruning, minus every binding that uses truck ``tru1``."""
+
+    def bind(self, dp, operator):
+        for binding in StaticPrunedBinder().bind(dp, operator):
+            if "tru1" not in binding.values():
+                yield binding
+
+
+@pytest.mark.parametrize("binder", [_NoTruck1(), CartesianBinder()])
+def test_the_problem_binder_decides(binder):
+    dp = _dp("logistics")
+    eager = _moves(GroundedTask(dp), GroundedTask(dp).initial)
+    dp.binder = binder
+    lazy = LazyGroundedTask(dp)
+    assert _moves(lazy, lazy.initial) == _moves(GroundedTask(dp), lazy.initial)
+    assert isinstance(binder, CartesianBinder) or _moves(lazy, lazy.initial) != eager
+
+
+def test_cache_evicts_the_least_recently_used():
+    task = LazyGroundedTask(_dp("gripper"), cache_size=None)
+    moves = _moves(task, task.initial)
+    assert len(moves) > 2
+    info = task.cache_info()
+    assert info.misses == len(moves) and info.currsize == len(moves)
+    _moves(task, task.initial)
+    assert task.cache_info().hits == len(moves)
+
+    dp = _dp("gripper")
+    task = LazyGroundedTask(dp, cache_size=2)
+    first, second, third = [("move", dict(op.variable_list))
+                            for op in list(dp.ground_operator("move"))[:3]]
+    for name, binding in (first, second, first, third):
+        task._action(name, binding)
+    assert [args for _, args in task._cache] == \
+        [tuple(first[1].values()), tuple(third[1].values())]
+    assert task.cache_info() == (1, 3, 2, 2)
+
+    task = LazyGroundedTask(dp, cache_size=0)
+    assert _moves(task, task.initial) == moves and task.cache_info().currsize == 0
+
+
+def test_bad_settings_are_rejected():
+    with pytest.raises(ValueError):
+        LazyGroundedTask(_dp("gripper"), cache_size=-1)
+    with pytest.raises(ValueError):
+        BFSPlanner(lazy=True, packed=True)
+    with pytest.raises(ValueError):
+        BFSPlanner(lazy=True, workers=2)
+    # Relaxed heuristics need every grounded action.
+    for name in ("gbfs-ff", "astar-hmax", "astar-lmcut", "gbfs-lmcount", "lazy-gbfs",
+                 "astar-pdb"):
+        with pytest.raises(ValueError):
+            registry.get(name, lazy=True)
+
+
+def test_ground_binding_matches_ground_operator():
+    dp = _dp("briefcase")
+    for name in dp.operators():
+        for gop in dp.ground_operator(name):
+            again = dp.ground_binding(name, dict(gop.variable_list))
+            assert (again.effect_pos, again.effect_neg, repr(again.precondition)) == \
+                (gop.effect_pos, gop.effect_neg, repr(gop.precondition))
@@ -0,0 +1,124 @@
+"""Lifted successor generation (LiftedTask / the ``lifted`` planner): the
+task is searched through per-state joins of the lifted operators, and only
+the plan found is ever grounded."""
+import gc
+import os
+import weakref
+from collections import deque
+
+import pytest
+
+from pddlpy import DomainProblem
+from pddlpy.planning import GroundedTask, LiftedAction, LiftedPlanner, LiftedTask, State, registry
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+NAMES = ["logistics", "gripper", "blocksworld", "briefcase", "rooms",
+         "numeric-transport", "travel"]
+
+
+def _dp(name):
+    return DomainProblem(os.path.join(CORPUS, "%s-domain.pddl" % name),
+                         os.path.join(CORPUS, "%s-problem.pddl" % name))
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_same_transitions_as_the_grounded_task(name):
+    dp = _dp(name)
+    grounded, lifted = GroundedTask(dp), LiftedTask(dp)
+    static = lifted.static_ids
+    assert lifted.initial.ids == grounded.initial.ids - static
+    seen = {grounded.initial}
+    frontier = deque([grounded.initial])
+    while frontier and len(seen) < 300:
+        state = frontier.popleft()
+        expected = sorted((op.operator_name, tuple(op.variable_list.values()),
+                           sorted(succ.ids - static), sorted(succ.fluents.items()))
+                          for op, succ in grounded.successors(state))
+        stripped = State.from_ids(state.ids - static, state.symbols, state.fluents)
+        got = sorted((action.name, action.args, sorted(succ.ids), sorted(succ.fluents.items()))
+                     for action, succ in lifted.successors(stripped))
+        assert got == expected
+        for _, succ in grounded.successors(state):
+            if succ not in seen:
+                seen.add(succ)
+                frontier.append(succ)
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_plans_are_valid(name):
+    dp = _dp(name)
+    plan = registry.get("lifted").solve(dp)
+    state = GroundedTask(dp).initial
+    for op in plan:
+        assert state.applicable(op)
+        state = state.apply(op)
+    assert state.satisfies(dp.goals())
+
+
+def test_only_the_plan_is_grounded(monkeypatch):
+    dp = _dp("logistics")
+    grounded = []
+    ground_binding = dp.ground_binding
+
+    def counting(name, binding):
+        grounded.append(name)
+        return ground_binding(name, binding)
+
+    monkeypatch.setattr(dp, "ground_binding", counting)
+    monkeypatch.setattr(dp, "ground_operator", None)
+    plan = LiftedPlanner().solve(dp)
+    assert len(grounded) == len(plan)
+    task = LiftedTask(dp)
+    action = LiftedAction("drive-truck", ("tru1", "pos1", "apt1", "cit1"))
+    assert dict(task.operator(action).variable_list) == \
+        {"?truck": "tru1", "?loc-from": "pos1", "?loc-to": "apt1", "?city": "cit1"}
+
+
+@pytest.mark.parametrize("name", ["numeric-transport", "rooms", "travel"])
+def test_groundings_for_the_test_are_dropped(name, monkeypatch):
+    dp = _dp(name)
+    grounded = []
+    ground_binding = dp.ground_binding
+
+    def tracking(op_name, binding):
+        op = ground_binding(op_name, binding)
+        grounded.append(weakref.ref(op))
+        return op
+
+    monkeypatch.setattr(dp, "ground_binding", tracking)
+    task = LiftedTask(dp)
+    assert list(task.successors(task.initial))
+    gc.collect()
+    assert grounded and all(ref() is None for ref in grounded)
+
+
+def test_static_goals(tmp_path):
+    domain = tmp_path / "d.pddl"
+    domain.write_text(
+        "(define (domain walk) (:requirements :strips)\n"
+        " (:predicates (at ?x) (road ?a ?b))\n"
+        " (:action go :parameters (?a ?b) :precondition (and (at ?a) (road ?a ?b))\n"
+        "  :effect (and (at ?b) (not (at ?a)))))")
+
+    def solve(goal):
+        problem = tmp_path / "p.pddl"
+        problem.write_text(
+            "(define (problem p) (:domain walk) (:objects a b c)\n"
+            " (:init (at a) (road a b) (road b c)) (:goal (and %s)))" % goal)
+        return LiftedPlanner().solve(DomainProblem(str(domain), str(problem)))
+
+    assert len(solve("(at c) (road a b)")) == 2
+    assert solve("(at c) (road c a)") is None
+
+
+def test_conditional_effects_see_static_atoms():
+    dp = DomainProblem.from_strings(
+        "(define (domain bonus) (:requirements :strips :conditional-effects)\n"
+        " (:predicates (ready) (special ?x) (done ?x) (bonus ?x))\n"
+        " (:action go :parameters (?x) :precondition (ready)\n"
+        "  :effect (and (done ?x) (when (special ?x) (bonus ?x)))))",
+        "(define (problem p) (:domain bonus) (:objects a b)\n"
+        " (:init (ready) (special a)) (:goal (bonus a)))")
+    plan = LiftedPlanner().solve(dp)
+    assert [(op.operator_name, list(op.variable_list.values())) for op in plan] == [("go", ["a"])]
+    assert registry.get("bfs").solve(dp) is not None
@@ -0,0 +1,120 @@
+"""The LM-cut heuristic and the cost-optimal ``astar-lmcut`` planner: same
+plan costs as uniform-cost search, far fewer expansions."""
+import os
+
+import pytest
+
+from pddlpy import DomainProblem
+from pddlpy.planning import (
+    CostAStarPlanner,
+    GroundedTask,
+    LMCut,
+    UniformCostPlanner,
+    action_cost,
+    make_heuristic,
+    registry,
+)
+from pddlpy.planning.heuristics import INF
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+NAMES = ["logistics", "gripper", "blocksworld", "briefcase", "rooms",
+         "numeric-transport", "travel"]
+
+GO = (
+    "(define (domain walk) (:requirements :strips :action-costs :numeric-fluents)\n"
+    " (:predicates (at ?x) (road ?a ?b)) (:functions (total-cost) (toll ?a ?b) (tired))\n"
+    " (:action go :parameters (?a ?b) :precondition (and (at ?a) (road ?a ?b))\n"
+    "  :effect (and (at ?b) (not (at ?a)) (increase (total-cost) (toll ?a ?b))))")
+RUN = (
+    " (:action run :parameters (?a ?b) :precondition (and (at ?a) (road ?a ?b))\n"
+    "  :effect (and (at ?b) (not (at ?a)) (increase (tired) 2)\n"
+    "               (increase (total-cost) (+ (tired) 2)))))")
+ROADS = ("(road a b) (road b c) (road c d) (road a d) (= (toll a b) 1) (= (toll b c) 1)"
+         " (= (toll c d) 1) (= (toll a d) 5)")
+
+
+def _dp(name):
+    return DomainProblem(os.path.join(CORPUS, "%s-domain.pddl" % name),
+                         os.path.join(CORPUS, "%s-problem.pddl" % name))
+
+
+def _walk(init, run=True):
+    return DomainProblem.from_strings(
+        GO + (RUN if run else ")"),
+        "(define (problem p) (:domain walk) (:objects a b c d)\n"
+        " (:init (at a) (= (total-cost) 0) (= (tired) 0) %s) (:goal (at d)))" % init)
+
+
+def _expansions(monkeypatch, planner, dp):
+    expanded = []
+    successors = GroundedTask.successors
+
+    def counting(self, state):
+        expanded.append(state)
+        return successors(self, state)
+
+    monkeypatch.setattr(GroundedTask, "successors", counting)
+    plan = planner.solve(dp)
+    monkeypatch.undo()
+    return plan, len(expanded)
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_same_costs_as_ucs_with_fewer_expansions(name, monkeypatch):
+    dp = _dp(name)
+    optimal, blind = _expansions(monkeypatch, UniformCostPlanner(), dp)
+    plan, informed = _expansions(monkeypatch, registry.get("astar-lmcut"), dp)
+    assert plan.cost == optimal.cost
+    assert informed <= blind
+    if name == "logistics":
+        assert informed * 3 < blind
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_between_hmax_and_the_optimal_cost(name):
+    dp = _dp(name)
+    task = GroundedTask(dp)
+    hmax, lmcut = make_heuristic("hmax", task, unit=False), LMCut(task, unit=False)
+    state = task.initial
+    plan = UniformCostPlanner().solve(dp)
+    remaining = plan.cost
+    for op in plan:
+        assert hmax(state) <= lmcut(state) <= remaining
+        remaining -= action_cost(op, state)
+        state = state.apply(op)
+    assert lmcut(state) == 0
+
+
+def test_fluent_costs():
+    # ``go`` costs a toll no action changes: it is read from the initial state.
+    dp = _walk(ROADS, run=False)
+    task = GroundedTask(dp)
+    assert LMCut(task, unit=False)(task.initial) == 3
+    assert LMCut(task)(task.initial) == 1
+    assert CostAStarPlanner().solve(dp).cost == UniformCostPlanner().solve(dp).cost == 3
+    # ``run`` reads (tired), which actions change: it is costed 0.
+    dp = _walk(ROADS)
+    task = GroundedTask(dp)
+    assert LMCut(task, unit=False)(task.initial) == 0
+    assert CostAStarPlanner().solve(dp).cost == UniformCostPlanner().solve(dp).cost == 2
+
+
+def test_dead_ends_and_presets():
+    dp = _walk("(road a b) (road c d)")
+    task = GroundedTask(dp)
+    assert LMCut(task, unit=False)(task.initial) == INF
+    assert registry.get("astar-lmcut").solve(dp) is None
+    assert CostAStarPlanner().heuristic == "lmcut"
+    assert registry.get("astar-lmcut", heuristic="hmax").solve(_dp("travel")).cost == 2.0
+
+
+def test_actions_without_preconditions():
+    dp = DomainProblem.from_strings(
+        "(define (domain d) (:requirements :strips)\n"
+        " (:predicates (ready) (done))\n"
+        " (:action prepare :parameters () :precondition (and) :effect (ready))\n"
+        " (:action finish :parameters () :precondition (ready) :effect (done)))",
+        "(define (problem p) (:domain d) (:init) (:goal (done)))")
+    task = GroundedTask(dp)
+    assert LMCut(task)(task.initial) == 2
+    assert len(registry.get("astar-lmcut").solve(dp)) == 2
@@ -5,7 +5,7 @@ import os
 import pytest
 
 from pddlpy import mcpserver
-from pddlpy.mcpserver import ground, parse, server, solve, validate
+from pddlpy.mcpserver import ground, parse, server, solve, validate, validate_text
 
 CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
 
@@ -75,9 +75,20 @@ def test_validate_clean_pair():
     assert validate(*_files("blocksworld")) == {"valid": True, "issues": []}
 
 
+def test_validate_text_without_files():
+    domain, problem = _files("blocksworld")
+    with open(domain) as d, open(problem) as p:
+        domain_text, problem_text = d.read(), p.read()
+    assert validate_text(domain_text, problem_text) == {"valid": True, "issues": []}
+    out = validate_text(domain_text, problem_text.replace("(:goal", "(:goal (on a zz)"))
+    assert out["valid"] is False
+    assert [i["check"] for i in out["issues"]] == ["syntax"]
+
+
 def test_tools_registered():
     tools = asyncio.run(server.list_tools())
-    assert sorted(t.name for t in tools) == ["ground", "parse", "solve", "validate"]
+    assert sorted(t.name for t in tools) == [
+        "ground", "parse", "solve", "validate", "validate_text"]
     for t in tools:
         assert t.description  # every tool documents itself
 
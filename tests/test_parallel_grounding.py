@@ -0,0 +1,94 @@
+"""Parallel grounding (ground_parallel / ``workers=N``): operators are
+bound and grounded over a process pool, a large operator split on its
+first parameter, and the actions come back as GroundRecords in exactly the
+sequential order."""
+import os
+import pickle
+
+import pytest
+
+from pddlpy import DomainProblem
+from pddlpy.binding import ReachabilityBinder
+from pddlpy.parallel import _run, from_record, ground_parallel, partition, to_record
+from pddlpy.planning import BFSPlanner, GroundedTask, PackedTask
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+NAMES = ["logistics", "gripper", "blocksworld", "briefcase", "rooms",
+         "numeric-transport", "travel"]
+
+
+def _dp(name, **kw):
+    return DomainProblem(os.path.join(CORPUS, "%s-domain.pddl" % name),
+                         os.path.join(CORPUS, "%s-problem.pddl" % name), **kw)
+
+
+def _view(op):
+    return (op.operator_name, list(op.variable_list.items()), op.precondition_pos,
+            op.precondition_neg, op.effect_pos, op.effect_neg, repr(op.precondition),
+            [repr(c) for c in op.precondition_num], [repr(e) for e in op.effect_num],
+            [(repr(c.condition), c.add, c.dele) for c in op.conditional_effects])
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_same_actions_in_the_same_order(name):
+    dp = _dp(name)
+    expected = [_view(op) for op in GroundedTask(dp).actions]
+    for workers in (1, 2):
+        task = GroundedTask(dp, workers=workers)
+        assert [_view(op) for op in task.actions] == expected
+        assert len(task.compiled) == len(expected)
+
+
+@pytest.mark.parametrize("name", ["briefcase", "rooms", "numeric-transport"])
+def test_records_are_picklable_and_rebuild_the_operator(name):
+    dp = _dp(name)
+    for lifted_name in dp.operators():
+        lifted = dp.domain.operators[lifted_name]
+        for gop in dp.ground_operator(lifted_name):
+            record = pickle.loads(pickle.dumps(to_record(gop)))
+            assert _view(from_record(record, lifted, dp)) == _view(gop)
+
+
+def test_simple_conjunctions_leave_the_tree_out_of_the_record():
+    dp = _dp("logistics")
+    gop = next(dp.ground_operator("drive-truck"))
+    assert gop.precondition is not None and to_record(gop).precondition is None
+
+
+def test_large_operators_are_split_on_their_first_parameter():
+    dp = _dp("logistics")
+    tasks = partition(dp, 16)
+    assert [name for name, _, _ in tasks] == sorted(
+        (name for name, _, _ in tasks), key=list(dp.operators()).index)
+    assert len(tasks) > len(dp.operators())
+    assert partition(dp, 1) == [(name, 0, 1) for name in dp.operators()]
+    bindings = {}
+    for name in dp.operators():
+        mine = [_run(dp, bindings, task) for task in tasks if task[0] == name]
+        assert len(mine) == next(parts for n, _, parts in tasks if n == name)
+        count = sum(1 for _ in dp.binder.bind(dp, dp.domain.operators[name]))
+        assert sorted(i for positions, _ in mine for i in positions) == list(range(count))
+        firsts = [{record.args[0] for record in records} for _, records in mine]
+        assert sum(map(len, firsts)) == len(set().union(*firsts))
+
+
+def test_the_binder_runs_in_the_workers():
+    binder = ReachabilityBinder()
+    dp = _dp("logistics", binder=binder)
+    expected = [_view(op) for op in GroundedTask(dp).actions]
+    assert pickle.loads(pickle.dumps(binder)).pruned(dp) == binder.pruned(dp)
+    assert [_view(op) for op in ground_parallel(dp, 2)] == expected
+    assert [_view(op) for op in ground_parallel(dp)] == expected
+
+
+def test_planners_take_workers():
+    dp = _dp("gripper")
+    plan = BFSPlanner().solve(dp)
+    for planner in (BFSPlanner(workers=2), BFSPlanner(packed=True, workers=2)):
+        assert [_view(op) for op in planner.solve(dp)] == [_view(op) for op in plan]
+    assert isinstance(BFSPlanner(packed=True, workers=1).prepare(dp), PackedTask)
+
+
+def test_workers_must_be_positive():
+    with pytest.raises(ValueError):
+        GroundedTask(_dp("gripper"), workers=0)
@@ -0,0 +1,151 @@
+"""Persistent parse cache: warm loads skip ANTLR, keys follow file content,
+hit/miss counters are reported and eviction keeps the store bounded."""
+import json
+import os
+
+import pytest
+
+import pddlpy.pddl
+from pddlpy import DomainProblem
+from pddlpy.cache import CACHE_DIR_ENV, ParseCache, default_cache
+from pddlpy.cli import main
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+
+
+def _files(name):
+    return (
+        os.path.join(CORPUS, "%s-domain.pddl" % name),
+        os.path.join(CORPUS, "%s-problem.pddl" % name),
+    )
+
+
+def _atoms(atoms):
+    return sorted(str(a) for a in atoms)
+
+
+def test_warm_load_skips_antlr(tmp_path, monkeypatch):
+    cache = ParseCache(str(tmp_path))
+    cold = DomainProblem(*_files("logistics"), cache=cache)
+    assert cache.stats()["misses"] == 2 and cache.stats()["entries"] == 2
+
+    def boom(*args):
+        raise AssertionError("ANTLR ran on a warm load")
+
+    monkeypatch.setattr(pddlpy.pddl, "_walk", boom)
+    warm = DomainProblem(*_files("logistics"), cache=cache)
+    assert cache.hits == 2 and cache.misses == 2
+    assert set(warm.operators()) == set(cold.operators())
+    assert warm.worldobjects() == cold.worldobjects()
+    assert _atoms(warm.initialstate()) == _atoms(cold.initialstate())
+    assert len(list(warm.ground_operator("drive-truck"))) == 16
+
+
+def test_shared_domain_is_one_entry(tmp_path):
+    cache = ParseCache(str(tmp_path))
+    domain, problem = _files("blocksworld")
+    DomainProblem(domain, problem, cache=cache)
+    DomainProblem(domain, os.path.join(CORPUS, "blocksworld-upper-problem.pddl"), cache=cache)
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert cache.stats()["entries"] == 3
+
+
+def test_key_follows_content_and_rule(tmp_path):
+    text = "(define (problem p) (:domain d) (:init (p)) (:goal (p)))"
+    assert ParseCache.key("problem", text) == ParseCache.key("problem", text)
+    assert ParseCache.key("problem", text) != ParseCache.key("domain", text)
+    assert ParseCache.key("problem", text) != ParseCache.key("problem", text + " ")
+
+    # Editing a file invalidates its entry: the new content misses.
+    cache = ParseCache(str(tmp_path / "cache"))
+    prob = tmp_path / "p.pddl"
+    prob.write_text(text)
+    domain, _ = _files("blocksworld")
+    DomainProblem(domain, str(prob), cache=cache)
+    prob.write_text(text.replace("(p)))", "(q)))"))
+    dp = DomainProblem(domain, str(prob), cache=cache)
+    assert _atoms(dp.goals()) == ["('q',)"]
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_lru_eviction_by_count(tmp_path):
+    cache = ParseCache(str(tmp_path), max_entries=2)
+    cache.store("a", 1)
+    cache.store("b", 2)
+    os.utime(cache._path("a"), (1, 1))
+    os.utime(cache._path("b"), (2, 2))
+    assert cache.load("a") == 1          # refreshes a; b is now the oldest
+    cache.store("c", 3)
+    assert cache.evictions == 1
+    assert cache.load("b") is None
+    assert cache.load("a") == 1 and cache.load("c") == 3
+
+
+def test_eviction_by_size(tmp_path):
+    cache = ParseCache(str(tmp_path), max_bytes=1)
+    cache.store("big", "x" * 100)
+    assert cache.stats()["entries"] == 0 and cache.evictions == 1
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = ParseCache(str(tmp_path))
+    with open(cache._path("k"), "wb") as f:
+        f.write(b"not a pickle")
+    assert cache.load("k") is None
+    assert cache.misses == 1 and not os.path.exists(cache._path("k"))
+
+
+@pytest.mark.parametrize("data", [b"\x80\x09.", b"\x80\x05\x95\x00"])
+def test_foreign_or_truncated_entry_is_a_miss(tmp_path, data):
+    cache = ParseCache(str(tmp_path))
+    with open(cache._path("k"), "wb") as f:
+        f.write(data)
+    assert cache.load("k") is None
+    assert cache.misses == 1 and not os.path.exists(cache._path("k"))
+
+
+def test_entry_evicted_after_the_read_is_still_a_hit(tmp_path, monkeypatch):
+    cache = ParseCache(str(tmp_path))
+    cache.store("k", {"model": 1})
+
+    def evicted(path, *args):
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(os, "utime", evicted)
+    assert cache.load("k") == {"model": 1}
+    assert cache.hits == 1
+
+
+def test_failed_store_leaves_nothing(tmp_path):
+    cache = ParseCache(str(tmp_path))
+    with pytest.raises(Exception):
+        cache.store("k", lambda: None)   # unpicklable
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_clear_and_stats(tmp_path):
+    cache = ParseCache(str(tmp_path / "never-created"))
+    assert cache.stats() == {"hits": 0, "misses": 0, "evictions": 0,
+                             "entries": 0, "bytes": 0}
+    cache.store("k", [1, 2, 3])
+    (tmp_path / "never-created" / "unrelated.txt").write_text("kept")
+    assert cache.stats()["entries"] == 1 and cache.stats()["bytes"] > 0
+    cache.clear()
+    assert cache.stats()["entries"] == 0
+    ParseCache._discard(cache._path("k"))  # already gone: no error
+
+
+def test_max_entries_validated(tmp_path):
+    with pytest.raises(ValueError):
+        ParseCache(str(tmp_path), max_entries=0)
+
+
+def test_default_cache_from_environment(tmp_path, monkeypatch, capsys):
+    monkeypatch.delenv(CACHE_DIR_ENV, raising=False)
+    assert default_cache() is None
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    assert default_cache().directory == str(tmp_path)
+    # The CLI picks the cache up from the environment.
+    assert main(["parse", *_files("gripper")]) == 0
+    assert json.loads(capsys.readouterr().out)["operators"] == ["drop", "move", "pick"]
+    assert len(os.listdir(str(tmp_path))) == 2
@@ -0,0 +1,168 @@
+"""Pattern databases: projections solved into array-backed distance
+tables, combined canonically (CanonicalPDB), and kept on disk (PDBStore)."""
+import json
+import os
+from array import array
+
+import pytest
+
+from pddlpy import DomainProblem
+from pddlpy.planning import (
+    CanonicalPDB,
+    GroundedTask,
+    PatternDatabase,
+    PDBStore,
+    UniformCostPlanner,
+    action_cost,
+    make_heuristic,
+    registry,
+)
+from pddlpy.planning.heuristics import INF
+from pddlpy.planning.pdb import PDB_DIR_ENV, default_store
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+NAMES = ["logistics", "gripper", "blocksworld", "briefcase", "rooms",
+         "numeric-transport", "travel"]
+
+WALK = (
+    "(define (domain walk) (:requirements :strips)\n"
+    " (:predicates (at ?x) (road ?a ?b))\n"
+    " (:action go :parameters (?a ?b) :precondition (and (at ?a) (road ?a ?b))\n"
+    "  :effect (and (at ?b) (not (at ?a)))))")
+
+
+def _dp(name):
+    return DomainProblem(os.path.join(CORPUS, "%s-domain.pddl" % name),
+                         os.path.join(CORPUS, "%s-problem.pddl" % name))
+
+
+def _walk(init, goal="(at d)"):
+    return DomainProblem.from_strings(
+        WALK, "(define (problem p) (:domain walk) (:objects a b c d)\n"
+              " (:init %s) (:goal %s))" % (init, goal))
+
+
+@pytest.mark.parametrize("name", NAMES)
+@pytest.mark.parametrize("selection", ["ipdb", "greedy"])
+def test_admissible_along_an_optimal_plan(name, selection):
+    dp = _dp(name)
+    task = GroundedTask(dp)
+    h = CanonicalPDB(task, unit=False, selection=selection)
+    plan = UniformCostPlanner().solve(dp)
+    remaining, state = plan.cost, task.initial
+    for op in plan:
+        assert h(state) <= remaining
+        remaining -= action_cost(op, state)
+        state = state.apply(op)
+    assert h(state) == 0
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_astar_pdb_is_cost_optimal(name):
+    dp = _dp(name)
+    assert registry.get("astar-pdb").solve(dp).cost == UniformCostPlanner().solve(dp).cost
+
+
+def test_tables_and_canonical_combination(tmp_path):
+    dp = _walk("(at a) (road a b) (road b c) (road c d)")
+    task = GroundedTask(dp)
+    at = {x: task.symbols.find_atom(("at", x)) for x in "abcd"}
+    store = PDBStore(str(tmp_path))
+    pdb = PatternDatabase.build(task, [at["c"], at["d"]], store=store)
+    assert pdb.key in store
+    assert PatternDatabase.build(task, [at["b"]], store=store, save=False).key not in store
+    assert len(pdb) == 4 and isinstance(pdb.distances, array)
+    assert pdb.facts == (("at", "c"), ("at", "d"))
+    assert pdb.value(task.initial.ids) == 2  # reach (at c), then (at d)
+    assert pdb.value({at["d"]}) == 0
+    with pytest.raises(ValueError):
+        PatternDatabase(pdb.atoms, pdb.facts, array("d", [0.0]), pdb.key)
+
+    h = CanonicalPDB(task, selection="greedy", max_pattern_size=4)
+    assert h(task.initial) == 3 and len(h.patterns) == 1
+    # The goal patterns of logistics move different packages: additive.
+    h = CanonicalPDB(GroundedTask(_dp("logistics")))
+    assert len(h.patterns) >= 2 and [0, 1] in h.cliques
+    with pytest.raises(ValueError):
+        CanonicalPDB(task, selection="random")
+
+
+def test_only_the_selected_collection_is_stored(tmp_path):
+    store = PDBStore(str(tmp_path))
+    h = CanonicalPDB(GroundedTask(_dp("logistics")), store=store)
+    assert len(h._built) > len(h.pdbs)  # ipdb tried candidates it rejected
+    assert sorted(os.listdir(str(tmp_path))) == sorted({pdb.key + ".pdb" for pdb in h.pdbs})
+
+
+def test_dead_ends():
+    task = GroundedTask(_walk("(at a) (road a b)", "(at c)"))
+    assert make_heuristic("pdb", task)(task.initial) == INF
+    assert registry.get("astar-pdb").solve(_walk("(at a) (road a b)", "(at c)")) is None
+    # Walks that stray into the dead end at b score no candidate.
+    task = GroundedTask(_walk("(at a) (road a b) (road a c)", "(at c)"))
+    h = CanonicalPDB(task)
+    to_b = next(succ for op, succ in task.successors(task.initial)
+                if op.variable_list["?b"] == "b")
+    assert h(task.initial) == 1 and h(to_b) == INF
+    task = GroundedTask(_walk("(at a) (road a b) (road a c)", "(and (at c) (road c a))"))
+    assert CanonicalPDB(task)(task.initial) == INF
+
+
+def test_store_reuses_tables_across_a_family(tmp_path, monkeypatch):
+    store = PDBStore(str(tmp_path / "pdbs"))
+    roads = "(road a b) (road b c) (road c d)"
+    task = GroundedTask(_walk("(at a) " + roads))
+    first = CanonicalPDB(task, selection="greedy", store=store)
+    assert (store.hits, store.misses) == (0, 1)
+    again = CanonicalPDB(GroundedTask(_walk("(at b) " + roads)), selection="greedy",
+                         store=store)
+    assert (store.hits, store.misses) == (1, 1)
+    assert again.pdbs[0].distances == first.pdbs[0].distances
+    # Another goal projects differently: a miss.
+    CanonicalPDB(GroundedTask(_walk("(at a) " + roads, "(at c)")), selection="greedy",
+                 store=store)
+    assert store.misses == 2
+
+    # A table written on a machine of the other byte order is swapped.
+    key = first.pdbs[0].key
+    path = os.path.join(store.directory, key + ".pdb")
+    with open(path, "rb") as f:
+        header, data = json.loads(f.readline()), array("d")
+        data.frombytes(f.read())
+    data.byteswap()
+    header["byteorder"] = "big" if header["byteorder"] == "little" else "little"
+    with open(path, "wb") as f:
+        f.write(json.dumps(header).encode() + b"\n" + data.tobytes())
+    assert store.load(key, len(first.pdbs[0].atoms)) == first.pdbs[0].distances
+
+    # A corrupt entry, or one of the wrong size, is dropped.
+    assert store.load(key, 1) is None and not os.path.exists(path)
+    assert key not in store
+    store.store(first.pdbs[0])
+    assert key in store and 1 not in store
+    with open(path, "wb") as f:
+        f.write(b"not a pdb")
+    assert store.load(key, 1) is None and not os.path.exists(path)
+    with open(path, "wb") as f:
+        f.write(b'{"format": 1}\n' + array("d", [0.0, 1.0]).tobytes())
+    misses = store.misses
+    assert store.load(key, 1) is None and not os.path.exists(path)
+    assert store.misses == misses + 1
+
+    # A failed write leaves neither the entry nor its temporary file.
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail)
+    with pytest.raises(OSError):
+        store.store(first.pdbs[0])
+    monkeypatch.undo()
+    assert not os.path.exists(path)
+    assert not [name for name in os.listdir(store.directory) if name.endswith(".tmp")]
+
+    monkeypatch.setenv(PDB_DIR_ENV, str(tmp_path / "env"))
+    assert default_store().directory == str(tmp_path / "env")
+    CanonicalPDB(task, selection="greedy")
+    assert os.listdir(str(tmp_path / "env"))
+    monkeypatch.delenv(PDB_DIR_ENV)
+    assert default_store() is None
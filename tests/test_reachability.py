@@ -0,0 +1,105 @@
+"""Relaxed-reachability grounding (ReachabilityBinder): only operator bindings
+whose positive preconditions are delete-relaxed reachable from the initial
+state are generated, never dropping one that a reachable state enables."""
+import os
+from collections import deque
+
+import pytest
+
+from pddlpy import DomainProblem
+from pddlpy.binding import ReachabilityBinder
+from pddlpy.planning import BFSPlanner, GroundedTask
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+
+
+def _dp(name, **kw):
+    return DomainProblem(os.path.join(CORPUS, "%s-domain.pddl" % name),
+                         os.path.join(CORPUS, "%s-problem.pddl" % name), **kw)
+
+
+def _key(op):
+    return (op.operator_name, tuple(sorted(op.variable_list.items())))
+
+
+def _reachable(task, limit=2000):
+    seen = {task.initial}
+    frontier = deque([task.initial])
+    while frontier and len(seen) < limit:
+        for _, succ in task.successors(frontier.popleft()):
+            if succ not in seen:
+                seen.add(succ)
+                frontier.append(succ)
+    return seen
+
+
+@pytest.mark.parametrize("name", ["logistics", "gripper", "blocksworld", "briefcase",
+                                  "rooms", "numeric-transport", "travel"])
+def test_every_reachable_application_is_kept(name):
+    full = GroundedTask(_dp(name))
+    kept = {_key(op) for op in GroundedTask(_dp(name, binder=ReachabilityBinder())).actions}
+    for state in _reachable(full):
+        for op, _ in full.successors(state):
+            assert _key(op) in kept
+
+
+def test_logistics_is_pruned_beyond_static():
+    binder = ReachabilityBinder()
+    dp = _dp("logistics", binder=binder)
+    reach = GroundedTask(dp).actions
+    static = GroundedTask(_dp("logistics")).actions
+    assert {_key(op) for op in reach} < {_key(op) for op in static}
+    pruned = binder.pruned(dp)
+    assert pruned["load-truck"] > 0 and pruned["fly-airplane"] == 0
+    assert sum(pruned.values()) == len(static) - len(reach)
+
+
+def test_analysis_is_kept_per_problem():
+    binder = ReachabilityBinder()
+    dp = _dp("gripper", binder=binder)
+    assert binder.reachable(dp) is binder.reachable(dp)
+    other = _dp("logistics", binder=binder)
+    assert binder.reachable(other) is not binder.reachable(dp)
+    assert set(binder.pruned(dp).values()) == {0}
+
+
+def test_plans_are_as_short():
+    for name in ("logistics", "gripper", "briefcase"):
+        plain = BFSPlanner().solve(_dp(name))
+        pruned = BFSPlanner().solve(_dp(name, binder=ReachabilityBinder()))
+        assert len(pruned) == len(plain)
+
+
+def test_unreachable_precondition_prunes_the_operator(tmp_path):
+    domain = tmp_path / "d.pddl"
+    domain.write_text(
+        "(define (domain keys) (:requirements :strips :negative-preconditions :adl)\n"
+        " (:predicates (at ?r) (door ?a ?b) (key ?k) (has ?k) (lit ?r) (open ?a ?b) (done ?r))\n"
+        " (:action take :parameters (?k) :precondition (key ?k)\n"
+        "  :effect (has ?k))\n"
+        " (:action unlock :parameters (?a ?b ?k)\n"
+        "  :precondition (and (at ?a) (door ?a ?b) (has ?k) (not (open ?a ?b)))\n"
+        "  :effect (open ?a ?b))\n"
+        " (:action go :parameters (?a ?b) :precondition (and (at ?a) (open ?a ?b))\n"
+        "  :effect (and (at ?b) (not (at ?a))))\n"
+        " (:action switch :parameters (?r) :precondition (or (at ?r) (lit ?r))\n"
+        "  :effect (when (at ?r) (lit ?r)))\n"
+        " (:action read :parameters (?r) :precondition (lit ?r) :effect (done ?r)))")
+    problem = tmp_path / "p.pddl"
+    problem.write_text(
+        "(define (problem p) (:domain keys) (:objects a b c k)\n"
+        " (:init (at a) (door a b) (door c a) (key k))\n"
+        " (:goal (at b)))")
+    binder = ReachabilityBinder()
+    dp = DomainProblem(str(domain), str(problem), binder=binder)
+    grounded = {name: {tuple(op.variable_list.values()) for op in dp.ground_operator(name)}
+                for name in dp.operators()}
+    # (has k) is reachable via take, but no door leads away from b or into c.
+    assert grounded["unlock"] == {("a", "b", "k")}
+    assert grounded["go"] == {("a", "b")}
+    # switch is not a conjunction: every binding, and (lit ?r) is then
+    # assumed reachable for every argument.
+    assert len(grounded["switch"]) == len(grounded["read"]) == 4
+    assert binder.pruned(dp)["go"] == 4 * 4 - 1
+    assert BFSPlanner().solve(dp) is not None
+
@@ -0,0 +1,175 @@
+"""Delete-relaxation heuristics (h_max, h_add, h_FF) and the ``heuristic``
+parameter of the best-first planners."""
+import os
+
+import pytest
+
+from pddlpy import DomainProblem
+from pddlpy.planning import (
+    HFF,
+    AStarPlanner,
+    BFSPlanner,
+    GBFSPlanner,
+    GroundedTask,
+    Heuristic,
+    HMax,
+    make_heuristic,
+    register_heuristic,
+    registry,
+)
+from pddlpy.planning.heuristics import HEURISTICS, INF, GoalCount
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+NAMES = ["logistics", "gripper", "blocksworld", "briefcase", "rooms",
+         "numeric-transport", "travel"]
+
+
+def _dp(name):
+    return DomainProblem(os.path.join(CORPUS, "%s-domain.pddl" % name),
+                         os.path.join(CORPUS, "%s-problem.pddl" % name))
+
+
+def _counting(monkeypatch, task_cls=GroundedTask):
+    expanded = []
+    successors = task_cls.successors
+
+    def counting(self, state):
+        expanded.append(state)
+        return successors(self, state)
+
+    monkeypatch.setattr(task_cls, "successors", counting)
+    return expanded
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_estimates_are_ordered_and_hmax_is_admissible(name):
+    dp = _dp(name)
+    task = GroundedTask(dp)
+    hmax, hadd, ff = (make_heuristic(n, task) for n in ("hmax", "hadd", "ff"))
+    state = task.initial
+    plan = BFSPlanner().solve(dp)
+    for i, op in enumerate(plan):
+        # Along an optimal plan the optimal cost to go is what is left of it.
+        assert hmax(state) <= len(plan) - i
+        assert hmax(state) <= ff(state) <= hadd(state)
+        state = state.apply(op)
+    assert hmax(state) == hadd(state) == ff(state) == 0
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_astar_hmax_is_optimal_and_gbfs_ff_plans_are_valid(name):
+    dp = _dp(name)
+    assert len(registry.get("astar-hmax").solve(dp)) == len(BFSPlanner().solve(dp))
+    for preset in ("gbfs-ff", "gbfs-hadd"):
+        plan = registry.get(preset).solve(dp)
+        state = GroundedTask(dp).initial
+        for op in plan:
+            assert state.applicable(op)
+            state = state.apply(op)
+        assert state.satisfies(dp.goals())
+
+
+def test_informed_heuristics_expand_fewer_states(monkeypatch):
+    dp = _dp("logistics")
+    expanded = _counting(monkeypatch)
+    counts = {}
+    for name, planner in (("goal-count", AStarPlanner()), ("hmax", AStarPlanner(heuristic="hmax")),
+                          ("gbfs", GBFSPlanner()), ("ff", GBFSPlanner(heuristic="ff"))):
+        del expanded[:]
+        planner.solve(dp)
+        counts[name] = len(expanded)
+    assert counts["hmax"] < counts["goal-count"]
+    assert counts["ff"] <= counts["gbfs"]
+
+
+def test_packed_tasks():
+    dp = _dp("gripper")
+    assert len(AStarPlanner(heuristic="hadd", packed=True).solve(dp)) == \
+        len(AStarPlanner(heuristic="hadd").solve(dp))
+
+
+def test_relaxed_plan_and_dead_ends(tmp_path):
+    domain = tmp_path / "d.pddl"
+    domain.write_text(
+        "(define (domain walk) (:requirements :strips :negative-preconditions)\n"
+        " (:predicates (at ?x) (road ?a ?b) (closed ?x) (key ?x) (waved))\n"
+        " (:action wave :parameters () :precondition (and) :effect (waved))\n"
+        " (:action go :parameters (?a ?b)\n"
+        "  :precondition (and (at ?a) (road ?a ?b) (not (closed ?b)))\n"
+        "  :effect (and (at ?b) (not (at ?a))))\n"
+        " (:action open :parameters (?x) :precondition (key ?x)\n"
+        "  :effect (not (closed ?x))))")
+
+    def dp(init, goal):
+        problem = tmp_path / "p.pddl"
+        problem.write_text(
+            "(define (problem p) (:domain walk) (:objects a b c d)\n"
+            " (:init (at a) %s) (:goal %s))" % (init, goal))
+        return DomainProblem(str(domain), str(problem))
+
+    task = GroundedTask(dp("(road a b) (road b c) (road a d)", "(at c)"))
+    ff = HFF(task)
+    assert ff(task.initial) == 2
+    assert sorted(tuple(task.compiled[j].operator.variable_list.values())
+                  for j in ff.relaxed_plan) == [("a", "b"), ("b", "c")]
+    # Moving to d is a dead end, which the planner prunes.
+    assert len(GBFSPlanner(heuristic="ff").solve(dp("(road a d) (road a b) (road b c)",
+                                                    "(at c)"))) == 2
+    assert make_heuristic("hadd", task)(task.initial) == 2
+    # Negative preconditions are relaxed away: (closed b) blocks, h does not see it.
+    closed = dp("(road a b) (road b c) (closed b)", "(at c)")
+    task = GroundedTask(closed)
+    assert HMax(task)(task.initial) == 2
+    assert AStarPlanner(heuristic="hmax").solve(closed) is None
+
+    stuck = dp("(road a b) (road c d)", "(at d)")
+    task = GroundedTask(stuck)
+    assert make_heuristic("hmax", task)(task.initial) == INF
+    ff = HFF(task)
+    assert ff(task.initial) == INF and ff.relaxed_plan == set()
+    assert GBFSPlanner(heuristic="ff").solve(stuck) is None
+
+
+def test_action_costs(tmp_path):
+    domain = tmp_path / "d.pddl"
+    domain.write_text(
+        "(define (domain walk) (:requirements :strips :action-costs)\n"
+        " (:predicates (at ?x) (road ?a ?b)) (:functions (total-cost))\n"
+        " (:action go :parameters (?a ?b) :precondition (and (at ?a) (road ?a ?b))\n"
+        "  :effect (and (at ?b) (not (at ?a)) (increase (total-cost) 3)))\n"
+        " (:action jump :parameters (?a ?b) :precondition (at ?a)\n"
+        "  :effect (and (at ?b) (not (at ?a)) (increase (total-cost) 10))))")
+    problem = tmp_path / "p.pddl"
+    problem.write_text(
+        "(define (problem p) (:domain walk) (:objects a b c)\n"
+        " (:init (at a) (road a b) (road b c) (= (total-cost) 0)) (:goal (at c)))")
+    task = GroundedTask(DomainProblem(str(domain), str(problem)))
+    assert HMax(task)(task.initial) == 1
+    assert HMax(task, unit=False)(task.initial) == 6
+    # travel's (distance ?a ?b) costs never change: read from the initial state.
+    travel = GroundedTask(_dp("travel"))
+    assert HMax(travel, unit=False)(travel.initial) == 2
+
+
+def test_selection_and_registration():
+    dp = _dp("gripper")
+    task = GroundedTask(dp)
+    assert isinstance(make_heuristic("goal-count", task), GoalCount)
+    with pytest.raises(KeyError):
+        make_heuristic("nope", task)
+    with pytest.raises(KeyError):
+        AStarPlanner(heuristic="nope").solve(dp)
+    with pytest.raises(ValueError):
+        GBFSPlanner(heuristic="ff", lazy=True)
+    assert registry.get("astar-hmax").heuristic == "hmax"
+    assert registry.get("astar-hmax", heuristic="hadd").heuristic == "hadd"
+
+    class Zero(Heuristic):
+        def __call__(self, state):
+            return 0
+
+    register_heuristic("zero", Zero)
+    try:
+        assert len(GBFSPlanner(heuristic="zero").solve(dp)) == len(BFSPlanner().solve(dp))
+    finally:
+        del HEURISTICS["zero"]
@@ -0,0 +1,295 @@
+"""S-expression fast-path parser: differential test against the ANTLR
+backend, plus the listener quirks it must reproduce and the inputs it hands
+back to ANTLR."""
+import glob
+import os
+
+import pytest
+
+import pddlpy.pddl
+from pddlpy import DomainProblem
+from pddlpy.pddl import DomainListener, ProblemListener, _read_text, _walk
+from pddlpy.sexpr import Unsupported, build
+
+HERE = os.path.dirname(__file__)
+ROOT = os.path.dirname(HERE)
+CORPUS = os.path.join(HERE, "corpus")
+
+FILES = sorted(
+    glob.glob(os.path.join(CORPUS, "*.pddl"))
+    + glob.glob(os.path.join(ROOT, "examples-pddl", "*.pddl"))
+    + glob.glob(os.path.join(ROOT, "examples", "pddl", "*.pddl"))
+)
+
+
+def _rule(path):
+    return "domain" if "domain" in os.path.basename(path) else "problem"
+
+
+def snapshot(obj):
+    """A structural view of a model that compares sets and dicts by content
+    (Atom has no value equality, and inferred objects come out of a set).
+    Parameter order is checked separately by :func:`parameter_order`."""
+    if isinstance(obj, (set, frozenset)):
+        return ("set", sorted(repr(snapshot(o)) for o in obj))
+    if isinstance(obj, dict):
+        return ("dict", sorted(repr((snapshot(k), snapshot(v))) for k, v in obj.items()))
+    if isinstance(obj, (list, tuple)):
+        return (type(obj).__name__, [snapshot(o) for o in obj])
+    if hasattr(obj, "__dict__"):
+        return (type(obj).__name__,
+                sorted((k, snapshot(v)) for k, v in vars(obj).items()))
+    return obj
+
+
+def parameter_order(model):
+    ops = list(getattr(model, "operators", {}).values())
+    ops += list(getattr(model, "durative_operators", {}).values())
+    return [(op.operator_name, list(op.variable_list)) for op in ops]
+
+
+def _models(text, rule):
+    listener = DomainListener if rule == "domain" else ProblemListener
+    fast, antlr = build(text, rule), _walk(text, rule, listener())
+    assert parameter_order(fast) == parameter_order(antlr)
+    return snapshot(fast), snapshot(antlr)
+
+
+@pytest.mark.parametrize("path", FILES, ids=lambda p: os.path.relpath(p, ROOT))
+def test_identical_model(path):
+    # build() raises Unsupported on a bail-out: every shipped file must take
+    # the fast path, not just fall back to ANTLR.
+    fast, antlr = _models(_read_text(path), _rule(path))
+    assert fast == antlr
+
+
+def test_corpus_is_covered():
+    assert len(FILES) > 40
+
+
+def test_backend_end_to_end(monkeypatch):
+    domain = os.path.join(CORPUS, "logistics-domain.pddl")
+    problem = os.path.join(CORPUS, "logistics-problem.pddl")
+    antlr = DomainProblem(domain, problem)
+
+    def boom(*args):
+        raise AssertionError("ANTLR ran on a supported file")
+
+    monkeypatch.setattr(pddlpy.pddl, "_walk", boom)
+    fast = DomainProblem(domain, problem, backend="sexpr")
+    assert snapshot(fast.domain) == snapshot(antlr.domain)
+    assert snapshot(fast.problem) == snapshot(antlr.problem)
+    assert len(list(fast.ground_operator("drive-truck"))) == 16
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="backend"):
+        DomainProblem("d.pddl", "p.pddl", backend="yacc")
+
+
+DOMAIN = """(define (domain quirks)
+  (:requirements :STRIPS :typing :adl :fluents :durative-actions)
+  (:types t u - object v w - (either t u) x)
+  (:constants at - t c1 c2)
+  (:predicates (p ?a - t) (q) (over ?a ?b))
+  (:functions (f ?d ?a - t ?b ?c - (either u v) ?e) - number (g) (h ?x))
+  (:action a
+    :parameters (?d ?a - t ?b ?c - (either u v) ?e)
+    :precondition (and (p ?a) (NOT (p ?b)) (not (and (q) (Not (p ?c))))
+                       (imply (p ?a) (q)) (= ?a ?b) (= c1 c2) (= g h)
+                       (>= (f ?d ?a ?b ?c ?e) (- 1)) (< (* g 2) (- g h))
+                       (exists (?z - t) (over ?z ?a)) (forall (?y) (or)))
+    :effect (and (NOT (p ?a)) (not (p ?b)) (increase (g) 1) (decrease g (h ?a))
+                 (forall (?y - t) (and (p ?y) (when (not (q)) (not (p ?y)))))
+                 (when (q) (and (p ?a) (assign (g) 0)))
+                 (when (q) (p ?b))))
+  (:action b :parameters () :precondition (or (q)) :effect (q))
+  (:action c :parameters () :precondition () :effect ())
+  (:action d :parameters ())
+  (:durative-action e
+    :parameters (?a - t)
+    :duration (and (>= ?duration 2) (at start (<= ?duration (g))) (at end (= ?duration 5)))
+    :condition (and (at start (p ?a)) (over all (not (q))) (at end (NOT (p ?a)))
+                    (and (at start (> (g) 1))))
+    :effect (and (at start (not (p ?a))) (at end (NOT (q)))
+                 (at end (forall (?y) (when (not (p ?y)) (and (q) (not (p ?y))))))
+                 (at start (increase (g) (* ?duration 2)))
+                 (at end (decrease (g) (- ?duration)))
+                 (assign (h ?a) 1)))
+  (:durative-action k :parameters () :duration () :condition () :effect ())
+  (:durative-action m :parameters () :duration (= ?duration (g))
+    :condition (at start (q)) :effect (at end (when (q) (p c1)))))
+"""
+
+PROBLEM = """(define (problem quirks) (:domain quirks)
+  (:requirements :strips)
+  (:objects o1 o2 - t o3 at)
+  (:init (p o1) (not (p o2)) (at 10 (q)) (at o1 o2) (= (f o1 o2) 3) (= g 1.5))
+  (:goal (and (p o1) (not (p o2)) (exists (?x) (p ?x)) (> (g) 1) (= o1 o2)))
+  (:metric minimize (+ (* (g) 2 3) (- total-time))))
+"""
+
+
+def test_quirks_match_antlr():
+    for text, rule in ((DOMAIN, "domain"), (PROBLEM, "problem")):
+        fast, antlr = _models(text, rule)
+        assert fast == antlr
+    dl = build(DOMAIN, "domain")
+    # Trailing untyped parameters come first, as enterTypedVariableList does.
+    assert list(dl.operators["a"].variable_list) == ["?e", "?d", "?a", "?b", "?c"]
+    assert dl.durative_operators["e"].duration == 5.0
+
+
+@pytest.mark.parametrize("text", [
+    # A problem without objects infers them; a domain without constants or
+    # types infers them from the operators.
+    "(define (problem p) (:domain d) (:init (on a b)) (:goal (on b c)) "
+    "(:metric maximize (is-violated pref)))",
+    "(define (problem p) (:domain d) (:init) (:goal (and)) (:metric minimize 3))",
+    "(define (problem p) (:domain d) (:init) (:goal (q)) (:metric minimize (total-cost)))",
+    "(define (problem p) (:domain d) (:init) (:goal (q)) (:metric minimize (/ f 2 3)))",
+    "(define (problem p) (:domain d) (:init) (:goal (q)) (:metric minimize (fn a b)))",
+])
+def test_problem_shapes(text):
+    fast, antlr = _models(text, "problem")
+    assert fast == antlr
+
+
+def test_inferred_domain_objects():
+    text = ("(define (domain d) (:action a :parameters (?x) "
+            ":precondition (on ?x b) :effect (not (on a ?x))))")
+    fast, antlr = _models(text, "domain")
+    assert fast == antlr
+
+
+BAIL_DOMAINS = [
+    "(define (domain d) (:predicates (p)) (:types t))",            # section order
+    "(define (domain d) (:derived (p) (q)))",                       # :derived
+    "(define (domain d) (:constraints (always (p))))",
+    "(define (domain d) (:requirements :constraints))",
+    "(define (domain d) (:requirements))",
+    "(define (domain d) (:predicates))",
+    "(define (domain d) (:predicates ()))",
+    "(define (domain d) (:functions (f) - object))",
+    "(define (domain d) (:functions ()))",
+    "(define (domain d) (:types a -))",
+    "(define (domain d) (:types a - (either)))",
+    "(define (domain d) (:types a - (oneof b)))",
+    "(define (domain d) (:constants ?x))",
+    "(define (domain d) foo)",
+    "(define (problem d))",
+    "(define (domain d d))",
+    "(define)",
+    "(define (domain d) (:predicates (p)) extra)",
+    "(define (domain d)) (define (domain e))",
+    "(define (domain d)",
+    "(define (domain d)))",
+    "(define (domain d)) junk",
+    "junk",
+    "(define (domain d.x))",                                        # URI token
+    "(define (domain d;x\n))",
+    "(define (domain d) # )",
+    "(define (domain d) (:action a))",
+    "(define (domain d) (:action a :parameters () :precondition))",
+    "(define (domain d) (:action a :parameters () :effect))",
+    "(define (domain d) (:action a :parameters () :effect (p) :bogus))",
+    "(define (domain d) (:action a :parameters () :precondition q))",
+    "(define (domain d) (:action a :parameters () :precondition ()()))",
+    "(define (domain d) (:action a :parameters () :precondition ((p))))",
+    "(define (domain d) (:action a :parameters () :precondition (not)))",
+    "(define (domain d) (:action a :parameters () :precondition (imply (p))))",
+    "(define (domain d) (:action a :parameters () :precondition (exists (?x))))",
+    "(define (domain d) (:action a :parameters () :precondition (= ?x 5)))",
+    "(define (domain d) (:action a :parameters () :precondition (< 1 2 3)))",
+    "(define (domain d) (:action a :parameters () :precondition (< (+ 1) 2)))",
+    "(define (domain d) (:action a :parameters () :precondition (< () 2)))",
+    "(define (domain d) (:action a :parameters () :precondition (< (f ?x 2) 2)))",
+    "(define (domain d) (:action a :parameters () :precondition (preference (p))))",
+    "(define (domain d) (:action a :parameters () :precondition (p 2)))",
+    "(define (domain d) (:action a :parameters (?x - ) :effect (p)))",
+    "(define (domain d) (:action a :parameters () :effect (increase (g))))",
+    "(define (domain d) (:action a :parameters () :effect (not)))",
+    "(define (domain d) (:action a :parameters () :effect (not (and))))",
+    "(define (domain d) (:action a :parameters () :effect (and (and))))",
+    "(define (domain d) (:action a :parameters () :effect (forall (?x))))",
+    "(define (domain d) (:action a :parameters () :effect (when (p))))",
+    "(define (domain d) (:action a :parameters () :effect p))",
+    "(define (domain d) (:durative-action e :parameters ()))",
+    "(define (domain d) (:durative-action e :parameters () :duration (and) "
+    ":condition () :effect ()))",
+    "(define (domain d) (:durative-action e :parameters () :duration (at start) "
+    ":condition () :effect ()))",
+    "(define (domain d) (:durative-action e :parameters () :duration (= 3 ?duration) "
+    ":condition () :effect ()))",
+    "(define (domain d) (:durative-action e :parameters () :duration () "
+    ":condition (at (q)) :effect ()))",
+    "(define (domain d) (:durative-action e :parameters () :duration () "
+    ":condition (forall (?x) (at start (q))) :effect ()))",
+    "(define (domain d) (:durative-action e :parameters () :duration () "
+    ":condition (preference (at start (q))) :effect ()))",
+    "(define (domain d) (:durative-action e :parameters () :duration () "
+    ":condition () :effect (forall (?x) (at end (q)))))",
+    "(define (domain d) (:durative-action e :parameters () :duration () "
+    ":condition () :effect (when (at start (q)) (at end (q)))))",
+    "(define (domain d) (:durative-action e :parameters () :duration () "
+    ":condition () :effect (at end)))",
+    "(define (domain d) (:durative-action e :parameters () :duration () "
+    ":condition () :effect (scale-up (g))))",
+    "(define (domain d) (:durative-action e :parameters () :duration () "
+    ":condition () :effect (increase (g) 1)))",
+    "(define (domain d) (:durative-action e :parameters () :duration () "
+    ":condition () :effect (at end (assign (g)))))",
+    "(define (domain d) (:durative-action e :parameters () :duration () "
+    ":condition () :effect (at end (assign (g) (+ ?duration)))))",
+    "(define (domain d) (:durative-action e :parameters () :duration () "
+    ":condition () :effect (at end (forall (?x)))))",
+    "(define (domain d) (:durative-action e :parameters () :duration () "
+    ":condition () :effect (at end (when (q)))))",
+]
+
+BAIL_PROBLEMS = [
+    "(define (problem p) (:domain d) (:init) (:goal (q)) (:constraints (always (q))))",
+    "(define (problem p) (:domain d) (:context) (:init) (:goal (q)))",
+    "(define (problem p) (:domain d) (:init) (:goal))",
+    "(define (problem p) (:domain d) (:goal (q)) (:init))",
+    "(define (problem p) (:domain d) (:init (= (f) g)) (:goal (q)))",
+    "(define (problem p) (:domain d) (:init (not)) (:goal (q)))",
+    "(define (problem p) (:domain d) (:init (and (q))) (:goal (q)))",
+    "(define (problem p) (:domain d) (:init (p ?x)) (:goal (q)))",
+    "(define (problem p) (:domain d) (:init) (:goal (q)) (:metric best (f)))",
+    "(define (problem p) (:domain d) (:init) (:goal (q)) (:metric minimize (+ (f))))",
+    "(define (problem p) (:domain d) (:init) (:goal (q)) (:metric minimize ()))",
+    "(define (problem p) (:domain d) (:init) (:goal (q)) (:metric minimize ?x))",
+    "(define (problem p) (:domain d) (:init) (:goal (q)) (:metric minimize (is-violated)))",
+    "(define (problem p) (:domain d) (:init) (:goal (q)) (:metric minimize (f 3)))",
+    "(define (problem p) (:domain d) (:init) (:goal (q)) (:metric minimize f) (:metric minimize f))",
+    "(define (problem p) (domain d) (:init) (:goal (q)))",
+    "(define (domain p) (:domain d) (:init) (:goal (q)))",
+]
+
+
+@pytest.mark.parametrize("text", BAIL_DOMAINS)
+def test_domain_bails(text):
+    with pytest.raises(Unsupported):
+        build(text, "domain")
+
+
+@pytest.mark.parametrize("text", BAIL_PROBLEMS)
+def test_problem_bails(text):
+    with pytest.raises(Unsupported):
+        build(text, "problem")
+
+
+def test_fallback_to_antlr(tmp_path):
+    # Preferences are outside the fast path: the ANTLR listeners build the model.
+    domain = tmp_path / "d.pddl"
+    domain.write_text("(define (domain d) (:predicates (p) (q)) "
+                      "(:durative-action a :parameters () :duration (= ?duration 1) "
+                      ":condition (preference (at start (q))) :effect (at end (p))))")
+    problem = tmp_path / "p.pddl"
+    problem.write_text("(define (problem p) (:domain d) (:init (q)) (:goal (p)))")
+    with pytest.raises(Unsupported):
+        build(domain.read_text(), "domain")
+    dp = DomainProblem(str(domain), str(problem), backend="sexpr")
+    assert set(dp.durative_operators()) == {"a"}
+    assert dp.domain.durative_operators["a"].condition_pos["start"]
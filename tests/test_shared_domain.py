@@ -0,0 +1,86 @@
+"""Parse a domain once and attach many problems to it: the domain model and
+its derived data are shared, and each problem behaves like a fresh
+DomainProblem."""
+import os
+
+import pytest
+
+import pddlpy.pddl
+from pddlpy import Domain, DomainProblem
+from pddlpy.cache import ParseCache
+from pddlpy.planning import BFSPlanner
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+
+
+def _path(name):
+    return os.path.join(CORPUS, name)
+
+
+def _atoms(atoms):
+    return sorted(str(a) for a in atoms)
+
+
+def test_from_domain_matches_fresh_parse():
+    domain = Domain(_path("logistics-domain.pddl"))
+    shared = DomainProblem.from_domain(domain, _path("logistics-problem.pddl"))
+    fresh = DomainProblem(_path("logistics-domain.pddl"), _path("logistics-problem.pddl"))
+    assert shared.domain is domain.listener
+    assert set(shared.operators()) == set(fresh.operators())
+    assert shared.worldobjects() == fresh.worldobjects()
+    assert _atoms(shared.initialstate()) == _atoms(fresh.initialstate())
+    assert shared.static_predicates() == fresh.static_predicates()
+    assert shared.subtypes_of("physobj") == fresh.subtypes_of("physobj")
+    assert len(list(shared.ground_operator("drive-truck"))) == 16
+
+
+def test_domain_parsed_once_and_derived_data_shared(monkeypatch):
+    calls = []
+    real_load = pddlpy.pddl._load_text
+
+    def counting_load(text, rule, *args):
+        calls.append(rule)
+        return real_load(text, rule, *args)
+
+    monkeypatch.setattr(pddlpy.pddl, "_load_text", counting_load)
+    domain = Domain(_path("blocksworld-domain.pddl"))
+    problems = [_path("blocksworld-problem.pddl"), _path("blocksworld-upper-problem.pddl")]
+    dps = list(domain.problems(problems))
+    assert calls == ["domain", "problem", "problem"]
+    assert len(dps) == 2 and dps[0].domain is dps[1].domain
+    assert dps[0].problem is not dps[1].problem
+
+    # The static predicates are computed once and returned as copies, so a
+    # caller cannot corrupt the shared value.
+    static = dps[0].static_predicates()
+    assert domain.static_predicates() is domain.static_predicates()
+    static.add("bogus")
+    assert "bogus" not in dps[1].static_predicates()
+
+
+def test_batch_solves_each_problem():
+    domain = Domain(_path("gripper-domain.pddl"))
+    plans = [BFSPlanner().solve(dp) for dp in domain.problems([_path("gripper-problem.pddl")] * 3)]
+    assert all(plan is not None for plan in plans)
+    assert len({len(plan) for plan in plans}) == 1
+
+
+def test_subtype_closure_memoized():
+    domain = Domain(_path("logistics-domain.pddl"))
+    first = domain.subtypes_of("physobj")
+    assert first == {"package", "vehicle", "truck", "airplane"}
+    assert domain.subtypes_of("physobj") is first
+    assert domain.subtypes_of("truck") == frozenset()
+
+
+def test_problems_use_domain_cache_and_backend(tmp_path):
+    cache = ParseCache(str(tmp_path))
+    domain = Domain(_path("travel-domain.pddl"), cache=cache, backend="sexpr")
+    dp = DomainProblem.from_domain(domain, _path("travel-problem.pddl"))
+    assert cache.stats()["entries"] == 2
+    assert set(dp.operators()) == {"move"}
+
+
+def test_domain_rejects_unknown_backend():
+    with pytest.raises(ValueError, match="backend"):
+        Domain(_path("travel-domain.pddl"), backend="yacc")
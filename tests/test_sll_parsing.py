@@ -0,0 +1,58 @@
+"""Two-stage ANTLR parsing: SLL with a bail-out error strategy first, full
+LL only when that fails. The models must not depend on which stage built
+them, and syntax errors must still be reported exactly once."""
+import os
+
+import pytest
+from antlr4 import ParseTreeWalker
+from antlr4.error.ErrorListener import ErrorListener
+from test_sexpr_parser import FILES, ROOT, _rule, parameter_order, snapshot
+
+import pddlpy.pddl
+from pddlpy.pddl import DomainListener, ProblemListener, _parse_tree, _read_text
+
+VALID = "(define (domain d) (:predicates (p ?x)) (:action a :parameters (?x) :effect (p ?x)))"
+BROKEN = VALID.replace("(p ?x)))", "((p ?x)))")
+
+
+class Collector(ErrorListener):
+    def __init__(self):
+        self.errors = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.errors.append((line, column))
+
+
+def _model(text, rule, sll):
+    listener = DomainListener() if rule == "domain" else ProblemListener()
+    ParseTreeWalker().walk(listener, _parse_tree(text, rule, sll=sll))
+    return listener
+
+
+@pytest.mark.parametrize("path", FILES, ids=lambda p: os.path.relpath(p, ROOT))
+def test_identical_model(path, monkeypatch):
+    text, rule = _read_text(path), _rule(path)
+    ll = _model(text, rule, sll=False)
+    # Every shipped file must parse in SLL without falling back.
+    monkeypatch.setattr(pddlpy.pddl, "DefaultErrorStrategy", None)
+    sll = _model(text, rule, sll=True)
+    assert parameter_order(sll) == parameter_order(ll)
+    assert snapshot(sll) == snapshot(ll)
+
+
+def test_fallback_reports_errors_once(capsys):
+    errors = {}
+    for sll in (True, False):
+        collector = Collector()
+        tree = _parse_tree(BROKEN, "domain", collector, sll=sll)
+        assert tree is not None
+        errors[sll] = collector.errors
+    assert errors[True] and errors[True] == errors[False]
+    assert capsys.readouterr().err == ""
+
+
+def test_fallback_reports_to_console_by_default(capsys):
+    _parse_tree(BROKEN, "domain")
+    assert "line 1:" in capsys.readouterr().err
+    _parse_tree(VALID, "domain")
+    assert capsys.readouterr().err == ""
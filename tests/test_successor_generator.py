@@ -0,0 +1,82 @@
+"""Successor generator (pddlpy.planning.successors): a trie over precondition
+atoms hands search only the actions that can apply, never missing one."""
+import os
+from collections import deque
+
+import pytest
+
+from pddlpy import DomainProblem
+from pddlpy.planning import GroundedTask, PackedTask, SuccessorGenerator
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+
+
+def _dp(name):
+    return DomainProblem(os.path.join(CORPUS, "%s-domain.pddl" % name),
+                         os.path.join(CORPUS, "%s-problem.pddl" % name))
+
+
+def _gripper(balls, rooms):
+    with open(os.path.join(CORPUS, "gripper-domain.pddl")) as f:
+        domain = f.read()
+    return DomainProblem.from_strings(domain, (
+        "(define (problem g) (:domain gripper)"
+        " (:objects %s - ball %s - room left right - gripper)"
+        " (:init (at-robby room0) (free left) (free right) %s)"
+        " (:goal (and (at ball0 room1))))" % (
+            " ".join("ball%d" % i for i in range(balls)),
+            " ".join("room%d" % i for i in range(rooms)),
+            " ".join("(at ball%d room0)" % i for i in range(balls)))))
+
+
+def _reachable(task, limit=500):
+    seen = {task.initial}
+    frontier = deque([task.initial])
+    while frontier and len(seen) < limit:
+        for _, succ in task.successors(frontier.popleft()):
+            if succ not in seen:
+                seen.add(succ)
+                frontier.append(succ)
+    return seen
+
+
+@pytest.mark.parametrize("name", ["blocksworld", "gripper", "logistics", "briefcase",
+                                  "rooms", "numeric-transport"])
+def test_candidates_cover_every_applicable_action(name):
+    task = GroundedTask(_dp(name))
+    packed = PackedTask(task.domainproblem)
+    for state in _reachable(task):
+        candidates = task.generator.candidates(state.ids)
+        assert candidates == sorted(set(candidates))
+        applicable = [i for i, action in enumerate(task.compiled)
+                      if state._applicable(action)]
+        assert set(applicable) <= set(candidates)
+        bits = sum(1 << i for i in state.ids)
+        assert packed.generator.candidates_bits(bits) == candidates
+
+
+def test_large_task_tests_few_actions():
+    task = GroundedTask(_gripper(40, 8))
+    assert len(task.actions) == 8 * 8 + 2 * 2 * 40 * 8
+    candidates = task.generator.candidates(task.initial.ids)
+    # move from room0 (8), and pick each ball in room0 with either gripper
+    # (80); drops need a carried ball and are pruned with it.
+    assert len(candidates) <= 8 + 80 + 8
+    assert task.generator.size > 1
+    assert len(list(task.successors(task.initial))) == 8 + 80
+
+
+def test_precondition_trees_are_always_candidates():
+    task = GroundedTask(_dp("rooms"))
+    trees = [i for i, action in enumerate(task.compiled) if action.precondition is not None]
+    assert trees
+    empty = SuccessorGenerator(task.compiled).candidates(frozenset())
+    assert set(trees) <= set(empty)
+
+
+def test_few_actions_are_one_bucket():
+    task = GroundedTask(_dp("gripper"))
+    generator = SuccessorGenerator(task.compiled[:5])
+    assert generator.size == 1 and not generator.root.children
+    assert generator.candidates(frozenset()) == [0, 1, 2, 3, 4]
+    assert generator.candidates_bits(0) == [0, 1, 2, 3, 4]
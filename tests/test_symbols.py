@@ -0,0 +1,114 @@
+"""Symbol interning (pddlpy.symbols): dense integer IDs for predicates,
+objects and ground atoms, and a planning layer that runs on them while
+states and plans still read as string tuples."""
+import os
+
+from pddlpy import DomainProblem
+from pddlpy.planning import BFSPlanner, GroundedTask, State
+from pddlpy.planning.state import _AtomView
+from pddlpy.symbols import SymbolTable
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+
+
+def _dp(name):
+    return DomainProblem(os.path.join(CORPUS, "%s-domain.pddl" % name),
+                         os.path.join(CORPUS, "%s-problem.pddl" % name))
+
+
+def test_table_interns_densely():
+    table = SymbolTable()
+    assert table.atom_id(("on", "a", "b")) == 0
+    assert table.atom_id(("on", "b", "a")) == 1
+    assert table.atom_id(("on", "a", "b")) == 0
+    assert table.atom(1) == ("on", "b", "a")
+    assert table.find_atom(("clear", "a")) is None
+    assert table.predicates == ["on"] and table.objects == ["a", "b"]
+    assert table.atom_terms == [(0, 0, 1), (0, 1, 0)]
+    assert table.atom_hashes[0] == hash(("on", "a", "b"))
+    assert table.atoms_of(table.atom_ids([("clear", "a"), ("on", "a", "b")])) == {
+        ("clear", "a"), ("on", "a", "b")}
+    assert len(table) == 3
+    assert repr(table) == "SymbolTable(2 predicates, 2 objects, 3 atoms)"
+
+
+def test_domainproblem_table_is_seeded_once():
+    dp = _dp("blocksworld")
+    table = dp.symbols()
+    assert dp.symbols() is table
+    assert table.predicates == sorted(dp.predicates())
+    assert table.objects == sorted(dp.worldobjects())
+    init = sorted(tuple(a.predicate) for a in dp.initialstate())
+    assert table.atoms[:len(init)] == init
+
+
+def test_task_states_are_ids_in_the_problem_table():
+    dp = _dp("logistics")
+    task = GroundedTask(dp)
+    assert task.symbols is dp.symbols() and task.initial.symbols is task.symbols
+    assert task.initial.atoms == {tuple(a.predicate) for a in dp.initialstate()}
+    assert {task.symbols.atom(i) for i in task.goal_ids} == {
+        tuple(a.predicate) for a in dp.goals()}
+    for action, succ in task.successors(task.initial):
+        assert succ.symbols is task.symbols
+        assert succ == task.initial.apply(action)
+        assert task.initial.applicable(action)
+
+
+def test_plans_replay_on_string_states():
+    dp = _dp("gripper")
+    plan = BFSPlanner().solve(dp)
+    # Plans carry the grounded Operators; replaying them on a state built from
+    # plain tuples (a table of its own) reaches the goal.
+    state = State(dp.initialstate())
+    for action in plan:
+        assert state.applicable(action)
+        state = state.apply(action)
+    assert state.satisfies(dp.goals())
+
+
+def test_states_compare_across_tables():
+    own = SymbolTable()
+    own.atom_id(("unrelated",))
+    a = State([("p", "x"), ("q",)], {("f",): 1.0}, symbols=own)
+    b = State([("q",), ("p", "x")], {("f",): 1.0})
+    assert a.symbols is not b.symbols and a.ids != b.ids
+    assert a == b and hash(a) == hash(b)
+    assert a != State([("q",)], {("f",): 1.0}) and a != {("p", "x"), ("q",)}
+    assert ("p", "x") in a and ("r",) not in a
+    assert sorted(a) == [("p", "x"), ("q",)] and len(a) == 2
+
+
+def test_queries_do_not_intern():
+    a, b = State([("p", "x")]), State([("p", "x")])
+    assert a.symbols is not b.symbols  # no table shared between states
+    table = a.symbols
+    assert a.satisfies([("p", "x")]) and not a.satisfies([("p", "x"), ("never",)])
+    assert ("never", "seen") not in a and len(table) == 1
+
+
+def test_atom_view():
+    table = SymbolTable()
+    ids = table.atom_ids([("p", "a"), ("q",)])
+    table.atom_id(("r",))
+    view = _AtomView(ids, table)
+    assert ("p", "a") in view and ("r",) not in view and ("s",) not in view
+    assert len(view) == 2 and set(view) == {("p", "a"), ("q",)}
+
+
+def test_flat_sets_agree_with_tree_for_simple_conjunctions():
+    # Interned actions test a simple-conjunction precondition through the flat
+    # ID sets instead of the tree; both must agree in every reachable state.
+    for name in ("numeric-transport", "rooms", "logistics"):
+        task = GroundedTask(_dp(name))
+        frontier, seen = [task.initial], {task.initial}
+        while frontier and len(seen) < 200:
+            state = frontier.pop()
+            for action in task.actions:
+                if action.precondition is not None:
+                    assert action.precondition.holds(state.atoms, state.fluents) \
+                        == state.applicable(action)
+            for _, succ in task.successors(state):
+                if succ not in seen:
+                    seen.add(succ)
+                    frontier.append(succ)
@@ -10,6 +10,7 @@ and a makespan.
 import os
 
 from pddlpy import DomainProblem
+from pddlpy.binding import CartesianBinder
 from pddlpy.planning import (
     DurativeState,
     ScheduledAction,
@@ -118,6 +119,7 @@ def test_start_and_end_effect_timing():
 
 def test_at_start_condition_gates_application():
     dp = _go()
+    dp.binder = CartesianBinder()  # the default binder prunes go(b, a): no (road b a)
     state = State.from_problem(dp)  # (at a), (road a b)
     go_ba = next(
         g
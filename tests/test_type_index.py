@@ -0,0 +1,144 @@
+"""Memoized type closure and object-by-type index: built once per
+Domain / DomainProblem, equal to the previous per-call computations, and
+rebuilt when the hierarchy or the objects are mutated."""
+import glob
+import os
+
+import pytest
+
+from pddlpy import DomainProblem
+from pddlpy.pddl import _TrackedDict, _TrackedSet
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+DOMAINS = sorted(glob.glob(os.path.join(CORPUS, "*-domain.pddl")))
+
+
+def _dp(name):
+    return DomainProblem(os.path.join(CORPUS, "%s-domain.pddl" % name),
+                         os.path.join(CORPUS, "%s-problem.pddl" % name))
+
+
+def _fixed_point_subtypes(hierarchy, t):
+    """The former quadratic ``subtypes_of``, as a reference."""
+    result, changed = set(), True
+    while changed:
+        changed = False
+        for sub, sup in hierarchy.items():
+            if sub not in result and (sup == t or sup in result):
+                result.add(sub)
+                changed = True
+    return result
+
+
+def _walk_is_subtype(hierarchy, ot, t):
+    """The former supertype-chain walk of ``_is_subtype``, as a reference."""
+    if t is None:
+        return ot is None
+    seen = set()
+    while ot is not None and ot not in seen:
+        if ot == t:
+            return True
+        seen.add(ot)
+        ot = hierarchy.get(ot)
+    return False
+
+
+HIERARCHIES = [
+    {"a": "b", "b": "a"},                          # cycle
+    {"a": "b", "b": "c", "c": "a", "d": "a"},      # cycle with a tail
+    {"x": "undeclared", "y": "x", "z": None},      # dangling parent
+]
+
+
+@pytest.mark.parametrize("hierarchy", HIERARCHIES)
+def test_closure_matches_reference(hierarchy):
+    dp = _dp("logistics")
+    dp.domain.types = hierarchy
+    names = set(hierarchy) | set(hierarchy.values()) | {"nope", None}
+    for t in names:
+        assert dp.subtypes_of(t) == _fixed_point_subtypes(hierarchy, t)
+        for ot in names:
+            assert dp._is_subtype(ot, t) == _walk_is_subtype(hierarchy, ot, t)
+
+
+@pytest.mark.parametrize("path", DOMAINS, ids=os.path.basename)
+def test_corpus_closure_and_index(path):
+    problem = path.replace("-domain.pddl", "-problem.pddl")
+    if not os.path.exists(problem):
+        pytest.skip("no matching problem")
+    dp = DomainProblem(path, problem)
+    hierarchy = dict(dp.domain.types)
+    objects = dp.worldobjects()
+    for t in set(hierarchy) | set(hierarchy.values()) | set(objects.values()):
+        assert dp.subtypes_of(t) == _fixed_point_subtypes(hierarchy, t)
+        assert dp.candidate_objects(t) == [
+            o for o, ot in objects.items() if _walk_is_subtype(hierarchy, ot, t)]
+
+
+def test_built_once():
+    dp = _dp("logistics")
+    index = dp._objects_by_type()
+    closure = dp._shared.type_closure()
+    list(dp.ground_operator("drive-truck"))
+    assert dp._objects_by_type() is index
+    assert dp._shared.type_closure() is closure
+    # Callers get their own list.
+    dp.candidate_objects("truck").append("bogus")
+    assert "bogus" not in dp.candidate_objects("truck")
+
+
+def test_rebuilt_on_mutation():
+    dp = _dp("logistics")
+    trucks = set(dp.candidate_objects("truck"))
+    assert "t9" not in dp.candidate_objects("vehicle")
+
+    dp.problem.objects["t9"] = "truck"
+    assert set(dp.candidate_objects("vehicle")) >= trucks | {"t9"}
+
+    dp.domain.types["truck"] = "location"
+    assert "t9" in dp.candidate_objects("location")
+    assert "t9" not in dp.candidate_objects("vehicle")
+    assert "truck" in dp.subtypes_of("location")
+
+    dp.domain.types = {"truck": "vehicle"}
+    assert dp.subtypes_of("location") == set()
+    assert "t9" in dp.candidate_objects("vehicle")
+
+    dp.problem.objects = {"only": "truck"}
+    assert dp.candidate_objects("truck") == ["only"]
+
+
+def test_problem_objects_override_constants():
+    dp = _dp("logistics")
+    dp.domain.objects = {"c": "city", "shared": "city"}
+    dp.problem.objects = {"shared": "truck"}
+    assert list(dp.worldobjects().items()) == [("c", "city"), ("shared", "truck")]
+    assert dp.candidate_objects("city") == ["c"]
+
+
+def test_tracked_dict_counts_mutations():
+    d = _TrackedDict(a=1)
+    versions = []
+    for mutate in (lambda: d.__setitem__("b", 2), lambda: d.__delitem__("b"),
+                   lambda: d.update(c=3), lambda: d.setdefault("e", 5),
+                   lambda: d.pop("c"), lambda: d.popitem(), lambda: d.__ior__({"f": 6}),
+                   d.clear):
+        mutate()
+        versions.append(d.version)
+    assert versions == list(range(1, 9))
+    assert d == {}
+
+
+def test_tracked_set_counts_mutations():
+    s = _TrackedSet({1})
+    versions = []
+    for mutate in (lambda: s.add(2), lambda: s.discard(2), lambda: s.remove(1),
+                   lambda: s.update({3, 4}), s.pop, lambda: s.difference_update({9}),
+                   lambda: s.intersection_update({3, 4}),
+                   lambda: s.symmetric_difference_update({5}),
+                   lambda: s.__ior__({6}), lambda: s.__iand__({5, 6}),
+                   lambda: s.__isub__({5}), lambda: s.__ixor__({7}), s.clear):
+        mutate()
+        versions.append(s.version)
+    assert versions == list(range(1, 14))
+    assert s == set()